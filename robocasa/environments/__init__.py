@@ -1,3 +1,12 @@
-from .kitchen.kitchen import REGISTERED_KITCHEN_ENVS
+from robocasa.environments.registry import KITCHEN_TASK_MODULES
 
-ALL_KITCHEN_ENVIRONMENTS = REGISTERED_KITCHEN_ENVS.keys()
+# names of all kitchen tasks, including those whose modules have not been imported yet
+ALL_KITCHEN_ENVIRONMENTS = KITCHEN_TASK_MODULES.keys()
+
+
+def __getattr__(name):
+    if name == "REGISTERED_KITCHEN_ENVS":
+        from .kitchen.kitchen import REGISTERED_KITCHEN_ENVS
+
+        return REGISTERED_KITCHEN_ENVS
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -139,35 +139,10 @@ class ManipulateDrawer(Kitchen):
         Returns:
             bool: True if the point is in contact with any fixture, False otherwise
         """
-        fxtrs = [
-            fxtr
-            for fxtr in self.fixtures.values()
-            if isinstance(fxtr, Counter)
-            or isinstance(fxtr, Stove)
-            or isinstance(fxtr, Stovetop)
-            or isinstance(fxtr, HousingCabinet)
-            or isinstance(fxtr, SingleCabinet)
-            or isinstance(fxtr, HingeCabinet)
-            or isinstance(fxtr, Fridge)
-            or (isinstance(fxtr, Wall) and not isinstance(fxtr, Floor))
-        ]
-
-        for fxtr in fxtrs:
-            # get bounds of fixture
-            if OU.point_in_fixture(point=pos, fixture=fxtr, only_2d=True):
-                return True
-        return False
+        return OU.check_fxtr_contact(self, pos)
 
     def _point_outside_scene(self, pos):
-        walls = [
-            fxtr for (name, fxtr) in self.fixtures.items() if isinstance(fxtr, Floor)
-        ]
-        return not any(
-            [
-                OU.point_in_fixture(point=pos, fixture=wall, only_2d=True)
-                for wall in walls
-            ]
-        )
+        return OU.point_outside_scene(self, pos)
 
     def _check_success(self):
         """
@@ -13,6 +13,8 @@ class OvenBroilFish(Kitchen):
         3. Close the oven door.
     """
 
+    STATEFUL_SUCCESS_CHECK = True
+
     EXCLUDE_LAYOUTS = Kitchen.OVEN_EXCLUDED_LAYOUTS
 
     def __init__(self, *args, **kwargs):
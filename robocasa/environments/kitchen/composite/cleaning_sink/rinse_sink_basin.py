@@ -13,6 +13,8 @@ class RinseSinkBasin(Kitchen):
 
     """
 
+    STATEFUL_SUCCESS_CHECK = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -81,15 +81,8 @@ class FoodCleanup(Kitchen):
         return cfgs
 
     def _check_success(self):
-        food_inside_cab = all(
-            [OU.obj_inside_of(self, f"food{i}", self.cab) for i in range(self.num_food)]
-        )
-        gripper_obj_far = True
-        for i in range(self.num_food):
-            gripper_obj_far = gripper_obj_far and OU.gripper_obj_far(
-                self, obj_name=f"food{i}"
-            )
-            if gripper_obj_far is False:
-                break
+        food_names = [f"food{i}" for i in range(self.num_food)]
+        food_inside_cab = np.all(OU.objs_inside_of(self, food_names, self.cab))
+        gripper_obj_far = np.all(OU.gripper_objs_far(self, food_names))
         cab_closed = self.cab.is_closed(env=self)
-        return food_inside_cab and gripper_obj_far and cab_closed
+        return bool(food_inside_cab and gripper_obj_far and cab_closed)
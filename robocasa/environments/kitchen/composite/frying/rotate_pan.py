@@ -13,6 +13,8 @@ class RotatePan(Kitchen):
         3) Rotate the pan.
     """
 
+    STATEFUL_SUCCESS_CHECK = True
+
     def __init__(self, knob_id="random", *args, **kwargs):
         self.knob_id = knob_id
         super().__init__(*args, **kwargs)
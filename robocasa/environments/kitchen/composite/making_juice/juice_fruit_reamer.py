@@ -12,6 +12,8 @@ class JuiceFruitReamer(Kitchen):
         2. Press the sliced fruit against the reamer to juice it.
     """
 
+    STATEFUL_SUCCESS_CHECK = True
+
     _SLICED_OBJECTS = [
         {"instance": "orange_1", "split": "pretrain"},
         {"instance": "kiwi_1", "split": "pretrain"},
@@ -10,6 +10,8 @@ class CheeseMixing(Kitchen):
         2) Stir the cheese in the pot using the spatula
     """
 
+    STATEFUL_SUCCESS_CHECK = True
+
     def __init__(self, knob_id="random", *args, **kwargs):
         self.knob_id = knob_id
         super().__init__(*args, **kwargs)
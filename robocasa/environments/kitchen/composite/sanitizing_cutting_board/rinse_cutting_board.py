@@ -12,6 +12,8 @@ class RinseCuttingBoard(Kitchen):
         After 100 timesteps of rinsing, turn off the sink.
     """
 
+    STATEFUL_SUCCESS_CHECK = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -13,6 +13,8 @@ class SanitizeSink(Kitchen):
         3. When finished, drop the sponge.
     """
 
+    STATEFUL_SUCCESS_CHECK = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -13,6 +13,8 @@ class WipeTable(Kitchen):
         3. Once the wiping is complete, place the sponge down.
     """
 
+    STATEFUL_SUCCESS_CHECK = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
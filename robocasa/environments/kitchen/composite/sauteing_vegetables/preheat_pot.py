@@ -14,6 +14,8 @@ class PreheatPot(Kitchen):
 
     """
 
+    STATEFUL_SUCCESS_CHECK = True
+
     def __init__(self, knob_id="random", *args, **kwargs):
         self.knob_id = knob_id
         super().__init__(*args, **kwargs)
@@ -9,6 +9,8 @@ class TurnOffSimmeredSauceHeat(Kitchen):
         Turn off the stove knob once the sauce has simmered.
     """
 
+    STATEFUL_SUCCESS_CHECK = True
+
     # randomize amount of time to simmer so policy doesnt wait a fixed length. Min must be longer
     # than the average time it takesto simply turn on the knob because we want the policy to wait
     MIN_SIMMER_SAUCE_TIMESTEPS = 450
@@ -16,6 +16,8 @@ class MultistepSteaming(Kitchen):
         knob_id (str): The id of the knob who's burner the pot will be placed on.
     """
 
+    STATEFUL_SUCCESS_CHECK = True
+
     def __init__(self, knob_id="random", *args, **kwargs):
         self.knob_id = knob_id
         # Flags to keep track of the task progress
@@ -12,6 +12,8 @@ class PrepareVeggiesForSteaming(Kitchen):
         2. Place the colander with vegetables next to the stove
     """
 
+    STATEFUL_SUCCESS_CHECK = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -11,6 +11,8 @@ class GetToastedBread(Kitchen):
         3. Place the bread on the plate on the dining counter.
     """
 
+    STATEFUL_SUCCESS_CHECK = True
+
     EXCLUDE_LAYOUTS = Kitchen.DINING_COUNTER_EXCLUDED_LAYOUTS
 
     def __init__(self, *args, **kwargs):
@@ -103,24 +103,12 @@ class ClearSink(Kitchen):
         2. All dishes are moved from the counter into the sink.
         """
 
-        food_on_counter = all(
-            [OU.obj_inside_of(self, f"food{i}", self.sink) == False for i in range(2)]
-        )
+        food_names = [f"food{i}" for i in range(2)]
+        dish_names = [f"dish{i}" for i in range(2)]
 
-        dishes_in_sink = all(
-            [OU.obj_inside_of(self, f"dish{i}", self.sink) for i in range(2)]
-        )
+        food_on_counter = not np.any(OU.objs_inside_of(self, food_names, self.sink))
+        dishes_in_sink = np.all(OU.objs_inside_of(self, dish_names, self.sink))
 
-        gripper_far_food = all(
-            [OU.gripper_obj_far(self, obj_name=f"food{i}") for i in range(2)]
-        )
-        gripper_far_dishes = all(
-            [OU.gripper_obj_far(self, obj_name=f"dish{i}") for i in range(2)]
-        )
+        gripper_far = np.all(OU.gripper_objs_far(self, food_names + dish_names))
 
-        return (
-            food_on_counter
-            and dishes_in_sink
-            and gripper_far_food
-            and gripper_far_dishes
-        )
+        return bool(food_on_counter and dishes_in_sink and gripper_far)
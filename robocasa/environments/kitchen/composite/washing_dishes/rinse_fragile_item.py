@@ -13,6 +13,8 @@ class RinseFragileItem(Kitchen):
         3) Place the item on a drying rack
     """
 
+    STATEFUL_SUCCESS_CHECK = True
+
     def __init__(self, enable_fixtures=None, *args, **kwargs):
         enable_fixtures = enable_fixtures or []
         enable_fixtures = list(enable_fixtures) + ["dish_rack"]
@@ -13,6 +13,8 @@ class DrainVeggies(Kitchen):
         the pot.
     """
 
+    STATEFUL_SUCCESS_CHECK = True
+
     def __init__(self, *args, **kwargs):
         # internal state variables for the task
         self.vegetables_washed = False
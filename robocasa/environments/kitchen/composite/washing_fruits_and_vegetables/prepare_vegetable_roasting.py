@@ -13,6 +13,8 @@ class PrepareVegetableRoasting(Kitchen):
         Then place the vegetable on the oven tray next to the sink.
     """
 
+    STATEFUL_SUCCESS_CHECK = True
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
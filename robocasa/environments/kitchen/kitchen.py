@@ -1,7 +1,9 @@
 import os
+import time
 import xml.etree.ElementTree as ET
 from copy import deepcopy
 
+import mujoco
 import numpy as np
 import robosuite.utils.transform_utils as T
 from robosuite.environments.manipulation.manipulation_env import ManipulationEnv
@@ -11,6 +13,7 @@ from robosuite.utils.mjcf_utils import (
     find_elements,
 )
 from robosuite.models.robots.robot_model import REGISTERED_ROBOTS
+from robosuite.utils.binding_utils import MjSim
 from robosuite.utils.observables import Observable, sensor
 from robosuite.environments.base import EnvMeta
 from collections import defaultdict
@@ -19,10 +22,16 @@ from robosuite.models.robots import PandaOmron
 
 import robocasa
 import robocasa.macros as macros
+import robocasa.utils.asset_cache as AssetCache
 import robocasa.utils.camera_utils as CamUtils
 import robocasa.utils.env_utils as EnvUtils
 import robocasa.utils.object_utils as OU
+import robocasa.utils.scene_cache as SceneCache
 import robocasa.models.scenes.scene_registry as SceneRegistry
+from robocasa.environments.registry import (
+    KITCHEN_TASK_MODULES,
+    UNREGISTERED_KITCHEN_ENVS,
+)
 from robocasa.models.scenes import KitchenArena
 from robocasa.models.fixtures import *
 import robocasa.models.fixtures.fixture_utils as FixtureUtils
@@ -31,13 +40,14 @@ from robocasa.models.objects.kitchen_object_utils import (
 )
 from robocasa.utils.texture_swap import (
     get_random_textures,
-    replace_cab_textures,
-    replace_counter_top_texture,
-    replace_floor_texture,
-    replace_wall_texture,
+    replace_textures_in_tree,
 )
 from robocasa.utils.config_utils import refactor_composite_controller_config
+from robocasa.utils.asset_cost_index import get_asset_cost_index
+from robocasa.utils.contact_index import ContactIndex
 from robocasa.utils.errors import PlacementError
+from robocasa.utils.fixture_index import FixtureIndex
+from robocasa.utils.reset_profiler import ResetProfiler
 from robocasa.models.objects.kitchen_objects import OBJ_GROUPS, OBJ_CATEGORIES
 from robocasa.models.fixtures.fixture_utils import fixture_is_type
 from robocasa.models.fixtures import FixtureType
@@ -52,10 +62,13 @@ SLIDING_INTERIOR_FIXTURES = [
     FixtureType.TOASTER_OVEN,
     FixtureType.FRIDGE,
 ]
+# stages of scene placement, as reported in Kitchen.placement_stats
+PLACEMENT_STAGES = ("scene", "fixture_pairs", "fixtures", "objects", "robot")
 
 
 def register_kitchen_env(target_class):
     REGISTERED_KITCHEN_ENVS[target_class.__name__] = target_class
+    KITCHEN_TASK_MODULES[target_class.__name__] = target_class.__module__
 
 
 class KitchenEnvMeta(EnvMeta):
@@ -63,13 +76,7 @@ class KitchenEnvMeta(EnvMeta):
 
     def __new__(meta, name, bases, class_dict):
         cls = super().__new__(meta, name, bases, class_dict)
-        if cls.__name__ not in [
-            "MG_Robocasa_Env",
-            "PickPlace",
-            "ManipulateDoor",
-            "OpenDoor",
-            "CloseDoor",
-        ]:
+        if cls.__name__ not in UNREGISTERED_KITCHEN_ENVS:
             register_kitchen_env(cls)
         return cls
 
@@ -207,12 +214,21 @@ class Kitchen(ManipulationEnv, metaclass=KitchenEnvMeta):
             wrist and agentview cameras
 
         clutter_mode (int): sets clutter level. default is 0.
+
+        asset_cost_budget (float): if set, per-episode budget (in seconds, see robocasa/utils/asset_cost_index.py)
+            for the cost of fixture and object assets. Fixtures are charged first; objects are then sampled among
+            those that fit in the remaining budget. Episodes for a given seed differ from episodes sampled without a
+            budget only if the budget excludes some of the candidate assets
     """
 
     EXCLUDE_LAYOUTS = []
 
     EXCLUDE_STYLES = []
 
+    # set by tasks whose _check_success updates task state (eg. timers counting steps in contact), so that
+    # check_success evaluates it on every call instead of once per simulation state
+    STATEFUL_SUCCESS_CHECK = False
+
     PROBLEMATIC_BLENDER_LID_STYLES = [
         13,
         29,
@@ -409,6 +425,7 @@ class Kitchen(ManipulationEnv, metaclass=KitchenEnvMeta):
         update_fxtr_cfg_dict=None,
         use_cotraining_cameras=False,
         use_novel_instructions=False,
+        asset_cost_budget=None,
     ):
         self.init_robot_base_ref = init_robot_base_ref
 
@@ -495,11 +512,17 @@ class Kitchen(ManipulationEnv, metaclass=KitchenEnvMeta):
         # self._reset_internal_end_callbacks.append(lambda: EnvUtils.set_robot_state(self))
 
         self.use_novel_instructions = use_novel_instructions
+        self.asset_cost_budget = asset_cost_budget
+        # cost of the assets of the current episode
+        self.asset_cost = 0.0
         if self.use_novel_instructions:
             self._load_novel_instructions()
         else:
             self.novel_instructions = None
 
+        # time spent per phase of each reset (see get_reset_profile)
+        self.reset_profiler = ResetProfiler()
+
         super().__init__(
             robots=robots,
             env_configuration=env_configuration,
@@ -608,14 +631,17 @@ class Kitchen(ManipulationEnv, metaclass=KitchenEnvMeta):
         self._curr_gen_fixtures = self._ep_meta.get("gen_textures")
 
         # setup scene
-        self.mujoco_arena = KitchenArena(
-            layout_id=self.layout_id,
-            style_id=self.style_id,
-            rng=self.rng,
-            enable_fixtures=self.enable_fixtures,
-            clutter_mode=self.clutter_mode,
-            update_fxtr_cfg_dict=self.update_fxtr_cfg_dict,
-        )
+        with self.reset_profiler.phase("arena"):
+            self.mujoco_arena = KitchenArena(
+                layout_id=self.layout_id,
+                style_id=self.style_id,
+                rng=self.rng,
+                enable_fixtures=self.enable_fixtures,
+                clutter_mode=self.clutter_mode,
+                update_fxtr_cfg_dict=self.update_fxtr_cfg_dict,
+                cost_budget=self.asset_cost_budget,
+            )
+        self.asset_cost = self.mujoco_arena.asset_cost
         # Arena always gets set to zero origin
         self.mujoco_arena.set_origin([0, 0, 0])
         CamUtils.set_cameras(self)  # setup cameras
@@ -630,6 +656,7 @@ class Kitchen(ManipulationEnv, metaclass=KitchenEnvMeta):
         # setup fixtures
         self.fixture_cfgs = self.mujoco_arena.get_fixture_cfgs()
         self.fixtures = {cfg["name"]: cfg["model"] for cfg in self.fixture_cfgs}
+        self._fixture_index = None
 
         # setup scene, robots, objects
         self.model = ManipulationTask(
@@ -642,13 +669,36 @@ class Kitchen(ManipulationEnv, metaclass=KitchenEnvMeta):
 
     def _load_model(self, attempt_num=1):
         """
-        Loads an xml model, puts it in self.model
+        Loads an xml model, puts it in self.model. See _load_model_attempt
+        """
+        with self.reset_profiler.phase("load_model"):
+            self._load_model_attempt(attempt_num=attempt_num)
+
+    def _load_model_attempt(self, attempt_num=1):
+        """
+        Builds the scene and places fixtures, objects and the robot. Failed attempts rebuild the scene by
+        calling _load_model again (so that subclasses can set up their own model on every attempt)
+
+        Placement happens in stages (fixture pairs, remaining fixtures, objects). A failing stage is first resampled
+        on the already built scene, up to macros.LOAD_MODEL_STAGE_ATTEMPTS times, and the whole scene is only rebuilt
+        once that budget is exhausted. Attempt counts and time spent per stage are stored in self.placement_stats
         """
         if attempt_num >= 50:
             raise RuntimeError(
                 "Ran _load_model() 50 times but could not initialize task!"
             )
+        if attempt_num == 1:
+            self.placement_stats = dict(
+                num_rebuilds=0,
+                stages={
+                    stage: dict(attempts=0, failures=0, time=0.0)
+                    for stage in PLACEMENT_STAGES
+                },
+            )
+        else:
+            self.placement_stats["num_rebuilds"] += 1
 
+        t_start = time.perf_counter()
         super()._load_model()
 
         self._setup_model()
@@ -659,9 +709,140 @@ class Kitchen(ManipulationEnv, metaclass=KitchenEnvMeta):
                 if init_fixture is not None:
                     break
                 self._setup_model()
+        self._record_placement_stage("scene", True, time.perf_counter() - t_start)
+
+        scene_cache_key = None
+        cached_placements = None
+        if SceneCache.scene_cache_enabled():
+            scene_cache_key = SceneCache.get_scene_cache_key(self)
+            cached_placements = SceneCache.load_fixture_placements(
+                scene_cache_key, self.fixtures, rng=self.rng
+            )
 
-        MAX_FIXTURE_PLACEMENT_ATTEMPTS = 3
-        self.fxtr_placements = {}
+        if cached_placements is not None:
+            self.fxtr_placements = cached_placements
+        else:
+            if not self._sample_fixture_placements():
+                if macros.VERBOSE:
+                    print(
+                        "Could not place fixtures. Trying again with self._load_model()"
+                    )
+                self._destroy_sim()
+                self._load_model(attempt_num=attempt_num + 1)
+                return
+            if scene_cache_key is not None:
+                SceneCache.store_fixture_placements(
+                    scene_cache_key, self.fxtr_placements, rng=self.rng
+                )
+
+        # apply placements
+        for obj_pos, obj_quat, obj in self.fxtr_placements.values():
+            assert isinstance(obj, Fixture)
+            obj.set_pos(obj_pos)
+            # hacky code to set orientation
+            obj.set_euler(T.mat2euler(T.quat2mat(T.convert_quat(obj_quat, "xyzw"))))
+        # fixtures moved, so the spatial index needs to be rebuilt
+        self._fixture_index = None
+
+        # setup internal references related to fixtures
+        self._setup_kitchen_references()
+
+        # create and place objects
+        with self.reset_profiler.phase("create_objects"):
+            self._create_objects()
+
+        # setup object locations
+        t_start = time.perf_counter()
+        try:
+            with self.reset_profiler.phase("placement_initializer"):
+                self.placement_initializer = EnvUtils._get_placement_initializer(
+                    self, self.object_cfgs
+                )
+        except PlacementError as e:
+            self._record_placement_stage(
+                "objects", False, time.perf_counter() - t_start
+            )
+            if macros.VERBOSE:
+                print(
+                    "Could not create placement initializer for objects. Trying again with self._load_model()"
+                )
+            if scene_cache_key is not None:
+                SceneCache.evict_fixture_placements(scene_cache_key)
+            self._destroy_sim()
+            self._load_model(attempt_num=attempt_num + 1)
+            return
+        object_placements = None
+        for attempt in range(macros.LOAD_MODEL_STAGE_ATTEMPTS):
+            t_start = time.perf_counter()
+            try:
+                object_placements = self.placement_initializer.sample(
+                    placed_objects=self.fxtr_placements
+                )
+            except PlacementError as e:
+                self._record_placement_stage(
+                    "objects", False, time.perf_counter() - t_start
+                )
+                if macros.VERBOSE:
+                    print("Placement error for objects")
+                continue
+            self._record_placement_stage("objects", True, time.perf_counter() - t_start)
+            break
+        if object_placements is None:
+            if macros.VERBOSE:
+                print("Could not place objects. Trying again with self._load_model()")
+            if scene_cache_key is not None:
+                SceneCache.evict_fixture_placements(scene_cache_key)
+            self._destroy_sim()
+            self._load_model(attempt_num=attempt_num + 1)
+            return
+
+        self.object_placements = object_placements
+
+        (
+            self.init_robot_base_pos_anchor,
+            self.init_robot_base_ori_anchor,
+        ) = EnvUtils.init_robot_base_pose(self)
+
+        robot_model = self.robots[0].robot_model
+        # set the robot way out of the scene at the start, it will be placed correctly later
+        robot_model.set_base_xpos([10.0, 10.0, self.init_robot_base_pos_anchor[2]])
+        robot_model.set_base_ori(self.init_robot_base_ori_anchor)
+
+        self.robot_geom_ids = None
+        # candidates, simulator checks and rings used to spawn the robot (see EnvUtils.set_robot_base)
+        self.robot_spawn_stats = None
+
+    def _record_placement_stage(self, stage, success, duration, num_attempts=1):
+        """
+        Adds attempts of a placement stage to self.placement_stats
+
+        Args:
+            stage (str): one of PLACEMENT_STAGES
+
+            success (bool): whether the last attempt succeeded
+
+            duration (float): time spent on the attempts, in seconds
+
+            num_attempts (int): number of attempts made
+        """
+        stage_stats = self.placement_stats["stages"][stage]
+        stage_stats["attempts"] += num_attempts
+        stage_stats["failures"] += num_attempts - int(success)
+        stage_stats["time"] += duration
+        self.reset_profiler.record(
+            "placement_{}".format(stage), duration, num_calls=num_attempts
+        )
+
+    def _sample_fixture_placements(self):
+        """
+        Samples placements for all fixtures in the scene and stores them in self.fxtr_placements.
+        Fixture pairs are placed first, then all other fixtures. If the other fixtures cannot be placed, they are
+        resampled around the same fixture pair placements, and the fixture pairs are only resampled once that budget
+        is exhausted (up to macros.LOAD_MODEL_STAGE_ATTEMPTS times per stage)
+
+        Returns:
+            bool: True if all fixtures were placed successfully
+        """
 
         """
         step 1: identify all fixtures that involve auxiliary items
@@ -706,6 +887,43 @@ class Kitchen(ManipulationEnv, metaclass=KitchenEnvMeta):
             if v in self.fixtures
         }
 
+        num_pair_attempts = macros.LOAD_MODEL_STAGE_ATTEMPTS if paired_fixtures else 1
+        for _ in range(num_pair_attempts):
+            self.fxtr_placements = {}
+            t_start = time.perf_counter()
+            success = self._sample_fixture_pair_placements(paired_fixtures)
+            self._record_placement_stage(
+                "fixture_pairs", success, time.perf_counter() - t_start
+            )
+            if not success:
+                continue
+
+            # resample the other fixtures around the same fixture pair placements
+            pair_placements = dict(self.fxtr_placements)
+            for _ in range(macros.LOAD_MODEL_STAGE_ATTEMPTS):
+                self.fxtr_placements = dict(pair_placements)
+                t_start = time.perf_counter()
+                success = self._sample_single_fixture_placements(paired_names)
+                self._record_placement_stage(
+                    "fixtures", success, time.perf_counter() - t_start
+                )
+                if success:
+                    return True
+
+        return False
+
+    def _sample_fixture_pair_placements(self, paired_fixtures):
+        """
+        Samples placements for all base-auxiliary fixture pairs and adds them to self.fxtr_placements
+
+        Args:
+            paired_fixtures (dict): base and auxiliary fixture names of each pair
+
+        Returns:
+            bool: True if all fixture pairs were placed successfully
+        """
+        MAX_FIXTURE_PLACEMENT_ATTEMPTS = 3
+
         # sample aux fixture pairs first
         for _, pair in paired_fixtures.items():
             base_name = pair.get("base")
@@ -743,17 +961,23 @@ class Kitchen(ManipulationEnv, metaclass=KitchenEnvMeta):
 
             if not success:
                 if macros.VERBOSE:
-                    print(
-                        f"Could not place {fxtr_name}. Trying again with self._load_model()"
-                    )
-                self._destroy_sim()
-                self._load_model(attempt_num=attempt_num + 1)
-                return
+                    print(f"Could not place {base_name}. Resampling fixture pairs")
+                return False
+
+        return True
 
+    def _sample_single_fixture_placements(self, paired_names):
         """
-        step 2: placement logic for all other fixtures
+        Samples placements for all fixtures that are not part of a fixture pair and adds them to self.fxtr_placements
+
+        Args:
+            paired_names (set): names of the fixtures that are part of a fixture pair
 
+        Returns:
+            bool: True if all fixtures were placed successfully
         """
+        MAX_FIXTURE_PLACEMENT_ATTEMPTS = 3
+
         for fxtr_obj in self.fixtures.values():
 
             fxtr_name = fxtr_obj.name
@@ -779,70 +1003,10 @@ class Kitchen(ManipulationEnv, metaclass=KitchenEnvMeta):
 
             if not success:
                 if macros.VERBOSE:
-                    print(
-                        f"Could not place {fxtr_name}. Trying again with self._load_model()"
-                    )
-                self._destroy_sim()
-                self._load_model(attempt_num=attempt_num + 1)
-                return
+                    print(f"Could not place {fxtr_name}. Resampling fixtures")
+                return False
 
-        # apply placements
-        for obj_pos, obj_quat, obj in self.fxtr_placements.values():
-            assert isinstance(obj, Fixture)
-            obj.set_pos(obj_pos)
-            # hacky code to set orientation
-            obj.set_euler(T.mat2euler(T.quat2mat(T.convert_quat(obj_quat, "xyzw"))))
-
-        # setup internal references related to fixtures
-        self._setup_kitchen_references()
-
-        # create and place objects
-        self._create_objects()
-
-        # setup object locations
-        try:
-            self.placement_initializer = EnvUtils._get_placement_initializer(
-                self, self.object_cfgs
-            )
-        except PlacementError as e:
-            if macros.VERBOSE:
-                print(
-                    "Could not create placement initializer for objects. Trying again with self._load_model()"
-                )
-            self._destroy_sim()
-            self._load_model(attempt_num=attempt_num + 1)
-            return
-        object_placements = None
-        for attempt in range(1):
-            try:
-                object_placements = self.placement_initializer.sample(
-                    placed_objects=self.fxtr_placements
-                )
-            except PlacementError as e:
-                if macros.VERBOSE:
-                    print("Placement error for objects")
-                continue
-            break
-        if object_placements is None:
-            if macros.VERBOSE:
-                print("Could not place objects. Trying again with self._load_model()")
-            self._destroy_sim()
-            self._load_model(attempt_num=attempt_num + 1)
-            return
-
-        self.object_placements = object_placements
-
-        (
-            self.init_robot_base_pos_anchor,
-            self.init_robot_base_ori_anchor,
-        ) = EnvUtils.init_robot_base_pose(self)
-
-        robot_model = self.robots[0].robot_model
-        # set the robot way out of the scene at the start, it will be placed correctly later
-        robot_model.set_base_xpos([10.0, 10.0, self.init_robot_base_pos_anchor[2]])
-        robot_model.set_base_ori(self.init_robot_base_ori_anchor)
-
-        self.robot_geom_ids = None
+        return True
 
     def _create_objects(self):
         """
@@ -1098,6 +1262,9 @@ class Kitchen(ManipulationEnv, metaclass=KitchenEnvMeta):
         """
         super()._reset_internal()
 
+        # results of success checks are only valid within an episode
+        self._success_cache_key = None
+
         # set up the scene (fixtures, variables, etc)
         self._setup_scene()
 
@@ -1121,6 +1288,7 @@ class Kitchen(ManipulationEnv, metaclass=KitchenEnvMeta):
             EnvUtils.set_robot_to_position(self, self.init_robot_base_pos)
             self.sim.forward()
         else:
+            t_start = time.perf_counter()
             robot_pos = EnvUtils.set_robot_base(
                 env=self,
                 anchor_pos=self.init_robot_base_pos_anchor,
@@ -1131,6 +1299,14 @@ class Kitchen(ManipulationEnv, metaclass=KitchenEnvMeta):
             )
             self.init_robot_base_pos = robot_pos
             self.init_robot_base_ori = self.init_robot_base_ori_anchor
+            if getattr(self, "placement_stats", None) is not None:
+                # every robot position candidate counts as one attempt
+                self._record_placement_stage(
+                    "robot",
+                    True,
+                    time.perf_counter() - t_start,
+                    num_attempts=self.robot_spawn_stats["num_candidates"],
+                )
 
         # step through a few timesteps to settle objects
         action = np.zeros(self.action_spec[0].shape)  # apply empty action
@@ -1143,11 +1319,66 @@ class Kitchen(ManipulationEnv, metaclass=KitchenEnvMeta):
 
         # Loop through the simulation at the model timestep rate until we're ready to take the next policy step
         # (as defined by the control frequency specified at the environment level)
-        for i in range(10 * int(self.control_timestep / self.model_timestep)):
-            self.sim.step1()
-            self._pre_action(action, policy_step)
-            self.sim.step2()
-            policy_step = False
+        with self.reset_profiler.phase("settle"):
+            substeps_per_control_step = int(self.control_timestep / self.model_timestep)
+            adaptive = macros.SETTLE_MODE == "adaptive"
+            if adaptive:
+                num_control_steps = macros.SETTLE_MAX_CONTROL_STEPS
+            else:
+                num_control_steps = macros.SETTLE_FIXED_CONTROL_STEPS
+            num_substeps = 0
+            num_calm_checks = 0
+            for i in range(num_control_steps * substeps_per_control_step):
+                self.sim.step1()
+                self._pre_action(action, policy_step)
+                self.sim.step2()
+                policy_step = False
+                num_substeps += 1
+
+                # check velocities at the end of every control step
+                if adaptive and num_substeps % substeps_per_control_step == 0:
+                    num_calm_checks = (
+                        num_calm_checks + 1 if self._free_bodies_at_rest() else 0
+                    )
+                    if num_calm_checks == 2:
+                        break
+
+            self.settle_stats = dict(
+                mode=macros.SETTLE_MODE,
+                num_substeps=num_substeps,
+                at_rest=(num_calm_checks == 2) if adaptive else None,
+            )
+
+    def _free_bodies_at_rest(self):
+        """
+        Checks whether all free bodies (objects) are at rest, as defined by macros.SETTLE_LIN_VEL_THRESHOLD and
+        macros.SETTLE_ANG_VEL_THRESHOLD
+
+        Returns:
+            bool: True if the linear and angular velocities of all free joints are below the thresholds
+        """
+        model = self.sim.model
+        # dof addresses of the free joints, bound once per simulation model
+        if getattr(self, "_free_joint_dofs", (None,))[0] is not model:
+            free_joints = np.flatnonzero(model.jnt_type == mujoco.mjtJoint.mjJNT_FREE)
+            dof_adr = model.jnt_dofadr[free_joints]
+            self._free_joint_dofs = (
+                model,
+                dof_adr[:, None] + np.arange(3),
+                dof_adr[:, None] + np.arange(3, 6),
+            )
+        (_, lin_dofs, ang_dofs) = self._free_joint_dofs
+        qvel = self.sim.data.qvel
+        return bool(
+            np.all(
+                np.linalg.norm(qvel[lin_dofs], axis=-1)
+                < macros.SETTLE_LIN_VEL_THRESHOLD
+            )
+            and np.all(
+                np.linalg.norm(qvel[ang_dofs], axis=-1)
+                < macros.SETTLE_ANG_VEL_THRESHOLD
+            )
+        )
 
     def _setup_scene(self):
         pass
@@ -1224,6 +1455,7 @@ class Kitchen(ManipulationEnv, metaclass=KitchenEnvMeta):
         Returns:
             str: Post-processed xml file as string
         """
+        t_start = time.perf_counter()
         xml_str = super().edit_model_xml(xml_str)
 
         tree = ET.fromstring(xml_str)
@@ -1308,9 +1540,6 @@ class Kitchen(ManipulationEnv, metaclass=KitchenEnvMeta):
             for (k, v) in cam_config.get("camera_attribs", {}).items():
                 cam.set(k, v)
 
-        # result = ET.tostring(root, encoding="utf8").decode("utf8")
-        result = ET.tostring(root).decode("utf8")
-
         # replace with generative textures
         if (self.generative_textures is not None) and (
             self.generative_textures is not False
@@ -1320,26 +1549,83 @@ class Kitchen(ManipulationEnv, metaclass=KitchenEnvMeta):
             if self._curr_gen_fixtures is None or self._curr_gen_fixtures == {}:
                 self._curr_gen_fixtures = get_random_textures(self.rng)
 
-            cab_tex = self._curr_gen_fixtures["cab_tex"]
-            counter_tex = self._curr_gen_fixtures["counter_tex"]
-            wall_tex = self._curr_gen_fixtures["wall_tex"]
-            floor_tex = self._curr_gen_fixtures["floor_tex"]
+            # apply all replacements to the already parsed tree
+            with self.reset_profiler.phase("texture_swap"):
+                replace_textures_in_tree(
+                    root,
+                    cab_tex=self._curr_gen_fixtures["cab_tex"],
+                    counter_tex=self._curr_gen_fixtures["counter_tex"],
+                    wall_tex=self._curr_gen_fixtures["wall_tex"],
+                    floor_tex=self._curr_gen_fixtures["floor_tex"],
+                )
 
-            result = replace_cab_textures(
-                self.rng, result, new_cab_texture_file=cab_tex
-            )
-            result = replace_counter_top_texture(
-                self.rng, result, new_counter_top_texture_file=counter_tex
-            )
-            result = replace_wall_texture(
-                self.rng, result, new_wall_texture_file=wall_tex
-            )
-            result = replace_floor_texture(
-                self.rng, result, new_floor_texture_file=floor_tex
-            )
+        # result = ET.tostring(root, encoding="utf8").decode("utf8")
+        result = ET.tostring(root).decode("utf8")
 
+        self.reset_profiler.record("edit_model_xml", time.perf_counter() - t_start)
         return result
 
+    def _initialize_sim(self, xml_string=None):
+        """
+        Creates the simulation, recording the time spent compiling the model in the reset profile.
+        Same as robosuite's _initialize_sim, except that asset files are read through the in-memory asset cache
+        when it is enabled (see robocasa/utils/asset_cache.py)
+
+        Args:
+            xml_string (str): If specified, creates MjSim object from this filepath
+        """
+        xml = xml_string if xml_string else self.model.get_xml()
+
+        # process the xml before initializing sim. xml processors (edit_model_xml) are recorded separately
+        for processor in self._xml_processors:
+            xml = processor(xml)
+
+        with self.reset_profiler.phase("compile"):
+            self.sim = MjSim(AssetCache.compile_model(xml))
+            self.sim.forward()
+
+        self.initialize_time(self.control_freq)
+
+    def reset(self):
+        """
+        Resets the environment, and finalizes the reset profile (see get_reset_profile)
+
+        Returns:
+            OrderedDict: Environment observation space after reset occurs
+        """
+        t_start = time.perf_counter()
+        observations = super().reset()
+        style_id = getattr(self, "style_id", None)
+        info = dict(
+            env_name=type(self).__name__,
+            layout_id=getattr(self, "layout_id", None),
+            style_id="custom" if isinstance(style_id, dict) else style_id,
+        )
+        if self.reset_profiler.has_phase("load_model"):
+            info["num_rebuilds"] = self.placement_stats["num_rebuilds"]
+        if getattr(self, "settle_stats", None) is not None:
+            info["settle_substeps"] = self.settle_stats["num_substeps"]
+        self.reset_profiler.finalize(
+            time.perf_counter() - t_start, path=macros.RESET_PROFILE_PATH, **info
+        )
+        return observations
+
+    def get_reset_profile(self):
+        """
+        Get the profile of the last reset: wall time and number of calls (or attempts) of each phase.
+        Phases include building the arena, fixture and object placement stages (placement_*), creating objects,
+        edit_model_xml and texture swaps, compiling the model, spawning the robot and settling objects.
+        Phases may be nested (eg. load_model contains arena and the placement phases). Phases that ran before
+        the reset (eg. the compile step of reset_from_xml_string) are included
+
+        Returns:
+            dict: profile with env_name, layout_id, style_id, total_time (seconds) and phases (phase name ->
+                dict with time and calls). num_rebuilds is included if the scene was rebuilt during the reset,
+                and settle_substeps holds the number of physics sub-steps used to settle objects (see
+                macros.SETTLE_MODE). None if the environment has not been reset yet
+        """
+        return self.reset_profiler.last_profile
+
     def _setup_references(self):
         """
         Sets up references to important components. A reference is typically an
@@ -1495,12 +1781,32 @@ class Kitchen(ManipulationEnv, metaclass=KitchenEnvMeta):
     def update_state(self):
         """
         Updates the state of the environment.
-        This involves updating the state of all fixtures in the environment.
+        This involves updating the state of all fixtures with dynamic state in the environment.
         """
         super().update_state()
 
-        for fixtr in self.fixtures.values():
+        # only a change of fixture state invalidates the memoized success check, so that success queries
+        # after the step reuse the evaluation made for the reward
+        fixtures = self.fixture_index.get_dynamic_fixtures()
+        state_before = self._get_fixture_state_fingerprint(fixtures)
+        for fixtr in fixtures:
             fixtr.update_state(self)
+        if self._get_fixture_state_fingerprint(fixtures) != state_before:
+            self._fixture_state_version = getattr(self, "_fixture_state_version", 0) + 1
+
+    def _get_fixture_state_fingerprint(self, fixtures):
+        """
+        Args:
+            fixtures (list): fixtures with dynamic state
+
+        Returns:
+            list: fingerprints of the fixture states and of the site appearance that fixtures update
+                (eg. stove flames, sink water)
+        """
+        fingerprint = [fixtr.get_state_fingerprint() for fixtr in fixtures]
+        fingerprint.append(self.sim.model.site_rgba.tobytes())
+        fingerprint.append(self.sim.model.site_size.tobytes())
+        return fingerprint
 
     def visualize(self, vis_settings):
         """
@@ -1536,9 +1842,39 @@ class Kitchen(ManipulationEnv, metaclass=KitchenEnvMeta):
         Returns:
             float: Reward for the task
         """
-        reward = float(self._check_success())
+        reward = float(self.check_success())
         return reward
 
+    def _get_success_cache_key(self):
+        """
+        Returns:
+            tuple: key identifying the current simulation state and fixture states
+        """
+        return (
+            self.sim.data.time,
+            self.sim.data.qpos.tobytes(),
+            self.sim.data.qvel.tobytes(),
+            getattr(self, "_fixture_state_version", 0),
+        )
+
+    def check_success(self):
+        """
+        Memoized version of _check_success. Success is evaluated once per simulation state, so that
+        the reward, wrappers and scripts can all query it within the same step at no extra cost. The fixture
+        state update after the reward only invalidates the result if it changes a fixture state. Tasks with
+        STATEFUL_SUCCESS_CHECK are evaluated on every call, as their result depends on past calls
+
+        Returns:
+            bool or dict: result of _check_success for the current state
+        """
+        if self.STATEFUL_SUCCESS_CHECK:
+            return self._check_success()
+        key = self._get_success_cache_key()
+        if getattr(self, "_success_cache_key", None) != key:
+            self._success_cache = self._check_success()
+            self._success_cache_key = key
+        return self._success_cache
+
     def _check_success(self):
         """
         Checks if the task has been successfully completed.
@@ -1607,7 +1943,10 @@ class Kitchen(ManipulationEnv, metaclass=KitchenEnvMeta):
             dict: info about the sampled object - the path of the mjcf, groups which the object's category belongs to,
             the category of the object the sampling split the object came from, and the groups the object was sampled from
         """
-        return sample_kitchen_object(
+        cost_budget = None
+        if self.asset_cost_budget is not None:
+            cost_budget = self.asset_cost_budget - self.asset_cost
+        mjcf_kwargs, info = sample_kitchen_object(
             groups,
             exclude_groups=exclude_groups,
             graspable=graspable,
@@ -1623,7 +1962,10 @@ class Kitchen(ManipulationEnv, metaclass=KitchenEnvMeta):
             max_size=max_size,
             object_scale=object_scale,
             rotate_upright=rotate_upright,
+            cost_budget=cost_budget,
         )
+        self.asset_cost += get_asset_cost_index().get_cost(info["mjcf_path"])
+        return mjcf_kwargs, info
 
     def get_fixture(
         self,
@@ -1656,24 +1998,21 @@ class Kitchen(ManipulationEnv, metaclass=KitchenEnvMeta):
         elif id in self.fixtures.keys():
             return self.fixtures[id]
 
+        fixture_index = self.fixture_index
         if ref is None:
             # find all fixtures with names containing given name
             if isinstance(id, FixtureType) or isinstance(id, int):
-                matches = [
-                    name
-                    for (name, fxtr) in self.fixtures.items()
-                    if fixture_is_type(fxtr, id)
-                ]
+                matches = fixture_index.get_names_of_type(id)
             else:
                 if full_name_check:
                     matches = [name for name in self.fixtures.keys() if name == id]
                 else:
-                    matches = [name for name in self.fixtures.keys() if id in name]
+                    matches = fixture_index.get_names_containing(id)
             if id == FixtureType.COUNTER or id == FixtureType.COUNTER_NON_CORNER:
                 matches = [
                     name
                     for name in matches
-                    if FixtureUtils.is_fxtr_valid(self, self.fixtures[name], size)
+                    if fixture_index.is_valid_counter(name, size)
                 ]
 
             if (
@@ -1713,13 +2052,12 @@ class Kitchen(ManipulationEnv, metaclass=KitchenEnvMeta):
 
             assert isinstance(id, FixtureType)
             cand_fixtures = []
-            for fxtr in self.fixtures.values():
-                if not fixture_is_type(fxtr, id):
-                    continue
+            for name in fixture_index.get_names_of_type(id):
+                fxtr = self.fixtures[name]
                 if fxtr is ref_fixture:
                     continue
                 if id == FixtureType.COUNTER:
-                    fxtr_is_valid = FixtureUtils.is_fxtr_valid(self, fxtr, size)
+                    fxtr_is_valid = fixture_index.is_valid_counter(name, size)
                     if not fxtr_is_valid:
                         continue
                 cand_fixtures.append(fxtr)
@@ -1728,14 +2066,12 @@ class Kitchen(ManipulationEnv, metaclass=KitchenEnvMeta):
                 return cand_fixtures
             else:
                 # first, try to find fixture "containing" the reference fixture
+                containing = fixture_index.get_fixtures_at_point(ref_fixture.pos)
                 for fxtr in cand_fixtures:
-                    if OU.point_in_fixture(ref_fixture.pos, fxtr, only_2d=True):
+                    if any(fxtr is c for c in containing):
                         return fxtr
                 # if no fixture contains reference fixture, sample all close fixtures
-                dists = [
-                    OU.fixture_pairwise_dist(ref_fixture, fxtr)
-                    for fxtr in cand_fixtures
-                ]
+                dists = fixture_index.get_pairwise_dists(ref_fixture, cand_fixtures)
                 min_dist = np.min(dists)
                 close_fixtures = [
                     fxtr
@@ -1744,6 +2080,56 @@ class Kitchen(ManipulationEnv, metaclass=KitchenEnvMeta):
                 ]
                 return self.rng.choice(close_fixtures)
 
+    @property
+    def fixture_index(self):
+        """
+        Index of the fixtures of the current scene, used to speed up fixture lookups.
+        Rebuilt whenever the fixtures are created or placed
+
+        Returns:
+            FixtureIndex: fixture index
+        """
+        if (
+            getattr(self, "_fixture_index", None) is None
+            or self._fixture_index.fixtures is not self.fixtures
+        ):
+            self._fixture_index = FixtureIndex(self)
+        return self._fixture_index
+
+    @property
+    def contact_index(self):
+        """
+        Index of the geom groups of the current simulation, used to speed up contact queries.
+        Rebuilt whenever the simulation is recreated
+
+        Returns:
+            ContactIndex: contact index
+        """
+        if (
+            getattr(self, "_contact_index", None) is None
+            or self._contact_index.sim is not self.sim
+            or self._contact_index.model is not self.sim.model
+        ):
+            self._contact_index = ContactIndex(self.sim)
+        return self._contact_index
+
+    def check_contact(self, geoms_1, geoms_2=None):
+        """
+        Finds contact between two geom groups. Same as MujocoEnv.check_contact, but answered through the
+        contact index, and @geoms_1 and @geoms_2 may also be lists of models
+
+        Args:
+            geoms_1 (str or list or MujocoModel): an individual geom name, a list of geom names and/or models,
+                or a model. The geoms checked for a model are its contact_geoms
+
+            geoms_2 (str or list or MujocoModel or None): another geom group. If None, will check any
+                collision with @geoms_1 to any other geom in the environment
+
+        Returns:
+            bool: True if any geom in @geoms_1 is in contact with any geom in @geoms_2
+        """
+        return self.contact_index.check_contact(geoms_1, geoms_2)
+
     def register_fixture_ref(self, ref_name, fn_kwargs):
         """
         Registers a fixture reference for later use. Initializes the fixture
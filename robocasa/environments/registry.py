@@ -0,0 +1,101 @@
+"""
+Lazy registry of kitchen tasks.
+
+Task modules are only imported once a task is actually used. Until then, each task is registered with
+robosuite through a lightweight placeholder, so that robosuite.make("TaskName") imports the defining
+module on demand (which in turn registers the actual task class). The mapping of task names to modules
+is read from the generated manifest in robocasa/environments/task_manifest.py.
+"""
+
+import importlib
+
+from robocasa.environments.task_manifest import KITCHEN_TASK_MANIFEST
+
+# kitchen classes that are not registered as standalone environments
+UNREGISTERED_KITCHEN_ENVS = (
+    "MG_Robocasa_Env",
+    "PickPlace",
+    "ManipulateDoor",
+    "OpenDoor",
+    "CloseDoor",
+)
+
+# task name to defining module, for all registered kitchen tasks (whether imported yet or not).
+# tasks defined outside of the manifest are added here as they are registered
+KITCHEN_TASK_MODULES = {
+    name: module
+    for (name, module) in KITCHEN_TASK_MANIFEST.items()
+    if name not in UNREGISTERED_KITCHEN_ENVS
+}
+
+
+class LazyKitchenEnv:
+    """
+    Placeholder registered with robosuite for a kitchen task whose module has not been imported yet.
+    Calling it imports the task class and instantiates it.
+
+    Args:
+        env_name (str): name of the kitchen task
+    """
+
+    def __init__(self, env_name):
+        self.env_name = env_name
+        self.__name__ = env_name
+
+    def __call__(self, *args, **kwargs):
+        return get_kitchen_env_class(self.env_name)(*args, **kwargs)
+
+    def __repr__(self):
+        return "LazyKitchenEnv({})".format(self.env_name)
+
+
+def get_kitchen_env_class(env_name):
+    """
+    Get the class of a kitchen task, importing its module if needed
+
+    Args:
+        env_name (str): name of the kitchen task (or of any class in the task manifest)
+
+    Returns:
+        type: task class
+    """
+    module = KITCHEN_TASK_MODULES.get(env_name, KITCHEN_TASK_MANIFEST.get(env_name))
+    if module is None:
+        raise KeyError("Unknown kitchen environment: {}".format(env_name))
+    return getattr(importlib.import_module(module), env_name)
+
+
+def import_all_kitchen_envs():
+    """
+    Eagerly imports all kitchen task modules. Useful to pay the import cost up front (eg. before forking workers)
+    """
+    for module in sorted(set(KITCHEN_TASK_MANIFEST.values())):
+        importlib.import_module(module)
+
+
+def register_lazy_kitchen_envs():
+    """
+    Registers a LazyKitchenEnv placeholder with robosuite for every kitchen task that has not been imported yet
+    """
+    from robosuite.environments.base import REGISTERED_ENVS
+
+    for env_name in KITCHEN_TASK_MODULES:
+        if env_name not in REGISTERED_ENVS:
+            REGISTERED_ENVS[env_name] = LazyKitchenEnv(env_name)
+
+
+def register_gym_envs():
+    """
+    Registers a gymnasium environment (robocasa/<env_name>) for every robosuite environment. Entry points
+    are resolved lazily, so the gym wrapper is only imported once a gym environment is made
+    """
+    from gymnasium.envs.registration import register, registry
+    from robosuite.environments.base import REGISTERED_ENVS
+
+    for env_name in REGISTERED_ENVS:
+        id_name = "robocasa/{}".format(env_name)
+        if id_name not in registry:
+            register(
+                id=id_name,
+                entry_point="robocasa.wrappers.gym_wrapper:{}".format(env_name),
+            )
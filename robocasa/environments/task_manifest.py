@@ -0,0 +1,386 @@
+"""
+Maps the name of every kitchen task class to the module that defines it.
+
+AUTO-GENERATED by robocasa/scripts/build_task_manifest.py. Do not edit by hand.
+"""
+
+KITCHEN_TASK_MANIFEST = {
+    "AddIceCubes": "robocasa.environments.kitchen.composite.making_smoothies.add_ice_cubes",
+    "AddLemonToFish": "robocasa.environments.kitchen.composite.garnishing_dishes.add_lemon_to_fish",
+    "AddMarshmallow": "robocasa.environments.kitchen.composite.preparing_hot_chocolate.add_marshmallow",
+    "AddSugarCubes": "robocasa.environments.kitchen.composite.garnishing_dishes.add_sugar_cubes",
+    "AddSweetener": "robocasa.environments.kitchen.composite.making_smoothies.add_sweetener",
+    "AddToSoupPot": "robocasa.environments.kitchen.composite.slow_cooking.add_to_soup_pot",
+    "AdjustHeat": "robocasa.environments.kitchen.composite.sauteing_vegetables.adjust_heat",
+    "AdjustToasterOvenTemperature": "robocasa.environments.kitchen.atomic.kitchen_toaster_oven",
+    "AdjustWaterTemperature": "robocasa.environments.kitchen.atomic.kitchen_sink",
+    "AfterwashSorting": "robocasa.environments.kitchen.composite.washing_fruits_and_vegetables.afterwash_sorting",
+    "AirDryFruit": "robocasa.environments.kitchen.composite.washing_fruits_and_vegetables.airdry_fruit",
+    "AlcoholServingPrep": "robocasa.environments.kitchen.composite.serving_food.alcohol_serving_prep",
+    "AlignSilverware": "robocasa.environments.kitchen.composite.setting_the_table.align_silverware",
+    "ArrangeBreadBasket": "robocasa.environments.kitchen.composite.setting_the_table.arrange_bread_basket",
+    "ArrangeBreadBowl": "robocasa.environments.kitchen.composite.setting_the_table.arrange_bread_bowl",
+    "ArrangeBuffetDessert": "robocasa.environments.kitchen.composite.arranging_buffet.arrange_buffet_dessert",
+    "ArrangeCuttingFruits": "robocasa.environments.kitchen.composite.chopping_food.arrange_cutting_fruits",
+    "ArrangeDrinkware": "robocasa.environments.kitchen.composite.setting_the_table.arrange_drinkware",
+    "ArrangeSinkSanitization": "robocasa.environments.kitchen.composite.sanitizing_surface.arrange_sink_sanitization",
+    "ArrangeTea": "robocasa.environments.kitchen.composite.brewing.arrange_tea",
+    "ArrangeTeaAccompaniments": "robocasa.environments.kitchen.composite.making_tea.arrange_tea_accompaniments",
+    "ArrangeUtensilsByType": "robocasa.environments.kitchen.composite.organizing_utensils.arrange_utensils_by_type",
+    "ArrangeVegetables": "robocasa.environments.kitchen.composite.chopping_food.arrange_vegetables",
+    "AssembleCookingArray": "robocasa.environments.kitchen.composite.frying.assemble_cooking_array",
+    "BalancedMealPrep": "robocasa.environments.kitchen.composite.plating_food.balanced_meal_prep",
+    "BeginSlowCooking": "robocasa.environments.kitchen.composite.slow_cooking.begin_slow_cooking",
+    "BeverageOrganization": "robocasa.environments.kitchen.composite.setting_the_table.beverage_organization",
+    "BeverageSorting": "robocasa.environments.kitchen.composite.restocking_supplies.beverage_sorting",
+    "BlendIngredients": "robocasa.environments.kitchen.composite.making_smoothies.blend_ingredients",
+    "BlendMarinade": "robocasa.environments.kitchen.composite.preparing_marinade.blend_marinade",
+    "BlendSalsaMix": "robocasa.environments.kitchen.composite.mixing_ingredients.blend_salsa_mix",
+    "BlendVegetableSauce": "robocasa.environments.kitchen.composite.mixing_ingredients.blend_vegetable_sauce",
+    "BoilCorn": "robocasa.environments.kitchen.composite.boiling.boil_corn",
+    "BoilEggs": "robocasa.environments.kitchen.composite.boiling.boil_eggs",
+    "BoilPot": "robocasa.environments.kitchen.composite.boiling.boil_pot",
+    "BowlAndCup": "robocasa.environments.kitchen.composite.clearing_table.bowl_and_cup",
+    "BreadAndCheese": "robocasa.environments.kitchen.composite.snack_preparation.bread_and_cheese",
+    "BreadSelection": "robocasa.environments.kitchen.composite.making_toast.bread_selection",
+    "BreadSetupSlicing": "robocasa.environments.kitchen.composite.chopping_food.bread_setup_slicing",
+    "BuildAppetizerPlate": "robocasa.environments.kitchen.composite.filling_serving_dishes.build_appetizer_plate",
+    "ButterOnPan": "robocasa.environments.kitchen.composite.sauteing_vegetables.butter_on_pan",
+    "CandleCleanup": "robocasa.environments.kitchen.composite.clearing_table.candle_cleanup",
+    "CategorizeCondiments": "robocasa.environments.kitchen.composite.arranging_condiments.categorize_condiments",
+    "CerealAndBowl": "robocasa.environments.kitchen.composite.snack_preparation.cereal_and_bowl",
+    "CheeseMixing": "robocasa.environments.kitchen.composite.mixing_ingredients.cheese_mixing",
+    "CheesyBread": "robocasa.environments.kitchen.atomic.kitchen_pick_place",
+    "ChooseMeasuringCup": "robocasa.environments.kitchen.composite.measuring_ingredients.choose_measuring_cup",
+    "ChooseRipeFruit": "robocasa.environments.kitchen.composite.making_juice.choose_ripe_fruit",
+    "CleanBlenderJug": "robocasa.environments.kitchen.composite.cleaning_appliances.clean_blender_jug",
+    "CleanBoard": "robocasa.environments.kitchen.composite.slicing_meat.clean_board",
+    "CleanMicrowave": "robocasa.environments.kitchen.composite.sanitizing_surface.clean_microwave",
+    "ClearClutter": "robocasa.environments.kitchen.composite.washing_fruits_and_vegetables.clear_clutter",
+    "ClearCuttingBoard": "robocasa.environments.kitchen.composite.chopping_food.clear_cutting_board",
+    "ClearFoodWaste": "robocasa.environments.kitchen.composite.cleaning_sink.clear_food_waste",
+    "ClearFreezer": "robocasa.environments.kitchen.composite.managing_freezer_space.clear_freezer",
+    "ClearReceptaclesForCleaning": "robocasa.environments.kitchen.composite.clearing_table.clear_receptacles_for_cleaning",
+    "ClearSink": "robocasa.environments.kitchen.composite.washing_dishes.clear_sink",
+    "ClearSinkArea": "robocasa.environments.kitchen.composite.cleaning_sink.clear_sink_area",
+    "ClearSinkSpace": "robocasa.environments.kitchen.composite.washing_fruits_and_vegetables.clear_sink_space",
+    "CloseBlenderLid": "robocasa.environments.kitchen.atomic.kitchen_blender",
+    "CloseCabinet": "robocasa.environments.kitchen.atomic.kitchen_doors",
+    "CloseDishwasher": "robocasa.environments.kitchen.atomic.kitchen_doors",
+    "CloseDoor": "robocasa.environments.kitchen.atomic.kitchen_doors",
+    "CloseDrawer": "robocasa.environments.kitchen.atomic.kitchen_drawer",
+    "CloseDropDownDoor": "robocasa.environments.kitchen.atomic.kitchen_doors",
+    "CloseElectricKettleLid": "robocasa.environments.kitchen.atomic.kitchen_electric_kettle",
+    "CloseFridge": "robocasa.environments.kitchen.atomic.kitchen_doors",
+    "CloseFridgeDrawer": "robocasa.environments.kitchen.atomic.kitchen_drawer",
+    "CloseMicrowave": "robocasa.environments.kitchen.atomic.kitchen_doors",
+    "CloseOven": "robocasa.environments.kitchen.atomic.kitchen_doors",
+    "CloseStandMixerHead": "robocasa.environments.kitchen.atomic.kitchen_stand_mixer",
+    "CloseToasterOvenDoor": "robocasa.environments.kitchen.atomic.kitchen_doors",
+    "ClusterItemsForClearing": "robocasa.environments.kitchen.composite.clearing_table.cluster_items_for_clearing",
+    "ClusterUtensilsInDrawer": "robocasa.environments.kitchen.composite.organizing_utensils.cluster_utensils_in_drawer",
+    "CoffeeServeMug": "robocasa.environments.kitchen.atomic.kitchen_coffee",
+    "CoffeeSetupMug": "robocasa.environments.kitchen.atomic.kitchen_coffee",
+    "CollectWashingSupplies": "robocasa.environments.kitchen.composite.washing_dishes.collect_washing_supplies",
+    "ColorfulSalsa": "robocasa.environments.kitchen.composite.mixing_and_blending.colorful_salsa",
+    "CondimentCollection": "robocasa.environments.kitchen.composite.clearing_table.condiment_collection",
+    "CookieDoughPrep": "robocasa.environments.kitchen.composite.baking.cookie_dough_prep",
+    "CoolBakedCake": "robocasa.environments.kitchen.composite.baking.cool_baked_cake",
+    "CoolBakedCookies": "robocasa.environments.kitchen.composite.baking.cool_baked_cookies",
+    "CoolKettle": "robocasa.environments.kitchen.composite.boiling.cool_kettle",
+    "CountertopCleanup": "robocasa.environments.kitchen.composite.sanitizing_surface.countertop_cleanup",
+    "CreateChildFriendlyFridge": "robocasa.environments.kitchen.composite.loading_fridge.create_child_friendly_fridge",
+    "CupcakeCleanup": "robocasa.environments.kitchen.composite.baking.cupcake_cleanup",
+    "CutBuffetPizza": "robocasa.environments.kitchen.composite.arranging_buffet.cut_buffet_pizza",
+    "CuttingToolSelection": "robocasa.environments.kitchen.composite.chopping_vegetables.cutting_tool_selection",
+    "DateNight": "robocasa.environments.kitchen.composite.setting_the_table.date_night",
+    "DefrostByCategory": "robocasa.environments.kitchen.composite.defrosting_food.defrost_by_category",
+    "DeliverBrewedCoffee": "robocasa.environments.kitchen.composite.brewing.deliver_brewed_coffee",
+    "DeliverStraw": "robocasa.environments.kitchen.composite.serving_beverages.deliver_straw",
+    "DessertAssembly": "robocasa.environments.kitchen.composite.clearing_table.dessert_assembly",
+    "DessertUpgrade": "robocasa.environments.kitchen.composite.serving_food.dessert_upgrade",
+    "DisplayMeatVariety": "robocasa.environments.kitchen.composite.filling_serving_dishes.display_meat_variety",
+    "DistributeChicken": "robocasa.environments.kitchen.composite.portioning_meals.distribute_chicken",
+    "DistributeSteakOnPans": "robocasa.environments.kitchen.composite.frying.distribute_steak_on_pans",
+    "DivideBasins": "robocasa.environments.kitchen.composite.washing_dishes.divide_basins",
+    "DivideBuffetTrays": "robocasa.environments.kitchen.composite.arranging_buffet.divide_buffet_trays",
+    "DrainVeggies": "robocasa.environments.kitchen.composite.washing_fruits_and_vegetables.drain_veggies",
+    "DrawerUtensilSort": "robocasa.environments.kitchen.composite.tidying_cabinets_and_drawers.drawer_utensil_sort",
+    "DrinkwareConsolidation": "robocasa.environments.kitchen.composite.clearing_table.drinkware_consolidation",
+    "DryDishes": "robocasa.environments.kitchen.composite.washing_dishes.dry_dishes",
+    "DryDrinkware": "robocasa.environments.kitchen.composite.washing_dishes.dry_drinkware",
+    "DumpLeftovers": "robocasa.environments.kitchen.composite.washing_dishes.dump_leftovers",
+    "EmptyDishRack": "robocasa.environments.kitchen.composite.organizing_dishes_and_containers.empty_dish_rack",
+    "FillBlenderJug": "robocasa.environments.kitchen.composite.making_juice.fill_blender_jug",
+    "FillKettle": "robocasa.environments.kitchen.composite.boiling.fill_kettle",
+    "FilterMicrowavableItem": "robocasa.environments.kitchen.composite.microwaving_food.filter_microwavable_item",
+    "FoodCleanup": "robocasa.environments.kitchen.composite.clearing_table.food_cleanup",
+    "FreezeBottledWaters": "robocasa.environments.kitchen.composite.managing_freezer_space.freeze_bottled_waters",
+    "FreezeCookedFood": "robocasa.environments.kitchen.composite.storing_leftovers.freeze_cooked_food",
+    "FreezeIceTray": "robocasa.environments.kitchen.composite.managing_freezer_space.freeze_ice_tray",
+    "FreshProduceOrganization": "robocasa.environments.kitchen.composite.restocking_supplies.fresh_produce_organization",
+    "FryingPanAdjustment": "robocasa.environments.kitchen.composite.frying.frying_pan_adjustment",
+    "GarnishCake": "robocasa.environments.kitchen.composite.garnishing_dishes.garnish_cake",
+    "GarnishCupcake": "robocasa.environments.kitchen.composite.garnishing_dishes.garnish_cupcake",
+    "GarnishPancake": "robocasa.environments.kitchen.composite.garnishing_dishes.garnish_pancake",
+    "GatherCuttingTools": "robocasa.environments.kitchen.composite.chopping_vegetables.gather_cutting_tools",
+    "GatherMarinadeIngredients": "robocasa.environments.kitchen.composite.preparing_marinade.gather_marinade_ingredients",
+    "GatherProduceWashing": "robocasa.environments.kitchen.composite.washing_fruits_and_vegetables.gather_produce_washing",
+    "GatherTableware": "robocasa.environments.kitchen.composite.arranging_cabinets.gather_tableware",
+    "GatherVegetables": "robocasa.environments.kitchen.composite.preparing_sandwiches.gather_vegetables",
+    "GetToastedBread": "robocasa.environments.kitchen.composite.toasting_bread.get_toasted_bread",
+    "HeatKebabSandwich": "robocasa.environments.kitchen.composite.preparing_sandwiches.heat_kebab_sandwich",
+    "HeatMug": "robocasa.environments.kitchen.composite.reheating_food.heat_mug",
+    "HeatMultipleWater": "robocasa.environments.kitchen.composite.boiling.heat_multiple_water",
+    "HotDogSetup": "robocasa.environments.kitchen.composite.preparing_sandwiches.hot_dog_setup",
+    "JuiceFruitReamer": "robocasa.environments.kitchen.composite.making_juice.juice_fruit_reamer",
+    "KettleBoiling": "robocasa.environments.kitchen.composite.brewing.kettle_boiling",
+    "Kitchen": "robocasa.environments.kitchen.kitchen",
+    "LemonSeasoningFish": "robocasa.environments.kitchen.composite.seasoning_food.lemon_seasoning_fish",
+    "LineUpCondiments": "robocasa.environments.kitchen.composite.arranging_condiments.line_up_condiments",
+    "LoadCondimentsInFridge": "robocasa.environments.kitchen.composite.loading_fridge.load_condiments_in_fridge",
+    "LoadDishwasher": "robocasa.environments.kitchen.composite.loading_dishwasher.load_dishwasher",
+    "LoadFridgeByType": "robocasa.environments.kitchen.composite.loading_fridge.load_fridge_by_type",
+    "LoadFridgeFifo": "robocasa.environments.kitchen.composite.loading_fridge.load_fridge_fifo",
+    "LoadPreparedFood": "robocasa.environments.kitchen.composite.loading_fridge.load_prepared_food",
+    "LowerHeat": "robocasa.environments.kitchen.atomic.kitchen_stove",
+    "MakeBananaMilkshake": "robocasa.environments.kitchen.composite.mixing_and_blending.make_banana_milkshake",
+    "MakeCheesecakeFilling": "robocasa.environments.kitchen.composite.mixing_ingredients.make_cheesecake_filling",
+    "MakeChocolateMilk": "robocasa.environments.kitchen.composite.mixing_ingredients.make_chocolate_milk",
+    "MakeFruitBowl": "robocasa.environments.kitchen.composite.snack_preparation.make_fruit_bowl",
+    "MakeIceLemonade": "robocasa.environments.kitchen.composite.adding_ice_to_beverages.make_ice_lemonade",
+    "MakeIcedCoffee": "robocasa.environments.kitchen.atomic.kitchen_pick_place",
+    "MakeLoadedPotato": "robocasa.environments.kitchen.composite.reheating_food.make_loaded_potato",
+    "ManipulateDoor": "robocasa.environments.kitchen.atomic.kitchen_doors",
+    "ManipulateDrawer": "robocasa.environments.kitchen.atomic.kitchen_drawer",
+    "ManipulateLowerDoor": "robocasa.environments.kitchen.atomic.kitchen_doors",
+    "ManipulateSinkFaucet": "robocasa.environments.kitchen.atomic.kitchen_sink",
+    "ManipulateStoveKnob": "robocasa.environments.kitchen.atomic.kitchen_stove",
+    "MatchCupAndDrink": "robocasa.environments.kitchen.composite.serving_beverages.match_cup_and_drink",
+    "MaximizeFreezerSpace": "robocasa.environments.kitchen.composite.managing_freezer_space.maximize_freezer_space",
+    "MealPrepStaging": "robocasa.environments.kitchen.composite.frying.meal_prep_staging",
+    "MeatSkewerAssembly": "robocasa.environments.kitchen.composite.filling_serving_dishes.meat_skewer_assembly",
+    "MeatTransfer": "robocasa.environments.kitchen.composite.chopping_food.meat_transfer",
+    "MicrowaveCorrectMeal": "robocasa.environments.kitchen.composite.microwaving_food.microwave_correct_meal",
+    "MicrowaveDefrostMeat": "robocasa.environments.kitchen.composite.microwaving_food.microwave_defrost_meat",
+    "MicrowavePressButton": "robocasa.environments.kitchen.atomic.kitchen_microwave",
+    "MicrowaveThawing": "robocasa.environments.kitchen.composite.defrosting_food.microwave_thawing",
+    "MicrowaveThawingFridge": "robocasa.environments.kitchen.composite.defrosting_food.microwave_thawing_fridge",
+    "MixCakeFrosting": "robocasa.environments.kitchen.composite.baking.mix_cake_frosting",
+    "MixedFruitPlatter": "robocasa.environments.kitchen.composite.filling_serving_dishes.mixed_fruit_platter",
+    "MoveFreezerToFridge": "robocasa.environments.kitchen.composite.loading_fridge.move_freezer_to_fridge",
+    "MoveFridgeToFreezer": "robocasa.environments.kitchen.composite.managing_freezer_space.move_fridge_to_freezer",
+    "MoveToCounter": "robocasa.environments.kitchen.composite.defrosting_food.move_to_counter",
+    "MoveToFreezerDrawer": "robocasa.environments.kitchen.composite.managing_freezer_space.move_to_freezer_drawer",
+    "MultistepSteaming": "robocasa.environments.kitchen.composite.steaming_food.multistep_steaming",
+    "NavigateKitchen": "robocasa.environments.kitchen.atomic.kitchen_navigate",
+    "OpenBlenderLid": "robocasa.environments.kitchen.atomic.kitchen_blender",
+    "OpenCabinet": "robocasa.environments.kitchen.atomic.kitchen_doors",
+    "OpenDishwasher": "robocasa.environments.kitchen.atomic.kitchen_doors",
+    "OpenDoor": "robocasa.environments.kitchen.atomic.kitchen_doors",
+    "OpenDrawer": "robocasa.environments.kitchen.atomic.kitchen_drawer",
+    "OpenDropDownDoor": "robocasa.environments.kitchen.atomic.kitchen_doors",
+    "OpenElectricKettleLid": "robocasa.environments.kitchen.atomic.kitchen_electric_kettle",
+    "OpenFridge": "robocasa.environments.kitchen.atomic.kitchen_doors",
+    "OpenFridgeDrawer": "robocasa.environments.kitchen.atomic.kitchen_drawer",
+    "OpenMicrowave": "robocasa.environments.kitchen.atomic.kitchen_doors",
+    "OpenOven": "robocasa.environments.kitchen.atomic.kitchen_doors",
+    "OpenStandMixerHead": "robocasa.environments.kitchen.atomic.kitchen_stand_mixer",
+    "OpenToasterOvenDoor": "robocasa.environments.kitchen.atomic.kitchen_doors",
+    "OrganizeBakingIngredients": "robocasa.environments.kitchen.composite.baking.organize_baking_ingredients",
+    "OrganizeCleaningSupplies": "robocasa.environments.kitchen.composite.tidying_cabinets_and_drawers.organize_cleaning_supplies",
+    "OrganizeCoffeeCondiments": "robocasa.environments.kitchen.composite.brewing.organize_coffee_condiments",
+    "OrganizeCondiments": "robocasa.environments.kitchen.composite.arranging_condiments.organize_condiments",
+    "OrganizeMeasuringCups": "robocasa.environments.kitchen.composite.measuring_ingredients.organize_measuring_cups",
+    "OrganizeMetallicUtensils": "robocasa.environments.kitchen.composite.organizing_utensils.organize_metalic_utensils",
+    "OrganizeMugsByHandle": "robocasa.environments.kitchen.composite.organizing_dishes_and_containers.organize_mugs_by_handle",
+    "OrganizeVegetables": "robocasa.environments.kitchen.composite.chopping_food.organize_vegetables",
+    "OvenBroilFish": "robocasa.environments.kitchen.composite.broiling_fish.oven_broil_fish",
+    "PJSandwichPrep": "robocasa.environments.kitchen.composite.toasting_bread.pj_sandwich_prep",
+    "PackDessert": "robocasa.environments.kitchen.atomic.kitchen_pick_place",
+    "PackFoodByTemp": "robocasa.environments.kitchen.composite.packing_lunches.pack_food_by_temp",
+    "PackFruitContainer": "robocasa.environments.kitchen.composite.packing_lunches.pack_fruit_container",
+    "PackIdenticalLunches": "robocasa.environments.kitchen.composite.packing_lunches.pack_identical_lunches",
+    "PackSnack": "robocasa.environments.kitchen.composite.packing_lunches.pack_snack",
+    "PanTransfer": "robocasa.environments.kitchen.composite.serving_food.pan_transfer",
+    "PastryDisplay": "robocasa.environments.kitchen.composite.baking.pastry_display",
+    "PickPlace": "robocasa.environments.kitchen.atomic.kitchen_pick_place",
+    "PickPlaceCabinetToCounter": "robocasa.environments.kitchen.atomic.kitchen_pick_place",
+    "PickPlaceCoffee": "robocasa.environments.kitchen.atomic.kitchen_coffee",
+    "PickPlaceCounterToBlender": "robocasa.environments.kitchen.atomic.kitchen_pick_place",
+    "PickPlaceCounterToCabinet": "robocasa.environments.kitchen.atomic.kitchen_pick_place",
+    "PickPlaceCounterToDrawer": "robocasa.environments.kitchen.atomic.kitchen_pick_place",
+    "PickPlaceCounterToMicrowave": "robocasa.environments.kitchen.atomic.kitchen_pick_place",
+    "PickPlaceCounterToOven": "robocasa.environments.kitchen.atomic.kitchen_pick_place",
+    "PickPlaceCounterToSink": "robocasa.environments.kitchen.atomic.kitchen_pick_place",
+    "PickPlaceCounterToStandMixer": "robocasa.environments.kitchen.atomic.kitchen_pick_place",
+    "PickPlaceCounterToStove": "robocasa.environments.kitchen.atomic.kitchen_pick_place",
+    "PickPlaceCounterToToasterOven": "robocasa.environments.kitchen.atomic.kitchen_pick_place",
+    "PickPlaceDrawerToCounter": "robocasa.environments.kitchen.atomic.kitchen_pick_place",
+    "PickPlaceFridgeDrawerToShelf": "robocasa.environments.kitchen.atomic.kitchen_pick_place",
+    "PickPlaceFridgeShelfToDrawer": "robocasa.environments.kitchen.atomic.kitchen_pick_place",
+    "PickPlaceMicrowaveToCounter": "robocasa.environments.kitchen.atomic.kitchen_pick_place",
+    "PickPlaceSinkToCounter": "robocasa.environments.kitchen.atomic.kitchen_pick_place",
+    "PickPlaceStoveToCounter": "robocasa.environments.kitchen.atomic.kitchen_pick_place",
+    "PickPlaceToasterOvenToCounter": "robocasa.environments.kitchen.atomic.kitchen_pick_place",
+    "PickPlaceToasterToCounter": "robocasa.environments.kitchen.atomic.kitchen_pick_place",
+    "PlaceBeveragesTogether": "robocasa.environments.kitchen.composite.arranging_buffet.place_beverages_together",
+    "PlaceBreakfastItemsAway": "robocasa.environments.kitchen.composite.tidying_cabinets_and_drawers.place_breakfast_items_away",
+    "PlaceDishesBySink": "robocasa.environments.kitchen.composite.washing_dishes.place_dishes_by_sink",
+    "PlaceEqualIceCubes": "robocasa.environments.kitchen.composite.adding_ice_to_beverages.place_equal_ice_cubes",
+    "PlaceFoodInBowls": "robocasa.environments.kitchen.composite.serving_food.place_food_in_bowls",
+    "PlaceIceInCup": "robocasa.environments.kitchen.composite.adding_ice_to_beverages.place_ice_in_cup",
+    "PlaceLidToBoil": "robocasa.environments.kitchen.composite.boiling.place_lid_to_boil",
+    "PlaceMeatInMarinade": "robocasa.environments.kitchen.composite.preparing_marinade.place_meat_in_marinade",
+    "PlaceMicrowaveSafeItem": "robocasa.environments.kitchen.composite.microwaving_food.place_microwave_safe_item",
+    "PlaceOnDishRack": "robocasa.environments.kitchen.composite.washing_dishes.place_on_dish_rack",
+    "PlaceStraw": "robocasa.environments.kitchen.composite.making_smoothies.place_straw",
+    "PlaceVegetablesEvenly": "robocasa.environments.kitchen.composite.sauteing_vegetables.place_vegetables_evenly",
+    "PlaceVeggiesInDrawer": "robocasa.environments.kitchen.composite.loading_fridge.place_veggies_in_drawer",
+    "PlateSteakMeal": "robocasa.environments.kitchen.composite.plating_food.plate_steak_meal",
+    "PlateStoreDinner": "robocasa.environments.kitchen.composite.plating_food.plate_store_dinner",
+    "PortionFruitBowl": "robocasa.environments.kitchen.composite.portioning_meals.portion_fruit_bowl",
+    "PortionHotDogs": "robocasa.environments.kitchen.composite.portioning_meals.portion_hot_dogs",
+    "PortionInTupperware": "robocasa.environments.kitchen.composite.portioning_meals.portion_in_tupperware",
+    "PortionOnSize": "robocasa.environments.kitchen.composite.portioning_meals.portion_on_size",
+    "PortionYogurt": "robocasa.environments.kitchen.composite.portioning_meals.portion_yogurt",
+    "PreRinseStation": "robocasa.environments.kitchen.composite.washing_dishes.pre_rinse_station",
+    "PreSoakPan": "robocasa.environments.kitchen.composite.washing_dishes.pre_soak_pan",
+    "PreheatOven": "robocasa.environments.kitchen.atomic.kitchen_oven",
+    "PreheatPot": "robocasa.environments.kitchen.composite.sauteing_vegetables.preheat_pot",
+    "PrepForSanitizing": "robocasa.environments.kitchen.composite.sanitizing_surface.prep_for_sanitizing",
+    "PrepForTenderizing": "robocasa.environments.kitchen.composite.meat_preparation.prep_for_tenderizing",
+    "PrepFridgeForCleaning": "robocasa.environments.kitchen.composite.cleaning_appliances.prep_fridge_for_cleaning",
+    "PrepMarinatingMeat": "robocasa.environments.kitchen.composite.meat_preparation.prep_marinating_meat",
+    "PrepSinkForCleaning": "robocasa.environments.kitchen.composite.cleaning_appliances.prep_sink_for_cleaning",
+    "PrepareBroilingStation": "robocasa.environments.kitchen.composite.broiling_fish.prepare_broiling_station",
+    "PrepareCheeseStation": "robocasa.environments.kitchen.composite.making_salads.prepare_cheese_station",
+    "PrepareCocktailStation": "robocasa.environments.kitchen.composite.serving_beverages.prepare_cocktail_station",
+    "PrepareCoffee": "robocasa.environments.kitchen.composite.brewing.prepare_coffee",
+    "PrepareDishwasher": "robocasa.environments.kitchen.composite.loading_dishwasher.prepare_dishwasher",
+    "PrepareDrinkStation": "robocasa.environments.kitchen.composite.serving_beverages.prepare_drink_station",
+    "PrepareSandwichStation": "robocasa.environments.kitchen.composite.preparing_sandwiches.prepare_sandwich_station",
+    "PrepareSausageCheese": "robocasa.environments.kitchen.composite.preparing_sandwiches.prepare_sausage_cheese",
+    "PrepareSmoothie": "robocasa.environments.kitchen.composite.making_smoothies.prepare_smoothie",
+    "PrepareSoupServing": "robocasa.environments.kitchen.composite.serving_food.prepare_soup_serving",
+    "PrepareStoringLeftovers": "robocasa.environments.kitchen.composite.storing_leftovers.prepare_storing_leftovers",
+    "PrepareToast": "robocasa.environments.kitchen.composite.making_toast.prepare_toast",
+    "PrepareVegetableRoasting": "robocasa.environments.kitchen.composite.washing_fruits_and_vegetables.prepare_vegetable_roasting",
+    "PrepareVeggieDip": "robocasa.environments.kitchen.composite.mixing_ingredients.prepare_veggie_dip",
+    "PrepareVeggiesForSteaming": "robocasa.environments.kitchen.composite.steaming_vegetables.prepare_veggies_for_steaming",
+    "PressChicken": "robocasa.environments.kitchen.composite.frying.press_chicken",
+    "PrewashFoodAssembly": "robocasa.environments.kitchen.composite.washing_fruits_and_vegetables.prewash_food_assembly",
+    "PrewashFoodSorting": "robocasa.environments.kitchen.composite.washing_fruits_and_vegetables.prewash_food_sorting",
+    "QuickThaw": "robocasa.environments.kitchen.composite.defrosting_food.quick_thaw",
+    "RearrangeFridgeItems": "robocasa.environments.kitchen.composite.loading_fridge.rearrange_fridge_items",
+    "RecycleBottlesBySize": "robocasa.environments.kitchen.composite.organizing_recycling.recycle_bottles_by_size",
+    "RecycleBottlesByType": "robocasa.environments.kitchen.composite.organizing_recycling.recycle_bottles_by_type",
+    "RecycleSodaCans": "robocasa.environments.kitchen.composite.organizing_recycling.recycle_soda_cans",
+    "RecycleStackedYogurt": "robocasa.environments.kitchen.composite.organizing_recycling.recycle_stacked_yogurt",
+    "RefillCondimentStation": "robocasa.environments.kitchen.composite.restocking_supplies.refill_condiment_station",
+    "ReheatMeal": "robocasa.environments.kitchen.composite.microwaving_food.reheat_meal",
+    "ReheatMeatOnStove": "robocasa.environments.kitchen.composite.reheating_food.reheat_meat_on_stove",
+    "RemoveBroiledFish": "robocasa.environments.kitchen.composite.broiling_fish.remove_broiled_fish",
+    "RemoveCuttingBoardItems": "robocasa.environments.kitchen.composite.sanitizing_cutting_board.remove_cutting_board_items",
+    "RemoveSteamedVegetables": "robocasa.environments.kitchen.composite.steaming_vegetables.remove_steamed_vegetables",
+    "ReorganizeFrozenVegetables": "robocasa.environments.kitchen.composite.managing_freezer_space.reorganize_frozen_vegetables",
+    "ResetCabinetDoors": "robocasa.environments.kitchen.composite.arranging_cabinets.reset_cabinet_doors",
+    "RestockBowls": "robocasa.environments.kitchen.composite.restocking_supplies.restock_bowls",
+    "RestockCannedFood": "robocasa.environments.kitchen.composite.restocking_supplies.restock_canned_food",
+    "RestockPantry": "robocasa.environments.kitchen.composite.restocking_supplies.restock_pantry",
+    "RestockSinkSupplies": "robocasa.environments.kitchen.composite.restocking_supplies.restock_sink_supplies",
+    "RetrieveIceTray": "robocasa.environments.kitchen.composite.adding_ice_to_beverages.retrieve_ice_tray",
+    "RetrieveMeat": "robocasa.environments.kitchen.composite.slicing_meat.retrieve_meat",
+    "ReturnHeatedFood": "robocasa.environments.kitchen.composite.microwaving_food.return_heated_food",
+    "ReturnWashingSupplies": "robocasa.environments.kitchen.composite.washing_dishes.return_washing_supplies",
+    "RinseBowls": "robocasa.environments.kitchen.composite.washing_dishes.rinse_bowls",
+    "RinseCuttingBoard": "robocasa.environments.kitchen.composite.sanitizing_cutting_board.rinse_cutting_board",
+    "RinseFragileItem": "robocasa.environments.kitchen.composite.washing_dishes.rinse_fragile_item",
+    "RinseSinkBasin": "robocasa.environments.kitchen.composite.cleaning_sink.rinse_sink_basin",
+    "RotatePan": "robocasa.environments.kitchen.composite.frying.rotate_pan",
+    "SanitizePrepCuttingBoard": "robocasa.environments.kitchen.composite.sanitizing_cutting_board.sanitize_prep_cutting_board",
+    "SanitizeSink": "robocasa.environments.kitchen.composite.sanitizing_surface.sanitize_sink",
+    "ScalePortioning": "robocasa.environments.kitchen.composite.portioning_meals.scale_portioning",
+    "ScrubBowl": "robocasa.environments.kitchen.composite.washing_dishes.scrub_bowl",
+    "ScrubCuttingBoard": "robocasa.environments.kitchen.composite.sanitizing_cutting_board.scrub_cutting_board",
+    "SearingMeat": "robocasa.environments.kitchen.composite.frying.searing_meat",
+    "SeasoningSpiceSetup": "robocasa.environments.kitchen.composite.setting_the_table.seasoning_spice_setup",
+    "SeasoningSteak": "robocasa.environments.kitchen.composite.seasoning_food.seasoning_steak",
+    "SeparateFreezerRack": "robocasa.environments.kitchen.composite.managing_freezer_space.separate_freezer_rack",
+    "SeparateRawIngredients": "robocasa.environments.kitchen.composite.sorting_ingredients.separate_raw_ingredients",
+    "ServeMealJuice": "robocasa.environments.kitchen.composite.serving_beverages.serve_meal_juice",
+    "ServeSteak": "robocasa.environments.kitchen.composite.serving_food.serve_steak",
+    "ServeTea": "robocasa.environments.kitchen.composite.making_tea.serve_tea",
+    "ServeWarmCroissant": "robocasa.environments.kitchen.composite.toasting_bread.serve_warm_croissant",
+    "SetBowlsForSoup": "robocasa.environments.kitchen.composite.setting_the_table.set_bowls_for_soup",
+    "SetUpCuttingStation": "robocasa.environments.kitchen.composite.slicing_meat.set_up_cutting_station",
+    "SetUpSpiceStation": "robocasa.environments.kitchen.composite.seasoning_food.setup_spice_station",
+    "SetupBowls": "robocasa.environments.kitchen.composite.setting_the_table.setup_bowls",
+    "SetupButterPlate": "robocasa.environments.kitchen.composite.setting_the_table.setup_butter_plate",
+    "SetupFruitBowl": "robocasa.environments.kitchen.composite.setting_the_table.setup_fruit_bowl",
+    "SetupFrying": "robocasa.environments.kitchen.composite.frying.setup_frying",
+    "SetupSodaBowl": "robocasa.environments.kitchen.composite.serving_beverages.setup_soda_bowl",
+    "SetupWineGlasses": "robocasa.environments.kitchen.composite.setting_the_table.setup_wine_glasses",
+    "ShakePan": "robocasa.environments.kitchen.composite.sauteing_vegetables.shake_pan",
+    "SimmeringSauce": "robocasa.environments.kitchen.composite.reheating_food.simmering_sauce",
+    "SizeSorting": "robocasa.environments.kitchen.composite.setting_the_table.size_sorting",
+    "SlideDishwasherRack": "robocasa.environments.kitchen.atomic.kitchen_drawer",
+    "SlideOvenRack": "robocasa.environments.kitchen.atomic.kitchen_oven",
+    "SlideToasterOvenRack": "robocasa.environments.kitchen.atomic.kitchen_toaster_oven",
+    "SnackSorting": "robocasa.environments.kitchen.composite.tidying_cabinets_and_drawers.snack_sorting",
+    "SoakSponge": "robocasa.environments.kitchen.composite.washing_dishes.soak_sponge",
+    "SortBreakfastIngredients": "robocasa.environments.kitchen.composite.sorting_ingredients.sort_breakfast_ingredients",
+    "SortingCleanup": "robocasa.environments.kitchen.composite.washing_dishes.sorting_cleanup",
+    "SpicyMarinade": "robocasa.environments.kitchen.composite.mixing_and_blending.spicy_marinade",
+    "StackBowlsCabinet": "robocasa.environments.kitchen.composite.organizing_dishes_and_containers.stack_bowls_cabinet",
+    "StackBowlsInSink": "robocasa.environments.kitchen.composite.washing_dishes.stack_bowls",
+    "StackCans": "robocasa.environments.kitchen.composite.arranging_cabinets.stack_cans",
+    "StartCoffeeMachine": "robocasa.environments.kitchen.atomic.kitchen_coffee",
+    "StartElectricKettle": "robocasa.environments.kitchen.composite.boiling.start_electric_kettle",
+    "SteamFish": "robocasa.environments.kitchen.composite.steaming_food.steam_fish",
+    "SteamInMicrowave": "robocasa.environments.kitchen.composite.steaming_food.steam_in_microwave",
+    "SteamVeggiesWithWater": "robocasa.environments.kitchen.composite.steaming_vegetables.steam_veggies_with_water",
+    "StirVegetables": "robocasa.environments.kitchen.composite.sauteing_vegetables.stir_vegetables",
+    "StockingBreakfastFoods": "robocasa.environments.kitchen.composite.restocking_supplies.stocking_breakfast_foods",
+    "StopSlowCooking": "robocasa.environments.kitchen.composite.slow_cooking.stop_slow_cooking",
+    "StoreDumplings": "robocasa.environments.kitchen.composite.storing_leftovers.store_dumplings",
+    "StoreLeftoversByType": "robocasa.environments.kitchen.composite.storing_leftovers.store_leftovers_by_type",
+    "StoreLeftoversInBowl": "robocasa.environments.kitchen.composite.storing_leftovers.store_leftovers_in_bowl",
+    "StrainerSetup": "robocasa.environments.kitchen.composite.making_tea.strainer_setup",
+    "SweetSavoryToastSetup": "robocasa.environments.kitchen.composite.making_toast.sweet_savory_toast_setup",
+    "SweetenCoffee": "robocasa.environments.kitchen.composite.brewing.sweeten_coffee",
+    "SweetenHotChocolate": "robocasa.environments.kitchen.composite.preparing_hot_chocolate.sweeten_hot_chocolate",
+    "ThawInSink": "robocasa.environments.kitchen.composite.defrosting_food.thaw_in_sink",
+    "TiltPan": "robocasa.environments.kitchen.composite.sauteing_vegetables.tilt_pan",
+    "ToastBagel": "robocasa.environments.kitchen.composite.toasting_bread.toast_bagel",
+    "ToastBaguette": "robocasa.environments.kitchen.composite.toasting_bread.toast_baguette",
+    "ToastHeatableIngredients": "robocasa.environments.kitchen.composite.preparing_sandwiches.toast_heatable_ingredients",
+    "ToastOnCorrectRack": "robocasa.environments.kitchen.composite.toasting_bread.toast_on_correct_rack",
+    "ToastOneSlotPair": "robocasa.environments.kitchen.composite.toasting_bread.toast_one_slot_pair",
+    "ToasterOvenBroilFish": "robocasa.environments.kitchen.composite.broiling_fish.toaster_oven_broil_fish",
+    "TongBuffetSetup": "robocasa.environments.kitchen.composite.arranging_buffet.tong_buffet_setup",
+    "TransportCookware": "robocasa.environments.kitchen.composite.washing_dishes.transport_cookware",
+    "TurnOffMicrowave": "robocasa.environments.kitchen.atomic.kitchen_microwave",
+    "TurnOffSimmeredSauceHeat": "robocasa.environments.kitchen.composite.simmering_sauces.turn_off_simmered_sauce_heat",
+    "TurnOffSinkFaucet": "robocasa.environments.kitchen.atomic.kitchen_sink",
+    "TurnOffStove": "robocasa.environments.kitchen.atomic.kitchen_stove",
+    "TurnOnBlender": "robocasa.environments.kitchen.atomic.kitchen_blender",
+    "TurnOnElectricKettle": "robocasa.environments.kitchen.atomic.kitchen_electric_kettle",
+    "TurnOnMicrowave": "robocasa.environments.kitchen.atomic.kitchen_microwave",
+    "TurnOnSinkFaucet": "robocasa.environments.kitchen.atomic.kitchen_sink",
+    "TurnOnStove": "robocasa.environments.kitchen.atomic.kitchen_stove",
+    "TurnOnToaster": "robocasa.environments.kitchen.atomic.kitchen_toaster",
+    "TurnOnToasterOven": "robocasa.environments.kitchen.atomic.kitchen_toaster_oven",
+    "TurnSinkSpout": "robocasa.environments.kitchen.atomic.kitchen_sink",
+    "UtensilShuffle": "robocasa.environments.kitchen.composite.tidying_cabinets_and_drawers.utensil_shuffle",
+    "VeggieDipPrep": "robocasa.environments.kitchen.composite.snack_preparation.veggie_dip_prep",
+    "WaffleReheat": "robocasa.environments.kitchen.composite.reheating_food.waffle_reheat",
+    "WarmCroissant": "robocasa.environments.kitchen.composite.reheating_food.warm_croissant",
+    "WashFish": "robocasa.environments.kitchen.composite.broiling_fish.wash_fish",
+    "WashFruitColander": "robocasa.environments.kitchen.composite.washing_fruits_and_vegetables.wash_fruit_colander",
+    "WashInSaucepan": "robocasa.environments.kitchen.composite.washing_fruits_and_vegetables.wash_in_saucepan",
+    "WashLettuce": "robocasa.environments.kitchen.composite.making_salads.wash_lettuce",
+    "WeighIngredients": "robocasa.environments.kitchen.composite.measuring_ingredients.weigh_ingredients",
+    "WipeTable": "robocasa.environments.kitchen.composite.sanitizing_surface.wipe_table",
+    "YogurtDelightPrep": "robocasa.environments.kitchen.composite.snack_preparation.yogurt_delight_prep",
+}
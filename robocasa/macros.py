@@ -18,6 +18,52 @@ SPACEMOUSE_PRODUCT_ID = 50741
 
 DATASET_BASE_PATH = None
 
+# number of candidate poses evaluated at once by UniformRandomSampler. Set to 1 to sample poses one at a time
+PLACEMENT_SAMPLER_BATCH_SIZE = 64
+
+# whether to pre-check robot spawn candidates against a free-space map of the scene, and run the simulator
+# collision check on the candidates the map reports free first. This usually needs a single simulator check,
+# but prefers candidates away from obstacles, so spawn poses differ from the default search (which checks
+# candidates in sampling order) for the same seed
+ROBOT_SPAWN_USE_FREE_SPACE_MAP = False
+
+# whether demo hdf5 writers store model xmls once per file in a content-addressed store (see
+# robocasa/utils/model_store.py). Set to False to store the full xml as a model_file attribute on every demo
+HDF5_MODEL_STORE = True
+
+# number of times each placement stage of Kitchen._load_model (fixture pairs, fixtures, objects) is resampled
+# on the already built scene before the whole scene is rebuilt
+LOAD_MODEL_STAGE_ATTEMPTS = 3
+
+# directory for files cached across processes (object asset index, asset cost index, config bundle, on-disk scene
+# cache entries, see robocasa/utils/cache_utils.py). Defaults to ~/.cache/robocasa if None
+CACHE_DIR = None
+
+# opt-in cache of fixture placements per scene (see robocasa/utils/scene_cache.py). One of None, "memory", "disk"
+SCENE_CACHE_MODE = None
+# directory for on-disk scene cache entries. Defaults to scene_cache under the cache directory if None
+SCENE_CACHE_DIR = None
+# maximum number of scene cache entries kept in memory and on disk. The least recently used entries are evicted
+SCENE_CACHE_MAX_ENTRIES = 1000
+
+# if set, the profile of every Kitchen reset (time spent per phase, see robocasa/utils/reset_profiler.py) is
+# appended as one json line to this file
+RESET_PROFILE_PATH = None
+
+# how Kitchen resets let objects settle. "fixed" always simulates SETTLE_FIXED_CONTROL_STEPS control steps, "adaptive"
+# stops once all free bodies are at rest (below the velocity thresholds, in m/s and rad/s) at two consecutive
+# control steps, or after SETTLE_MAX_CONTROL_STEPS control steps
+SETTLE_MODE = "fixed"
+SETTLE_FIXED_CONTROL_STEPS = 10
+SETTLE_MAX_CONTROL_STEPS = 40
+SETTLE_LIN_VEL_THRESHOLD = 1e-2
+SETTLE_ANG_VEL_THRESHOLD = 1e-1
+
+# maximum number of bytes of mesh and texture files held in memory to compile models (see
+# robocasa/utils/asset_cache.py), eg. 512 * 1024**2. Disabled by default (0): MuJoCo reads asset files
+# from disk on every compile
+ASSET_CACHE_MAX_BYTES = 0
+
 try:
     from robocasa.macros_private import *
 except ImportError:
@@ -660,10 +660,10 @@ class HingeCabinet(Cabinet):
 
         # Get raw qpos values
         left_qpos = sim.data.qpos[
-            sim.model.get_joint_qpos_addr(f"{self.name}_leftdoorhinge")
+            self.get_joint_qpos_addr(env, f"{self.name}_leftdoorhinge")
         ]
         right_qpos = sim.data.qpos[
-            sim.model.get_joint_qpos_addr(f"{self.name}_rightdoorhinge")
+            self.get_joint_qpos_addr(env, f"{self.name}_rightdoorhinge")
         ]
 
         # Normalize each based on correct direction
@@ -1068,7 +1068,7 @@ class Drawer(Cabinet):
         """
         sim = env.sim
         hinge_qpos = sim.data.qpos[
-            sim.model.get_joint_qpos_addr(f"{self.name}_slidejoint")
+            self.get_joint_qpos_addr(env, f"{self.name}_slidejoint")
         ]
         sign = -1
         hinge_qpos = hinge_qpos * sign
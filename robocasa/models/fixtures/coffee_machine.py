@@ -86,7 +86,7 @@ class CoffeeMachine(Fixture):
             self._turned_on = True
 
         for site_name in self._coffee_liquid_site_names:
-            site_id = env.sim.model.site_name2id(site_name)
+            site_id = self.get_site_id(env, site_name)
             if self._turned_on:
                 env.sim.model.site_rgba[site_id][3] = 1.0
             else:
@@ -108,7 +108,7 @@ class CoffeeMachine(Fixture):
         """
         obj_pos = np.array(env.sim.data.body_xpos[env.obj_body_id[obj_name]])
         pour_site_name = "{}{}".format(self.naming_prefix, "receptacle_place_site")
-        site_id = env.sim.model.site_name2id(pour_site_name)
+        site_id = self.get_site_id(env, pour_site_name)
         pour_site_pos = env.sim.data.site_xpos[site_id]
         xy_check = np.linalg.norm(obj_pos[0:2] - pour_site_pos[0:2]) < xy_thresh
         z_check = np.abs(obj_pos[2] - pour_site_pos[2]) < 0.10
@@ -127,7 +127,7 @@ class CoffeeMachine(Fixture):
             bool: True if gripper is far from the button, False otherwise
         """
         for button_name in self._start_button_names:
-            button_id = env.sim.model.geom_name2id(f"{self.naming_prefix}{button_name}")
+            button_id = self.get_geom_id(env, f"{self.naming_prefix}{button_name}")
             button_pos = env.sim.data.geom_xpos[button_id]
             gripper_site_pos = env.sim.data.site_xpos[
                 env.robots[0].eef_site_id["right"]
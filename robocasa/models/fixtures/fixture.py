@@ -1,5 +1,6 @@
 import abc
 import os
+import pickle
 import random
 import xml.etree.ElementTree as ET
 from copy import deepcopy
@@ -32,6 +33,22 @@ def get_texture_name_from_file(file):
     return name
 
 
+def is_plain_state(value):
+    """
+    Whether @value is plain data (numbers, strings, arrays and containers of them), as opposed to
+    references to xml elements, models or other objects
+    """
+    if value is None or isinstance(value, (bool, int, float, str, np.generic)):
+        return True
+    if isinstance(value, np.ndarray):
+        return value.dtype != object
+    if isinstance(value, (list, tuple)):
+        return all(is_plain_state(v) for v in value)
+    if isinstance(value, dict):
+        return all(is_plain_state(k) and is_plain_state(v) for (k, v) in value.items())
+    return False
+
+
 class FixtureType(IntEnum):
     """
     Enum for fixture types in robosuite kitchen environments.
@@ -292,6 +309,7 @@ class Fixture(MujocoXMLObjectRobocasa):
             for (k, v) in reg_dict.items():
                 if isinstance(v, np.ndarray):
                     reg_dict[k] = v * scale
+        self._invalidate_geometry_cache()
 
     def get_reset_regions(
         self,
@@ -407,6 +425,32 @@ class Fixture(MujocoXMLObjectRobocasa):
         """
         return
 
+    @property
+    def has_dynamic_state(self):
+        """
+        Whether the fixture has internal state that is updated every step. Fixtures declare dynamic state by
+        overriding update_state, and only those are updated by Kitchen.update_state
+        """
+        return type(self).update_state is not Fixture.update_state
+
+    def get_state_fingerprint(self):
+        """
+        Snapshot of the state that update_state can change: the plain data attributes of the fixture and
+        the boundary points of its regions
+
+        Returns:
+            bytes: fingerprint that is equal for equal fixture states
+        """
+        state = [
+            (k, v)
+            for (k, v) in sorted(vars(self).items())
+            # the geometry cache is cleared when regions are updated, even if they do not move
+            if k != "_geometry_cache" and is_plain_state(v)
+        ]
+        for (name, reg) in sorted(self._regions.items()):
+            state.append((name, [reg.get(k) for k in ["p0", "px", "py", "pz"]]))
+        return pickle.dumps(state)
+
     @property
     def pos(self):
         return string_to_array(self._obj.get("pos"))
@@ -532,6 +576,61 @@ class Fixture(MujocoXMLObjectRobocasa):
             self._regions[name]["py"] = py
             self._regions[name]["pz"] = pz
 
+        self._invalidate_geometry_cache()
+
+    def _compute_region_geometry(self, reg_name):
+        """
+        Computes the geometry of region @reg_name from its boundary points p0, px, py, pz
+        """
+        reg_dict = self._regions[reg_name]
+        p0, px, py, pz = reg_dict["p0"], reg_dict["px"], reg_dict["py"], reg_dict["pz"]
+        corners = np.array(
+            [
+                p0,
+                px,
+                py,
+                pz,
+                [p0[0], py[1], pz[2]],
+                [px[0], py[1], pz[2]],
+                [px[0], py[1], p0[2]],
+                [px[0], p0[1], pz[2]],
+            ],
+            dtype=float,
+        )
+        p1 = corners[5]
+        return dict(
+            center=(corners[0] + p1) / 2,
+            half_size=(p1 - corners[0]) / 2,
+            corners=corners,
+        )
+
+    def _get_world_region_corners(self, reg_name):
+        """
+        Get the (cached) 8 corners of region @reg_name in the world frame, based on the fixture's pos and rot.
+        Recomputed only after set_scale, set_pos or set_euler
+
+        Returns:
+            np.array: (8, 3) read-only array of points
+        """
+        corners = self.get_region_geometry(reg_name)["corners"]
+        key = ("world", reg_name)
+        if key not in self._geometry_cache:
+            fixture_mat = T.euler2mat(np.array([0, 0, self.rot]))
+            world_corners = corners @ fixture_mat.T + self.pos
+            world_corners.setflags(write=False)
+            self._geometry_cache[key] = world_corners
+        return self._geometry_cache[key]
+
+    def _get_ext_region_name(self):
+        """
+        Get the name of the region that defines the exterior bounding box of the fixture
+        """
+        if "main" in self._regions:
+            return "main"
+        elif "bbox" in self._regions:
+            return "bbox"
+        raise ValueError
+
     def get_ext_sites(self, all_points=False, relative=True):
         """
         Get the exterior bounding box points of the object
@@ -542,36 +641,15 @@ class Fixture(MujocoXMLObjectRobocasa):
             relative (bool): If True, will return the points relative to the object's position
 
         Returns:
-            list: 4 or 8 points
+            np.array: (4, 3) or (8, 3) read-only array of points
         """
-        reg_key = None
-        if "main" in self._regions:
-            reg_key = "main"
-        elif "bbox" in self._regions:
-            reg_key = "bbox"
+        reg_key = self._get_ext_region_name()
+        if relative:
+            sites = self.get_region_geometry(reg_key)["corners"]
         else:
-            raise ValueError
-
-        sites = [
-            self._regions[reg_key]["p0"],
-            self._regions[reg_key]["px"],
-            self._regions[reg_key]["py"],
-            self._regions[reg_key]["pz"],
-        ]
-
-        if all_points:
-            p0, px, py, pz = sites
-            sites += [
-                np.array([p0[0], py[1], pz[2]]),
-                np.array([px[0], py[1], pz[2]]),
-                np.array([px[0], py[1], p0[2]]),
-                np.array([px[0], p0[1], pz[2]]),
-            ]
-
-        if relative is False:
-            sites = [OU.get_pos_after_rel_offset(self, offset) for offset in sites]
+            sites = self._get_world_region_corners(reg_key)
 
-        return sites
+        return sites if all_points else sites[:4]
 
     def get_int_sites(self, all_points=False, relative=True):
         """
@@ -583,42 +661,64 @@ class Fixture(MujocoXMLObjectRobocasa):
             relative (bool): If True, will return the points relative to the object's position
 
         Returns:
-            dict: a dictionary of interior areas, each with 4 or 8 points
+            dict: a dictionary of interior areas, each with a (4, 3) or (8, 3) read-only array of points
         """
         sites_dict = {}
         for prefix in self.get_reset_region_names():
-            reg_dict = self._regions.get(prefix, None)
-            if reg_dict is None:
+            if prefix not in self._regions:
                 continue
 
-            sites = [
-                reg_dict["p0"],
-                reg_dict["px"],
-                reg_dict["py"],
-                reg_dict["pz"],
-            ]
+            if relative:
+                sites = self.get_region_geometry(prefix)["corners"]
+            else:
+                sites = self._get_world_region_corners(prefix)
 
-            if all_points:
-                p0, px, py, pz = sites
-                sites += [
-                    np.array([p0[0], py[1], pz[2]]),
-                    np.array([px[0], py[1], pz[2]]),
-                    np.array([px[0], py[1], p0[2]]),
-                    np.array([px[0], p0[1], pz[2]]),
-                ]
+            sites_dict[prefix] = sites if all_points else sites[:4]
 
-            if relative is False:
-                sites = [OU.get_pos_after_rel_offset(self, offset) for offset in sites]
+        return sites_dict
 
-            sites_dict[prefix] = sites
+    def get_int_region_halfspaces(self):
+        """
+        Get the (cached) interior regions of the fixture in the world frame, as bounds along the region axes.
+        A point p lies in region i if lo[i] <= axes[i] @ p <= hi[i]. Recomputed only after set_scale, set_pos
+        or set_euler
 
-        return sites_dict
+        Returns:
+            dict: names (list of region names), axes ((R, 3, 3) array whose rows are the region edges
+                px - p0, py - p0, pz - p0), lo and hi ((R, 3) arrays of bounds)
+        """
+        if getattr(self, "_geometry_cache", None) is None:
+            self._invalidate_geometry_cache()
+        key = ("world", "int_halfspaces")
+        if key not in self._geometry_cache:
+            int_sites = self.get_int_sites(relative=False)
+            names = list(int_sites.keys())
+            if len(names) == 0:
+                axes = np.zeros((0, 3, 3))
+                lo = np.zeros((0, 3))
+                hi = np.zeros((0, 3))
+            else:
+                sites = np.array([int_sites[name] for name in names])
+                p0 = sites[:, 0]
+                axes = sites[:, 1:4] - p0[:, None]
+                lo = np.einsum("rad,rd->ra", axes, p0)
+                hi = np.einsum("rad,rad->ra", axes, sites[:, 1:4])
+            for v in (axes, lo, hi):
+                v.setflags(write=False)
+            self._geometry_cache[key] = dict(names=names, axes=axes, lo=lo, hi=hi)
+        return self._geometry_cache[key]
 
     def get_bbox_points(self, trans=None, rot=None):
         """
         Get the full set of bounding box points of the object
-        rot: a rotation matrix
+        rot: a quaternion in (x,y,z,w) form
+
+        Returns:
+            np.array: (8, 3) array of points
         """
+        if trans is None and rot is None:
+            return self.get_ext_sites(all_points=True, relative=False).copy()
+
         bbox_offsets = self.get_ext_sites(all_points=True, relative=True)
 
         if trans is None:
@@ -629,8 +729,7 @@ class Fixture(MujocoXMLObjectRobocasa):
             rot = np.array([0, 0, self.rot])
             rot = T.euler2mat(rot)
 
-        points = [(np.matmul(rot, p) + trans) for p in bbox_offsets]
-        return points
+        return bbox_offsets @ rot.T + trans
 
     def set_door_state(self, min, max, env):
         """
@@ -657,6 +756,73 @@ class Fixture(MujocoXMLObjectRobocasa):
         elem.set("pos", "0 0 10")
         elem.set("size", "0.01 0.01 0.01")
 
+    def get_sim_binding(self, env, key, bind_fn):
+        """
+        Get a value derived from the simulation model, such as the ids of some elements of the fixture.
+        The value is computed once and cached until the simulation model changes (eg. after the environment
+        is reloaded through reset_from_xml_string), so that per-step updates can index the simulation arrays
+        directly instead of resolving names
+
+        Args:
+            env (MujocoEnv): environment
+
+            key (hashable): name of the binding
+
+            bind_fn (function): computes the binding from the simulation model (MjModel)
+
+        Returns:
+            the value returned by @bind_fn
+        """
+        model = env.sim.model
+        bindings = getattr(self, "_sim_bindings", None)
+        if bindings is None or bindings[0] is not model:
+            bindings = (model, dict())
+            self._sim_bindings = bindings
+        if key not in bindings[1]:
+            bindings[1][key] = bind_fn(model)
+        return bindings[1][key]
+
+    def get_site_id(self, env, site_name):
+        """
+        Returns:
+            int: (cached) id of site @site_name in the simulation model
+        """
+        return self.get_sim_binding(
+            env, ("site", site_name), lambda model: model.site_name2id(site_name)
+        )
+
+    def get_geom_id(self, env, geom_name):
+        """
+        Returns:
+            int: (cached) id of geom @geom_name in the simulation model
+        """
+        return self.get_sim_binding(
+            env, ("geom", geom_name), lambda model: model.geom_name2id(geom_name)
+        )
+
+    def get_joint_id(self, env, joint_name):
+        """
+        Returns:
+            int: (cached) id of joint @joint_name in the simulation model
+        """
+        return self.get_sim_binding(
+            env, ("joint", joint_name), lambda model: model.joint_name2id(joint_name)
+        )
+
+    def get_joint_qpos_addr(self, env, joint_name):
+        """
+        Returns:
+            int or slice: (cached) index of the qpos of joint @joint_name, to be used with sim.data.qpos
+        """
+
+        def bind_fn(model):
+            addr = model.get_joint_qpos_addr(joint_name)
+            if isinstance(addr, tuple):
+                return slice(*addr)
+            return addr
+
+        return self.get_sim_binding(env, ("qpos", joint_name), bind_fn)
+
     def get_joint_state(self, env, joint_names):
         """
         Args:
@@ -668,7 +834,7 @@ class Fixture(MujocoXMLObjectRobocasa):
         joint_state = dict()
 
         for j_name in joint_names:
-            joint_qpos = env.sim.data.qpos[env.sim.model.get_joint_qpos_addr(j_name)]
+            joint_qpos = env.sim.data.qpos[self.get_joint_qpos_addr(env, j_name)]
             joint_info = self._joint_infos.get(j_name, None)
             assert joint_info is not None
             joint_min, joint_max = joint_info["range"]
@@ -704,9 +870,8 @@ class Fixture(MujocoXMLObjectRobocasa):
             else:
                 desired_min = joint_min + (joint_max - joint_min) * (1 - max)
                 desired_max = joint_min + (joint_max - joint_min) * (1 - min)
-            env.sim.data.set_joint_qpos(
-                j_name,
-                env.rng.uniform(desired_min, desired_max),
+            env.sim.data.qpos[self.get_joint_qpos_addr(env, j_name)] = env.rng.uniform(
+                desired_min, desired_max
             )
 
     def is_open(self, env, joint_names=None, th=0.90):
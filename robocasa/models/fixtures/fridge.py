@@ -391,17 +391,13 @@ class Fridge(Fixture):
         if not filtered_region_names:
             return False
 
-        orig_get_int = self.get_int_sites
-
-        def get_int_sites_filtered(relative=False):
-            sites = orig_get_int(relative=relative)
-            return {rn: sites[rn] for rn in filtered_region_names}
-
-        self.get_int_sites = get_int_sites_filtered
-        inside = obj_inside_of(env, object_name, self.name, partial_check=False)
-
-        self.get_int_sites = orig_get_int
-        return inside
+        return obj_inside_of(
+            env,
+            object_name,
+            self.name,
+            partial_check=False,
+            region_names=filtered_region_names,
+        )
 
     def update_state(self, env):
         """
@@ -104,9 +104,7 @@ class Microwave(Fixture):
             bool: True if gripper is far from the button, False otherwise
         """
         assert button in ["start_button", "stop_button"]
-        button_id = env.sim.model.geom_name2id(
-            "{}{}".format(self.naming_prefix, button)
-        )
+        button_id = self.get_geom_id(env, "{}{}".format(self.naming_prefix, button))
         button_pos = env.sim.data.geom_xpos[button_id]
         gripper_site_pos = env.sim.data.site_xpos[env.robots[0].eef_site_id["right"]]
 
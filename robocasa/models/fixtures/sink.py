@@ -80,7 +80,7 @@ class Sink(Fixture):
         state = self.get_handle_state(env)
         water_on = state["water_on"]
 
-        site_id = env.sim.model.site_name2id("{}water".format(self.naming_prefix))
+        site_id = self.get_site_id(env, "{}water".format(self.naming_prefix))
 
         if water_on:
             if state["water_pressure"] == "low":
@@ -160,8 +160,8 @@ class Sink(Fixture):
         if self.handle_joint is None:
             return handle_state
 
-        handle_joint_id = env.sim.model.get_joint_qpos_addr(
-            "{}handle_joint".format(self.naming_prefix)
+        handle_joint_id = self.get_joint_qpos_addr(
+            env, "{}handle_joint".format(self.naming_prefix)
         )
         handle_joint_max = string_to_array(self.handle_joint.get("range"))[1]
         handle_joint_qpos = deepcopy(env.sim.data.qpos[handle_joint_id])
@@ -183,8 +183,8 @@ class Sink(Fixture):
             handle_state["water_pressure"] = "zero"
 
         # Spout rotation
-        spout_joint_id = env.sim.model.get_joint_qpos_addr(
-            "{}spout_joint".format(self.naming_prefix)
+        spout_joint_id = self.get_joint_qpos_addr(
+            env, "{}spout_joint".format(self.naming_prefix)
         )
         spout_joint_qpos = deepcopy(env.sim.data.qpos[spout_joint_id])
         spout_joint_qpos = spout_joint_qpos % (2 * np.pi)
@@ -200,14 +200,14 @@ class Sink(Fixture):
         handle_state["spout_ori"] = spout_ori
 
         # Temperature joint
-        temp_joint_id = env.sim.model.get_joint_qpos_addr(
-            f"{self.naming_prefix}handle_temp_joint"
+        temp_joint_id = self.get_joint_qpos_addr(
+            env, f"{self.naming_prefix}handle_temp_joint"
         )
         temp_joint_qpos = float(env.sim.data.qpos[temp_joint_id])
         handle_state["temp_joint"] = temp_joint_qpos
 
         lo, hi = env.sim.model.jnt_range[
-            env.sim.model.joint_name2id(f"{self.naming_prefix}handle_temp_joint")
+            self.get_joint_id(env, f"{self.naming_prefix}handle_temp_joint")
         ]
 
         # Normalize temp where lo = cold (0.0) and hi = hot (1.0)
@@ -93,24 +93,14 @@ class Stove(Fixture):
         Args:
             env (MujocoEnv): environment
         """
-        for location in STOVE_LOCATIONS:
-            site = self.burner_sites[location]
-            if site is None:
-                continue
-            site_id = env.sim.model.site_name2id(
-                "{}burner_on_{}".format(self.naming_prefix, location)
-            )
-
-            joint = self.knob_joints[location]
-            if joint is None:
+        for (site_id, qpos_addr) in self.get_sim_binding(
+            env, "burners", self._bind_burners
+        ):
+            if qpos_addr is None:
                 env.sim.model.site_rgba[site_id][3] = 0.0
                 continue
-            joint_id = env.sim.model.get_joint_qpos_addr(
-                "{}knob_{}_joint".format(self.naming_prefix, location)
-            )
 
-            joint_qpos = deepcopy(env.sim.data.qpos[joint_id])
-            joint_qpos = joint_qpos % (2 * np.pi)
+            joint_qpos = env.sim.data.qpos[qpos_addr] % (2 * np.pi)
             if joint_qpos < 0:
                 joint_qpos += 2 * np.pi
 
@@ -119,6 +109,31 @@ class Stove(Fixture):
             else:
                 env.sim.model.site_rgba[site_id][3] = 0.0
 
+    def _bind_burners(self, model):
+        """
+        Resolves the flame site id and the knob joint qpos address (None if there is no knob) of each burner
+
+        Args:
+            model (MjModel): simulation model
+
+        Returns:
+            list: (site_id, qpos_addr) of each burner that has a flame site
+        """
+        burners = []
+        for location in STOVE_LOCATIONS:
+            if self.burner_sites[location] is None:
+                continue
+            site_id = model.site_name2id(
+                "{}burner_on_{}".format(self.naming_prefix, location)
+            )
+            qpos_addr = None
+            if self.knob_joints[location] is not None:
+                qpos_addr = model.get_joint_qpos_addr(
+                    "{}knob_{}_joint".format(self.naming_prefix, location)
+                )
+            burners.append((site_id, qpos_addr))
+        return burners
+
     def set_knob_state(self, env, rng, knob, mode="on"):
         """
         Sets the state of the knob joint based on the mode parameter
@@ -168,8 +183,8 @@ class Stove(Fixture):
             if site is None:
                 continue
 
-            joint_id = env.sim.model.get_joint_qpos_addr(
-                "{}knob_{}_joint".format(self.naming_prefix, location)
+            joint_id = self.get_joint_qpos_addr(
+                env, "{}knob_{}_joint".format(self.naming_prefix, location)
             )
 
             joint_qpos = deepcopy(env.sim.data.qpos[joint_id])
@@ -0,0 +1,299 @@
+"""
+Index of the object assets in the object asset zoo.
+
+Listing every model folder of every object category (and parsing model xmls to read bounding box sizes)
+is expensive, especially on network filesystems. The index stores, for each category folder, the mjcf paths
+of its models along with the half size of their reg_bbox geom. It is built on first use and stored as a compact
+json file in the user cache directory (see robocasa/utils/cache_utils.py) when the process exits. Folders whose modification
+time changed (models added or removed) are rescanned. Models whose xml files changed are read again when their size
+is first looked up in the process, or on an explicit rebuild, so that listing models only stats the category folder.
+
+Object types and capability flags (graspable, washable, etc.) are defined in kitchen_objects.py and are
+joined with the index by ObjCat.
+"""
+
+import atexit
+import json
+import os
+import xml.etree.ElementTree as ET
+
+import numpy as np
+
+import robocasa
+from robocasa.utils.cache_utils import get_cache_path
+
+ASSET_INDEX_VERSION = 2
+
+BASE_ASSET_ZOO_PATH = os.path.join(robocasa.models.assets_root, "objects")
+ASSET_INDEX_FILENAME = "asset_index.json"
+
+
+def read_bbox_half_size(mjcf_path):
+    """
+    Reads the half size of the reg_bbox geom of an object model
+
+    Args:
+        mjcf_path (str): path to the model xml
+
+    Returns:
+        list or None: (x, y, z) half size, or None if the model does not exist or has no reg_bbox geom
+    """
+    if not os.path.exists(mjcf_path):
+        return None
+    root = ET.parse(mjcf_path).getroot()
+    for geom in root.iter("geom"):
+        if geom.get("name") == "reg_bbox":
+            return [float(v) for v in geom.get("size").split()]
+    return None
+
+
+def get_model_signature(model_dir):
+    """
+    Get the signature of the xml files of a model, used to detect models that changed since they were indexed
+
+    Args:
+        model_dir (str): model folder
+
+    Returns:
+        list: (mtime in ns, size) of model.xml and model_upright.xml, None for files that do not exist
+    """
+    signature = []
+    for fname in ("model.xml", "model_upright.xml"):
+        try:
+            stat = os.stat(os.path.join(model_dir, fname))
+            signature.append([stat.st_mtime_ns, stat.st_size])
+        except OSError:
+            signature.append(None)
+    return signature
+
+
+class ObjectAssetIndex:
+    """
+    Index of object models per category folder of the asset zoo.
+
+    Args:
+        root (str): root directory of the object asset zoo
+
+        index_path (str): path of the index file. Defaults to asset_index.json in the user cache directory
+    """
+
+    def __init__(self, root=BASE_ASSET_ZOO_PATH, index_path=None):
+        self.root = root
+        if index_path is None:
+            index_path = get_cache_path(ASSET_INDEX_FILENAME)
+        self.index_path = index_path
+
+        self._folders = self._load()
+        self._dirty = False
+
+        # absolute mjcf path -> half size of the reg_bbox geom
+        self._half_sizes = dict()
+        # absolute mjcf path -> entry of loaded models whose xml files were not checked for changes yet
+        self._unchecked = dict()
+        for entry in self._folders.values():
+            for model in entry["models"]:
+                self._add_model(model, checked=False)
+
+    def _load(self):
+        if not os.path.exists(self.index_path):
+            return dict()
+        try:
+            with open(self.index_path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return dict()
+        if data.get("version") != ASSET_INDEX_VERSION or data.get("root") != self.root:
+            return dict()
+        return data["folders"]
+
+    def _add_model(self, model, checked=True):
+        mjcf_path = os.path.join(self.root, model["mjcf_path"])
+        upright_path = os.path.join(os.path.dirname(mjcf_path), "model_upright.xml")
+        for (path, half_size) in [
+            (mjcf_path, model["half_size"]),
+            (upright_path, model.get("upright_half_size")),
+        ]:
+            self._half_sizes[path] = (
+                np.array(half_size) if half_size is not None else None
+            )
+            if checked:
+                self._unchecked.pop(path, None)
+            else:
+                self._unchecked[path] = model
+
+    def _scan_folder(self, folder, is_auxiliary_obj):
+        """
+        Lists all models in a category folder and reads their bounding box sizes
+        """
+        cat_path = os.path.join(self.root, folder)
+        model_dirs = []
+        for model_name in sorted(os.listdir(cat_path)):
+            model_dir = os.path.join(cat_path, model_name)
+            if not os.path.isdir(model_dir):
+                continue
+            if is_auxiliary_obj:
+                # auxiliary objects live one directory deeper
+                for sub_name in sorted(os.listdir(model_dir)):
+                    sub_dir = os.path.join(model_dir, sub_name)
+                    if os.path.isdir(sub_dir) and "model.xml" in os.listdir(sub_dir):
+                        model_dirs.append((model_name, sub_dir))
+            elif "model.xml" in os.listdir(model_dir):
+                model_dirs.append((model_name, model_dir))
+
+        return [
+            self._read_model(model_name, model_dir)
+            for (model_name, model_dir) in model_dirs
+        ]
+
+    def _read_model(self, model_name, model_dir):
+        """
+        Reads the index entry of a model: its mjcf path, xml signature and bounding box sizes
+        """
+        mjcf_path = os.path.join(model_dir, "model.xml")
+        return dict(
+            name=model_name,
+            mjcf_path=os.path.relpath(mjcf_path, self.root),
+            signature=get_model_signature(model_dir),
+            half_size=read_bbox_half_size(mjcf_path),
+            upright_half_size=read_bbox_half_size(
+                os.path.join(model_dir, "model_upright.xml")
+            ),
+        )
+
+    def _check_model(self, model):
+        """
+        Reads the model again if its xml files changed since it was indexed
+        """
+        model_dir = os.path.dirname(os.path.join(self.root, model["mjcf_path"]))
+        if get_model_signature(model_dir) != model["signature"]:
+            model.update(self._read_model(model["name"], model_dir))
+            self._set_dirty()
+        self._add_model(model)
+
+    def _set_dirty(self):
+        if not self._dirty:
+            # save once, when the process exits, rather than on every change
+            atexit.register(self.save)
+        self._dirty = True
+
+    def get_models(self, folder, is_auxiliary_obj=False):
+        """
+        Get all models in a category folder. The folder is rescanned if models were added or removed since it
+        was indexed. Only the folder is checked, the xml files of the models are checked by get_half_sizes
+
+        Args:
+            folder (str): category folder, relative to the asset zoo root (eg. "objaverse/apple")
+
+            is_auxiliary_obj (bool): if True, models are located one directory deeper
+
+        Returns:
+            list: model entries, each a dict with name, mjcf_path (relative to the root) and half_size
+        """
+        cat_path = os.path.join(self.root, folder)
+        if not os.path.exists(cat_path):
+            return []
+        mtime = os.stat(cat_path).st_mtime
+
+        key = "{}:aux".format(folder) if is_auxiliary_obj else folder
+        entry = self._folders.get(key)
+        if entry is None or entry["mtime"] != mtime:
+            entry = dict(
+                mtime=mtime, models=self._scan_folder(folder, is_auxiliary_obj)
+            )
+            self._folders[key] = entry
+            for model in entry["models"]:
+                self._add_model(model)
+            self._set_dirty()
+        return entry["models"]
+
+    def rebuild(self):
+        """
+        Checks all indexed folders and models against the files on disk: folders whose models were added or
+        removed are rescanned, and models whose xml files changed are read again
+        """
+        for key in list(self._folders.keys()):
+            is_auxiliary_obj = key.endswith(":aux")
+            folder = key[: -len(":aux")] if is_auxiliary_obj else key
+            for model in self.get_models(folder, is_auxiliary_obj=is_auxiliary_obj):
+                self._check_model(model)
+            if not os.path.exists(os.path.join(self.root, folder)):
+                del self._folders[key]
+                self._set_dirty()
+
+    def get_mjcf_paths(self, folder, is_auxiliary_obj=False, exclude=None):
+        """
+        Get the absolute mjcf paths of all models in a category folder
+
+        Args:
+            folder (str): category folder, relative to the asset zoo root
+
+            is_auxiliary_obj (bool): if True, models are located one directory deeper
+
+            exclude (list): names of models to exclude
+
+        Returns:
+            list: mjcf paths
+        """
+        exclude = exclude or []
+        return [
+            os.path.join(self.root, model["mjcf_path"])
+            for model in self.get_models(folder, is_auxiliary_obj=is_auxiliary_obj)
+            if model["name"] not in exclude
+        ]
+
+    def get_half_sizes(self, mjcf_paths):
+        """
+        Get the reg_bbox half sizes of a list of models. Indexed models are checked for changes the first time
+        their size is looked up, and models that are not indexed are read from disk once
+
+        Args:
+            mjcf_paths (list): absolute mjcf paths
+
+        Returns:
+            np.array: (N, 3) array of half sizes. Rows of models without a reg_bbox geom are nan
+        """
+        half_sizes = np.full((len(mjcf_paths), 3), np.nan)
+        for (i, mjcf_path) in enumerate(mjcf_paths):
+            if mjcf_path in self._unchecked:
+                self._check_model(self._unchecked[mjcf_path])
+            if mjcf_path not in self._half_sizes:
+                half_size = read_bbox_half_size(mjcf_path)
+                self._half_sizes[mjcf_path] = (
+                    np.array(half_size) if half_size is not None else None
+                )
+            if self._half_sizes[mjcf_path] is not None:
+                half_sizes[i] = self._half_sizes[mjcf_path]
+        return half_sizes
+
+    def save(self, force=False):
+        """
+        Writes the index to disk if it changed since it was loaded. Failing to write the index is not an error
+
+        Args:
+            force (bool): if True, writes the index even if it did not change
+        """
+        if not (self._dirty or force):
+            return
+        data = dict(version=ASSET_INDEX_VERSION, root=self.root, folders=self._folders)
+        tmp_path = "{}.{}.tmp".format(self.index_path, os.getpid())
+        try:
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, self.index_path)
+            self._dirty = False
+        except OSError:
+            pass
+
+
+_ASSET_INDEX = None
+
+
+def get_asset_index():
+    """
+    Get the (process-wide) object asset index
+    """
+    global _ASSET_INDEX
+    if _ASSET_INDEX is None:
+        _ASSET_INDEX = ObjectAssetIndex()
+    return _ASSET_INDEX
@@ -1,15 +1,13 @@
 import math
 import os
-import xml.etree.ElementTree as ET
 from copy import deepcopy
 
 import numpy as np
-from robosuite.utils.mjcf_utils import find_elements, string_to_array
 
-import robocasa
+from robocasa.models.objects.asset_index import BASE_ASSET_ZOO_PATH, get_asset_index
 from robocasa.models.objects.kitchen_objects import OBJ_CATEGORIES, OBJ_GROUPS
-
-BASE_ASSET_ZOO_PATH = os.path.join(robocasa.models.assets_root, "objects")
+from robocasa.utils.asset_cost_index import get_asset_cost_index
+from robocasa.utils.errors import SamplingError
 
 
 class ObjCat:
@@ -108,31 +106,12 @@ class ObjCat:
 
         if model_folders is None:
             model_folders = ["{}/{}".format(reg_type, name)]
+        asset_index = get_asset_index()
         cat_mjcf_paths = []
         for folder in model_folders:
-            cat_path = os.path.join(BASE_ASSET_ZOO_PATH, folder)
-            if not os.path.exists(cat_path):
-                # skip if the asset path folder does not exist
-                continue
-            for model_name in os.listdir(cat_path):
-                model_dir = os.path.join(cat_path, model_name)
-                if not os.path.isdir(model_dir):
-                    continue
-                if self.is_auxiliary_obj:
-                    # auxiliary objects live one directory deeper
-                    for sub_name in os.listdir(model_dir):
-                        sub_dir = os.path.join(model_dir, sub_name)
-                        if os.path.isdir(sub_dir) and "model.xml" in os.listdir(
-                            sub_dir
-                        ):
-                            if model_name in self.exclude:
-                                continue
-                            cat_mjcf_paths.append(os.path.join(sub_dir, "model.xml"))
-                else:
-                    if "model.xml" in os.listdir(model_dir):
-                        if model_name in self.exclude:
-                            continue
-                        cat_mjcf_paths.append(os.path.join(model_dir, "model.xml"))
+            cat_mjcf_paths += asset_index.get_mjcf_paths(
+                folder, is_auxiliary_obj=self.is_auxiliary_obj, exclude=self.exclude
+            )
         self.mjcf_paths = sorted(cat_mjcf_paths)
 
     def get_mjcf_kwargs(self):
@@ -197,6 +176,68 @@ for (name, kwargs) in OBJ_CATEGORIES.items():
         )
 
 
+def _apply_object_scale(scale, object_scale):
+    """
+    Multiplies the scale of an object category by @object_scale (a float or a 3-tuple)
+    """
+    if object_scale is None:
+        return scale
+    if isinstance(object_scale, float):
+        if isinstance(scale, float):
+            scale *= object_scale
+        else:
+            scale = [e * object_scale for e in scale]
+    else:
+        if isinstance(scale, float):
+            scale = [scale for _ in range(3)]
+        scale = [scale[ind] * object_scale[ind] for ind in range(3)]
+    return scale
+
+
+def filter_mjcf_paths_by_size(mjcf_paths, max_size, scale=1.0, rotate_upright=False):
+    """
+    Filters object models to those whose (scaled) bounding box is within bounds of max size
+
+    Args:
+        mjcf_paths (list): mjcf paths of the object models
+
+        max_size (tuple): max size of the object. Dimensions set to None are not bounded
+
+        scale (float or tuple): scale applied to the object models
+
+        rotate_upright (bool): if True, checks the bounding box of the upright version of the models
+
+    Returns:
+        list: mjcf paths within bounds
+    """
+    size_paths = mjcf_paths
+    if rotate_upright:
+        size_paths = [p.replace("model.xml", "model_upright.xml") for p in mjcf_paths]
+    obj_sizes = get_asset_index().get_half_sizes(size_paths) * 2 * np.array(scale)
+
+    max_size = np.array([np.inf if v is None else v for v in max_size], dtype=float)
+    # models without a bounding box are never within bounds
+    valid = np.all(obj_sizes <= max_size, axis=1)
+    return [p for (p, v) in zip(mjcf_paths, valid) if v]
+
+
+def filter_mjcf_paths_by_cost(mjcf_paths, cost_budget):
+    """
+    Filters object models to those whose cost (see robocasa/utils/asset_cost_index.py) is within a budget
+
+    Args:
+        mjcf_paths (list): mjcf paths of the object models
+
+        cost_budget (float): maximum cost of a model, in seconds per episode. Models that are not in the asset
+            cost index are always within budget
+
+    Returns:
+        list: mjcf paths within budget
+    """
+    costs = get_asset_cost_index().get_costs(mjcf_paths)
+    return [p for (p, c) in zip(mjcf_paths, costs) if c <= cost_budget]
+
+
 def sample_kitchen_object(
     groups,
     exclude_groups=None,
@@ -214,6 +255,7 @@ def sample_kitchen_object(
     max_size=(None, None, None),
     object_scale=None,
     rotate_upright=False,
+    cost_budget=None,
 ):
     """
     Sample a kitchen object from the specified groups and within max_size bounds.
@@ -246,10 +288,14 @@ def sample_kitchen_object(
         split (str): split to sample from. Split "pretrain" specifies all but the last 4 object instances
                     (or the first half - whichever is larger), "target" specifies the rest, and None specifies all.
 
-        max_size (tuple): max size of the object. If the sampled object is not within bounds of max size, function will resample
+        max_size (tuple): max size of the object. Only objects within bounds of max size are sampled
 
         object_scale (float): scale of the object. If set will multiply the scale of the sampled object by this value
 
+        cost_budget (float): if set, only objects whose cost (see robocasa/utils/asset_cost_index.py) is within
+            this budget are sampled. The budget is ignored if no object is within it, and sampling (and the
+            rng draws) are the same as without a budget if every object is within it
+
 
     Returns:
         dict: kwargs to apply to the MJCF model for the sampled object
@@ -257,44 +303,25 @@ def sample_kitchen_object(
         dict: info about the sampled object - the path of the mjcf, groups which the object's category belongs to, the category of the object
               the sampling split the object came from, and the groups the object was sampled from
     """
-    valid_object_sampled = False
-    while valid_object_sampled is False:
-        mjcf_kwargs, info = sample_kitchen_object_helper(
-            groups=groups,
-            exclude_groups=exclude_groups,
-            graspable=graspable,
-            washable=washable,
-            microwavable=microwavable,
-            cookable=cookable,
-            fridgable=fridgable,
-            freezable=freezable,
-            dishwashable=dishwashable,
-            auxiliary_obj=auxiliary_obj,
-            rng=rng,
-            obj_registries=obj_registries,
-            split=split,
-            object_scale=object_scale,
-            rotate_upright=rotate_upright,
-        )
-
-        # check if object size is within bounds
-        mjcf_path = info["mjcf_path"]
-        tree = ET.parse(mjcf_path)
-        root = tree.getroot()
-        half_size = string_to_array(
-            find_elements(root=root, tags="geom", attribs={"name": "reg_bbox"}).get(
-                "size"
-            )
-        )
-        scale = mjcf_kwargs["scale"]
-        obj_size = (half_size * 2) * scale
-
-        valid_object_sampled = True
-        for i in range(3):
-            if max_size[i] is not None and obj_size[i] > max_size[i]:
-                valid_object_sampled = False
-
-    return mjcf_kwargs, info
+    return sample_kitchen_object_helper(
+        groups=groups,
+        exclude_groups=exclude_groups,
+        graspable=graspable,
+        washable=washable,
+        microwavable=microwavable,
+        cookable=cookable,
+        fridgable=fridgable,
+        freezable=freezable,
+        dishwashable=dishwashable,
+        auxiliary_obj=auxiliary_obj,
+        rng=rng,
+        obj_registries=obj_registries,
+        split=split,
+        max_size=max_size,
+        object_scale=object_scale,
+        rotate_upright=rotate_upright,
+        cost_budget=cost_budget,
+    )
 
 
 def sample_kitchen_object_helper(
@@ -311,8 +338,10 @@ def sample_kitchen_object_helper(
     rng=None,
     obj_registries=("objaverse",),
     split=None,
+    max_size=(None, None, None),
     object_scale=None,
     rotate_upright=False,
+    cost_budget=None,
 ):
     """
     Helper function to sample a kitchen object.
@@ -345,8 +374,14 @@ def sample_kitchen_object_helper(
         split (str): split to sample from. Split "pretrain" specifies all but the last 4 object instances
                     (or the first half - whichever is larger), "target" specifies the rest, and None specifies all.
 
+        max_size (tuple): max size of the object. Only objects within bounds of max size are sampled
+
         object_scale (float): scale of the object. If set will multiply the scale of the sampled object by this value
 
+        cost_budget (float): if set, only objects whose cost (see robocasa/utils/asset_cost_index.py) is within
+            this budget are sampled. The budget is ignored if no object is within it, and sampling (and the
+            rng draws) are the same as without a budget if every object is within it
+
 
     Returns:
         dict: kwargs to apply to the MJCF model for the sampled object
@@ -437,28 +472,94 @@ def sample_kitchen_object_helper(
 
                 valid_categories.append(cat)
 
-        cat = rng.choice(valid_categories)
+        def get_choices(cat):
+            choices = {reg: [] for reg in obj_registries}
 
-        choices = {reg: [] for reg in obj_registries}
-
-        for reg in obj_registries:
-            if reg not in OBJ_CATEGORIES[cat]:
-                choices[reg] = []
-                continue
-            reg_choices = deepcopy(OBJ_CATEGORIES[cat][reg].mjcf_paths)
-
-            # exclude out objects based on split
-            if split is not None:
-                split_th = max(
-                    len(reg_choices) - 5, int(math.ceil(len(reg_choices) / 2))
+            for reg in obj_registries:
+                if reg not in OBJ_CATEGORIES[cat]:
+                    choices[reg] = []
+                    continue
+                reg_choices = deepcopy(OBJ_CATEGORIES[cat][reg].mjcf_paths)
+
+                # exclude out objects based on split
+                if split is not None:
+                    split_th = max(
+                        len(reg_choices) - 5, int(math.ceil(len(reg_choices) / 2))
+                    )
+                    if split == "pretrain":
+                        reg_choices = reg_choices[:split_th]
+                    elif split == "target":
+                        reg_choices = reg_choices[split_th:]
+                    else:
+                        raise ValueError
+                choices[reg] = reg_choices
+            return choices
+
+        bounded_size = not all(v is None for v in max_size)
+        # restrict choices to objects within bounds of max size and within the cost budget. Categories are
+        # weighted by the fraction of their objects that fit, which matches resampling until one is found
+        cat_choices = []
+        cat_weights = []
+        cat_cost_choices = []
+        cat_cost_weights = []
+        cost_filtered = False
+        if bounded_size or cost_budget is not None:
+            for cand_cat in valid_categories:
+                choices = get_choices(cand_cat)
+                num_choices = sum(len(choices[reg]) for reg in obj_registries)
+                if bounded_size:
+                    for reg in obj_registries:
+                        if len(choices[reg]) == 0:
+                            continue
+                        choices[reg] = filter_mjcf_paths_by_size(
+                            choices[reg],
+                            max_size=max_size,
+                            scale=_apply_object_scale(
+                                OBJ_CATEGORIES[cand_cat][reg].scale, object_scale
+                            ),
+                            rotate_upright=rotate_upright,
+                        )
+                num_valid_choices = sum(len(choices[reg]) for reg in obj_registries)
+                cat_choices.append(choices)
+                cat_weights.append(
+                    num_valid_choices / num_choices if num_choices > 0 else 0.0
+                )
+                if cost_budget is not None:
+                    cost_choices = {
+                        reg: filter_mjcf_paths_by_cost(choices[reg], cost_budget)
+                        for reg in obj_registries
+                    }
+                    num_cost_choices = sum(
+                        len(cost_choices[reg]) for reg in obj_registries
+                    )
+                    cost_filtered |= num_cost_choices < num_valid_choices
+                    cat_cost_choices.append(cost_choices)
+                    cat_cost_weights.append(
+                        num_cost_choices / num_choices if num_choices > 0 else 0.0
+                    )
+            # if no object is within budget, sample as if there was none
+            cost_filtered = cost_filtered and np.sum(cat_cost_weights) > 0
+
+        if not bounded_size and not cost_filtered:
+            # the budget does not remove any object, so categories are sampled as without it (same seeds)
+            cat = rng.choice(valid_categories)
+            choices = get_choices(cat)
+        else:
+            if cost_filtered:
+                cat_choices = cat_cost_choices
+                cat_weights = cat_cost_weights
+            cat_weights = np.array(cat_weights)
+            if np.sum(cat_weights) == 0:
+                raise SamplingError(
+                    "No objects in groups {} within bounds of max size {}".format(
+                        groups, max_size
+                    )
                 )
-                if split == "pretrain":
-                    reg_choices = reg_choices[:split_th]
-                elif split == "target":
-                    reg_choices = reg_choices[split_th:]
-                else:
-                    raise ValueError
-            choices[reg] = reg_choices
+            cat_ind = rng.choice(
+                len(valid_categories), p=cat_weights / np.sum(cat_weights)
+            )
+            cat = valid_categories[cat_ind]
+            choices = cat_choices[cat_ind]
 
         chosen_reg = rng.choice(
             obj_registries,
@@ -472,18 +573,7 @@ def sample_kitchen_object_helper(
         mjcf_kwargs = OBJ_CATEGORIES[cat][chosen_reg].get_mjcf_kwargs()
         mjcf_kwargs["mjcf_path"] = mjcf_path
 
-    if object_scale is not None:
-        if isinstance(object_scale, float):
-            if isinstance(mjcf_kwargs["scale"], float):
-                mjcf_kwargs["scale"] *= object_scale
-            else:
-                mjcf_kwargs["scale"] = [e * object_scale for e in mjcf_kwargs["scale"]]
-        else:
-            if isinstance(mjcf_kwargs["scale"], float):
-                mjcf_kwargs["scale"] = [mjcf_kwargs["scale"] for _ in range(3)]
-            mjcf_kwargs["scale"] = [
-                mjcf_kwargs["scale"][ind] * object_scale[ind] for ind in range(3)
-            ]
+    mjcf_kwargs["scale"] = _apply_object_scale(mjcf_kwargs["scale"], object_scale)
 
     groups_containing_sampled_obj = []
     for group, group_cats in OBJ_GROUPS.items():
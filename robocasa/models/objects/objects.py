@@ -1,5 +1,5 @@
+import io
 import os
-import time
 import xml.etree.ElementTree as ET
 
 import numpy as np
@@ -9,6 +9,42 @@ from robosuite.models.objects import MujocoXMLObject
 from robosuite.models.base import MujocoXML
 from robosuite.utils.mjcf_utils import array_to_string, string_to_array, find_elements
 
+# signs of the 8 bounding box corners relative to the box center. first four are p0, px, py, pz
+BBOX_CORNER_SIGNS = np.array(
+    [
+        [-1, -1, -1],  # p0
+        [1, -1, -1],  # px
+        [-1, 1, -1],  # py
+        [-1, -1, 1],  # pz
+        [1, 1, 1],
+        [-1, 1, 1],
+        [1, -1, 1],
+        [1, 1, -1],
+    ]
+)
+
+# per-process cache of postprocessed object xmls, keyed by (object class, mjcf path, file mtime)
+MJCF_TEMPLATE_CACHE = dict()
+
+
+class MJCFBuffer(io.BytesIO):
+    """
+    In-memory xml file for robosuite's MujocoXML. It is read like a file, but behaves as the path of the
+    original xml (os.fspath), so that relative asset paths resolve against the original model folder
+
+    Args:
+        xml_bytes (bytes): xml contents
+
+        path (str): path of the original xml file
+    """
+
+    def __init__(self, xml_bytes, path):
+        super().__init__(xml_bytes)
+        self.path = path
+
+    def __fspath__(self):
+        return self.path
+
 
 class MujocoXMLObjectRobocasa(MujocoXMLObject):
     def set_scale(self, scale, obj=None):
@@ -23,6 +59,8 @@ class MujocoXMLObjectRobocasa(MujocoXMLObject):
         if obj is None:
             obj = self._obj
 
+        self._invalidate_geometry_cache()
+
         # set scale as 3-dim np array
         if isinstance(scale, float) or isinstance(scale, int):
             scale = np.array([scale] * 3)
@@ -149,6 +187,53 @@ class MujocoXMLObjectRobocasa(MujocoXMLObject):
                 s_size = array_to_string(s_size_np)
                 elem.set("size", s_size)
 
+    def set_pos(self, pos):
+        super().set_pos(pos)
+        self._invalidate_geometry_cache()
+
+    def set_euler(self, euler):
+        super().set_euler(euler)
+        self._invalidate_geometry_cache()
+
+    def _invalidate_geometry_cache(self):
+        """
+        Clears all cached region geometry. Must be called whenever the regions, scale or pose of the model change
+        """
+        self._geometry_cache = dict()
+
+    def _compute_region_geometry(self, reg_name):
+        """
+        Computes the geometry of region @reg_name in the local frame of the model. Implemented by subclasses
+
+        Returns:
+            dict: center (3-array), half_size (3-array) and corners ((8, 3) array)
+        """
+        raise NotImplementedError
+
+    def get_region_geometry(self, reg_name):
+        """
+        Get the (cached) geometry of a region in the local frame of the model. Arrays are read-only
+        and are recomputed only after set_scale, set_pos or set_euler
+
+        Args:
+            reg_name (str): name of the region (eg. "bbox", "main", "int")
+
+        Returns:
+            dict: center (3-array), half_size (3-array) and corners ((8, 3) array, where the first four
+                corners are p0, px, py, pz)
+        """
+        cache = getattr(self, "_geometry_cache", None)
+        if cache is None:
+            self._invalidate_geometry_cache()
+            cache = self._geometry_cache
+        key = ("local", reg_name)
+        if key not in cache:
+            geometry = self._compute_region_geometry(reg_name)
+            for v in geometry.values():
+                v.setflags(write=False)
+            cache[key] = geometry
+        return cache[key]
+
     @property
     def anchor_offset(self):
         anchor_site = self.worldbody.find(
@@ -234,35 +319,19 @@ class MJCFObject(MujocoXMLObjectRobocasa):
 
         self.rgba = rgba
 
-        # read default xml
-        xml_path = mjcf_path
+        # build the object from an in-memory copy of its (postprocessed) xml, without writing temp files
         self.mjcf_path = mjcf_path
-        folder = os.path.dirname(xml_path)
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
-
-        # write modified xml (and make sure to postprocess any paths just in case)
-        xml_str = ET.tostring(root, encoding="utf8").decode("utf8")
-        xml_str = self.postprocess_model_xml(xml_str)
-        time_str = str(time.time()).replace(".", "_")
-        new_xml_path = os.path.join(folder, "{}_{}.xml".format(time_str, os.getpid()))
-        f = open(new_xml_path, "w")
-        f.write(xml_str)
-        f.close()
-
-        # initialize object with new xml we wrote
+        xml_file = MJCFBuffer(self.get_model_xml_template(mjcf_path), mjcf_path)
+
         super().__init__(
-            fname=new_xml_path,
+            fname=xml_file,
             name=name,
             joints=[dict(type="free", damping="0.0005")],
             obj_type="all",
             duplicate_collision_geoms=False,
             scale=scale,
         )
-
-        # clean up xml - we don't need it anymore
-        if os.path.exists(new_xml_path):
-            os.remove(new_xml_path)
+        self.file = mjcf_path
 
         self._regions = dict()
         self._setup_region_dict()
@@ -298,9 +367,7 @@ class MJCFObject(MujocoXMLObjectRobocasa):
 
             reg_dict = dict()
             reg_pos = string_to_array(geom.get("pos"))
-            reg_halfsize = string_to_array(geom.get("size"))
-            if geom.get("type") == "cylinder":
-                reg_halfsize = [reg_halfsize[0], reg_halfsize[0], reg_halfsize[1]]
+            reg_halfsize = self._get_region_half_size(geom)
             p0 = reg_pos + [-reg_halfsize[0], -reg_halfsize[1], -reg_halfsize[2]]
             px = reg_pos + [reg_halfsize[0], -reg_halfsize[1], -reg_halfsize[2]]
             py = reg_pos + [-reg_halfsize[0], reg_halfsize[1], -reg_halfsize[2]]
@@ -314,18 +381,41 @@ class MJCFObject(MujocoXMLObjectRobocasa):
             prefix = g_name[4:]
             self._regions[prefix] = reg_dict
 
+    def get_model_xml_template(self, mjcf_path):
+        """
+        Get the postprocessed xml of the model at @mjcf_path. The xml is read and postprocessed once per process
+        (and again only if the file changes), and reused for all objects created from the same model
+
+        Returns:
+            bytes: postprocessed xml
+        """
+        key = (type(self), mjcf_path, os.stat(mjcf_path).st_mtime)
+        xml_bytes = MJCF_TEMPLATE_CACHE.get(key)
+        if xml_bytes is None:
+            root = ET.parse(mjcf_path).getroot()
+            self.postprocess_model_root(root)
+            xml_bytes = ET.tostring(root, encoding="utf8")
+            MJCF_TEMPLATE_CACHE[key] = xml_bytes
+        return xml_bytes
+
     def postprocess_model_xml(self, xml_str):
         """
         New version of postprocess model xml that only replaces robosuite file paths if necessary (otherwise
         there is an error with the "max" operation)
         """
+        root = ET.fromstring(xml_str)
+        self.postprocess_model_root(root)
+        return ET.tostring(root, encoding="utf8").decode("utf8")
+
+    def postprocess_model_root(self, root):
+        """
+        In-place version of postprocess_model_xml, operating on the root element of the model
+        """
 
         path = os.path.split(robosuite.__file__)[0]
         path_split = path.split("/")
 
         # replace mesh and texture file paths
-        tree = ET.fromstring(xml_str)
-        root = tree
         asset = root.find("asset")
         meshes = asset.findall("mesh")
         textures = asset.findall("texture")
@@ -347,8 +437,6 @@ class MJCFObject(MujocoXMLObjectRobocasa):
                 new_path = "/".join(new_path_split)
                 elem.set("file", new_path)
 
-        return ET.tostring(root, encoding="utf8").decode("utf8")
-
     def _get_geoms(self, root, _parent=None):
         """
         Helper function to recursively search through element tree starting at @root and returns
@@ -383,58 +471,73 @@ class MJCFObject(MujocoXMLObjectRobocasa):
 
         return geom_pairs
 
+    @staticmethod
+    def _get_region_half_size(reg_geom):
+        """
+        Get the half size of a region geom along x, y and z. Box regions give their size attribute as is.
+        Cylinder regions (size is radius, half height) are treated as their axis-aligned bounding box
+
+        Args:
+            reg_geom (ET.Element): geom element of the region
+
+        Returns:
+            np.array: (3,) half size of the region
+        """
+        half_size = string_to_array(reg_geom.get("size"))
+        if reg_geom.get("type") == "cylinder":
+            half_size = np.array([half_size[0], half_size[0], half_size[1]])
+        return half_size
+
+    def _compute_region_geometry(self, reg_name):
+        """
+        Computes the geometry of region @reg_name from the pos and size attributes of its geom
+        (see _get_region_half_size)
+        """
+        reg_geom = self._regions[reg_name]["elem"]
+        center = string_to_array(reg_geom.get("pos"))
+        half_size = self._get_region_half_size(reg_geom)
+        return dict(
+            center=center,
+            half_size=half_size,
+            corners=center + half_size * BBOX_CORNER_SIGNS,
+        )
+
     @property
     def horizontal_radius(self):
-        _horizontal_radius = string_to_array(self._regions["bbox"]["elem"].get("size"))[
-            0:2
-        ]
-        return np.linalg.norm(_horizontal_radius)
+        half_size = self.get_region_geometry("bbox")["half_size"]
+        return np.linalg.norm(half_size[0:2])
 
     @property
     def bottom_offset(self):
-        pos = string_to_array(self._regions["bbox"]["elem"].get("pos"))
-        half_size = string_to_array(self._regions["bbox"]["elem"].get("size"))
+        bbox = self.get_region_geometry("bbox")
+        pos, half_size = bbox["center"], bbox["half_size"]
         return np.array([pos[0], pos[1], pos[2] - half_size[2]])
 
     @property
     def top_offset(self):
-        pos = string_to_array(self._regions["bbox"]["elem"].get("pos"))
-        half_size = string_to_array(self._regions["bbox"]["elem"].get("size"))
+        bbox = self.get_region_geometry("bbox")
+        pos, half_size = bbox["center"], bbox["half_size"]
         return np.array([pos[0], pos[1], pos[2] + half_size[2]])
 
     def get_bbox_points(self, trans=None, rot=None):
         """
         Get the full 8 bounding box points of the object
-        rot: a rotation matrix
+        rot: a quaternion in (x,y,z,w) form
+
+        Returns:
+            np.array: (8, 3) array of points
         """
-        bbox_offsets = []
-        reg_bbox_geom = self._regions["bbox"]["elem"]
-        center = string_to_array(reg_bbox_geom.get("pos"))
-        half_size = string_to_array(reg_bbox_geom.get("size"))
-
-        bbox_offsets = [
-            center + half_size * np.array([-1, -1, -1]),  # p0
-            center + half_size * np.array([1, -1, -1]),  # px
-            center + half_size * np.array([-1, 1, -1]),  # py
-            center + half_size * np.array([-1, -1, 1]),  # pz
-            center + half_size * np.array([1, 1, 1]),
-            center + half_size * np.array([-1, 1, 1]),
-            center + half_size * np.array([1, -1, 1]),
-            center + half_size * np.array([1, 1, -1]),
-        ]
+        bbox_offsets = self.get_region_geometry("bbox")["corners"]
 
         if trans is None:
-            trans = np.array([0, 0, 0])
-        if rot is not None:
-            rot = T.quat2mat(rot)
-        else:
-            rot = np.eye(3)
+            trans = np.zeros(3)
+        if rot is None:
+            return bbox_offsets + trans
 
-        points = [(np.matmul(rot, p) + trans) for p in bbox_offsets]
-        return points
+        rot = T.quat2mat(rot)
+        return bbox_offsets @ rot.T + trans
 
     @property
     def size(self):
-        reg_bbox_geom = self._regions["bbox"]["elem"]
-        half_size = string_to_array(reg_bbox_geom.get("size"))
+        half_size = self.get_region_geometry("bbox")["half_size"]
         return list(half_size * 2)
@@ -0,0 +1,138 @@
+"""
+Process-wide cache of parsed scene configs (fixture registry, kitchen layouts and kitchen styles).
+
+Every scene build reads the layout and style yaml files, and one fixture registry yaml file per fixture. Callers
+(eg. create_fixtures) mutate the configs they get, so the cache stores each parsed config in serialized form and
+hands out a fresh copy on every load. Deserializing a copy is much cheaper than parsing yaml, and the cached
+configs can never be modified by a caller. Entries are invalidated when the modification time or size of the
+yaml file changes.
+
+Optionally, all configs under the fixture registry and scenes asset folders can be pre-compiled into a single
+bundle file in the user cache directory (see build_config_bundle), which is loaded on first use to skip parsing
+yaml files altogether:
+
+    python robocasa/scripts/build_config_bundle.py
+"""
+
+import os
+import pickle
+
+import yaml
+
+import robocasa
+from robocasa.utils.cache_utils import get_cache_path
+
+CONFIG_BUNDLE_VERSION = 1
+
+# asset folders whose configs are included in the bundle, relative to the assets root
+CONFIG_BUNDLE_FOLDERS = ("fixtures/fixture_registry", "scenes")
+CONFIG_BUNDLE_FILENAME = "config_bundle.pkl"
+
+# absolute yaml path -> (mtime, size, pickled config)
+_CONFIG_CACHE = dict()
+_BUNDLE_LOADED = False
+
+
+def get_config_bundle_path():
+    """
+    Returns:
+        str: path of the config bundle, in the user cache directory
+    """
+    return get_cache_path(CONFIG_BUNDLE_FILENAME)
+
+
+def _file_signature(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load_bundle():
+    """
+    Adds the entries of the config bundle (if any) to the cache. Stale entries are dropped on first access
+    """
+    global _BUNDLE_LOADED
+    _BUNDLE_LOADED = True
+    bundle_path = get_config_bundle_path()
+    if not os.path.exists(bundle_path):
+        return
+    try:
+        with open(bundle_path, "rb") as f:
+            data = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return
+    if data.get("version") != CONFIG_BUNDLE_VERSION:
+        return
+    for (rel_path, entry) in data["configs"].items():
+        path = os.path.join(robocasa.models.assets_root, rel_path)
+        _CONFIG_CACHE.setdefault(path, entry)
+
+
+def load_yaml_config(path):
+    """
+    Loads a yaml config through the process-wide cache
+
+    Args:
+        path (str): path to the yaml file
+
+    Returns:
+        dict: parsed config. This is a fresh copy, which the caller is free to modify
+    """
+    if not _BUNDLE_LOADED:
+        _load_bundle()
+
+    path = os.path.abspath(path)
+    signature = _file_signature(path)
+    entry = _CONFIG_CACHE.get(path)
+    if entry is None or entry[:2] != signature:
+        with open(path, "r") as f:
+            config = yaml.safe_load(f)
+        entry = signature + (pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL),)
+        _CONFIG_CACHE[path] = entry
+    return pickle.loads(entry[2])
+
+
+def clear_config_cache():
+    """
+    Clears all cached configs. The config bundle is reloaded on next use
+    """
+    global _BUNDLE_LOADED
+    _CONFIG_CACHE.clear()
+    _BUNDLE_LOADED = False
+
+
+def build_config_bundle(bundle_path=None):
+    """
+    Parses all yaml configs under CONFIG_BUNDLE_FOLDERS and writes them to a single bundle file
+
+    Args:
+        bundle_path (str): path of the bundle. Defaults to get_config_bundle_path()
+
+    Returns:
+        int: number of configs in the bundle
+    """
+    if bundle_path is None:
+        bundle_path = get_config_bundle_path()
+
+    configs = dict()
+    for folder in CONFIG_BUNDLE_FOLDERS:
+        folder_path = os.path.join(robocasa.models.assets_root, folder)
+        for (dirpath, dirnames, filenames) in os.walk(folder_path):
+            dirnames.sort()
+            for fname in sorted(filenames):
+                if not fname.endswith(".yaml"):
+                    continue
+                path = os.path.join(dirpath, fname)
+                with open(path, "r") as f:
+                    config = yaml.safe_load(f)
+                rel_path = os.path.relpath(path, robocasa.models.assets_root)
+                configs[rel_path] = _file_signature(path) + (
+                    pickle.dumps(config, protocol=pickle.HIGHEST_PROTOCOL),
+                )
+
+    data = dict(version=CONFIG_BUNDLE_VERSION, configs=configs)
+    os.makedirs(os.path.dirname(bundle_path), exist_ok=True)
+    tmp_path = "{}.{}.tmp".format(bundle_path, os.getpid())
+    with open(tmp_path, "wb") as f:
+        pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, bundle_path)
+    return len(configs)
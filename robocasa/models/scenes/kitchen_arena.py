@@ -2,12 +2,13 @@ from robosuite.models.arenas import Arena
 from robosuite.utils.mjcf_utils import xml_path_completion
 
 import robocasa
-import yaml
+from robocasa.models.scenes.config_cache import load_yaml_config
 from robocasa.models.scenes.scene_builder import (
     create_fixtures,
     get_layout_path,
     get_style_path,
 )
+from robocasa.utils.asset_cost_index import get_asset_cost_index
 from copy import deepcopy
 
 
@@ -88,6 +89,9 @@ class KitchenArena(Arena):
         enable_fixtures (list of str): any fixtures to enable (some are disabled by default)
 
         clutter_mode (int): sets clutter level. default is 0.
+
+        cost_budget (float): if set, total cost of the fixture xmls (see robocasa/utils/asset_cost_index.py).
+            Styled fixtures that do not fit in the budget are replaced by cheaper fixtures of the same type
     """
 
     def __init__(
@@ -98,6 +102,7 @@ class KitchenArena(Arena):
         enable_fixtures=None,
         clutter_mode=0,
         update_fxtr_cfg_dict=None,
+        cost_budget=None,
     ):
         super().__init__(
             xml_path_completion(
@@ -110,8 +115,7 @@ class KitchenArena(Arena):
             layout_config = layout_id
         else:
             layout_path = get_layout_path(layout_id=layout_id)
-            with open(layout_path, "r") as f:
-                layout_config = yaml.safe_load(f)
+            layout_config = load_yaml_config(layout_path)
 
         if enable_fixtures is not None:
             enable_fixtures_in_config(layout_config, enable_fixtures)
@@ -132,13 +136,21 @@ class KitchenArena(Arena):
             style_config = style_id
         else:
             style_path = get_style_path(style_id=style_id)
-            with open(style_path, "r") as f:
-                style_config = yaml.safe_load(f)
+            style_config = load_yaml_config(style_path)
 
         self.fixtures = create_fixtures(
             layout_config=layout_config,
             style_config=style_config,
             rng=rng,
+            cost_budget=cost_budget,
+        )
+
+        # total cost of the fixture xmls
+        cost_index = get_asset_cost_index()
+        self.asset_cost = sum(
+            cost_index.get_cost(fxtr.file)
+            for fxtr in self.fixtures.values()
+            if getattr(fxtr, "file", None) is not None
         )
 
     def get_fixture_cfgs(self):
@@ -7,6 +7,7 @@ from copy import deepcopy
 
 from robocasa.models.scenes.scene_registry import get_layout_path, get_style_path
 from robocasa.models.scenes.scene_utils import *
+from robocasa.utils.asset_cost_index import get_asset_cost_index
 from robocasa.models.fixtures import *
 
 # fixture string to class
@@ -126,7 +127,7 @@ def check_syntax(fixture):
             )
 
 
-def create_fixtures(layout_config, style_config, rng=None):
+def create_fixtures(layout_config, style_config, rng=None, cost_budget=None):
     """
     Initializes fixtures based on the given layout yaml file and style type
 
@@ -136,6 +137,10 @@ def create_fixtures(layout_config, style_config, rng=None):
         style_config (dict): style of the kitchen to load
 
         rng (np.random.Generator): random number generator used for initializing fixture state
+
+        cost_budget (float): if set, total cost of the fixture xmls (see robocasa/utils/asset_cost_index.py).
+            Styled fixtures that do not fit in the remaining budget are replaced by the cheapest fixture of
+            their type
     """
 
     # contains all fixtures with updated configs
@@ -245,6 +250,8 @@ def create_fixtures(layout_config, style_config, rng=None):
     configs = dict()
     # names of composites, delete from fixtures before returning
     composites = list()
+    # total cost of the fixture xmls, if cost_budget is set
+    fixtures_cost = 0.0
 
     # initialize each fixture in the arena by processing config
     for fixture_config in arena:
@@ -273,7 +280,11 @@ def create_fixtures(layout_config, style_config, rng=None):
             continue
 
         # load style information and update config to include it
-        default_config = load_style_config(style_config, fixture_config)
+        default_config = load_style_config(
+            style_config,
+            fixture_config,
+            cost_budget=(None if cost_budget is None else cost_budget - fixtures_cost),
+        )
         if default_config is not None:
             for k, v in fixture_config.items():
                 default_config[k] = v
@@ -295,6 +306,9 @@ def create_fixtures(layout_config, style_config, rng=None):
         fixture = initialize_fixture(fixture_config, fixtures, rng=rng)
         fixtures[fixture_name] = fixture
         configs[fixture_name] = fixture_config
+        # procedural fixtures (walls, floors, boxes) have no xml
+        if cost_budget is not None and getattr(fixture, "file", None) is not None:
+            fixtures_cost += get_asset_cost_index().get_cost(fixture.file)
 
         # update fixture position
         if fixture_config["type"] not in FIXTURES_INTERIOR.values():
@@ -367,8 +381,11 @@ def create_fixtures(layout_config, style_config, rng=None):
             else:
                 rot_new = [0, 0, z_rot]
 
+            # the pose is edited in the xml rather than through set_pos, since some fixtures (eg. cabinets)
+            # also re-place their interior objects there, so the cached region geometry is cleared here
             fixture._obj.set("pos", a2s(pos_new))
             fixture._obj.set("euler", a2s(rot_new))
+            fixture._invalidate_geometry_cache()
 
     # apply individual z_rot to fixtures that have it specified
     for name, fixture in fixtures.items():
@@ -383,6 +400,7 @@ def create_fixtures(layout_config, style_config, rng=None):
             else:
                 rot_new = [0, 0, z_rot]
             fixture._obj.set("euler", a2s(rot_new))
+            fixture._invalidate_geometry_cache()
 
     # add auxiliary fixture references to the main fixture
     for base_name, auxiliary_name in base_to_auxiliary_instance_map.items():
@@ -1,9 +1,10 @@
 from collections import OrderedDict
 from copy import deepcopy
-import yaml
 from robosuite.utils.mjcf_utils import xml_path_completion
 
 import robocasa
+from robocasa.models.scenes.config_cache import load_yaml_config
+from robocasa.utils.asset_cost_index import get_asset_cost_index
 
 
 # second keyword corresponds to positive end of axis
@@ -78,7 +79,7 @@ def initialize_fixture(config, cur_fixtures, rng=None):
     return fixture
 
 
-def load_style_config(style, fixture_config):
+def load_style_config(style, fixture_config, cost_budget=None):
     """
     Loads the style information for a given fixture. Style information can consist of
     which xml to use if there are multiple instances of a fixture, which texture to apply,
@@ -88,6 +89,10 @@ def load_style_config(style, fixture_config):
         style (dict): dictionary containing the style information for each fixture type
 
         fixture_config (dict): dictionary containing the fixture configuration
+
+        cost_budget (float): if set and the xml of the styled fixture costs more than this budget (see
+            robocasa/utils/asset_cost_index.py), the cheapest profiled config of the same fixture type is used
+            instead, if it fits
     """
     # accounts for the different types of cabinets
     fixture_type = fixture_config["type"]
@@ -104,8 +109,7 @@ def load_style_config(style, fixture_config):
         f"fixtures/fixture_registry/{fixture_type}.yaml",
         root=robocasa.models.assets_root,
     )
-    with open(yaml_path, "r") as f:
-        default_configs = yaml.safe_load(f)
+    default_configs = load_yaml_config(yaml_path)
 
     # find which configuration to use
     if type(fixture_style) == dict and "config_name" not in fixture_config:
@@ -126,7 +130,7 @@ def load_style_config(style, fixture_config):
         config_ids = fixture_style
 
     # search for config by name
-    config = default_configs["default"]
+    config = dict(default_configs["default"])
     if not isinstance(config_ids, list):
         config_ids = [config_ids]
     for cfg_id in config_ids:
@@ -140,6 +144,22 @@ def load_style_config(style, fixture_config):
                 'Did not find style that matches "{}" for '
                 'fixture type "{}"'.format(cfg_id, fixture_type)
             )
+
+    if cost_budget is not None and "xml" in config:
+        cost_index = get_asset_cost_index()
+        if cost_index.get_cost(config["xml"]) > cost_budget:
+            # only substitute fixtures that were profiled
+            candidates = [
+                (cost_index.get_cost(cfg["xml"]), cfg_id)
+                for (cfg_id, cfg) in default_configs.items()
+                if cfg_id != "default"
+                and "xml" in cfg
+                and cost_index.get_entry(cfg["xml"]) is not None
+            ]
+            if len(candidates) > 0 and min(candidates)[0] <= cost_budget:
+                # the substitute replaces the styled configs rather than being layered on top of them
+                config = dict(default_configs["default"])
+                config.update(default_configs[min(candidates)[1]])
     return config
 
 
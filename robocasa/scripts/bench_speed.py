@@ -1,261 +1,509 @@
 """
-A script to run benchmarking on environments.
-Runs several rollouts and logs the reset times and fps of the environment.
+Benchmark harness for robocasa environments.
+
+Runs a matrix of tasks x layouts x styles x robots x render modes and measures, for each cell:
+    - environment construction time
+    - reset time, along with the time of each reset phase (see Kitchen.get_reset_profile)
+    - number of physics sub-steps used to settle objects at reset (settle_substeps)
+    - step time (with camera observations rendered offscreen, or without rendering)
+    - success check time (the _check_success evaluations made by the env during a step)
+and optionally the cold import time of robocasa and the playback time of a dataset. Results are written as json,
+with mean/p50/p95/p99 summaries of every metric (in seconds, except for settle_substeps) and a fingerprint of the
+machine and software.
+A results file can then be compared against a stored baseline, which flags regressions and exits with a non-zero
+status. Runs headless, and rendering works on CPU-only machines through osmesa (--mujoco_gl osmesa).
+
+Example:
+    python robocasa/scripts/bench_speed.py --tasks PickPlaceCounterToCabinet --layouts 1 2 --styles 1 \
+        --render_modes none camera --import_trials 5 --out results.json
+
+    python robocasa/scripts/bench_speed.py --compare results.json --baseline baseline.json --threshold 0.1
 """
 
 import argparse
+import json
 import os
+import platform
+import subprocess
+import sys
 import time
+from collections import defaultdict
 
 import numpy as np
 from termcolor import colored
-from tianshou.env import SubprocVectorEnv
 
-import robosuite as suite
-from robosuite.controllers import load_composite_controller_config
-from robocasa import ALL_KITCHEN_ENVIRONMENTS
+BENCH_VERSION = 1
+SUMMARY_PERCENTILES = (50, 95, 99)
+RENDER_MODES = ("none", "camera")
+CAMERA_NAMES = [
+    "robot0_agentview_left",
+    "robot0_agentview_right",
+    "robot0_eye_in_hand",
+]
+
+IMPORT_SCRIPT = """
+import time
+t_start = time.perf_counter()
 import robocasa
+print(time.perf_counter() - t_start)
+"""
 
 
-def run_rollout(env, arm, env_configuration, num_steps=200, render=False):
+def log_info(message, color="yellow"):
+    print(colored(message, color))
+
+
+def summarize(samples):
     """
-    Use the device (keyboard or SpaceNav 3D mouse) to collect a demonstration.
-    The rollout trajectory is saved to files in npz format.
-    Modify the DataCollectionWrapper wrapper to add new fields or change data formats.
     Args:
-        env (MujocoEnv): environment to control
-        device (Device): to receive controls from the device
-        arms (str): which arm to control (eg bimanual) 'right' or 'left'
-        env_configuration (str): specified environment configuration
+        samples (list): measurements, in seconds
+
+    Returns:
+        dict: number of samples, mean, std, min, max and percentiles (p50, p95, p99) of @samples
     """
+    samples = np.asarray(samples, dtype=np.float64)
+    if len(samples) == 0:
+        return dict(n=0)
+    summary = dict(
+        n=len(samples),
+        mean=float(np.mean(samples)),
+        std=float(np.std(samples)),
+        min=float(np.min(samples)),
+        max=float(np.max(samples)),
+    )
+    for (q, v) in zip(SUMMARY_PERCENTILES, np.percentile(samples, SUMMARY_PERCENTILES)):
+        summary["p{}".format(q)] = float(v)
+    return summary
+
+
+def get_git_commit(path):
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=path,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
 
-    t_reset_start = time.time()
-    obs = env.reset()
-    # print(obs.keys())
-    reset_time = time.time() - t_reset_start
 
-    # ID = 2 always corresponds to agentview
-    if render:
-        env.render()
+def get_fingerprint():
+    """
+    Returns:
+        dict: description of the machine and software the benchmark ran on, stored alongside the results
+    """
+    import mujoco
+    import robosuite
+
+    import robocasa
+
+    return dict(
+        bench_version=BENCH_VERSION,
+        hostname=platform.node(),
+        platform=platform.platform(),
+        processor=platform.processor(),
+        cpu_count=os.cpu_count(),
+        python=platform.python_version(),
+        numpy=np.__version__,
+        mujoco=mujoco.__version__,
+        robosuite=robosuite.__version__,
+        robocasa=robocasa.__version__,
+        robocasa_commit=get_git_commit(os.path.dirname(robocasa.__file__)),
+        mujoco_gl=os.environ.get("MUJOCO_GL"),
+    )
 
-    # Loop until we get a reset from the input or the task completes
 
-    if isinstance(env, SubprocVectorEnv):
-        ac_dim = env.get_env_attr(key="action_spec", id=0)[0][0].shape
-        ac_dim = list([len(env)]) + list(ac_dim)
-    else:
-        ac_dim = env.action_spec[0].shape
+def bench_import(num_trials):
+    """
+    Measures the time to import robocasa in fresh interpreters
 
-    t_start = time.time()
+    Returns:
+        dict: metric name -> list of samples
+    """
+    samples = []
+    for _ in range(num_trials):
+        out = subprocess.run(
+            [sys.executable, "-c", IMPORT_SCRIPT],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        samples.append(float(out.stdout.strip().splitlines()[-1]))
+    return dict(import_time=samples)
 
-    for _ in range(num_steps):
-        # Get the newest action
-        action = np.random.normal(size=ac_dim)
-        # set base actions to 0
-        action[-5:] = 0.0
 
-        # Run environment step
-        obs, _, _, _ = env.step(action)
+def create_env(env_name, robot, layout, style, seed, render):
+    """
+    Creates an environment for benchmarking. No on-screen renderer is used
 
-        # import cv2
-        # im = obs["robot0_agentview_left_image"]
-        # cv2.imshow("offscreen render", im)
-        # key = cv2.waitKey(1)
+    Args:
+        render (bool): if True, camera observations are rendered offscreen at every step
+    """
+    import robosuite
+    from robosuite.controllers import load_composite_controller_config
+
+    controller_config = load_composite_controller_config(controller=None, robot=robot)
+    config = dict(
+        env_name=env_name,
+        robots=robot,
+        controller_configs=controller_config,
+        layout_ids=layout,
+        style_ids=style,
+        seed=seed,
+        ignore_done=True,
+        reward_shaping=True,
+        control_freq=20,
+        translucent_robot=True,
+        has_renderer=False,
+        has_offscreen_renderer=render,
+        use_camera_obs=render,
+        camera_names=CAMERA_NAMES,
+        camera_heights=84,
+        camera_widths=84,
+    )
+    return robosuite.make(**config)
 
-        if render:
-            env.render()
 
-    t_end = time.time()
-    steps_per_sec = num_steps / (t_end - t_start)
+def bench_env(env_name, robot, layout, style, render, num_resets, num_steps, seed=0):
+    """
+    Measures construction, reset, step and success check times of one environment configuration.
+    The same environment is used for all resets
 
-    # # cleanup for end of data collection episodes
-    env.close()
+    Returns:
+        dict: metric name -> list of samples
+    """
+    samples = defaultdict(list)
+    rng = np.random.default_rng(seed)
+
+    t_start = time.perf_counter()
+    env = create_env(env_name, robot, layout, style, seed, render)
+    samples["construct_time"].append(time.perf_counter() - t_start)
+
+    ac_dim = env.action_spec[0].shape
+
+    # time the success checks that the env makes while stepping (for the reward) instead of calling
+    # _check_success again, which would advance the timers of tasks with stateful success checks
+    check_success = env._check_success
+    check_success_times = []
+
+    def timed_check_success():
+        t_start = time.perf_counter()
+        result = check_success()
+        check_success_times.append(time.perf_counter() - t_start)
+        return result
+
+    env._check_success = timed_check_success
+    try:
+        for _ in range(num_resets):
+            t_start = time.perf_counter()
+            env.reset()
+            samples["reset_time"].append(time.perf_counter() - t_start)
+
+            if hasattr(env, "get_reset_profile"):
+                profile = env.get_reset_profile()
+                for (phase_name, phase) in profile["phases"].items():
+                    samples["reset_phase/{}".format(phase_name)].append(phase["time"])
+                if "settle_substeps" in profile:
+                    samples["settle_substeps"].append(profile["settle_substeps"])
+
+            for _ in range(num_steps):
+                action = rng.normal(size=ac_dim)
+                # keep the mobile base still
+                action[-5:] = 0.0
+                check_success_times.clear()
+                t_start = time.perf_counter()
+                env.step(action)
+                samples["step_time"].append(time.perf_counter() - t_start)
+                if len(check_success_times) > 0:
+                    samples["check_success_time"].append(sum(check_success_times))
+    finally:
+        env.close()
+
+    return samples
+
+
+def bench_playback(dataset, num_demos):
+    """
+    Measures the time to play back demos of a dataset by setting simulator states
 
-    return reset_time, steps_per_sec
+    Returns:
+        dict: metric name -> list of samples
+    """
+    import h5py
+    import robosuite
 
+    import robocasa.utils.model_store as ModelStore
+    from robocasa.scripts.dataset_scripts.playback_dataset_hdf5 import (
+        get_env_metadata_from_dataset,
+        reset_to,
+    )
 
-def log_info(message, color="yellow"):
-    print(colored(message, color))
+    samples = defaultdict(list)
+    env_meta = get_env_metadata_from_dataset(dataset_path=dataset)
+    env_kwargs = env_meta["env_kwargs"]
+    env_kwargs["env_name"] = env_meta["env_name"]
+    env_kwargs["has_renderer"] = False
+    env_kwargs["has_offscreen_renderer"] = False
+    env_kwargs["use_camera_obs"] = False
+    env = robosuite.make(**env_kwargs)
+
+    try:
+        with h5py.File(os.path.expanduser(dataset), "r") as f:
+            demos = sorted(f["data"].keys(), key=lambda ep: int(ep[5:]))[:num_demos]
+            for ep in demos:
+                ep_grp = f["data/{}".format(ep)]
+                states = ep_grp["states"][()]
+                initial_state = dict(
+                    states=states[0],
+                    model=ModelStore.read_model_xml(ep_grp),
+                    ep_meta=ep_grp.attrs.get("ep_meta", None),
+                )
 
+                t_start = time.perf_counter()
+                reset_to(env, initial_state)
+                samples["playback_reset_time"].append(time.perf_counter() - t_start)
 
-def run_bench(
-    env_name,
-    robots="PandaOmron",
-    camera=None,
-    seed=0,
-    layout=-1,
-    style=-1,
-    no_render=False,
-    n_envs=1,
-    n_trials=30,
-    onscreen=False,
-):
-    def create_env():
-        # Get controller config
-        # controller_config = load_controller_config(default_controller=args.controller)
-        controller_config = load_composite_controller_config(
-            controller=None,
-            robot=robots,
-        )
+                t_start = time.perf_counter()
+                for state in states:
+                    reset_to(env, {"states": state})
+                duration = time.perf_counter() - t_start
+                samples["playback_demo_time"].append(duration)
+                samples["playback_state_time"].append(duration / len(states))
+    finally:
+        env.close()
 
-        # Create argument configuration
-        config = dict(
-            controller_configs=controller_config,
-            env_name=env_name,
-            ignore_done=True,
-            reward_shaping=True,
-            control_freq=20,
-            camera_heights=84,
-            camera_widths=84,
-            translucent_robot=True,
-        )
+    return samples
 
-        if onscreen:
-            assert no_render is False
-            config.update(
-                has_renderer=True,
-                has_offscreen_renderer=False,
-                render_camera=camera,
-                use_camera_obs=False,
-            )
-        else:
-            config.update(
-                has_renderer=False,
-                has_offscreen_renderer=(not no_render),
-                use_camera_obs=(not no_render),
-                render_camera=camera,
-            )
 
-        if env_name in ALL_KITCHEN_ENVIRONMENTS:
-            config["camera_names"] = [
-                "robot0_agentview_left",
-                "robot0_agentview_right",
-                "robot0_eye_in_hand",
-            ]
-            config["layout_ids"] = layout
-            config["style_ids"] = style
-            config["seed"] = seed
-
-            config["robots"] = robots or "PandaOmron"
-        else:
-            config["robots"] = robots or "Panda"
-
-        env = suite.make(**config)
-        return env
-
-    if n_envs > 1:
-        env_fns = [lambda env_i=i: create_env() for i in range(n_envs)]
-        env = SubprocVectorEnv(env_fns)
-    else:
-        env = create_env()
+def get_cell_name(env_name, robot, layout, style, render_mode):
+    return "{}/robot={}/layout={}/style={}/render={}".format(
+        env_name, robot, layout, style, render_mode
+    )
 
-    print(f"Task: {env_name}")
 
-    # collect demonstrations
-    steps_per_sec_list = []
-    reset_time_list = []
-    for ep in range(n_trials):
-        try:
-            reset_time, steps_per_sec = run_rollout(
-                env, "right", "single-arm-opposed", render=False, num_steps=100
-            )
-            print("ep #{}".format(ep + 1))
-            print("   {:.2f}s reset time".format(reset_time))
-            print("   {:.2f} fps".format(steps_per_sec))
-            print()
-            reset_time_list.append(reset_time)
-            steps_per_sec_list.append(steps_per_sec)
+def run_benchmark(args):
+    """
+    Runs all benchmarks requested in @args
+
+    Returns:
+        dict: fingerprint, config and results (cell name -> metric name -> summary). Cells that raised an
+            exception hold an "error" entry instead
+    """
+    results = dict()
+
+    if args.import_trials > 0:
+        log_info("Benchmarking cold import ({} trials)".format(args.import_trials))
+        results["import"] = {
+            k: summarize(v) for (k, v) in bench_import(args.import_trials).items()
+        }
+
+    for env_name in args.tasks or []:
+        for robot in args.robots:
+            for layout in args.layouts:
+                for style in args.styles:
+                    for render_mode in args.render_modes:
+                        cell_name = get_cell_name(
+                            env_name, robot, layout, style, render_mode
+                        )
+                        log_info("Benchmarking {}".format(cell_name))
+                        try:
+                            samples = bench_env(
+                                env_name,
+                                robot,
+                                layout,
+                                style,
+                                render=(render_mode == "camera"),
+                                num_resets=args.num_resets,
+                                num_steps=args.num_steps,
+                                seed=args.seed,
+                            )
+                        except Exception as e:
+                            log_info("{}: {}".format(cell_name, e), color="red")
+                            results[cell_name] = dict(error=repr(e))
+                            continue
+                        results[cell_name] = {
+                            k: summarize(v) for (k, v) in samples.items()
+                        }
+
+    if args.dataset is not None:
+        log_info("Benchmarking playback of {}".format(args.dataset))
+        samples = bench_playback(args.dataset, args.num_demos)
+        results["playback"] = {k: summarize(v) for (k, v) in samples.items()}
+
+    import robocasa.utils.asset_cache as AssetCache
+
+    return dict(
+        fingerprint=get_fingerprint(),
+        config=vars(args),
+        results=results,
+        asset_cache=AssetCache.get_asset_cache_stats(),
+    )
+
 
+def print_results(results):
+    for (cell_name, metrics) in results["results"].items():
+        log_info(cell_name)
+        if "error" in metrics:
+            print("    error: {}".format(metrics["error"]))
+            continue
+        for (metric, summary) in metrics.items():
+            if summary["n"] == 0:
+                continue
             print(
-                colored(
-                    "AVG reset time: {:.2f}s".format(np.mean(reset_time_list)), "yellow"
+                "    {:<40s} p50 {:>10.4f}s  p95 {:>10.4f}s  p99 {:>10.4f}s  (n={})".format(
+                    metric, summary["p50"], summary["p95"], summary["p99"], summary["n"]
                 )
             )
-            print(
-                colored("AVG fps: {:.2f}".format(np.mean(steps_per_sec_list)), "yellow")
-            )
-            print()
-        except Exception as e:
-            print("EXCEPTION!")
-            print(e)
 
-    print("reset time: {:.2f}s".format(np.mean(reset_time_list)))
-    print("fps: {:.2f}".format(np.mean(steps_per_sec_list)))
 
-    env.close()
-    del env
+def compare_results(results, baseline, threshold=0.1, stat="p50", min_diff=1e-4):
+    """
+    Compares benchmark results against a baseline. All metrics are times, so larger values are worse
 
-    info = dict(
-        reset_time_list=reset_time_list,
-        steps_per_sec_list=steps_per_sec_list,
-    )
-    return info
+    Args:
+        results (dict): results, as returned by run_benchmark
+
+        baseline (dict): baseline results, in the same format
+
+        threshold (float): relative slowdown above which a metric is flagged as a regression
+
+        stat (str): statistic of the summaries to compare (eg. "p50", "p95")
+
+        min_diff (float): absolute slowdown (in seconds) below which differences are ignored as noise
+
+    Returns:
+        list: comparisons (dicts with cell, metric, baseline, current, ratio and regression) of all metrics
+            present in both results
+    """
+    comparisons = []
+    for (cell_name, metrics) in results["results"].items():
+        base_metrics = baseline["results"].get(cell_name)
+        if base_metrics is None or "error" in metrics or "error" in base_metrics:
+            continue
+        for (metric, summary) in metrics.items():
+            base_summary = base_metrics.get(metric)
+            if base_summary is None or stat not in summary or stat not in base_summary:
+                continue
+            current, base = summary[stat], base_summary[stat]
+            ratio = current / base if base > 0 else float("inf")
+            comparisons.append(
+                dict(
+                    cell=cell_name,
+                    metric=metric,
+                    baseline=base,
+                    current=current,
+                    ratio=ratio,
+                    regression=bool(
+                        ratio > 1 + threshold and current - base > min_diff
+                    ),
+                )
+            )
+    return comparisons
+
+
+def print_comparisons(comparisons, stat):
+    for comp in comparisons:
+        color = "red" if comp["regression"] else "green"
+        print(
+            colored(
+                "{:<60s} {:<40s} {} {:>10.4f}s -> {:>10.4f}s ({:+.1f}%)".format(
+                    comp["cell"],
+                    comp["metric"],
+                    stat,
+                    comp["baseline"],
+                    comp["current"],
+                    (comp["ratio"] - 1) * 100,
+                ),
+                color,
+            )
+        )
 
 
 def get_args():
     parser = argparse.ArgumentParser()
-    parser.add_argument("--mjcf_path", type=str, help="path to object MJCF")
-    parser.add_argument("--env", type=str, default="Lift")
-    parser.add_argument("--n_envs", type=int, default=1)
-    parser.add_argument("--n_trials", type=int, default=30)
-    parser.add_argument("--n_objs", type=int, default=None)
-    parser.add_argument("--layout", type=int, nargs="+", default=-1)
-    parser.add_argument("--style", type=int, nargs="+", default=-1)
+    parser.add_argument("--tasks", type=str, nargs="+", default=None)
+    parser.add_argument("--robots", type=str, nargs="+", default=["PandaOmron"])
+    parser.add_argument("--layouts", type=int, nargs="+", default=[-1])
+    parser.add_argument("--styles", type=int, nargs="+", default=[-1])
     parser.add_argument(
-        "--robots",
-        nargs="+",
+        "--render_modes",
         type=str,
-        default="PandaOmron",
-        help="Which robot(s) to use in the env",
+        nargs="+",
+        choices=RENDER_MODES,
+        default=["none"],
+        help="none: no rendering, camera: render camera observations offscreen at every step",
+    )
+    parser.add_argument("--num_resets", type=int, default=5)
+    parser.add_argument("--num_steps", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--import_trials",
+        type=int,
+        default=0,
+        help="number of cold imports of robocasa to time",
+    )
+    parser.add_argument(
+        "--dataset", type=str, default=None, help="hdf5 dataset to time playback of"
     )
-    # parser.add_argument(
-    #     "--config",
-    #     type=str,
-    #     default="single-arm-opposed",
-    #     help="Specified environment configuration if necessary",
-    # )
-    # parser.add_argument(
-    #     "--arm",
-    #     type=str,
-    #     default="right",
-    #     help="Which arm to control (eg bimanual) 'right' or 'left'",
-    # )
+    parser.add_argument("--num_demos", type=int, default=5)
     parser.add_argument(
-        "--camera",
+        "--mujoco_gl",
         type=str,
         default=None,
-        help="Which camera to use for collecting demos",
+        help="rendering backend (eg. egl, osmesa). osmesa renders on CPU-only machines",
     )
     parser.add_argument(
-        "--seed",
-        type=int,
-        default=0,
-        help="Environment seed",
+        "--out", type=str, default=None, help="path of the json results"
     )
     parser.add_argument(
-        "--controller",
+        "--compare",
         type=str,
         default=None,
-        help="Choice of controller. Can be, eg. 'NONE' or 'WHOLE_BODY_IK', etc. Or path to controller json file",
+        help="json results to compare against --baseline, instead of running benchmarks",
+    )
+    parser.add_argument("--baseline", type=str, default=None)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown flagged as a regression",
     )
-    parser.add_argument("--onscreen", action="store_true")
-    parser.add_argument("--no_render", action="store_true")
+    parser.add_argument("--stat", type=str, default="p50")
     args = parser.parse_args()
     return args
 
 
 if __name__ == "__main__":
-    # Arguments
     args = get_args()
-    run_bench(
-        env_name=args.env,
-        robots=args.robots,
-        camera=args.camera,
-        seed=args.seed,
-        n_trials=args.n_trials,
-        n_envs=args.n_envs,
-        layout=args.layout,
-        style=args.style,
-        onscreen=args.onscreen,
-        no_render=args.onscreen,
-    )
+
+    if args.compare is not None:
+        assert args.baseline is not None, "--compare requires --baseline"
+        with open(args.compare, "r") as f:
+            results = json.load(f)
+    else:
+        # the rendering backend must be chosen before mujoco is imported
+        if args.mujoco_gl is not None:
+            os.environ["MUJOCO_GL"] = args.mujoco_gl
+            os.environ["PYOPENGL_PLATFORM"] = args.mujoco_gl
+        results = run_benchmark(args)
+        print_results(results)
+        if args.out is not None:
+            with open(args.out, "w") as f:
+                json.dump(results, f, indent=2)
+            log_info("Saved results to {}".format(args.out), color="green")
+
+    if args.baseline is not None:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+        comparisons = compare_results(
+            results, baseline, threshold=args.threshold, stat=args.stat
+        )
+        print_comparisons(comparisons, args.stat)
+        num_regressions = sum(comp["regression"] for comp in comparisons)
+        if num_regressions > 0:
+            log_info("{} regression(s) found".format(num_regressions), color="red")
+            sys.exit(1)
+        log_info("No regressions found", color="green")
@@ -0,0 +1,100 @@
+"""
+Profiles the simulation cost (compile time, mesh sizes, convex hulls, per-step contact cost) of every object and
+fixture model under the assets folder, and stores it in the asset cost index (see
+robocasa/utils/asset_cost_index.py). Models that were already profiled are skipped unless their xml changed:
+
+    python robocasa/scripts/build_asset_cost_index.py
+
+    # only profile some folders, and show the most expensive models
+    python robocasa/scripts/build_asset_cost_index.py --folders objects/objaverse/apple fixtures/sinks --top 20
+"""
+
+import argparse
+import os
+import traceback
+
+import tqdm
+
+import robocasa
+from robocasa.utils.asset_cost_index import get_asset_cost_index, profile_asset
+
+
+def find_model_xmls(folder):
+    model_xmls = []
+    for (dirpath, dirnames, filenames) in os.walk(folder):
+        dirnames.sort()
+        if "model.xml" in filenames:
+            model_xmls.append(os.path.join(dirpath, "model.xml"))
+    return model_xmls
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--folders",
+        type=str,
+        nargs="+",
+        default=["objects", "fixtures"],
+        help="folders to profile, relative to the assets root",
+    )
+    parser.add_argument("--num_compiles", type=int, default=3)
+    parser.add_argument("--num_steps", type=int, default=200)
+    parser.add_argument(
+        "--force", action="store_true", help="re-profile models that are up to date"
+    )
+    parser.add_argument(
+        "--top", type=int, default=10, help="number of most expensive models to print"
+    )
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    index = get_asset_cost_index()
+    model_xmls = []
+    for folder in args.folders:
+        model_xmls += find_model_xmls(os.path.join(robocasa.models.assets_root, folder))
+
+    num_failed = 0
+    for (i, mjcf_path) in enumerate(tqdm.tqdm(model_xmls)):
+        if not args.force and not index.is_stale(mjcf_path):
+            continue
+        rel_path = os.path.relpath(mjcf_path, robocasa.models.assets_root)
+        try:
+            entry = profile_asset(
+                mjcf_path,
+                is_object=rel_path.startswith("objects"),
+                num_compiles=args.num_compiles,
+                num_steps=args.num_steps,
+            )
+        except Exception:
+            num_failed += 1
+            if args.verbose:
+                print("Caught exception for {}".format(mjcf_path))
+                traceback.print_exc()
+            continue
+        index.add_entry(mjcf_path, entry)
+        # save periodically, so that interrupted runs can be resumed
+        if (i + 1) % 100 == 0:
+            index.save()
+    index.save()
+
+    print(
+        "Indexed {} models ({} failed) in {}".format(
+            len(index), num_failed, index.index_path
+        )
+    )
+
+    costs = sorted(
+        ((index.get_cost(p), p) for p in model_xmls if index.get_entry(p) is not None),
+        reverse=True,
+    )
+    for (cost, mjcf_path) in costs[: args.top]:
+        entry = index.get_entry(mjcf_path)
+        print(
+            "{:.4f}s  compile {:.4f}s  {} faces  {} convex hulls  {}".format(
+                cost,
+                entry["compile_time"],
+                entry["num_mesh_faces"],
+                entry["num_convex_hulls"],
+                os.path.relpath(mjcf_path, robocasa.models.assets_root),
+            )
+        )
@@ -0,0 +1,23 @@
+"""
+Pre-compiles all fixture registry, kitchen layout and kitchen style yaml configs into a single bundle file,
+which is loaded on first use instead of parsing each yaml file (see robocasa/models/scenes/config_cache.py).
+Configs that changed since the bundle was built are re-parsed from yaml, so the bundle never needs to be
+rebuilt for correctness, only for speed:
+
+    python robocasa/scripts/build_config_bundle.py
+"""
+
+import argparse
+
+from robocasa.models.scenes.config_cache import (
+    build_config_bundle,
+    get_config_bundle_path,
+)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.parse_args()
+
+    bundle_path = get_config_bundle_path()
+    num_configs = build_config_bundle(bundle_path=bundle_path)
+    print("Wrote {} configs to {}".format(num_configs, bundle_path))
@@ -0,0 +1,123 @@
+"""
+Generates robocasa/environments/task_manifest.py, which maps the name of every kitchen task class
+to the module that defines it. The manifest lets `import robocasa` register tasks lazily instead of
+importing every task module up front.
+
+The manifest is built by statically parsing the task modules, so this script does not need to import
+robocasa (or any of its dependencies). Re-run it whenever a task class is added, renamed or moved:
+
+    python robocasa/scripts/build_task_manifest.py
+"""
+
+import argparse
+import ast
+import os
+
+ROBOCASA_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+KITCHEN_ENVS_DIR = os.path.join(ROBOCASA_ROOT, "environments", "kitchen")
+DEFAULT_MANIFEST_PATH = os.path.join(ROBOCASA_ROOT, "environments", "task_manifest.py")
+
+MANIFEST_HEADER = '''"""
+Maps the name of every kitchen task class to the module that defines it.
+
+AUTO-GENERATED by robocasa/scripts/build_task_manifest.py. Do not edit by hand.
+"""
+
+'''
+
+
+def get_module_path(filepath):
+    rel_path = os.path.relpath(filepath, os.path.dirname(ROBOCASA_ROOT))
+    return os.path.splitext(rel_path)[0].replace(os.sep, ".")
+
+
+def get_base_name(base):
+    if isinstance(base, ast.Name):
+        return base.id
+    if isinstance(base, ast.Attribute):
+        return base.attr
+    return None
+
+
+def find_class_defs(root_dir):
+    """
+    Parses all modules under @root_dir and collects their top-level class definitions
+
+    Returns:
+        list: (class name, module path, list of base class names) tuples, in sorted module order
+    """
+    class_defs = []
+    for (dirpath, dirnames, filenames) in os.walk(root_dir):
+        dirnames.sort()
+        for fname in sorted(filenames):
+            if not fname.endswith(".py") or fname == "__init__.py":
+                continue
+            filepath = os.path.join(dirpath, fname)
+            with open(filepath, "r") as f:
+                tree = ast.parse(f.read(), filename=filepath)
+            module = get_module_path(filepath)
+            for node in tree.body:
+                if isinstance(node, ast.ClassDef):
+                    bases = [get_base_name(b) for b in node.bases]
+                    class_defs.append((node.name, module, bases))
+    return class_defs
+
+
+def build_manifest(root_dir=KITCHEN_ENVS_DIR, base_class="Kitchen"):
+    """
+    Finds all subclasses of @base_class (including @base_class itself) under @root_dir
+
+    Returns:
+        dict: class name to module path. If a class name is defined in several modules, the first
+            module in sorted order is used
+    """
+    class_defs = find_class_defs(root_dir)
+
+    class_bases = dict()
+    class_modules = dict()
+    for (name, module, bases) in class_defs:
+        if name in class_modules:
+            print(
+                "Warning: {} is defined in both {} and {}. Using the former.".format(
+                    name, class_modules[name], module
+                )
+            )
+            continue
+        class_bases[name] = bases
+        class_modules[name] = module
+
+    # transitively resolve which classes derive from the base class
+    task_names = {base_class}
+    changed = True
+    while changed:
+        changed = False
+        for (name, bases) in class_bases.items():
+            if name not in task_names and any(b in task_names for b in bases):
+                task_names.add(name)
+                changed = True
+
+    return {name: class_modules[name] for name in sorted(task_names)}
+
+
+def write_manifest(manifest, path=DEFAULT_MANIFEST_PATH):
+    lines = [MANIFEST_HEADER, "KITCHEN_TASK_MANIFEST = {\n"]
+    for (name, module) in manifest.items():
+        lines.append('    "{}": "{}",\n'.format(name, module))
+    lines.append("}\n")
+    with open(path, "w") as f:
+        f.writelines(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=DEFAULT_MANIFEST_PATH,
+        help="path of the generated manifest module",
+    )
+    args = parser.parse_args()
+
+    manifest = build_manifest()
+    write_manifest(manifest, path=args.output)
+    print("Wrote {} tasks to {}".format(len(manifest), args.output))
@@ -29,6 +29,7 @@ from termcolor import colored
 
 import robocasa
 import robocasa.macros as macros
+import robocasa.utils.model_store as ModelStore
 from robocasa.models.fixtures import FixtureType
 from robocasa.utils.robomimic.robomimic_dataset_utils import convert_to_robomimic_format
 from robocasa.wrappers.enclosing_wall_render_wrapper import (
@@ -174,7 +175,7 @@ def collect_human_trajectory(
             break
 
         # state machine to check for having a success for 15 consecutive timesteps
-        if env._check_success():
+        if env.check_success():
             if task_completion_hold_count > 0:
                 task_completion_hold_count -= 1  # latched state, decrement count
             else:
@@ -216,13 +217,14 @@ def gather_demonstrations_as_hdf5(
     Gathers the demonstrations saved in @directory into a
     single hdf5 file.
     The strucure of the hdf5 file is as follows.
+    model_store (group) - compressed model xmls, one dataset per distinct xml (keyed by its hash)
     data (group)
         date (attribute) - date of collection
         time (attribute) - time of collection
         repository_version (attribute) - repository version used during collection
         env (attribute) - environment name on which demos were collected
         demo1 (group) - every demonstration has a group
-            model_file (attribute) - model xml string for demonstration
+            model_hash (attribute) - key of the model xml of the demonstration in the model_store group
             states (dataset) - flattened mujoco states
             actions (dataset) - actions applied during demonstration
         demo2 (group)
@@ -286,11 +288,11 @@ def gather_demonstrations_as_hdf5(
         num_eps += 1
         ep_data_grp = grp.create_group("demo_{}".format(num_eps))
 
-        # store model xml as an attribute
+        # store model xml (deduplicated across demos, see robocasa/utils/model_store.py)
         xml_path = os.path.join(directory, ep_directory, "model.xml")
         with open(xml_path, "r") as f:
             xml_str = f.read()
-        ep_data_grp.attrs["model_file"] = xml_str
+        ModelStore.write_model_xml(ep_data_grp, xml_str)
 
         # store ep meta as an attribute
         ep_meta_path = os.path.join(directory, ep_directory, "ep_meta.json")
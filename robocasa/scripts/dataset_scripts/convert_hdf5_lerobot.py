@@ -1,6 +1,8 @@
 import shutil
 from copy import deepcopy
-from lerobot.datasets.lerobot_dataset import LeRobotDataset
+import datasets
+from lerobot.datasets.compute_stats import compute_episode_stats
+from lerobot.datasets.lerobot_dataset import LeRobotDataset, LeRobotDatasetMetadata
 import h5py
 import numpy as np
 import json
@@ -8,7 +10,11 @@ import os
 from tqdm import tqdm
 from pathlib import Path
 import argparse
+import multiprocessing as mp
 from lerobot.datasets.utils import (
+    cast_stats_to_numpy,
+    get_hf_features_from_features,
+    serialize_dict,
     write_info,
 )
 from lerobot.datasets.video_utils import (
@@ -16,7 +22,9 @@ from lerobot.datasets.video_utils import (
 )
 import glob
 from robocasa.utils.lerobot_utils import (
+    LEROBOT_STATE_TO_HDF5_STATE,
     LerobotDatasetWrapper,
+    StreamingVideoWriter,
     reorder_hdf5_action,
     reorder_hdf5_state,
     add_groot_specific_metadata,
@@ -26,6 +34,7 @@ from robocasa.utils.lerobot_utils import (
 import robocasa.utils.robomimic.robomimic_env_utils as EnvUtils
 import robocasa.utils.robomimic.robomimic_tensor_utils as TensorUtils
 import robocasa.utils.robomimic.robomimic_dataset_utils as DatasetUtils
+import robocasa.utils.model_store as ModelStore
 
 # default fps for robosuite
 FPS = 20
@@ -36,6 +45,37 @@ VIDEO_INFO = {
     "video.is_depth_map": False,
     "has_audio": False,
 }
+CAMERA_NAMES = [
+    "robot0_eye_in_hand",
+    "robot0_agentview_left",
+    "robot0_agentview_right",
+]
+
+
+def get_lerobot_features(img_shape):
+    """
+    Get the features of the LeRobot dataset, with one video feature per camera in CAMERA_NAMES
+    """
+    features = {
+        "observation.images.{}".format(cam): {
+            "dtype": "video",
+            "shape": img_shape,
+            "names": ["height", "width", "channel"],
+            "video_info": VIDEO_INFO,
+        }
+        for cam in CAMERA_NAMES
+    }
+    features.update(
+        {
+            "annotation.human.task_description": {"dtype": "int64", "shape": (1,)},
+            "annotation.human.task_name": {"dtype": "int64", "shape": (1,)},
+            "observation.state": {"dtype": "float64", "shape": (16,)},
+            "action": {"dtype": "float64", "shape": (12,)},
+            "next.reward": {"dtype": "float32", "shape": (1,)},
+            "next.done": {"dtype": "bool", "shape": (1,)},
+        }
+    )
+    return features
 
 
 def add_task_name(lerobot_path: Path, task_name: str, task_idx: int):
@@ -176,6 +216,347 @@ def build_task_to_id_map(hdf5_file: h5py.File) -> dict:
     return task_to_id
 
 
+class RunningImageStats:
+    """
+    Per-channel statistics of a stream of RGB frames, normalized to [0, 1], in the format of LeRobot
+    episode stats. Unlike LeRobot, which computes them on a subsample of downscaled frames, they are
+    computed on all frames, so they can differ slightly from those of the single-process converter
+    """
+
+    def __init__(self):
+        self.num_frames = 0
+        self.num_pixels = 0
+        self.sum = np.zeros(3)
+        self.sum_sq = np.zeros(3)
+        self.min = np.full(3, np.inf)
+        self.max = np.full(3, -np.inf)
+
+    def update(self, frame):
+        pixels = np.asarray(frame, dtype=np.float64).reshape(-1, 3) / 255.0
+        self.num_frames += 1
+        self.num_pixels += len(pixels)
+        self.sum += pixels.sum(axis=0)
+        self.sum_sq += np.square(pixels).sum(axis=0)
+        self.min = np.minimum(self.min, pixels.min(axis=0))
+        self.max = np.maximum(self.max, pixels.max(axis=0))
+
+    def get_stats(self):
+        mean = self.sum / self.num_pixels
+        std = np.sqrt(np.maximum(self.sum_sq / self.num_pixels - np.square(mean), 0.0))
+        stats = {"min": self.min, "max": self.max, "mean": mean, "std": std}
+        # (channel, 1, 1), as in LeRobot
+        stats = {k: v.reshape(3, 1, 1) for (k, v) in stats.items()}
+        stats["count"] = np.array([self.num_frames])
+        return stats
+
+
+def extract_trajectory_streaming(
+    env,
+    initial_state,
+    states,
+    video_writers,
+    done_mode,
+):
+    """
+    Streaming version of extract_trajectory. Camera frames are passed to @video_writers as soon as they are
+    rendered instead of being collected, so only the low-dimensional observations of the trajectory are kept
+    in memory.
+
+    Args:
+        env (instance of EnvBase): environment
+        initial_state (dict): initial simulation state to load
+        states (np.array): array of simulation states to load to extract information
+        video_writers (dict): camera name to StreamingVideoWriter
+        done_mode (int): how to write done signal (see extract_trajectory)
+
+    Returns:
+        dict: low-dimensional observations, rewards and dones along the trajectory, and statistics of the
+            frames of each camera
+    """
+    env.reset()
+    env.reset_to(initial_state)
+
+    traj = dict(
+        obs={k: [] for k in LEROBOT_STATE_TO_HDF5_STATE.values()},
+        rewards=[],
+        dones=[],
+        image_stats={cam: RunningImageStats() for cam in video_writers},
+    )
+    traj_len = states.shape[0]
+    for t in range(traj_len):
+        obs = env.reset_to({"states": states[t]})
+
+        r = env.get_reward()
+        done = False
+        if (done_mode == 1) or (done_mode == 2):
+            done = done or (t == traj_len - 1)
+        if (done_mode == 0) or (done_mode == 2):
+            done = done or env.is_success()["task"]
+
+        for k in traj["obs"]:
+            traj["obs"][k].append(np.array(obs[k]))
+        for (cam, writer) in video_writers.items():
+            frame = obs["{}_image".format(cam)]
+            writer.write(frame)
+            traj["image_stats"][cam].update(frame)
+        traj["rewards"].append(r)
+        traj["dones"].append(int(done))
+
+    traj["obs"] = {k: np.array(v) for (k, v) in traj["obs"].items()}
+    traj["rewards"] = np.array(traj["rewards"])
+    traj["dones"] = np.array(traj["dones"])
+    return traj
+
+
+def convert_episode_range(
+    worker_id,
+    args,
+    demos,
+    ep_start,
+    frame_start,
+    task_to_id,
+    lerobot_info,
+    lerobot_path,
+    worker_meta_path,
+):
+    """
+    Converts a contiguous range of episodes with a dedicated environment. Parquet files (written with the
+    same features and writer as LeRobotDataset.save_episode), videos and extras are written directly to
+    their final location in the LeRobot dataset. Episode metadata and statistics are written to
+    @worker_meta_path, to be added to the dataset metadata by save_lerobot_meta.
+
+    Args:
+        worker_id (int): index of the worker
+        args (argparse.Namespace): converter arguments
+        demos (list): demo keys of the range, in order
+        ep_start (int): episode index of the first demo of the range
+        frame_start (int): global frame index of the first frame of the range
+        task_to_id (dict): task description to task index
+        lerobot_info (dict): info of the LeRobot dataset metadata, giving its features and file layout
+        lerobot_path (Path): root of the LeRobot dataset
+        worker_meta_path (Path): path of the episode metadata written by this worker
+    """
+    raw_dataset_path = Path(args.raw_dataset_path)
+    modality_path = (
+        Path(__file__).parent.parent.parent
+        / "models/assets/groot_dataset_assets/PandaOmron_modality.json"
+    )
+    with open(modality_path, "r") as f:
+        modality_dict = json.load(f)
+    task_name_idx = len(task_to_id)
+    features = lerobot_info["features"]
+    hf_features = get_hf_features_from_features(features)
+
+    env = create_env_from_hdf5(raw_dataset_path, args)
+    raw_file = h5py.File(raw_dataset_path, "r")
+
+    frame_index = frame_start
+    with open(worker_meta_path, "w") as meta_f:
+        for (i, demo) in enumerate(
+            tqdm(demos, desc="Worker {}".format(worker_id), position=worker_id)
+        ):
+            ep_idx = ep_start + i
+            ep_chunk = ep_idx // lerobot_info["chunks_size"]
+
+            save_extra_demo_info(lerobot_path, raw_file["data"], demo, ep_idx)
+            demo_data = raw_file["data"][demo]
+
+            states = demo_data["states"][()]
+            initial_state = dict(states=states[0])
+            initial_state["model"] = ModelStore.read_model_xml(demo_data)
+            initial_state["ep_meta"] = demo_data.attrs.get("ep_meta", None)
+
+            video_writers = {
+                cam: StreamingVideoWriter(
+                    lerobot_path
+                    / lerobot_info["video_path"].format(
+                        episode_chunk=ep_chunk,
+                        video_key="observation.images.{}".format(cam),
+                        episode_index=ep_idx,
+                    ),
+                    width=args.camera_width,
+                    height=args.camera_height,
+                    fps=FPS,
+                )
+                for cam in CAMERA_NAMES
+            }
+            try:
+                traj = extract_trajectory_streaming(
+                    env=env,
+                    initial_state=initial_state,
+                    states=states,
+                    video_writers=video_writers,
+                    done_mode=1,
+                )
+            finally:
+                for writer in video_writers.values():
+                    writer.close()
+
+            # reorder actions and states to match modality definition for model training
+            actions = reorder_hdf5_action(demo_data["actions"][:], modality_dict)
+            robot_states = reorder_hdf5_state(traj["obs"], modality_dict)
+            lang = json.loads(demo_data.attrs["ep_meta"])["lang"]
+            demo_length = len(actions)
+
+            columns = {
+                "observation.state": robot_states,
+                "action": actions,
+                "annotation.human.task_description": np.full(
+                    demo_length, task_to_id[lang], dtype=np.int64
+                ),
+                "annotation.human.task_name": np.full(
+                    demo_length, task_name_idx, dtype=np.int64
+                ),
+                "next.reward": traj["rewards"].astype(np.float32),
+                "next.done": traj["dones"].astype(bool),
+                "timestamp": (np.arange(demo_length) / FPS).astype(np.float32),
+                "frame_index": np.arange(demo_length, dtype=np.int64),
+                "episode_index": np.full(demo_length, ep_idx, dtype=np.int64),
+                "index": np.arange(
+                    frame_index, frame_index + demo_length, dtype=np.int64
+                ),
+                "task_index": np.full(demo_length, task_to_id[lang], dtype=np.int64),
+            }
+            parquet_path = lerobot_path / lerobot_info["data_path"].format(
+                episode_chunk=ep_chunk, episode_index=ep_idx
+            )
+            parquet_path.parent.mkdir(parents=True, exist_ok=True)
+            ep_dataset = datasets.Dataset.from_dict(
+                {k: columns[k] for k in hf_features},
+                features=hf_features,
+                split="train",
+            )
+            ep_dataset.to_parquet(parquet_path)
+            frame_index += demo_length
+
+            ep_stats = compute_episode_stats(columns, features)
+            for cam in CAMERA_NAMES:
+                ep_stats["observation.images.{}".format(cam)] = traj["image_stats"][
+                    cam
+                ].get_stats()
+            meta_f.write(
+                json.dumps(
+                    dict(
+                        episode_index=ep_idx,
+                        tasks=[lang],
+                        length=demo_length,
+                        stats=serialize_dict(ep_stats),
+                    )
+                )
+                + "\n"
+            )
+            meta_f.flush()
+
+    raw_file.close()
+
+
+def save_lerobot_meta(lerobot_meta, worker_meta_paths):
+    """
+    Adds the episodes converted by the workers to the LeRobot dataset metadata, in episode order, in the same way
+    as LeRobotDataset.save_episode. LeRobot writes the meta/ files (info.json, episodes.jsonl,
+    episodes_stats.jsonl and tasks.jsonl)
+
+    Args:
+        lerobot_meta (LeRobotDatasetMetadata): metadata of the dataset
+        worker_meta_paths (list): paths of the episode metadata written by the workers
+    """
+    episodes = []
+    for worker_meta_path in worker_meta_paths:
+        with open(worker_meta_path, "r") as f:
+            episodes.extend(json.loads(line) for line in f)
+    episodes.sort(key=lambda ep: ep["episode_index"])
+
+    for ep in episodes:
+        for task in ep["tasks"]:
+            if lerobot_meta.get_task_index(task) is None:
+                lerobot_meta.add_task(task)
+        lerobot_meta.save_episode(
+            ep["episode_index"],
+            ep["length"],
+            ep["tasks"],
+            cast_stats_to_numpy(ep["stats"]),
+        )
+
+    # video info is read from the videos of the first episode, as in LerobotDatasetWrapper.encode_episode_videos
+    if len(lerobot_meta.video_keys) > 0 and len(episodes) > 0:
+        lerobot_meta.update_video_info()
+        write_info(lerobot_meta.info, lerobot_meta.root)
+
+
+def main_parallel(args):
+    """
+    Converts the dataset with @args.num_workers processes. Each worker owns an environment and a contiguous
+    range of episodes, and streams rendered frames directly into video encoders, so that memory use per worker
+    is bounded by a few frames rather than a full episode. The episodes are added to the dataset metadata at
+    the end.
+    """
+    raw_dataset_path = Path(args.raw_dataset_path)
+    data_dir = raw_dataset_path.parent
+
+    # Clean up any existing dataset in the output directory
+    lerobot_path = data_dir / "lerobot"
+    if lerobot_path.exists():
+        shutil.rmtree(lerobot_path)
+
+    img_shape = (args.camera_height, args.camera_width, 3)
+    lerobot_meta = LeRobotDatasetMetadata.create(
+        repo_id=lerobot_path,
+        fps=FPS,
+        features=get_lerobot_features(img_shape),
+        robot_type="PandaOmron",
+        use_videos=True,
+    )
+
+    extras_dir = lerobot_path / "extras"
+    extras_dir.mkdir(parents=True, exist_ok=True)
+    workers_dir = lerobot_path / "workers_tmp"
+    workers_dir.mkdir(parents=True, exist_ok=True)
+
+    with h5py.File(raw_dataset_path, "r") as raw_file:
+        task_to_id = build_task_to_id_map(raw_file)
+        demos = list(raw_file["data"].keys())
+        demo_lengths = [len(raw_file["data"][demo]["actions"]) for demo in demos]
+        save_dataset_meta(lerobot_path, raw_file)
+
+    num_workers = min(args.num_workers, len(demos))
+    ranges = np.array_split(np.arange(len(demos)), num_workers)
+    frame_starts = np.concatenate([[0], np.cumsum(demo_lengths)])
+
+    processes = []
+    worker_meta_paths = []
+    for (worker_id, inds) in enumerate(ranges):
+        worker_meta_path = workers_dir / "worker_{}.jsonl".format(worker_id)
+        worker_meta_paths.append(worker_meta_path)
+        p = mp.Process(
+            target=convert_episode_range,
+            args=(
+                worker_id,
+                args,
+                [demos[i] for i in inds],
+                int(inds[0]),
+                int(frame_starts[inds[0]]),
+                task_to_id,
+                lerobot_meta.info,
+                lerobot_path,
+                worker_meta_path,
+            ),
+        )
+        p.start()
+        processes.append(p)
+    for p in processes:
+        p.join()
+    failed = [i for (i, p) in enumerate(processes) if p.exitcode != 0]
+    if len(failed) > 0:
+        raise RuntimeError("Conversion workers {} failed".format(failed))
+
+    save_lerobot_meta(lerobot_meta, worker_meta_paths)
+    shutil.rmtree(workers_dir)
+
+    add_groot_specific_metadata(data_dir)
+    env_meta = DatasetUtils.get_env_metadata_from_dataset(dataset_path=raw_dataset_path)
+    add_task_name(lerobot_path, env_meta["env_name"], len(task_to_id))
+
+
 def main(args):
     raw_dataset_path = Path(args.raw_dataset_path)
     data_dir = raw_dataset_path.parent
@@ -194,32 +575,7 @@ def main(args):
         repo_id=data_dir / "lerobot",
         robot_type="PandaOmron",
         fps=FPS,
-        features={
-            "observation.images.robot0_eye_in_hand": {
-                "dtype": "video",
-                "shape": img_shape,
-                "names": ["height", "width", "channel"],
-                "video_info": VIDEO_INFO,
-            },
-            "observation.images.robot0_agentview_left": {
-                "dtype": "video",
-                "shape": img_shape,
-                "names": ["height", "width", "channel"],
-                "video_info": VIDEO_INFO,
-            },
-            "observation.images.robot0_agentview_right": {
-                "dtype": "video",
-                "shape": img_shape,
-                "names": ["height", "width", "channel"],
-                "video_info": VIDEO_INFO,
-            },
-            "annotation.human.task_description": {"dtype": "int64", "shape": (1,)},
-            "annotation.human.task_name": {"dtype": "int64", "shape": (1,)},
-            "observation.state": {"dtype": "float64", "shape": (16,)},
-            "action": {"dtype": "float64", "shape": (12,)},
-            "next.reward": {"dtype": "float32", "shape": (1,)},
-            "next.done": {"dtype": "bool", "shape": (1,)},
-        },
+        features=get_lerobot_features(img_shape),
         image_writer_threads=30,
         image_writer_processes=30,
     )
@@ -250,7 +606,7 @@ def main(args):
         # prepare initial state to reload from
         states = demo_data["states"][()]
         initial_state = dict(states=states[0])
-        initial_state["model"] = demo_data.attrs["model_file"]
+        initial_state["model"] = ModelStore.read_model_xml(demo_data)
         initial_state["ep_meta"] = demo_data.attrs.get("ep_meta", None)
         traj = extract_trajectory(
             env=env,
@@ -346,5 +702,16 @@ if __name__ == "__main__":
         default=256,
         help="Width of the rendered camera images",
     )
+    parser.add_argument(
+        "--num_workers",
+        type=int,
+        default=1,
+        help="number of conversion processes. If greater than 1, each process converts a contiguous range of "
+        "episodes and streams frames directly to the video encoder",
+    )
     args = parser.parse_args()
-    main(args)
+    if args.num_workers > 1:
+        mp.set_start_method("spawn")
+        main_parallel(args)
+    else:
+        main(args)
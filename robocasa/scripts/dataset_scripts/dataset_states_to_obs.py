@@ -26,6 +26,16 @@ Args:
 
     num_procs (int): number of parallel processes to use for extraction. Default is 1.
 
+    stream (bool): if flag is set, observations are written to chunked hdf5 datasets as they are
+        extracted, instead of holding whole trajectories in memory. This bounds peak memory by
+        @chunk_size frames, regardless of the length of the demos.
+
+    chunk_size (int): number of timesteps per hdf5 chunk (and per write) in streaming mode. Default is 64.
+
+    sharded (bool): if flag is set, the output file is a small index whose demos are external links into
+        per-process shard files (<output_name>_shard_<i>.hdf5, written next to it), instead of a single
+        file that all demos are copied into. Keep the shards next to the output file.
+
     gpu_ids (int or [int]): GPU IDs to use for processes. Processes will be distributed 
         across these GPUs in round-robin fashion.
 
@@ -45,6 +55,16 @@ Example usage:
     python dataset_states_to_obs_mp.py --dataset /path/to/demo.hdf5 --output_name image_dense_done_1.hdf5 \
         --done_mode 1 --dense --camera_names agentview robot0_eye_in_hand --camera_height 84 --camera_width 84
 
+    # stream image observations to disk in chunks of 32 timesteps to bound memory on long demos
+    python dataset_states_to_obs_mp.py --dataset /path/to/demo.hdf5 --output_name image.hdf5 \
+        --done_mode 2 --camera_names agentview robot0_eye_in_hand --camera_height 84 --camera_width 84 \
+        --stream --chunk_size 32
+
+    # extract with 8 processes, writing the output as an index file over per-process shards
+    python dataset_states_to_obs_mp.py --dataset /path/to/demo.hdf5 --output_name image.hdf5 \
+        --done_mode 2 --camera_names agentview robot0_eye_in_hand --camera_height 84 --camera_width 84 \
+        --num_procs 8 --sharded
+
     # extract with 8 processes distributed across 4 GPUs
     python dataset_states_to_obs_mp.py --dataset /path/to/demo.hdf5 --output_name image.hdf5 \
         --done_mode 2 --camera_names agentview robot0_eye_in_hand --camera_height 84 --camera_width 84 \
@@ -84,6 +104,7 @@ import shutil  # For getting terminal size
 import robocasa.utils.robomimic.robomimic_env_utils as EnvUtils
 import robocasa.utils.robomimic.robomimic_tensor_utils as TensorUtils
 import robocasa.utils.robomimic.robomimic_dataset_utils as DatasetUtils
+import robocasa.utils.model_store as ModelStore
 
 
 try:
@@ -191,6 +212,132 @@ def extract_trajectory(
     return traj
 
 
+def extract_trajectory_streaming(
+    env,
+    initial_state,
+    states,
+    actions,
+    done_mode,
+    ep_data_grp,
+    chunk_size=64,
+    compress=True,
+    include_next_obs=False,
+):
+    """
+    Streaming version of @extract_trajectory. Observations are written to preallocated, chunked hdf5
+    datasets in @ep_data_grp every @chunk_size timesteps, so that at most @chunk_size frames are held
+    in memory at a time. Observations are copied once into the chunk buffers, so they are not deepcopied.
+
+    Args:
+        env (instance of EnvBase): environment
+        initial_state (dict): initial simulation state to load
+        states (np.array): array of simulation states to load to extract information
+        actions (np.array): array of actions
+        done_mode (int): how to write done signal. If 0, done is 1 whenever s' is a
+            success state. If 1, done is 1 at the end of each trajectory.
+            If 2, do both.
+        ep_data_grp (h5py.Group): group of the demo in the output file. Observations are written to
+            its "obs" (and "next_obs") subgroups
+        chunk_size (int): number of timesteps per hdf5 chunk and per write
+        compress (bool): if True, observation datasets are gzip-compressed
+        include_next_obs (bool): if True, also writes next observations. These are read back from the
+            written observations chunk by chunk, so they do not require extra rendering
+
+    Returns:
+        traj (dict): rewards, dones, actions, states and initial_state_dict of the trajectory. Observations
+            are not included, since they have already been written to @ep_data_grp
+    """
+    assert states.shape[0] == actions.shape[0]
+    assert chunk_size > 0
+
+    # load the initial state
+    env.reset()
+    env.reset_to(initial_state)
+
+    # get updated ep meta in case it's been modified
+    ep_meta = env.env.get_ep_meta()
+    initial_state["ep_meta"] = json.dumps(ep_meta, indent=4)
+
+    traj_len = states.shape[0]
+    # empty demos write no observations, as in extract_trajectory
+    chunk_len = max(min(chunk_size, traj_len), 1)
+    compression = "gzip" if compress else None
+
+    rewards = np.zeros(traj_len)
+    dones = np.zeros(traj_len, dtype=np.int64)
+    obs_dsets = None
+    obs_bufs = None
+
+    # iteration variable @t is over "next obs" indices
+    for t in range(traj_len):
+        obs = env.reset_to({"states": states[t]})
+
+        if obs_dsets is None:
+            # preallocate datasets and chunk buffers from the first observation
+            obs_dsets = dict()
+            obs_bufs = dict()
+            for k in obs:
+                v = np.asarray(obs[k])
+                obs_dsets[k] = ep_data_grp.create_dataset(
+                    "obs/{}".format(k),
+                    shape=(traj_len,) + v.shape,
+                    dtype=v.dtype,
+                    chunks=(chunk_len,) + v.shape,
+                    compression=compression,
+                )
+                obs_bufs[k] = np.empty((chunk_len,) + v.shape, dtype=v.dtype)
+
+        i = t % chunk_len
+        for k in obs_bufs:
+            obs_bufs[k][i] = obs[k]
+
+        # flush the chunk buffers once they are full (or at the end of the trajectory)
+        if (i == chunk_len - 1) or (t == traj_len - 1):
+            start = t - i
+            for k in obs_bufs:
+                obs_dsets[k][start : t + 1] = obs_bufs[k][: i + 1]
+
+        # infer reward signal
+        # note: our tasks use reward r(s'), reward AFTER transition, so this is
+        #       the reward for the current timestep
+        rewards[t] = env.get_reward()
+
+        # infer done signal. Note that extract_trajectory never marks the end of the trajectory for
+        # done_mode 1 and 2 (it checks t == traj_len), so only success states are marked here as well
+        done = False
+        if (done_mode == 0) or (done_mode == 2):
+            # done = 1 when s' is task success state
+            done = done or env.is_success()["task"]
+        dones[t] = int(done)
+
+    if include_next_obs and obs_dsets is not None:
+        # next obs at t is the obs at t + 1, and the last next obs repeats the last obs
+        for (k, obs_dset) in obs_dsets.items():
+            next_obs_dset = ep_data_grp.create_dataset(
+                "next_obs/{}".format(k),
+                shape=obs_dset.shape,
+                dtype=obs_dset.dtype,
+                chunks=obs_dset.chunks,
+                compression=compression,
+            )
+            for start in range(0, traj_len, chunk_len):
+                end = min(start + chunk_len, traj_len)
+                if end < traj_len:
+                    next_obs_dset[start:end] = obs_dset[start + 1 : end + 1]
+                else:
+                    next_obs_dset[start : end - 1] = obs_dset[start + 1 : end]
+                    next_obs_dset[end - 1] = obs_dset[end - 1]
+
+    traj = dict(
+        rewards=rewards,
+        dones=dones,
+        actions=np.array(actions),
+        states=np.array(states),
+        initial_state_dict=initial_state,
+    )
+    return traj
+
+
 def process_demo_batch(
     process_id, args, env_meta, work_queue, result_queue, progress_queue, gpu_id=None
 ):
@@ -263,20 +410,41 @@ def process_demo_batch(
             states = f["data/{}/states".format(ep)][()]
 
             initial_state = dict(states=states[0])
-            initial_state["model"] = f["data/{}".format(ep)].attrs["model_file"]
+            initial_state["model"] = ModelStore.read_model_xml(f["data/{}".format(ep)])
             initial_state["ep_meta"] = f["data/{}".format(ep)].attrs["ep_meta"]
 
             # extract obs, rewards, dones
             actions = f["data/{}/actions".format(ep)][()]
             # actions_abs = f["data/{}/actions_abs".format(ep)][()]
-            traj = extract_trajectory(
-                env=env,
-                initial_state=initial_state,
-                states=states,
-                actions=actions,
-                # actions_abs=actions_abs,
-                done_mode=args.done_mode,
-            )
+
+            # IMPORTANT: keep name of group the same as source file, to make sure that filter keys are
+            #            consistent as well
+            if ep in data_grp:
+                # remove partial output from a failed attempt
+                del data_grp[ep]
+            ep_data_grp = data_grp.create_group(ep)
+
+            if args.stream:
+                traj = extract_trajectory_streaming(
+                    env=env,
+                    initial_state=initial_state,
+                    states=states,
+                    actions=actions,
+                    done_mode=args.done_mode,
+                    ep_data_grp=ep_data_grp,
+                    chunk_size=args.chunk_size,
+                    compress=not args.no_compress,
+                    include_next_obs=args.include_next_obs,
+                )
+            else:
+                traj = extract_trajectory(
+                    env=env,
+                    initial_state=initial_state,
+                    states=states,
+                    actions=actions,
+                    # actions_abs=actions_abs,
+                    done_mode=args.done_mode,
+                )
 
             # maybe copy reward or done signal from source file
             if args.copy_rewards:
@@ -285,40 +453,40 @@ def process_demo_batch(
                 traj["dones"] = f["data/{}/dones".format(ep)][()]
 
             # store transitions
-            # IMPORTANT: keep name of group the same as source file, to make sure that filter keys are
-            #            consistent as well
-            ep_data_grp = data_grp.create_group(ep)
             ep_data_grp.create_dataset("actions", data=np.array(traj["actions"]))
             # ep_data_grp.create_dataset("actions_abs", data=np.array(traj["actions_abs"]))
             ep_data_grp.create_dataset("states", data=np.array(traj["states"]))
             ep_data_grp.create_dataset("rewards", data=np.array(traj["rewards"]))
             ep_data_grp.create_dataset("dones", data=np.array(traj["dones"]))
-            for k in traj["obs"]:
-                if args.no_compress:
-                    ep_data_grp.create_dataset(
-                        "obs/{}".format(k), data=np.array(traj["obs"][k])
-                    )
-
-                else:
-                    ep_data_grp.create_dataset(
-                        "obs/{}".format(k),
-                        data=np.array(traj["obs"][k]),
-                        compression="gzip",
-                    )
-                if args.include_next_obs:
+            if not args.stream:
+                # in streaming mode, observations have already been written
+                for k in traj["obs"]:
                     if args.no_compress:
                         ep_data_grp.create_dataset(
-                            "next_obs/{}".format(k), data=np.array(traj["next_obs"][k])
+                            "obs/{}".format(k), data=np.array(traj["obs"][k])
                         )
+
                     else:
                         ep_data_grp.create_dataset(
-                            "next_obs/{}".format(k),
-                            data=np.array(traj["next_obs"][k]),
+                            "obs/{}".format(k),
+                            data=np.array(traj["obs"][k]),
                             compression="gzip",
                         )
+                    if args.include_next_obs:
+                        if args.no_compress:
+                            ep_data_grp.create_dataset(
+                                "next_obs/{}".format(k),
+                                data=np.array(traj["next_obs"][k]),
+                            )
+                        else:
+                            ep_data_grp.create_dataset(
+                                "next_obs/{}".format(k),
+                                data=np.array(traj["next_obs"][k]),
+                                compression="gzip",
+                            )
 
             # episode metadata
-            ep_data_grp.attrs["model_file"] = traj["initial_state_dict"]["model"]
+            ModelStore.write_model_xml(ep_data_grp, traj["initial_state_dict"]["model"])
             ep_data_grp.attrs["ep_meta"] = traj["initial_state_dict"]["ep_meta"]
             ep_data_grp.attrs["num_samples"] = traj["actions"].shape[0]
 
@@ -414,6 +582,62 @@ def get_gpu_allocation(num_procs, gpu_ids, procs_per_gpu=None):
     return gpu_allocation
 
 
+def write_sharded_output(output_path, demos, demo_locations, source_dataset):
+    """
+    Writes the output dataset as an index file whose demos are external links into shard files,
+    instead of copying all demos into a single file. The per-process temporary files are moved next to
+    the index to become the shards, so no observation data is read, decompressed or copied, and the
+    time to write the output does not depend on the size of the dataset.
+
+    Readers open the index like any other dataset (h5py resolves the links transparently), as long as
+    the shards are kept in the same directory as the index.
+
+    Args:
+        output_path (str): path of the index file to write
+        demos (list): demo names, in the order they should appear in the output
+        demo_locations (dict): demo name to the temporary file containing it
+        source_dataset (str): path of the source dataset, to copy filter masks from
+
+    Returns:
+        shard_paths (dict): temporary file to the shard path it was moved to
+    """
+    output_prefix = os.path.splitext(output_path)[0]
+    shard_paths = dict()
+    for (i, temp_file) in enumerate(sorted(set(demo_locations.values()))):
+        shard_path = "{}_shard_{}.hdf5".format(output_prefix, i)
+        os.replace(temp_file, shard_path)
+        shard_paths[temp_file] = shard_path
+
+    with h5py.File(output_path, "w") as f_out:
+        data_grp = f_out.create_group("data")
+        total_samples = 0
+
+        for demo in demos:
+            if demo not in demo_locations:
+                print(
+                    f"Warning: Demo {demo} not found in any temporary files. Skipping."
+                )
+                continue
+            shard_path = shard_paths[demo_locations[demo]]
+            # link relative to the index file, so that the dataset directory can be moved as a whole
+            data_grp[demo] = h5py.ExternalLink(
+                os.path.basename(shard_path), "data/{}".format(demo)
+            )
+            total_samples += data_grp[demo].attrs["num_samples"]
+            if "env_args" not in data_grp.attrs:
+                with h5py.File(shard_path, "r") as f_shard:
+                    data_grp.attrs["env_args"] = f_shard["data"].attrs["env_args"]
+
+        # Copy filter masks if they exist in the original file
+        with h5py.File(source_dataset, "r") as f:
+            if "mask" in f:
+                f.copy("mask", f_out)
+
+        data_grp.attrs["total"] = total_samples
+
+    return shard_paths
+
+
 def dataset_states_to_obs_mp(args):
 
     # Get environment metadata
@@ -570,39 +794,54 @@ def dataset_states_to_obs_mp(args):
     # Merge results in the original demo order
     output_path = os.path.join(os.path.dirname(args.dataset), output_name)
 
-    print("\nMerging temporary files...")
-    with h5py.File(output_path, "w") as f_out:
-        data_grp = f_out.create_group("data")
-        total_samples = 0
-
-        # Copy data maintaining original demo order by following the original demos list
-        pbar = tqdm(demos, desc="Merging")
-        try:
-            for demo in pbar:
-                # Look up which temp file contains this demo
-                if demo not in demo_locations:
-                    print(
-                        f"Warning: Demo {demo} not found in any temporary files. Skipping."
-                    )
-                    continue
-                temp_file = demo_locations[demo]
-                with h5py.File(temp_file, "r") as f_temp:
-                    # Copy this demo's data to the output file
-                    f_temp.copy(f"data/{demo}", data_grp)
-                    total_samples += data_grp[demo].attrs["num_samples"]
-                    # Copy environment args from the first temp file if not done yet
-                    if "env_args" not in data_grp.attrs:
-                        data_grp.attrs["env_args"] = f_temp["data"].attrs["env_args"]
-                pbar.set_postfix({"total_samples": total_samples})
-        finally:
-            pbar.close()
-
-        # Copy filter masks if they exist in the original file
-        with h5py.File(args.dataset, "r") as f:
-            if "mask" in f:
-                f.copy("mask", f_out)
+    if args.sharded:
+        # keep the per-process files as shards, and only write a small index file linking to them
+        print("\nLinking shard files...")
+        shard_paths = write_sharded_output(
+            output_path=output_path,
+            demos=demos,
+            demo_locations=demo_locations,
+            source_dataset=args.dataset,
+        )
+    else:
+        print("\nMerging temporary files...")
+        with h5py.File(output_path, "w") as f_out:
+            data_grp = f_out.create_group("data")
+            total_samples = 0
 
-        data_grp.attrs["total"] = total_samples
+            # Copy data maintaining original demo order by following the original demos list
+            pbar = tqdm(demos, desc="Merging")
+            try:
+                for demo in pbar:
+                    # Look up which temp file contains this demo
+                    if demo not in demo_locations:
+                        print(
+                            f"Warning: Demo {demo} not found in any temporary files. Skipping."
+                        )
+                        continue
+                    temp_file = demo_locations[demo]
+                    with h5py.File(temp_file, "r") as f_temp:
+                        # Copy this demo's data to the output file
+                        f_temp.copy(f"data/{demo}", data_grp)
+                        ModelStore.copy_model_xml(
+                            f_temp[f"data/{demo}"], data_grp[demo]
+                        )
+                        total_samples += data_grp[demo].attrs["num_samples"]
+                        # Copy environment args from the first temp file if not done yet
+                        if "env_args" not in data_grp.attrs:
+                            data_grp.attrs["env_args"] = f_temp["data"].attrs[
+                                "env_args"
+                            ]
+                    pbar.set_postfix({"total_samples": total_samples})
+            finally:
+                pbar.close()
+
+            # Copy filter masks if they exist in the original file
+            with h5py.File(args.dataset, "r") as f:
+                if "mask" in f:
+                    f.copy("mask", f_out)
+
+            data_grp.attrs["total"] = total_samples
 
     DatasetUtils.extract_action_dict(dataset=output_path)
     DatasetUtils.make_demo_ids_contiguous(dataset=output_path)
@@ -648,6 +887,9 @@ def dataset_states_to_obs_mp(args):
         temp_file,
         _,
     ) in results:
+        if args.sharded and temp_file in shard_paths:
+            # temporary file has been moved to become a shard of the output
+            continue
         try:
             os.remove(temp_file)
         except OSError as e:
@@ -665,6 +907,8 @@ def dataset_states_to_obs_mp(args):
         num_processes=num_processes,
         gpu_allocation=gpu_allocation if gpu_allocation else "no GPU allocation",
     )
+    if args.sharded:
+        important_stats["shards"] = sorted(set(shard_paths.values()))
     return important_stats
 
 
@@ -766,6 +1010,28 @@ if __name__ == "__main__":
         action="store_true",
     )
 
+    # flag for streaming observations to chunked hdf5 datasets
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="(optional) write observations in chunks as they are extracted, to bound memory usage",
+    )
+
+    # number of timesteps per chunk in streaming mode
+    parser.add_argument(
+        "--chunk_size",
+        type=int,
+        default=64,
+        help="(optional) number of timesteps per hdf5 chunk in streaming mode",
+    )
+
+    # flag for writing the output as an index file linking to per-process shard files
+    parser.add_argument(
+        "--sharded",
+        action="store_true",
+        help="(optional) keep per-process output files as shards linked from the output file, instead of merging them",
+    )
+
     # flag for using generative textures
     parser.add_argument(
         "--generative-textures",
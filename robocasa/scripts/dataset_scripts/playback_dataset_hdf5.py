@@ -11,6 +11,7 @@ import traceback
 
 import robosuite
 import robocasa
+import robocasa.utils.model_store as ModelStore
 
 from robocasa.scripts.dataset_scripts.playback_utils import (
     resolve_instruction_from_ep_meta,
@@ -398,7 +399,7 @@ def playback_dataset(
         # prepare initial state to reload from
         states = f["data/{}/states".format(ep)][()]
         initial_state = dict(states=states[0])
-        initial_state["model"] = f["data/{}".format(ep)].attrs["model_file"]
+        initial_state["model"] = ModelStore.read_model_xml(f["data/{}".format(ep)])
         initial_state["ep_meta"] = f["data/{}".format(ep)].attrs.get("ep_meta", None)
 
         if extend_states:
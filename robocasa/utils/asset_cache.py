@@ -0,0 +1,155 @@
+"""
+Process-wide, size-bounded in-memory cache of the asset files (meshes, textures, height fields) of MuJoCo models.
+
+Compiling a model from an xml string opens and reads every file referenced by the xml, which for a kitchen
+means hundreds of fixture and object meshes and textures, at every scene rebuild and every playback reset.
+compile_model instead reads the referenced files through the cache, and hands their contents to MuJoCo through
+the in-memory assets mapping of MjModel.from_xml_string, so that files are only read from disk once per process.
+
+Entries are keyed by absolute path, and are re-read when the modification time or size of the file changes. The
+least recently used entries are evicted once the cache holds more than macros.ASSET_CACHE_MAX_BYTES. The cache
+is disabled unless macros.ASSET_CACHE_MAX_BYTES is set. Only absolute paths are cached (models merged by robosuite
+reference all assets by absolute path); other files are left for MuJoCo to resolve. MuJoCo looks up in-memory
+assets by file name only, so files whose name is shared with another file of the model are also read from disk.
+"""
+
+import os
+import re
+from collections import OrderedDict
+from xml.sax.saxutils import unescape
+
+import mujoco
+
+import robocasa.macros as macros
+
+# file attributes of asset elements (mesh, texture, hfield, skin), including the per-face files of cube textures
+ASSET_FILE_PATTERN = re.compile(r'\bfile(?:back|down|front|left|right|up)?="([^"]+)"')
+
+# absolute path -> (mtime, size, contents)
+_ASSET_CACHE = OrderedDict()
+_ASSET_CACHE_STATS = dict(hits=0, misses=0, evictions=0, num_bytes=0)
+
+
+def get_asset_paths(xml_str):
+    """
+    Args:
+        xml_str (str): model xml
+
+    Returns:
+        list: absolute paths of the asset files referenced by @xml_str that can be passed to MuJoCo in memory,
+            without duplicates. Files whose name is shared with another referenced file are left out
+    """
+    paths = dict()
+    fname_counts = dict()
+    for path in ASSET_FILE_PATTERN.findall(xml_str):
+        path = unescape(path, {"&quot;": '"', "&apos;": "'"})
+        if path in paths:
+            continue
+        paths[path] = None
+        fname = os.path.basename(path)
+        fname_counts[fname] = fname_counts.get(fname, 0) + 1
+    return [
+        path
+        for path in paths
+        if os.path.isabs(path) and fname_counts[os.path.basename(path)] == 1
+    ]
+
+
+def _evict(max_bytes):
+    while _ASSET_CACHE_STATS["num_bytes"] > max_bytes and len(_ASSET_CACHE) > 0:
+        (_, (_, size, _)) = _ASSET_CACHE.popitem(last=False)
+        _ASSET_CACHE_STATS["num_bytes"] -= size
+        _ASSET_CACHE_STATS["evictions"] += 1
+
+
+def read_asset(path):
+    """
+    Reads an asset file through the cache
+
+    Args:
+        path (str): absolute path of the file
+
+    Returns:
+        bytes: contents of the file, or None if it does not exist
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    max_bytes = macros.ASSET_CACHE_MAX_BYTES
+    entry = _ASSET_CACHE.get(path)
+    if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+        _ASSET_CACHE.move_to_end(path)
+        _ASSET_CACHE_STATS["hits"] += 1
+        return entry[2]
+
+    _ASSET_CACHE_STATS["misses"] += 1
+    with open(path, "rb") as f:
+        contents = f.read()
+    if entry is not None:
+        del _ASSET_CACHE[path]
+        _ASSET_CACHE_STATS["num_bytes"] -= entry[1]
+    if len(contents) <= max_bytes:
+        _ASSET_CACHE[path] = (stat.st_mtime_ns, len(contents), contents)
+        _ASSET_CACHE_STATS["num_bytes"] += len(contents)
+        _evict(max_bytes)
+    return contents
+
+
+def get_assets(xml_str):
+    """
+    Args:
+        xml_str (str): model xml
+
+    Returns:
+        dict: absolute path -> contents of every (existing) asset file referenced by @xml_str, to be passed as
+            the assets of MjModel.from_xml_string
+    """
+    # the size bound may have been lowered since the last read
+    _evict(macros.ASSET_CACHE_MAX_BYTES)
+    assets = dict()
+    for path in get_asset_paths(xml_str):
+        contents = read_asset(path)
+        if contents is not None:
+            assets[path] = contents
+    return assets
+
+
+def compile_model(xml_str):
+    """
+    Compiles a model, reading its asset files through the cache. If macros.ASSET_CACHE_MAX_BYTES is 0, the
+    cache is bypassed and MuJoCo reads the files from disk
+
+    Args:
+        xml_str (str): model xml
+
+    Returns:
+        MjModel: compiled model
+    """
+    if not macros.ASSET_CACHE_MAX_BYTES:
+        return mujoco.MjModel.from_xml_string(xml_str)
+    return mujoco.MjModel.from_xml_string(xml_str, get_assets(xml_str))
+
+
+def get_asset_cache_stats():
+    """
+    Returns:
+        dict: number of hits, misses and evictions since the last clear, hit rate, and number of files and
+            bytes currently held
+    """
+    stats = dict(_ASSET_CACHE_STATS)
+    num_reads = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = stats["hits"] / num_reads if num_reads > 0 else 0.0
+    stats["num_assets"] = len(_ASSET_CACHE)
+    stats["max_bytes"] = macros.ASSET_CACHE_MAX_BYTES
+    return stats
+
+
+def clear_asset_cache():
+    """
+    Clears all cached assets and resets the statistics
+    """
+    _ASSET_CACHE.clear()
+    for key in _ASSET_CACHE_STATS:
+        _ASSET_CACHE_STATS[key] = 0
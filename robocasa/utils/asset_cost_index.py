@@ -0,0 +1,278 @@
+"""
+Index of the simulation cost of object and fixture assets.
+
+Some assets are much more expensive than others: dense meshes and many convex hulls make models slow to compile,
+and make contacts slow to resolve at every step. The index stores, for every profiled model xml, its compile
+time, mesh vertex and face counts, number of convex hulls (collision meshes) and per-step contact cost, along
+with a single cost estimate in seconds per episode (see get_asset_cost). It is built offline and stored as a json
+file in the user cache directory (see robocasa/utils/cache_utils.py):
+
+    python robocasa/scripts/build_asset_cost_index.py
+
+Object sampling (sample_kitchen_object) and fixture style loading (load_style_config) can then take a cost
+budget, to avoid outlier assets. Assets that are not in the index are assumed to be free.
+"""
+
+import json
+import os
+import statistics
+import time
+
+import mujoco
+import numpy as np
+
+import robocasa
+from robocasa.utils.cache_utils import get_cache_path
+
+ASSET_COST_INDEX_VERSION = 1
+
+ASSET_COST_INDEX_FILENAME = "asset_cost_index.json"
+
+# number of steps of an episode, used to weigh the per-step contact cost of an asset against its compile time
+ASSET_COST_EPISODE_STEPS = 500
+
+
+def get_asset_key(mjcf_path):
+    """
+    Args:
+        mjcf_path (str): path of a model xml, or of a model folder (eg. "fixtures/sinks/Sink001") relative to
+            the assets root
+
+    Returns:
+        str: key of the model in the index: path of its model.xml, relative to the assets root. Upright versions
+            of object models share the key of the model
+    """
+    if not mjcf_path.endswith(".xml"):
+        mjcf_path = os.path.join(mjcf_path, "model.xml")
+    elif os.path.basename(mjcf_path) == "model_upright.xml":
+        mjcf_path = os.path.join(os.path.dirname(mjcf_path), "model.xml")
+    if os.path.isabs(mjcf_path):
+        mjcf_path = os.path.relpath(mjcf_path, robocasa.models.assets_root)
+    return os.path.normpath(mjcf_path)
+
+
+def get_asset_cost(entry, episode_steps=ASSET_COST_EPISODE_STEPS):
+    """
+    Args:
+        entry (dict): profile of an asset, as returned by profile_asset
+
+        episode_steps (int): number of steps per episode
+
+    Returns:
+        float: estimated cost of the asset per episode, in seconds: compile time plus contact cost of all steps
+    """
+    return entry["compile_time"] + episode_steps * max(entry["contact_step_time"], 0.0)
+
+
+def _time_steps(model, data, num_steps):
+    t_start = time.perf_counter()
+    for _ in range(num_steps):
+        mujoco.mj_step(model, data)
+    return (time.perf_counter() - t_start) / num_steps
+
+
+def _get_geom_bounds(model, data, geom_ids):
+    """
+    Returns the (conservative) lower and upper z bounds and the xy center of a set of geoms
+    """
+    pos = data.geom_xpos[geom_ids]
+    rbound = model.geom_rbound[geom_ids]
+    return (
+        float(np.min(pos[:, 2] - rbound)),
+        float(np.max(pos[:, 2] + rbound)),
+        np.mean(pos[:, :2], axis=0),
+    )
+
+
+def profile_asset(mjcf_path, is_object=True, num_compiles=3, num_steps=200):
+    """
+    Measures the cost of a model: compile time, mesh and collision geometry counts, and the step time of a
+    scene in which the model rests in contact. Objects are dropped onto a floor, fixtures get a box dropped on top
+
+    Args:
+        mjcf_path (str): path of the model xml
+
+        is_object (bool): True for objects (free bodies), False for fixtures (static)
+
+        num_compiles (int): number of compiles to time. The median is recorded
+
+        num_steps (int): number of steps to time
+
+    Returns:
+        dict: profile of the model
+    """
+    compile_times = []
+    for _ in range(num_compiles):
+        t_start = time.perf_counter()
+        model = mujoco.MjModel.from_xml_path(mjcf_path)
+        compile_times.append(time.perf_counter() - t_start)
+
+    collision = (model.geom_contype != 0) | (model.geom_conaffinity != 0)
+    convex_hulls = collision & (model.geom_type == mujoco.mjtGeom.mjGEOM_MESH)
+    entry = dict(
+        mtime=os.stat(mjcf_path).st_mtime,
+        compile_time=statistics.median(compile_times),
+        num_meshes=int(model.nmesh),
+        num_mesh_vertices=int(np.sum(model.mesh_vertnum)),
+        num_mesh_faces=int(np.sum(model.mesh_facenum)),
+        num_collision_geoms=int(np.sum(collision)),
+        num_convex_hulls=int(np.sum(convex_hulls)),
+    )
+
+    # build a scene in which the model is in contact
+    spec = mujoco.MjSpec.from_file(mjcf_path)
+    data = mujoco.MjData(model)
+    mujoco.mj_forward(model, data)
+    geom_ids = np.flatnonzero(collision)
+    if len(geom_ids) == 0:
+        geom_ids = np.arange(model.ngeom)
+    z_min, z_max, center = _get_geom_bounds(model, data, geom_ids)
+
+    spec.worldbody.add_geom(
+        type=mujoco.mjtGeom.mjGEOM_PLANE, size=[5, 5, 0.1], pos=[0, 0, min(z_min, 0)]
+    )
+    if is_object:
+        body = spec.worldbody.first_body()
+        body.add_freejoint()
+        body.pos = body.pos + np.array([0, 0, max(-z_min, 0) + 0.01])
+    else:
+        probe = spec.worldbody.add_body(pos=[center[0], center[1], z_max + 0.05])
+        probe.add_freejoint()
+        probe.add_geom(type=mujoco.mjtGeom.mjGEOM_BOX, size=[0.05, 0.05, 0.05])
+    scene_model = spec.compile()
+    scene_data = mujoco.MjData(scene_model)
+
+    # settle, then time steps
+    _time_steps(scene_model, scene_data, num_steps)
+    step_time = _time_steps(scene_model, scene_data, num_steps)
+
+    entry["step_time"] = step_time
+    entry["contact_step_time"] = step_time - _get_baseline_step_time(num_steps)
+    entry["num_contacts"] = int(scene_data.ncon)
+    entry["cost"] = get_asset_cost(entry)
+    return entry
+
+
+_BASELINE_STEP_TIME = dict()
+
+
+def _get_baseline_step_time(num_steps):
+    """
+    Step time of a scene with a box resting on a floor, subtracted from the step time of profiled models
+    """
+    if num_steps not in _BASELINE_STEP_TIME:
+        spec = mujoco.MjSpec()
+        spec.worldbody.add_geom(type=mujoco.mjtGeom.mjGEOM_PLANE, size=[5, 5, 0.1])
+        probe = spec.worldbody.add_body(pos=[0, 0, 0.06])
+        probe.add_freejoint()
+        probe.add_geom(type=mujoco.mjtGeom.mjGEOM_BOX, size=[0.05, 0.05, 0.05])
+        model = spec.compile()
+        data = mujoco.MjData(model)
+        _time_steps(model, data, num_steps)
+        _BASELINE_STEP_TIME[num_steps] = _time_steps(model, data, num_steps)
+    return _BASELINE_STEP_TIME[num_steps]
+
+
+class AssetCostIndex:
+    """
+    Index of asset costs, keyed by model xml path relative to the assets root.
+
+    Args:
+        index_path (str): path of the index file. Defaults to asset_cost_index.json in the user cache directory
+    """
+
+    def __init__(self, index_path=None):
+        if index_path is None:
+            index_path = get_cache_path(ASSET_COST_INDEX_FILENAME)
+        self.index_path = index_path
+
+        self._entries = self._load()
+        self._dirty = False
+
+    def _load(self):
+        if not os.path.exists(self.index_path):
+            return dict()
+        try:
+            with open(self.index_path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return dict()
+        if data.get("version") != ASSET_COST_INDEX_VERSION:
+            return dict()
+        return data["assets"]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_entry(self, mjcf_path):
+        """
+        Args:
+            mjcf_path (str): path of a model xml or model folder (see get_asset_key)
+
+        Returns:
+            dict or None: profile of the model, or None if it is not indexed
+        """
+        return self._entries.get(get_asset_key(mjcf_path))
+
+    def is_stale(self, mjcf_path):
+        """
+        Returns:
+            bool: True if the model is not indexed, or if its xml changed since it was profiled
+        """
+        entry = self.get_entry(mjcf_path)
+        return entry is None or entry["mtime"] != os.stat(mjcf_path).st_mtime
+
+    def add_entry(self, mjcf_path, entry):
+        """
+        Adds (or replaces) the profile of a model
+        """
+        self._entries[get_asset_key(mjcf_path)] = entry
+        self._dirty = True
+
+    def get_cost(self, mjcf_path):
+        """
+        Returns:
+            float: cost of the model per episode (see get_asset_cost), or 0 if it is not indexed
+        """
+        entry = self.get_entry(mjcf_path)
+        return 0.0 if entry is None else entry["cost"]
+
+    def get_costs(self, mjcf_paths):
+        """
+        Returns:
+            np.array: (N,) array of the costs of @mjcf_paths. Models that are not indexed cost 0
+        """
+        return np.array([self.get_cost(p) for p in mjcf_paths], dtype=float)
+
+    def save(self, force=False):
+        """
+        Writes the index to disk if it changed since it was loaded. Failing to write the index is not an error
+
+        Args:
+            force (bool): if True, writes the index even if it did not change
+        """
+        if not (self._dirty or force):
+            return
+        data = dict(version=ASSET_COST_INDEX_VERSION, assets=self._entries)
+        tmp_path = "{}.{}.tmp".format(self.index_path, os.getpid())
+        try:
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(data, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.index_path)
+            self._dirty = False
+        except OSError:
+            pass
+
+
+_ASSET_COST_INDEX = None
+
+
+def get_asset_cost_index():
+    """
+    Get the (process-wide) asset cost index
+    """
+    global _ASSET_COST_INDEX
+    if _ASSET_COST_INDEX is None:
+        _ASSET_COST_INDEX = AssetCostIndex()
+    return _ASSET_COST_INDEX
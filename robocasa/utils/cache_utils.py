@@ -0,0 +1,32 @@
+"""
+Location of the files that robocasa caches across processes (object asset index, asset cost index, config bundle
+and on-disk scene cache entries).
+
+All of them are written to a single user cache directory rather than next to the assets, which may be read-only
+or shared between users and checkouts. The directory is macros.CACHE_DIR, or ~/.cache/robocasa if it is not set.
+"""
+
+import os
+
+import robocasa.macros as macros
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "robocasa")
+
+
+def get_cache_dir():
+    """
+    Returns:
+        str: the robocasa cache directory
+    """
+    return macros.CACHE_DIR or DEFAULT_CACHE_DIR
+
+
+def get_cache_path(*names):
+    """
+    Args:
+        names (str): path components, relative to the cache directory
+
+    Returns:
+        str: path under the robocasa cache directory
+    """
+    return os.path.join(get_cache_dir(), *names)
@@ -0,0 +1,157 @@
+"""
+Per-simulation index of geom groups, used to answer contact queries.
+
+robosuite's check_contact walks the active contacts in Python and resolves the names of both geoms of every
+contact, for every query. Success checks and rewards issue many such queries per step. Instead, the index maps
+each geom group (a geom name, a list of geom names, or a model and its contact geoms) to a boolean mask over
+geom ids, built once per simulation. A query then only pulls the geom ids of the active contacts as arrays and
+looks them up in the masks.
+
+Query results are cached until the set of active contacts changes, so repeated queries within the same step
+are free.
+"""
+
+import numpy as np
+from robosuite.models.base import MujocoModel
+
+
+class ContactIndex:
+    """
+    Index of geom groups of a simulation
+
+    Args:
+        sim (MjSim): simulation whose contacts are queried
+    """
+
+    def __init__(self, sim):
+        self.sim = sim
+        self.model = sim.model
+        self.ngeom = sim.model.ngeom
+
+        # group key -> (ngeom,) boolean mask
+        self._masks = dict()
+        # query key -> result, valid as long as the active contacts are unchanged
+        self._results = dict()
+        self._pairs = np.zeros((0, 2), dtype=np.int32)
+        self._pairs_bytes = self._pairs.tobytes()
+
+    def _get_group_key(self, geoms):
+        if geoms is None or isinstance(geoms, (str, MujocoModel)):
+            return geoms
+        return tuple(geoms)
+
+    def _add_geoms_to_mask(self, mask, geoms):
+        if isinstance(geoms, MujocoModel):
+            geoms = geoms.contact_geoms
+        elif isinstance(geoms, str):
+            geoms = [geoms]
+        for geom in geoms:
+            if isinstance(geom, MujocoModel):
+                self._add_geoms_to_mask(mask, geom)
+                continue
+            try:
+                mask[self.model.geom_name2id(geom)] = True
+            except ValueError:
+                # geoms that are not in the model never make contact
+                pass
+
+    def get_geom_mask(self, geoms):
+        """
+        Get the (cached) mask of a geom group
+
+        Args:
+            geoms (str or list or MujocoModel): a geom name, a list of geom names and/or models, or a model.
+                The geoms of a model are its contact_geoms
+
+        Returns:
+            np.array: (ngeom,) read-only boolean array, True for the geoms of the group
+        """
+        key = self._get_group_key(geoms)
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = np.zeros(self.ngeom, dtype=bool)
+            self._add_geoms_to_mask(mask, geoms)
+            mask.setflags(write=False)
+            self._masks[key] = mask
+        return mask
+
+    def get_id_mask(self, key, geom_ids):
+        """
+        Get the (cached) mask of a group of geoms given by id
+
+        Args:
+            key (str): name of the group. Masks are cached by name, so @geom_ids is only read on first use
+
+            geom_ids (iterable): ids of the geoms of the group
+
+        Returns:
+            np.array: (ngeom,) read-only boolean array, True for the geoms of the group
+        """
+        key = ("ids", key)
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = np.zeros(self.ngeom, dtype=bool)
+            mask[list(geom_ids)] = True
+            mask.setflags(write=False)
+            self._masks[key] = mask
+        return mask
+
+    def get_contact_pairs(self):
+        """
+        Get the geom ids of the active contacts. Cached query results are cleared if they changed since the
+        last call
+
+        Returns:
+            2-tuple:
+                - (np.array): (ncon,) array of ids of the first geom of each contact
+                - (np.array): (ncon,) array of ids of the second geom of each contact
+        """
+        pairs = self.sim.data.contact.geom
+        pairs_bytes = pairs.tobytes()
+        if pairs_bytes != self._pairs_bytes:
+            self._pairs = np.array(pairs)
+            self._pairs_bytes = pairs_bytes
+            self._results.clear()
+        return self._pairs[:, 0], self._pairs[:, 1]
+
+    def check_contact(self, geoms_1, geoms_2=None):
+        """
+        Same as robosuite's check_contact: finds contact between two geom groups
+
+        Args:
+            geoms_1 (str or list or MujocoModel): first geom group (see get_geom_mask)
+
+            geoms_2 (str or list or MujocoModel or None): second geom group. If None, checks contact between
+                @geoms_1 and any other geom
+
+        Returns:
+            bool: True if any geom in @geoms_1 is in contact with any geom in @geoms_2
+        """
+        geom1, geom2 = self.get_contact_pairs()
+        key = (self._get_group_key(geoms_1), self._get_group_key(geoms_2))
+        result = self._results.get(key)
+        if result is None:
+            mask_1 = self.get_geom_mask(geoms_1)
+            if geoms_2 is None:
+                in_contact = mask_1[geom1] | mask_1[geom2]
+            else:
+                mask_2 = self.get_geom_mask(geoms_2)
+                in_contact = (mask_1[geom1] & mask_2[geom2]) | (
+                    mask_2[geom1] & mask_1[geom2]
+                )
+            result = bool(np.any(in_contact))
+            self._results[key] = result
+        return result
+
+    def check_external_contact(self, mask):
+        """
+        Checks whether any geom of a group is in contact with a geom outside of the group
+
+        Args:
+            mask (np.array): (ngeom,) boolean mask of the group, eg. from get_id_mask
+
+        Returns:
+            bool: True if such a contact exists
+        """
+        geom1, geom2 = self.get_contact_pairs()
+        return bool(np.any(mask[geom1] != mask[geom2]))
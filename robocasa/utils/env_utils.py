@@ -14,9 +14,9 @@ from robosuite.utils.mjcf_utils import (
 )
 import xml.etree.ElementTree as ET
 import os
+import mujoco
 import robosuite
 import robocasa
-import yaml
 import imageio
 import numpy as np
 import contextlib
@@ -220,11 +220,10 @@ def get_current_layout_stool_rotations(env):
         list: List of unique rotation values (floats) found in stool configurations
     """
     from robocasa.models.scenes.scene_registry import get_layout_path
+    from robocasa.models.scenes.config_cache import load_yaml_config
 
     layout_path = get_layout_path(env.layout_id)
-
-    with open(layout_path, "r") as file:
-        layout_data = yaml.safe_load(file)
+    layout_data = load_yaml_config(layout_path)
 
     unique_rots = set()
 
@@ -308,10 +307,10 @@ def get_island_group_counter_names(env):
         list: List of counter fixture names (str) under all island_group groups
     """
     from robocasa.models.scenes.scene_registry import get_layout_path
+    from robocasa.models.scenes.config_cache import load_yaml_config
 
     layout_path = get_layout_path(env.layout_id)
-    with open(layout_path, "r") as f:
-        layout_data = yaml.safe_load(f)
+    layout_data = load_yaml_config(layout_path)
     counter_names = []
     for group_key, group_val in layout_data.items():
         if group_key.startswith("island_group"):
@@ -1512,11 +1511,10 @@ def no_collision(sim):
         sim.model.geom_conaffinity = original_conaffinity
 
 
-def detect_robot_collision(env):
+def get_robot_geom_ids(env):
     """
-    Checks if the robot has a collision with any placed fixtures/objects.
     Returns:
-        bool: True if a collision is detected between the robot and any other fixtures/objects, False otherwise.
+        set: ids of all geoms of the robot. Computed once per model and stored in env.robot_geom_ids
     """
     if env.robot_geom_ids is None:
         env.robot_geom_ids = set()
@@ -1525,14 +1523,17 @@ def detect_robot_collision(env):
         )
         for robot_geom in robot_geoms:
             env.robot_geom_ids.add(env.sim.model.geom_name2id(robot_geom.get("name")))
-    for i in range(env.sim.data.ncon):
-        geom1 = env.sim.data.contact[i].geom1
-        geom2 = env.sim.data.contact[i].geom2
-        if (geom1 in env.robot_geom_ids and geom2 not in env.robot_geom_ids) or (
-            geom2 in env.robot_geom_ids and geom1 not in env.robot_geom_ids
-        ):
-            return True
-    return False
+    return env.robot_geom_ids
+
+
+def detect_robot_collision(env):
+    """
+    Checks if the robot has a collision with any placed fixtures/objects.
+    Returns:
+        bool: True if a collision is detected between the robot and any other fixtures/objects, False otherwise.
+    """
+    robot_mask = env.contact_index.get_id_mask("robot", get_robot_geom_ids(env))
+    return env.contact_index.check_external_contact(robot_mask)
 
 
 def generate_random_robot_pos(env, anchor_pos, anchor_ori, pos_dev_x, pos_dev_y):
@@ -1547,6 +1548,171 @@ def generate_random_robot_pos(env, anchor_pos, anchor_ori, pos_dev_x, pos_dev_y)
     return anchor_pos + global_deviation
 
 
+def generate_random_robot_pos_batch(
+    env, anchor_pos, anchor_ori, pos_dev_x, pos_dev_y, num_samples
+):
+    """
+    Batched version of generate_random_robot_pos. Draws the same random numbers as @num_samples
+    consecutive calls to generate_random_robot_pos.
+
+    Returns:
+        np.array: (num_samples, 3) array of candidate robot positions
+    """
+    low = np.array([-pos_dev_x, -pos_dev_y])
+    high = np.array([pos_dev_x, pos_dev_y])
+    local_deviation = low + (high - low) * env.rng.random((num_samples, 2))
+    local_deviation = np.concatenate(
+        (local_deviation, np.zeros((num_samples, 1))), axis=1
+    )
+    global_deviation = -local_deviation @ T.euler2mat(anchor_ori + [0, 0, np.pi / 2]).T
+    return np.array(anchor_pos) + global_deviation
+
+
+def get_geom_world_bbox_points(sim, geom_ids):
+    """
+    Computes the corners of the (oriented) bounding boxes of geoms in the world frame, from their current poses
+
+    Args:
+        sim (MjSim): simulation, on which forward has been called
+        geom_ids (np.array): ids of the geoms
+
+    Returns:
+        np.array: (N, 8, 3) bounding box points of the geoms, including their margins. As in
+            OU.objs_intersect_bbox, points 1-3 are adjacent to point 0
+    """
+    aabb = sim.model.geom_aabb[geom_ids]
+    xmat = sim.data.geom_xmat[geom_ids].reshape(-1, 3, 3)
+    centers = sim.data.geom_xpos[geom_ids] + np.einsum("nij,nj->ni", xmat, aabb[:, :3])
+    half_sizes = aabb[:, 3:] + sim.model.geom_margin[geom_ids][:, None]
+    signs = np.array(
+        [
+            [-1, -1, -1],
+            [1, -1, -1],
+            [-1, 1, -1],
+            [-1, -1, 1],
+            [1, 1, -1],
+            [1, -1, 1],
+            [-1, 1, 1],
+            [1, 1, 1],
+        ]
+    )
+    local_points = signs[None] * half_sizes[:, None]
+    return centers[:, None] + np.einsum("nij,nkj->nki", xmat, local_points)
+
+
+def compute_robot_spawn_map(env, ref_pos):
+    """
+    Builds a free-space map of the placed scene for spawning the robot base. The map holds the
+    bounding boxes of all collidable fixture and object geoms, and those of the robot geoms (in the
+    current robot configuration) at a reference position.
+
+    Since the robot base is positioned through slide joints, moving the base target from @ref_pos
+    to another position translates all robot geoms by a fixed linear function of the displacement,
+    which is measured here once. Candidate positions can then be checked in bulk with
+    robot_spawn_map_collisions instead of running the simulator for each of them.
+
+    Args:
+        env (Kitchen): environment, with the robot placed through set_robot_to_position
+        ref_pos (np.array): reference robot position
+
+    Returns:
+        dict or None: spawn map, or None if the robot has no collidable geoms
+    """
+    sim = env.sim
+    robot_geom_ids = get_robot_geom_ids(env)
+    collidable = (sim.model.geom_contype != 0) | (sim.model.geom_conaffinity != 0)
+    # planes are unbounded and are left to the simulator check of the chosen pose
+    collidable &= sim.model.geom_type != mujoco.mjtGeom.mjGEOM_PLANE
+    is_robot = np.zeros(sim.model.ngeom, dtype=bool)
+    is_robot[list(robot_geom_ids)] = True
+    robot_ids = np.where(collidable & is_robot)[0]
+    obstacle_ids = np.where(collidable & ~is_robot)[0]
+    if len(robot_ids) == 0:
+        return None
+
+    # measure how robot geoms move with the base target position
+    set_robot_to_position(env, np.array(ref_pos) + [1.0, 0.0, 0.0])
+    dx = sim.data.geom_xpos[robot_ids[0]].copy()
+    set_robot_to_position(env, np.array(ref_pos) + [0.0, 1.0, 0.0])
+    dy = sim.data.geom_xpos[robot_ids[0]].copy()
+    set_robot_to_position(env, ref_pos)
+    x0 = sim.data.geom_xpos[robot_ids[0]]
+    displacement_mat = np.stack([dx - x0, dy - x0], axis=1)
+
+    robot_points = get_geom_world_bbox_points(sim, robot_ids)
+    obstacle_points = get_geom_world_bbox_points(sim, obstacle_ids)
+
+    # geoms can only collide if their contype and conaffinity are compatible
+    robot_contype = sim.model.geom_contype[robot_ids]
+    robot_conaffinity = sim.model.geom_conaffinity[robot_ids]
+    obstacle_contype = sim.model.geom_contype[obstacle_ids]
+    obstacle_conaffinity = sim.model.geom_conaffinity[obstacle_ids]
+    compatible = (robot_contype[:, None] & obstacle_conaffinity[None]) != 0
+    compatible |= (obstacle_contype[None] & robot_conaffinity[:, None]) != 0
+
+    return dict(
+        ref_pos=np.array(ref_pos)[:2],
+        displacement_mat=displacement_mat,
+        robot_points=robot_points,
+        obstacle_points=obstacle_points,
+        obstacle_min=obstacle_points.min(axis=1),
+        obstacle_max=obstacle_points.max(axis=1),
+        compatible=compatible,
+    )
+
+
+def robot_spawn_map_collisions(spawn_map, robot_pos):
+    """
+    Checks candidate robot positions against a spawn map from compute_robot_spawn_map. The check is
+    conservative: a position is only reported free if no robot geom bounding box intersects an obstacle
+    geom bounding box, in which case the simulator cannot report a contact either.
+
+    Args:
+        spawn_map (dict): spawn map
+        robot_pos (np.array): (N, 3) candidate robot positions
+
+    Returns:
+        np.array: (N,) boolean array, True for positions where the robot may be in collision
+    """
+    offsets = (np.array(robot_pos)[:, :2] - spawn_map["ref_pos"]) @ spawn_map[
+        "displacement_mat"
+    ].T
+    # (N, R, 8, 3) robot bounding box points at each candidate
+    robot_points = spawn_map["robot_points"][None] + offsets[:, None, None]
+    robot_min = robot_points.min(axis=2)
+    robot_max = robot_points.max(axis=2)
+
+    # only keep obstacles that overlap the region swept by the robot over all candidates
+    obstacle_min = spawn_map["obstacle_min"]
+    obstacle_max = spawn_map["obstacle_max"]
+    in_region = np.where(
+        np.all(
+            (obstacle_max >= robot_min.min(axis=(0, 1)))
+            & (obstacle_min <= robot_max.max(axis=(0, 1))),
+            axis=1,
+        )
+    )[0]
+    may_collide = np.zeros(len(robot_pos), dtype=bool)
+    if len(in_region) == 0:
+        return may_collide
+
+    # (N, R, O) overlap of the axis-aligned bounds of robot and obstacle boxes
+    overlap = np.all(
+        (robot_max[:, :, None] >= obstacle_min[in_region][None, None])
+        & (robot_min[:, :, None] <= obstacle_max[in_region][None, None]),
+        axis=-1,
+    )
+    overlap &= spawn_map["compatible"][:, in_region][None]
+
+    # confirm the remaining pairs with a separating axis test on the oriented boxes
+    n, r, o = np.where(overlap)
+    intersect = OU.objs_intersect_bbox_pairwise(
+        robot_points[n, r], spawn_map["obstacle_points"][in_region[o]]
+    )
+    may_collide[n[intersect]] = True
+    return may_collide
+
+
 def set_robot_to_position(env, global_pos):
     local_pos = np.matmul(
         T.matrix_inverse(T.euler2mat(env.init_robot_base_ori_anchor)), global_pos
@@ -1596,6 +1762,11 @@ def set_robot_base(
     Sets the initial state of the robot by randomizing its position and orientation within defined deviation limits.
     The deviation limits are provided by `self.robot_spawn_position_deviation_x`, `self.robot_spawn_position_deviation_y`,
     and `self.robot_spawn_rotation_deviation`.
+    Candidate positions are checked in the simulator in sampling order. If macros.ROBOT_SPAWN_USE_FREE_SPACE_MAP is
+    set, they are first checked against a free-space map of the scene (see compute_robot_spawn_map) and candidates
+    that the map reports free are checked first, so that usually only one simulator check is needed. This changes
+    which candidate is chosen for a given seed, favoring positions away from obstacles. The number of candidates
+    sampled, simulator checks and sampling rings used are stored in env.robot_spawn_stats.
     Raises:
         RandomizationError: If the robot cannot be placed without collisions.
     """
@@ -1617,37 +1788,62 @@ def set_robot_base(
 
     initial_state_copy = env.sim.get_state()
 
-    # Try to move for 100 times to resolve any collision
-    found_valid = False
-    import time
+    spawn_map = None
+    if macros.ROBOT_SPAWN_USE_FREE_SPACE_MAP:
+        spawn_map = compute_robot_spawn_map(env, anchor_pos)
+        env.sim.set_state(initial_state_copy)
 
-    # t1 = time.time()
+    stats = dict(num_candidates=0, num_sim_checks=0, num_rings=0)
+
+    found_valid = False
     cur_dev_pos_x = pos_dev_x
     cur_dev_pos_y = pos_dev_y
     while found_valid is not True:
         # try up to 50 times
-        for attempt_position in range(50):
-            robot_pos = generate_random_robot_pos(
-                env=env,
-                anchor_pos=anchor_pos,
-                anchor_ori=anchor_ori,
-                pos_dev_x=cur_dev_pos_x,
-                pos_dev_y=cur_dev_pos_y,
+        num_attempts = 50
+        rng_state = env.rng.bit_generator.state
+        candidates = generate_random_robot_pos_batch(
+            env=env,
+            anchor_pos=anchor_pos,
+            anchor_ori=anchor_ori,
+            pos_dev_x=cur_dev_pos_x,
+            pos_dev_y=cur_dev_pos_y,
+            num_samples=num_attempts,
+        )
+        stats["num_rings"] += 1
+
+        # check candidates that the map reports free in the simulator first (note that this changes the
+        # distribution of chosen positions). Without the map, candidates are checked in sampling order
+        if spawn_map is not None:
+            may_collide = robot_spawn_map_collisions(spawn_map, candidates)
+            check_order = np.concatenate(
+                [np.where(~may_collide)[0], np.where(may_collide)[0]]
             )
+        else:
+            check_order = np.arange(num_attempts)
+
+        for attempt_position in check_order:
+            robot_pos = candidates[attempt_position]
             set_robot_to_position(env, robot_pos)
             env.sim.forward()
+            stats["num_sim_checks"] += 1
             if not detect_robot_collision(env):
                 found_valid = True
                 break
 
             env.sim.set_state(initial_state_copy)
 
-        # print(time.time() - t1, attempt_position)
+        # consume random numbers as if candidates were sampled one at a time up to the chosen one
+        num_used = attempt_position + 1 if found_valid else num_attempts
+        env.rng.bit_generator.state = rng_state
+        env.rng.random((num_used, 2))
+        stats["num_candidates"] += num_used
 
         # if valid position not found, increase range by 10 cm for x and 5 cm for y
         cur_dev_pos_x += 0.10
         cur_dev_pos_y += 0.05
 
+    env.robot_spawn_stats = stats
     return robot_pos
 
 
@@ -77,7 +77,7 @@ def run_random_rollouts(env, num_rollouts, num_steps, video_path=None):
                 )[::-1]
                 video_writer.append_data(video_img)
 
-            if env._check_success():
+            if env.check_success():
                 num_success_rollouts += 1
                 break
 
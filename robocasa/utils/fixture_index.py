@@ -0,0 +1,201 @@
+"""
+Per-scene index of the fixtures of a kitchen.
+
+Kitchen.get_fixture and several object_utils helpers look up fixtures by type, by name or by location, and are
+called many times while a task sets up its references (possibly across several model loading attempts). Instead
+of scanning all fixtures on every call, the index memoizes type, class and name queries (and counter size
+checks), and keeps the exterior bounding boxes of all fixtures in arrays, bucketed in a 2D grid over their
+footprints.
+
+The index assumes that fixtures do not move once it is built. Kitchen rebuilds it whenever the fixtures of the
+scene are created or placed.
+"""
+
+from collections import defaultdict
+
+import numpy as np
+
+from robocasa.models.fixtures.fixture_utils import fixture_is_type, is_fxtr_valid
+
+# side length of the cells of the spatial grid, in meters
+FIXTURE_INDEX_GRID_SIZE = 0.5
+
+
+class FixtureIndex:
+    """
+    Index of the fixtures of a kitchen scene
+
+    Args:
+        env (Kitchen): environment whose fixtures are indexed
+
+        grid_size (float): side length of the cells of the spatial grid
+    """
+
+    def __init__(self, env, grid_size=FIXTURE_INDEX_GRID_SIZE):
+        self.env = env
+        self.fixtures = env.fixtures
+        self.names = list(self.fixtures.keys())
+        self.grid_size = grid_size
+
+        self._type_cache = dict()
+        self._name_cache = dict()
+        self._class_cache = dict()
+        self._valid_cache = dict()
+        self._dynamic_fixtures = None
+
+        # spatial data is built on first use
+        self._spatial_names = None
+
+    def get_names_of_type(self, fixture_type):
+        """
+        Returns:
+            list: names of all fixtures of type @fixture_type, in scene order
+        """
+        names = self._type_cache.get(fixture_type)
+        if names is None:
+            names = [
+                name
+                for (name, fxtr) in self.fixtures.items()
+                if fixture_is_type(fxtr, fixture_type)
+            ]
+            self._type_cache[fixture_type] = names
+        return names
+
+    def get_names_containing(self, substr):
+        """
+        Returns:
+            list: names of all fixtures whose name contains @substr, in scene order
+        """
+        names = self._name_cache.get(substr)
+        if names is None:
+            names = [name for name in self.names if substr in name]
+            self._name_cache[substr] = names
+        return names
+
+    def get_fixtures_of_class(self, classes):
+        """
+        Args:
+            classes (type or tuple): fixture class(es), as accepted by isinstance
+
+        Returns:
+            list: all fixtures that are instances of @classes, in scene order
+        """
+        fxtrs = self._class_cache.get(classes)
+        if fxtrs is None:
+            fxtrs = [
+                fxtr for fxtr in self.fixtures.values() if isinstance(fxtr, classes)
+            ]
+            self._class_cache[classes] = fxtrs
+        return fxtrs
+
+    def get_dynamic_fixtures(self):
+        """
+        Returns:
+            list: all fixtures with dynamic state (see Fixture.has_dynamic_state), in scene order
+        """
+        if self._dynamic_fixtures is None:
+            self._dynamic_fixtures = [
+                fxtr
+                for fxtr in self.fixtures.values()
+                if getattr(fxtr, "has_dynamic_state", False)
+            ]
+        return self._dynamic_fixtures
+
+    def is_valid_counter(self, name, size):
+        """
+        Memoized version of FixtureUtils.is_fxtr_valid
+
+        Returns:
+            bool: True if the fixture has a reset region of at least @size
+        """
+        key = (name, tuple(size))
+        valid = self._valid_cache.get(key)
+        if valid is None:
+            valid = is_fxtr_valid(self.env, self.fixtures[name], size)
+            self._valid_cache[key] = valid
+        return valid
+
+    def _build_spatial_index(self):
+        """
+        Collects the exterior bounding boxes of all fixtures and buckets their footprints into a 2D grid
+        """
+        self._spatial_names = [
+            name
+            for (name, fxtr) in self.fixtures.items()
+            if hasattr(fxtr, "get_ext_sites")
+        ]
+        self._spatial_inds = {
+            id(self.fixtures[name]): i for (i, name) in enumerate(self._spatial_names)
+        }
+        if len(self._spatial_names) == 0:
+            self._ext_points = np.zeros((0, 8, 3))
+            self._grid = dict()
+            return
+
+        self._ext_points = np.array(
+            [
+                self.fixtures[name].get_ext_sites(all_points=True, relative=False)
+                for name in self._spatial_names
+            ]
+        )
+        # exterior bounding box axes (p0, px, py), as used by OU.point_in_fixture
+        p0 = self._ext_points[:, 0]
+        self._axes = np.stack(
+            [self._ext_points[:, 1] - p0, self._ext_points[:, 2] - p0], axis=1
+        )
+        self._axis_bounds = np.stack(
+            [
+                np.einsum("nad,nd->na", self._axes, p0),
+                np.einsum("nad,nad->na", self._axes, self._ext_points[:, 1:3]),
+            ],
+            axis=-1,
+        )
+
+        self._grid = defaultdict(list)
+        cell_min = np.floor(self._ext_points[:, :, :2].min(axis=1) / self.grid_size)
+        cell_max = np.floor(self._ext_points[:, :, :2].max(axis=1) / self.grid_size)
+        for (i, (lo, hi)) in enumerate(zip(cell_min.astype(int), cell_max.astype(int))):
+            for cx in range(lo[0], hi[0] + 1):
+                for cy in range(lo[1], hi[1] + 1):
+                    self._grid[(cx, cy)].append(i)
+
+    def get_names_at_point(self, point):
+        """
+        Finds the fixtures whose exterior bounding box contains @point in 2D. Equivalent to checking
+        OU.point_in_fixture(point, fxtr, only_2d=True) for every fixture
+
+        Returns:
+            list: names of the fixtures containing @point, in scene order
+        """
+        if self._spatial_names is None:
+            self._build_spatial_index()
+        cell = tuple(np.floor(np.array(point[:2]) / self.grid_size).astype(int))
+        inds = self._grid.get(cell)
+        if not inds:
+            return []
+        inds = np.array(inds)
+        projs = np.einsum("nad,d->na", self._axes[inds], np.array(point))
+        bounds = self._axis_bounds[inds]
+        inside = np.all((bounds[..., 0] <= projs) & (projs <= bounds[..., 1]), axis=1)
+        return [self._spatial_names[i] for i in inds[inside]]
+
+    def get_fixtures_at_point(self, point):
+        """
+        Returns:
+            list: fixtures whose exterior bounding box contains @point in 2D, in scene order
+        """
+        return [self.fixtures[name] for name in self.get_names_at_point(point)]
+
+    def get_pairwise_dists(self, ref_fixture, fxtrs):
+        """
+        Vectorized version of OU.fixture_pairwise_dist, between @ref_fixture and each fixture in @fxtrs
+
+        Returns:
+            np.array: minimum distance between the exterior bounding box points of @ref_fixture and each fixture
+        """
+        if self._spatial_names is None:
+            self._build_spatial_index()
+        ref_points = ref_fixture.get_ext_sites(all_points=True, relative=False)
+        points = self._ext_points[[self._spatial_inds[id(fxtr)] for fxtr in fxtrs]]
+        diffs = points[:, :, None] - np.asarray(ref_points)[None, None]
+        return np.linalg.norm(diffs, axis=-1).min(axis=(1, 2))
@@ -28,11 +28,12 @@ See `scripts/load_dataset.py` for examples on how to use these datasets.
 
 import hashlib
 import json
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from pathlib import Path
 from typing import Sequence
 import os
 import random
+import shutil
 
 import numpy as np
 import pandas as pd
@@ -41,7 +42,11 @@ from torch.utils.data import Dataset
 from tqdm import tqdm
 
 # from gr00t.utils.video import get_all_frames, get_frames_by_timestamps
-from .groot_video_utils import get_all_frames, get_frames_by_timestamps
+from .groot_video_utils import (
+    VideoFrameReader,
+    get_all_frames,
+    get_frames_by_timestamps,
+)
 
 from .embodiment_tags import EmbodimentTag
 from .schema import (
@@ -51,6 +56,7 @@ from .schema import (
     LeRobotStateActionMetadata,
 )
 from .groot_transform import ComposedModalityTransform
+from robocasa.utils.cache_utils import get_cache_path
 
 LE_ROBOT_MODALITY_FILENAME = "meta/modality.json"
 LE_ROBOT_EPISODE_FILENAME = "meta/episodes.jsonl"
@@ -58,6 +64,7 @@ LE_ROBOT_TASKS_FILENAME = "meta/tasks.jsonl"
 LE_ROBOT_INFO_FILENAME = "meta/info.json"
 LE_ROBOT_STATS_FILENAME = "meta/stats.json"
 LE_ROBOT_DATA_FILENAME = "data/*/*.parquet"
+LOWDIM_STORE_DIRNAME = "lowdim_store"
 
 
 def calculate_dataset_statistics(parquet_paths: list[Path]) -> dict:
@@ -158,6 +165,9 @@ class LeRobotSingleDataset(Dataset):
         transforms: ComposedModalityTransform | None = None,
         filter_key: str | None = None,
         filter_key_seed: int | None = 0,
+        trajectory_cache_size: int = 8,
+        video_reader_cache_size: int = 16,
+        use_lowdim_store: bool = False,
     ):
         """
         Initialize the dataset.
@@ -170,6 +180,11 @@ class LeRobotSingleDataset(Dataset):
             video_backend_kwargs (dict): Keyword arguments for the video backend when initializing the video reader.
             transforms (ComposedModalityTransform): The transforms to apply to the dataset.
             embodiment_tag (EmbodimentTag): Overload the embodiment tag for the dataset. e.g. define it as "new_embodiment"
+            trajectory_cache_size (int): The number of decoded trajectory tables to keep in memory (per DataLoader worker).
+            video_reader_cache_size (int): The number of video readers to keep open (per DataLoader worker).
+                Only used for the "decord" and "opencv" backends.
+            use_lowdim_store (bool): If True, the low-dim columns (state, action, timestamps and annotations) of all trajectories
+                are stored once in memory-mapped arrays, so that sampling steps does not decode parquet files.
         """
         assert (
             video_backend != "decord"
@@ -201,6 +216,9 @@ class LeRobotSingleDataset(Dataset):
         )
         self._metadata = self._get_metadata(EmbodimentTag(self.tag))
         self._trajectory_ids, self._trajectory_lengths = self._get_trajectories()
+        self._trajectory_indices = {
+            trajectory_id: i for i, trajectory_id in enumerate(self._trajectory_ids)
+        }
         self._all_steps = self._get_all_steps()
         self._modality_keys = self._get_modality_keys()
         self._delta_indices = self._get_delta_indices()
@@ -219,6 +237,19 @@ class LeRobotSingleDataset(Dataset):
         self.curr_traj_data = None
         self.curr_traj_id = None
 
+        # Per-worker caches. These are not pickled, so each DataLoader worker starts with empty caches.
+        self.trajectory_cache_size = trajectory_cache_size
+        self.video_reader_cache_size = video_reader_cache_size
+        self._traj_data_cache: OrderedDict[int, pd.DataFrame] = OrderedDict()
+        self._video_reader_cache: OrderedDict[str, VideoFrameReader] = OrderedDict()
+
+        # Memory-mapped low-dim columns of all trajectories, see `_build_lowdim_store`
+        self.use_lowdim_store = use_lowdim_store
+        self._lowdim_store_path = None
+        self._lowdim_store = None
+        if use_lowdim_store:
+            self._lowdim_store_path = self._build_lowdim_store()
+
         # Check if the dataset is valid
         self._check_integrity()
 
@@ -541,6 +572,102 @@ class LeRobotSingleDataset(Dataset):
                         + f"Unable to find key {key} in modality metadata:\n{e}"
                     )
 
+    def _get_lowdim_columns(self) -> list[str]:
+        """Get the parquet columns needed to sample steps: the state and action columns, the timestamps
+        (to find video frames) and the annotation columns."""
+        columns = ["timestamp"]
+        for modality in ["state", "action"]:
+            le_cfg = getattr(self.lerobot_modality_meta, modality)
+            for key in self.modality_keys.get(modality, []):
+                subkey = key.replace(modality + ".", "")
+                le_key = le_cfg[subkey].original_key
+                columns.append(le_key if le_key is not None else subkey)
+        for key in self.modality_keys.get("language", []):
+            subkey = key.replace("annotation.", "")
+            original_key = self.lerobot_modality_meta.annotation[subkey].original_key
+            columns.append(original_key if original_key is not None else key)
+        return list(dict.fromkeys(columns))
+
+    def _build_lowdim_store(self) -> Path:
+        """Build the low-dim store of the dataset, if it does not exist yet.
+
+        The store holds one .npy file per low-dim column, with the rows of all trajectories concatenated,
+        along with the start offset of each trajectory. It is identified by a hash of the trajectories, the
+        modification time and size of their parquet files (so that the store is rebuilt when they change) and
+        the columns, and is written to the user cache directory.
+
+        Returns:
+            Path: The directory of the store.
+        """
+        columns = self._get_lowdim_columns()
+        parquet_signatures = []
+        for trajectory_id in self.trajectory_ids:
+            stat = os.stat(self.get_trajectory_path(trajectory_id))
+            parquet_signatures.append((stat.st_mtime_ns, stat.st_size))
+        store_hash = safe_hash(
+            (
+                self.dataset_path.resolve().as_posix(),
+                tuple(int(i) for i in self.trajectory_ids),
+                tuple(parquet_signatures),
+                tuple(columns),
+            )
+        )
+        store_name = f"{store_hash:032x}"
+        store_path = Path(get_cache_path(LOWDIM_STORE_DIRNAME, store_name))
+        if store_path.exists():
+            return store_path
+
+        data: dict[str, list[np.ndarray]] = {column: [] for column in columns}
+        lengths = []
+        for trajectory_id in tqdm(
+            self.trajectory_ids, desc=f"Building low-dim store for {self.dataset_name}"
+        ):
+            traj_data = pd.read_parquet(
+                self.get_trajectory_path(trajectory_id), columns=columns
+            )
+            lengths.append(len(traj_data))
+            for column in columns:
+                data[column].append(np.stack(traj_data[column]))  # type: ignore
+
+        # write to a temporary directory first so that concurrent readers never see partial stores
+        tmp_path = store_path.parent / f"{store_name}.{os.getpid()}.tmp"
+        tmp_path.mkdir(parents=True, exist_ok=True)
+        for i, column in enumerate(columns):
+            np.save(tmp_path / f"{i}.npy", np.concatenate(data[column], axis=0))
+        np.save(tmp_path / "offsets.npy", np.cumsum([0] + lengths))
+        with open(tmp_path / "columns.json", "w") as f:
+            json.dump(columns, f)
+        try:
+            os.replace(tmp_path, store_path)
+        except OSError:
+            # another process built the same store in the meantime
+            shutil.rmtree(tmp_path, ignore_errors=True)
+        return store_path
+
+    def _get_lowdim_store(self) -> dict:
+        """Get the low-dim store, opening it (memory-mapped) on first use in this process."""
+        if self._lowdim_store is None:
+            with open(self._lowdim_store_path / "columns.json", "r") as f:
+                columns = json.load(f)
+            self._lowdim_store = dict(
+                offsets=np.load(self._lowdim_store_path / "offsets.npy"),
+                columns={
+                    column: np.load(self._lowdim_store_path / f"{i}.npy", mmap_mode="r")
+                    for i, column in enumerate(columns)
+                },
+            )
+        return self._lowdim_store
+
+    def __getstate__(self) -> dict:
+        # Do not pickle caches, open video readers or memory maps (e.g. when spawning DataLoader workers)
+        state = self.__dict__.copy()
+        state["curr_traj_data"] = None
+        state["curr_traj_id"] = None
+        state["_traj_data_cache"] = OrderedDict()
+        state["_video_reader_cache"] = OrderedDict()
+        state["_lowdim_store"] = None
+        return state
+
     def set_transforms_metadata(self, metadata: DatasetMetadata):
         """Set the metadata for the transforms. This is useful for transforms that need to know the metadata, such as the normalization values."""
         self.transforms.set_metadata(metadata)
@@ -605,7 +732,8 @@ class LeRobotSingleDataset(Dataset):
         """
         data = {}
         # Get the data for all modalities
-        self.curr_traj_data = self.get_trajectory_data(trajectory_id)
+        if not self.use_lowdim_store:
+            self.curr_traj_data = self.get_trajectory_data(trajectory_id)
         for modality in self.modality_keys:
             # Get the data corresponding to each key in the modality
             for key in self.modality_keys[modality]:
@@ -614,17 +742,47 @@ class LeRobotSingleDataset(Dataset):
                 )
         return data
 
+    def get_trajectory_path(self, trajectory_id: int) -> Path:
+        """Get the path to the parquet file of a trajectory."""
+        chunk_index = self.get_episode_chunk(trajectory_id)
+        parquet_path = self.dataset_path / self.data_path_pattern.format(
+            episode_chunk=chunk_index, episode_index=trajectory_id
+        )
+        assert parquet_path.exists(), f"Parquet file not found at {parquet_path}"
+        return parquet_path
+
     def get_trajectory_data(self, trajectory_id: int) -> pd.DataFrame:
-        """Get the data for a trajectory."""
+        """Get the data for a trajectory. The most recently used trajectories are kept in an LRU cache."""
         if self.curr_traj_id == trajectory_id and self.curr_traj_data is not None:
             return self.curr_traj_data
+        traj_data = self._traj_data_cache.get(trajectory_id)
+        if traj_data is None:
+            traj_data = pd.read_parquet(self.get_trajectory_path(trajectory_id))
+            if self.trajectory_cache_size > 0:
+                self._traj_data_cache[trajectory_id] = traj_data
+                if len(self._traj_data_cache) > self.trajectory_cache_size:
+                    self._traj_data_cache.popitem(last=False)
         else:
-            chunk_index = self.get_episode_chunk(trajectory_id)
-            parquet_path = self.dataset_path / self.data_path_pattern.format(
-                episode_chunk=chunk_index, episode_index=trajectory_id
-            )
-            assert parquet_path.exists(), f"Parquet file not found at {parquet_path}"
-            return pd.read_parquet(parquet_path)
+            self._traj_data_cache.move_to_end(trajectory_id)
+        # set together, so that the shortcut above always returns the data of the requested trajectory
+        self.curr_traj_id = trajectory_id
+        self.curr_traj_data = traj_data
+        return traj_data
+
+    def get_trajectory_column(self, trajectory_id: int, column: str) -> np.ndarray:
+        """Get a column of the data of a trajectory as an array of shape (T, ...).
+        Read from the low-dim store if it is used, and from the current trajectory data otherwise."""
+        if self.use_lowdim_store:
+            store = self._get_lowdim_store()
+            assert column in store["columns"], f"No {column} found in low-dim store"
+            trajectory_index = self.get_trajectory_index(trajectory_id)
+            start, end = store["offsets"][trajectory_index : trajectory_index + 2]
+            return store["columns"][column][start:end]
+        assert self.curr_traj_data is not None, f"No data found for {trajectory_id=}"
+        assert (
+            column in self.curr_traj_data.columns
+        ), f"No {column} found in {trajectory_id=}"
+        return np.stack(self.curr_traj_data[column])  # type: ignore
 
     def get_trajectory_index(self, trajectory_id: int) -> int:
         """Get the index of the trajectory in the dataset by the trajectory ID.
@@ -636,12 +794,10 @@ class LeRobotSingleDataset(Dataset):
         Returns:
             int: The index of the trajectory in the dataset.
         """
-        trajectory_indices = np.where(self.trajectory_ids == trajectory_id)[0]
-        if len(trajectory_indices) != 1:
-            raise ValueError(
-                f"Error finding trajectory index for {trajectory_id}, found {trajectory_indices=}"
-            )
-        return trajectory_indices[0]
+        trajectory_index = self._trajectory_indices.get(trajectory_id)
+        if trajectory_index is None:
+            raise ValueError(f"Error finding trajectory index for {trajectory_id}")
+        return trajectory_index
 
     def get_episode_chunk(self, ep_index: int) -> int:
         """Get the chunk index for an episode index."""
@@ -741,14 +897,16 @@ class LeRobotSingleDataset(Dataset):
         key = key.replace("video.", "")
         video_path = self.get_video_path(trajectory_id, key)
         # Get the action/state timestamps for each frame in the video
-        assert self.curr_traj_data is not None, f"No data found for {trajectory_id=}"
-        assert (
-            "timestamp" in self.curr_traj_data.columns
-        ), f"No timestamp found in {trajectory_id=}"
-        timestamp: np.ndarray = self.curr_traj_data["timestamp"].to_numpy()
+        timestamp = self.get_trajectory_column(trajectory_id, "timestamp")
         # Get the corresponding video timestamps from the step indices
         video_timestamp = timestamp[step_indices]
 
+        if (
+            self.video_reader_cache_size > 0
+            and self.video_backend in VideoFrameReader.SUPPORTED_BACKENDS
+        ):
+            reader = self.get_video_reader(video_path.as_posix())
+            return reader.get_frames_by_timestamps(video_timestamp)
         return get_frames_by_timestamps(
             video_path.as_posix(),
             video_timestamp,
@@ -756,6 +914,23 @@ class LeRobotSingleDataset(Dataset):
             video_backend_kwargs=self.video_backend_kwargs,
         )
 
+    def get_video_reader(self, video_path: str) -> VideoFrameReader:
+        """Get an open reader for a video. The most recently used readers are kept open in an LRU cache."""
+        reader = self._video_reader_cache.get(video_path)
+        if reader is None:
+            reader = VideoFrameReader(
+                video_path,
+                video_backend=self.video_backend,
+                video_backend_kwargs=self.video_backend_kwargs,
+            )
+            self._video_reader_cache[video_path] = reader
+            if len(self._video_reader_cache) > self.video_reader_cache_size:
+                _, evicted_reader = self._video_reader_cache.popitem(last=False)
+                evicted_reader.close()
+        else:
+            self._video_reader_cache.move_to_end(video_path)
+        return reader
+
     def get_state_or_action(
         self,
         trajectory_id: int,
@@ -795,11 +970,7 @@ class LeRobotSingleDataset(Dataset):
         if le_key is None:
             le_key = key
         # Get the data array, shape: (T, D)
-        assert self.curr_traj_data is not None, f"No data found for {trajectory_id=}"
-        assert (
-            le_key in self.curr_traj_data.columns
-        ), f"No {le_key} found in {trajectory_id=}"
-        data_array: np.ndarray = np.stack(self.curr_traj_data[le_key])  # type: ignore
+        data_array = self.get_trajectory_column(trajectory_id, le_key)
         assert data_array.ndim == 2, f"Expected 2D array, got {data_array.shape} array"
         le_indices = np.arange(
             le_state_or_action_cfg[key].start,
@@ -834,7 +1005,6 @@ class LeRobotSingleDataset(Dataset):
         Returns:
             list[str]: The annotation data for the trajectory and step indices. If no matching data is found, return empty strings.
         """
-        assert self.curr_traj_data is not None, f"No data found for {trajectory_id=}"
         # Get the step indices
         step_indices = self.delta_indices[key] + base_index
         # Get the trajectory index
@@ -859,10 +1029,9 @@ class LeRobotSingleDataset(Dataset):
         original_key = subkey_meta.original_key
         if original_key is None:
             original_key = key
+        annotation = self.get_trajectory_column(trajectory_id, original_key)
         for i in range(len(step_indices)):
-            task_indices.append(
-                self.curr_traj_data[original_key][step_indices[i]].item()
-            )
+            task_indices.append(annotation[step_indices[i]].item())
         return self.tasks.loc[task_indices]["task"].tolist()
 
     def get_data_by_modality(
@@ -973,7 +1142,8 @@ class CachedLeRobotSingleDataset(LeRobotSingleDataset):
             dict: The data for the step.
         """
         data = {}
-        self.curr_traj_data = self.get_trajectory_data(trajectory_id)
+        if not self.use_lowdim_store:
+            self.curr_traj_data = self.get_trajectory_data(trajectory_id)
         # Get the data for all modalities
         for modality in self.modality_keys:
             # Get the data corresponding to each key in the modality
@@ -50,6 +50,83 @@ def get_frames_by_indices(
         raise NotImplementedError
 
 
+class VideoFrameReader:
+    """Reader that keeps a video open, so that frames can be retrieved repeatedly without reopening
+    the video and recomputing its frame timestamps every time.
+    Args:
+        video_path (str): Path to the video file.
+        video_backend (str, optional): Video backend to use, one of SUPPORTED_BACKENDS. Defaults to "decord".
+        video_backend_kwargs (dict, optional): Keyword arguments for the video backend.
+    """
+
+    SUPPORTED_BACKENDS = ("decord", "opencv")
+
+    def __init__(
+        self,
+        video_path: str,
+        video_backend: str = "decord",
+        video_backend_kwargs: dict = {},
+    ):
+        self.video_path = video_path
+        self.video_backend = video_backend
+        if video_backend == "decord":
+            self._vr = decord.VideoReader(video_path, **video_backend_kwargs)
+            num_frames = len(self._vr)
+            # Retrieve the timestamps for each frame in the video
+            # Only take the first element of the frame_ts array which corresponds to start_seconds
+            self.frame_ts = self._vr.get_frame_timestamp(range(num_frames))[:, :1]
+        elif video_backend == "opencv":
+            # Open the video file
+            self._cap = cv2.VideoCapture(video_path, **video_backend_kwargs)
+            if not self._cap.isOpened():
+                raise ValueError(f"Unable to open video file: {video_path}")
+            # Retrieve the total number of frames
+            num_frames = int(self._cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            # Calculate timestamps for each frame
+            fps = self._cap.get(cv2.CAP_PROP_FPS)
+            # Reshape to (num_frames, 1) for broadcasting
+            self.frame_ts = (np.arange(num_frames) / fps)[:, np.newaxis]
+            # Index of the frame that the next read returns, to avoid seeking for consecutive frames
+            self._next_index = 0
+        else:
+            raise NotImplementedError(
+                f"Video backend {video_backend} not supported by VideoFrameReader"
+            )
+
+    def get_frames_by_timestamps(
+        self, timestamps: list[float] | np.ndarray
+    ) -> np.ndarray:
+        """Get frames at specified timestamps.
+        Args:
+            timestamps (list[int] | np.ndarray): Timestamps to retrieve frames for, in seconds.
+        Returns:
+            np.ndarray: Frames at the specified timestamps.
+        """
+        # Map each requested timestamp to the closest frame index
+        indices = np.abs(self.frame_ts - timestamps).argmin(axis=0)
+        if self.video_backend == "decord":
+            return self._vr.get_batch(indices).asnumpy()
+
+        frames = []
+        for idx in indices:
+            if idx != self._next_index:
+                self._cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
+            ret, frame = self._cap.read()
+            if not ret:
+                raise ValueError(f"Unable to read frame at index {idx}")
+            self._next_index = idx + 1
+            frames.append(frame)
+        frames = np.array(frames)
+        frames = np.flip(frames, axis=-1)
+        return frames
+
+    def close(self):
+        if self.video_backend == "opencv":
+            self._cap.release()
+        else:
+            self._vr = None
+
+
 def get_frames_by_timestamps(
     video_path: str,
     timestamps: list[float] | np.ndarray,
@@ -64,41 +141,14 @@ def get_frames_by_timestamps(
     Returns:
         np.ndarray: Frames at the specified timestamps.
     """
-    if video_backend == "decord":
-        vr = decord.VideoReader(video_path, **video_backend_kwargs)
-        num_frames = len(vr)
-        # Retrieve the timestamps for each frame in the video
-        frame_ts: np.ndarray = vr.get_frame_timestamp(range(num_frames))
-        # Map each requested timestamp to the closest frame index
-        # Only take the first element of the frame_ts array which corresponds to start_seconds
-        indices = np.abs(frame_ts[:, :1] - timestamps).argmin(axis=0)
-        frames = vr.get_batch(indices)
-        return frames.asnumpy()
-    elif video_backend == "opencv":
-        # Open the video file
-        cap = cv2.VideoCapture(video_path, **video_backend_kwargs)
-        if not cap.isOpened():
-            raise ValueError(f"Unable to open video file: {video_path}")
-        # Retrieve the total number of frames
-        num_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        # Calculate timestamps for each frame
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        frame_ts = np.arange(num_frames) / fps
-        frame_ts = frame_ts[
-            :, np.newaxis
-        ]  # Reshape to (num_frames, 1) for broadcasting
-        # Map each requested timestamp to the closest frame index
-        indices = np.abs(frame_ts - timestamps).argmin(axis=0)
-        frames = []
-        for idx in indices:
-            cap.set(cv2.CAP_PROP_POS_FRAMES, idx)
-            ret, frame = cap.read()
-            if not ret:
-                raise ValueError(f"Unable to read frame at index {idx}")
-            frames.append(frame)
-        cap.release()
-        frames = np.array(frames)
-        frames = np.flip(frames, axis=-1)
+    if video_backend in VideoFrameReader.SUPPORTED_BACKENDS:
+        reader = VideoFrameReader(
+            video_path,
+            video_backend=video_backend,
+            video_backend_kwargs=video_backend_kwargs,
+        )
+        frames = reader.get_frames_by_timestamps(timestamps)
+        reader.close()
         return frames
     elif video_backend == "torchvision_av":
         # set backend
@@ -10,8 +10,10 @@ from robocasa.utils.robomimic.robomimic_dataset_utils import (
     get_env_metadata_from_dataset,
 )
 import xml.etree.ElementTree as ET
+import robocasa.utils.model_store as ModelStore
 
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
+import av
 import numpy as np
 from pathlib import Path
 import json
@@ -60,6 +62,51 @@ class LerobotDatasetWrapper(LeRobotDataset):
             )  # ensure video info always written properly
 
 
+class StreamingVideoWriter:
+    """
+    Encodes a video from frames written one at a time. Uses the same encoder (PyAV) and encoding parameters as
+    LerobotDatasetWrapper.encode_episode_videos, but frames are encoded as they are written instead of being
+    saved to image files first.
+
+    Args:
+        video_path (Path): path of the output video
+
+        width (int): frame width
+
+        height (int): frame height
+
+        fps (int): frames per second
+    """
+
+    def __init__(self, video_path: Path, width: int, height: int, fps: int):
+        self.video_path = Path(video_path)
+        self.video_path.parent.mkdir(parents=True, exist_ok=True)
+        self.num_frames = 0
+        self._output = av.open(str(self.video_path), "w")
+        self._stream = self._output.add_stream("h264", fps, options={"crf": "23"})
+        self._stream.pix_fmt = "yuv420p"
+        self._stream.width = width
+        self._stream.height = height
+
+    def write(self, frame: np.ndarray) -> None:
+        """
+        Args:
+            frame (np.ndarray): (height, width, 3) uint8 RGB frame
+        """
+        video_frame = av.VideoFrame.from_ndarray(
+            np.ascontiguousarray(frame, dtype=np.uint8), format="rgb24"
+        )
+        self._output.mux(self._stream.encode(video_frame))
+        self.num_frames += 1
+
+    def close(self) -> None:
+        """
+        Flushes the encoder and finishes writing the video
+        """
+        self._output.mux(self._stream.encode())
+        self._output.close()
+
+
 # Define the ordering for lerobot datasets
 ACTION_KEY_ORDERING_HDF5 = {
     "end_effector_position": (0, 3),
@@ -204,7 +251,7 @@ def save_extra_demo_info(dataset_dir: Path, hdf5_dataset, demo, demo_index):
     extras_dir = dataset_dir / "extras"
     states = hdf5_dataset[demo]["states"][:]
     ep_meta = json.loads(hdf5_dataset[demo].attrs["ep_meta"])
-    model_file = hdf5_dataset[demo].attrs["model_file"]
+    model_file = ModelStore.read_model_xml(hdf5_dataset[demo])
 
     # Load XML from string
     root = ET.fromstring(model_file)
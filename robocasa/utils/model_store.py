@@ -0,0 +1,115 @@
+"""
+Content-addressed storage of model xmls in demo hdf5 files.
+
+Every demo needs the MuJoCo model xml of its scene to be played back. Storing the full xml as a "model_file"
+attribute on every demo group inflates files (demos from the same layout and style repeat near-identical xmls)
+and makes attribute reads slow. Instead, each distinct xml is stored once, zlib-compressed, in the "model_store"
+group at the root of the file, keyed by the sha256 of the xml. Demo groups only hold the key, in their
+"model_hash" attribute.
+
+Readers should go through read_model_xml, which also supports files written with the "model_file" attribute.
+"""
+
+import hashlib
+import zlib
+from collections import OrderedDict
+
+import numpy as np
+
+import robocasa.macros as macros
+
+MODEL_STORE_GROUP = "model_store"
+MODEL_HASH_ATTR = "model_hash"
+# attribute holding the full xml, as written by older versions
+MODEL_FILE_ATTR = "model_file"
+
+# number of decompressed xmls kept in memory, keyed by hash
+MODEL_XML_CACHE_SIZE = 8
+_MODEL_XML_CACHE = OrderedDict()
+
+
+def get_model_hash(xml_str):
+    """
+    Returns:
+        str: key of @xml_str in the model store
+    """
+    return hashlib.sha256(xml_str.encode("utf-8")).hexdigest()
+
+
+def has_model_xml(ep_grp):
+    """
+    Returns:
+        bool: True if the demo group @ep_grp references a model xml (through either storage format)
+    """
+    return MODEL_HASH_ATTR in ep_grp.attrs or MODEL_FILE_ATTR in ep_grp.attrs
+
+
+def write_model_xml(ep_grp, xml_str):
+    """
+    Stores the model xml of a demo. The xml is added to the model store of the file containing @ep_grp,
+    unless macros.HDF5_MODEL_STORE is False, in which case it is stored as a model_file attribute
+
+    Args:
+        ep_grp (h5py.Group): demo group
+
+        xml_str (str): model xml
+    """
+    if not macros.HDF5_MODEL_STORE:
+        ep_grp.attrs[MODEL_FILE_ATTR] = xml_str
+        return
+
+    model_hash = get_model_hash(xml_str)
+    store = ep_grp.file.require_group(MODEL_STORE_GROUP)
+    if model_hash not in store:
+        blob = zlib.compress(xml_str.encode("utf-8"))
+        store.create_dataset(model_hash, data=np.frombuffer(blob, dtype=np.uint8))
+    ep_grp.attrs[MODEL_HASH_ATTR] = model_hash
+
+
+def read_model_xml(ep_grp):
+    """
+    Reads the model xml of a demo, written either to the model store or as a model_file attribute
+
+    Args:
+        ep_grp (h5py.Group): demo group
+
+    Returns:
+        str: model xml
+    """
+    if MODEL_HASH_ATTR not in ep_grp.attrs:
+        return ep_grp.attrs[MODEL_FILE_ATTR]
+
+    model_hash = ep_grp.attrs[MODEL_HASH_ATTR]
+    xml_str = _MODEL_XML_CACHE.get(model_hash)
+    if xml_str is None:
+        blob = ep_grp.file[MODEL_STORE_GROUP][model_hash][()]
+        xml_str = zlib.decompress(blob.tobytes()).decode("utf-8")
+        _MODEL_XML_CACHE[model_hash] = xml_str
+        if len(_MODEL_XML_CACHE) > MODEL_XML_CACHE_SIZE:
+            _MODEL_XML_CACHE.popitem(last=False)
+    else:
+        _MODEL_XML_CACHE.move_to_end(model_hash)
+    return xml_str
+
+
+def copy_model_xml(src_ep_grp, dst_ep_grp):
+    """
+    Copies the model xml of a demo to another demo group, possibly in a different file. Compressed entries
+    of the model store are copied as is
+
+    Args:
+        src_ep_grp (h5py.Group): source demo group
+
+        dst_ep_grp (h5py.Group): destination demo group
+    """
+    if MODEL_HASH_ATTR not in src_ep_grp.attrs or not macros.HDF5_MODEL_STORE:
+        write_model_xml(dst_ep_grp, read_model_xml(src_ep_grp))
+        return
+
+    model_hash = src_ep_grp.attrs[MODEL_HASH_ATTR]
+    dst_store = dst_ep_grp.file.require_group(MODEL_STORE_GROUP)
+    if model_hash not in dst_store:
+        src_ep_grp.file.copy(
+            src_ep_grp.file[MODEL_STORE_GROUP][model_hash], dst_store, name=model_hash
+        )
+    dst_ep_grp.attrs[MODEL_HASH_ATTR] = model_hash
@@ -11,9 +11,12 @@ from scipy.spatial.transform import Rotation as R
 import mujoco
 
 
-def obj_inside_of(env, obj_name, fixture_id, partial_check=False, th=0.05):
+def obj_inside_of(
+    env, obj_name, fixture_id, partial_check=False, th=0.05, region_names=None
+):
     """
-    whether an object (another mujoco object) is inside of fixture. applies for most fixtures
+    whether an object (another mujoco object) is inside of fixture. applies for most fixtures.
+    If region_names is set, only those interior regions of the fixture are checked
     """
     from robocasa.models.fixtures import Fixture
 
@@ -22,46 +25,90 @@ def obj_inside_of(env, obj_name, fixture_id, partial_check=False, th=0.05):
     assert isinstance(obj, MJCFObject)
     assert isinstance(fixture, Fixture)
 
-    # step 1: calculate fxiture points
-    fixtr_int_regions = fixture.get_int_sites(relative=False)
-    for (fixtr_p0, fixtr_px, fixtr_py, fixtr_pz) in fixtr_int_regions.values():
-        u = fixtr_px - fixtr_p0
-        v = fixtr_py - fixtr_p0
-        w = fixtr_pz - fixtr_p0
-
-        # get the position and quaternion of object
-        obj_pos = np.array(env.sim.data.body_xpos[env.obj_body_id[obj.name]])
-        obj_quat = T.convert_quat(
-            env.sim.data.body_xquat[env.obj_body_id[obj.name]], to="xyzw"
-        )
+    return bool(
+        objs_inside_of(
+            env,
+            [obj_name],
+            fixture,
+            partial_check=partial_check,
+            th=th,
+            region_names=region_names,
+        )[0]
+    )
 
-        if partial_check:
-            obj_points_to_check = [obj_pos]
-            th = 0.0
-        else:
-            # calculate 8 boundary points of object
-            obj_points_to_check = obj.get_bbox_points(trans=obj_pos, rot=obj_quat)
 
-        inside_of = True
-        for obj_p in obj_points_to_check:
-            check1 = (
-                np.dot(u, fixtr_p0) - th <= np.dot(u, obj_p) <= np.dot(u, fixtr_px) + th
-            )
-            check2 = (
-                np.dot(v, fixtr_p0) - th <= np.dot(v, obj_p) <= np.dot(v, fixtr_py) + th
-            )
-            check3 = (
-                np.dot(w, fixtr_p0) - th <= np.dot(w, obj_p) <= np.dot(w, fixtr_pz) + th
-            )
+def get_obj_poses(env, obj_names):
+    """
+    Get the world positions and orientations of a set of objects, read from the simulation in one pass
 
-            if not (check1 and check2 and check3):
-                inside_of = False
-                break
+    Args:
+        obj_names (list): names of the objects
 
-        if inside_of is True:
-            return True
+    Returns:
+        2-tuple:
+            - (np.array): (N, 3) array of positions
+            - (np.array): (N, 3, 3) array of rotation matrices
+    """
+    body_ids = [env.obj_body_id[name] for name in obj_names]
+    obj_pos = np.array(env.sim.data.body_xpos[body_ids])
+    obj_mat = np.array(env.sim.data.body_xmat[body_ids]).reshape(-1, 3, 3)
+    return obj_pos, obj_mat
 
-    return False
+
+def objs_inside_of(
+    env, obj_names, fixture_id, partial_check=False, th=0.05, region_names=None
+):
+    """
+    Batched version of obj_inside_of. Checks all objects against all interior regions of the fixture at once,
+    using the fixture's cached region bounds
+
+    Args:
+        obj_names (list): names of the objects
+
+        fixture_id (str or Fixture): fixture to check against
+
+        partial_check (bool): if True, only checks the object positions (with no threshold) instead of
+            all 8 bounding box points
+
+        th (float): tolerance of the check along each region axis
+
+        region_names (list): if set, only these interior regions of the fixture are checked
+
+    Returns:
+        np.array: (N,) boolean array, True if the object is inside of any (checked) interior region of the
+            fixture
+    """
+    fixture = env.get_fixture(fixture_id)
+    halfspaces = fixture.get_int_region_halfspaces()
+    axes, lo, hi = halfspaces["axes"], halfspaces["lo"], halfspaces["hi"]
+    if region_names is not None:
+        rows = [
+            i for (i, name) in enumerate(halfspaces["names"]) if name in region_names
+        ]
+        axes, lo, hi = axes[rows], lo[rows], hi[rows]
+    if len(obj_names) == 0 or len(axes) == 0:
+        return np.zeros(len(obj_names), dtype=bool)
+
+    obj_pos, obj_mat = get_obj_poses(env, obj_names)
+    if partial_check:
+        obj_points = obj_pos[:, None, :]
+        th = 0.0
+    else:
+        # 8 boundary points of each object
+        local_points = np.array(
+            [
+                env.objects[name].get_region_geometry("bbox")["corners"]
+                for name in obj_names
+            ]
+        )
+        obj_points = local_points @ obj_mat.transpose(0, 2, 1) + obj_pos[:, None, :]
+
+    # (N, R, P, 3) projections of every object point on the axes of every region
+    projs = obj_points[:, None] @ axes.transpose(0, 2, 1)
+    lo = lo[None, :, None, :] - th
+    hi = hi[None, :, None, :] + th
+    inside = np.all((lo <= projs) & (projs <= hi), axis=(2, 3))
+    return np.any(inside, axis=1)
 
 
 # used for cabinets, cabinet panels, counters, etc.
@@ -357,22 +404,25 @@ def check_fxtr_contact(env, pos):
         Floor,
     )
 
-    fxtrs = [
-        fxtr
-        for fxtr in env.fixtures.values()
-        if isinstance(fxtr, Counter)
-        or isinstance(fxtr, Stove)
-        or isinstance(fxtr, Stovetop)
-        or isinstance(fxtr, HousingCabinet)
-        or isinstance(fxtr, SingleCabinet)
-        or isinstance(fxtr, HingeCabinet)
-        or isinstance(fxtr, Fridge)
-        or (isinstance(fxtr, Wall) and not isinstance(fxtr, Floor))
-    ]
+    fxtr_index = env.fixture_index
+    fxtrs = fxtr_index.get_fixtures_of_class(
+        (
+            Counter,
+            Stove,
+            Stovetop,
+            HousingCabinet,
+            SingleCabinet,
+            HingeCabinet,
+            Fridge,
+            Wall,
+        )
+    )
+    contact_ids = set(id(fxtr) for fxtr in fxtr_index.get_fixtures_at_point(pos))
 
     for fxtr in fxtrs:
-        # get bounds of fixture
-        if point_in_fixture(point=pos, fixture=fxtr, only_2d=True):
+        if isinstance(fxtr, Floor):
+            continue
+        if id(fxtr) in contact_ids:
             return True
     return False
 
@@ -380,9 +430,8 @@ def check_fxtr_contact(env, pos):
 def point_outside_scene(env, pos):
     from robocasa.models.fixtures import Floor
 
-    walls = [fxtr for (name, fxtr) in env.fixtures.items() if isinstance(fxtr, Floor)]
     return not any(
-        [point_in_fixture(point=pos, fixture=wall, only_2d=True) for wall in walls]
+        isinstance(fxtr, Floor) for fxtr in env.fixture_index.get_fixtures_at_point(pos)
     )
 
 
@@ -577,6 +626,193 @@ def objs_intersect(
     return intersect
 
 
+def get_local_bbox_points(obj):
+    """
+    Get the 8 bounding box points of an object (MJCFObject or Fixture) in the object's own frame
+
+    Returns:
+        np.array: (8, 3) array of points. The first four points are p0, px, py, pz
+    """
+    from robocasa.models.fixtures import Fixture
+
+    if isinstance(obj, Fixture):
+        return obj.get_ext_sites(all_points=True, relative=True)
+    return np.asarray(obj.get_bbox_points())
+
+
+def quat2mat_batch(quats):
+    """
+    Batched version of T.quat2mat
+
+    Args:
+        quats (np.array): (N, 4) array of quaternions in (x,y,z,w) form
+
+    Returns:
+        np.array: (N, 3, 3) array of rotation matrices
+    """
+    q = np.asarray(quats, dtype=np.float64)[:, [3, 0, 1, 2]]
+    n = np.sum(q * q, axis=1)
+    valid = n >= np.finfo(float).eps * 4.0
+    q = q * np.sqrt(2.0 / np.where(valid, n, 1.0))[:, None]
+    q2 = q[:, :, None] * q[:, None, :]
+
+    mats = np.empty((len(q), 3, 3))
+    mats[:, 0, 0] = 1.0 - q2[:, 2, 2] - q2[:, 3, 3]
+    mats[:, 0, 1] = q2[:, 1, 2] - q2[:, 3, 0]
+    mats[:, 0, 2] = q2[:, 1, 3] + q2[:, 2, 0]
+    mats[:, 1, 0] = q2[:, 1, 2] + q2[:, 3, 0]
+    mats[:, 1, 1] = 1.0 - q2[:, 1, 1] - q2[:, 3, 3]
+    mats[:, 1, 2] = q2[:, 2, 3] - q2[:, 1, 0]
+    mats[:, 2, 0] = q2[:, 1, 3] - q2[:, 2, 0]
+    mats[:, 2, 1] = q2[:, 2, 3] + q2[:, 1, 0]
+    mats[:, 2, 2] = 1.0 - q2[:, 1, 1] - q2[:, 2, 2]
+    mats[~valid] = np.eye(3)
+    return mats
+
+
+def transform_points_batch(points, trans, quats):
+    """
+    Transform a set of local points by a batch of poses
+
+    Args:
+        points (np.array): (P, 3) array of points in the local frame
+
+        trans (np.array): (N, 3) array of positions
+
+        quats (np.array): (N, 4) array of quaternions in (x,y,z,w) form
+
+    Returns:
+        np.array: (N, P, 3) array of transformed points
+    """
+    mats = quat2mat_batch(quats)
+    return np.einsum("nij,pj->npi", mats, points) + np.asarray(trans)[:, None, :]
+
+
+def points_in_region_batch(points, p0, px, py, pz=None):
+    """
+    Batched version of the region check in obj_in_region
+
+    Args:
+        points (np.array): (N, P, 3) array of points for N candidates
+
+        p0, px, py, pz (np.array): points defining the region. pz is optional
+
+    Returns:
+        np.array: (N,) boolean array, True if all points of the candidate lie in the region
+    """
+    in_region = np.ones(len(points), dtype=bool)
+    axes = [(px - p0, px), (py - p0, py)]
+    if pz is not None:
+        axes.append((pz - p0, pz))
+    for (u, p_max) in axes:
+        projs = points @ u
+        in_region &= np.all(
+            (np.dot(u, p0) <= projs) & (projs <= np.dot(u, p_max)), axis=1
+        )
+    return in_region
+
+
+def objs_intersect_bbox_batch(obj_points, other_obj_points):
+    """
+    Batched version of objs_intersect_bbox. Runs the separating axis test between
+    every candidate in @obj_points and every box in @other_obj_points
+
+    Args:
+        obj_points (np.array): (N, 8, 3) bounding box points of N candidates
+
+        other_obj_points (np.array): (M, 8, 3) bounding box points of M other objects
+
+    Returns:
+        np.array: (N, M) boolean array, True if candidate n intersects object m
+    """
+    obj_points = np.asarray(obj_points, dtype=np.float64)
+    other_obj_points = np.asarray(other_obj_points, dtype=np.float64)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        obj_normals = obj_points[:, 1:4] - obj_points[:, :1]
+        obj_normals /= np.linalg.norm(obj_normals, axis=-1, keepdims=True)
+        other_normals = other_obj_points[:, 1:4] - other_obj_points[:, :1]
+        other_normals /= np.linalg.norm(other_normals, axis=-1, keepdims=True)
+
+        # project both boxes onto the face normals of the candidate: (N, M, 3, 8)
+        obj_projs = np.einsum("nad,npd->nap", obj_normals, obj_points)[:, None]
+        other_projs = np.einsum("nad,mpd->nmap", obj_normals, other_obj_points)
+        gap = (other_projs.min(-1) > obj_projs.max(-1)) | (
+            obj_projs.min(-1) > other_projs.max(-1)
+        )
+
+        # project both boxes onto the face normals of the other object
+        obj_projs = np.einsum("mad,npd->nmap", other_normals, obj_points)
+        other_projs = np.einsum("mad,mpd->map", other_normals, other_obj_points)[None]
+        gap |= (other_projs.min(-1) > obj_projs.max(-1)) | (
+            obj_projs.min(-1) > other_projs.max(-1)
+        )
+
+    return ~np.any(gap, axis=-1)
+
+
+def objs_intersect_bbox_pairwise(obj_points, other_obj_points):
+    """
+    Pairwise version of objs_intersect_bbox, for P pairs of boxes
+
+    Args:
+        obj_points (np.array): (P, 8, 3) bounding box points of the first box of each pair
+
+        other_obj_points (np.array): (P, 8, 3) bounding box points of the second box of each pair
+
+    Returns:
+        np.array: (P,) boolean array, True if the boxes of pair p intersect
+    """
+    obj_points = np.asarray(obj_points, dtype=np.float64)
+    other_obj_points = np.asarray(other_obj_points, dtype=np.float64)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        normals = np.concatenate(
+            [
+                obj_points[:, 1:4] - obj_points[:, :1],
+                other_obj_points[:, 1:4] - other_obj_points[:, :1],
+            ],
+            axis=1,
+        )
+        normals /= np.linalg.norm(normals, axis=-1, keepdims=True)
+
+        # project both boxes onto the face normals of both boxes: (P, 6, 8)
+        obj_projs = np.einsum("pad,pkd->pak", normals, obj_points)
+        other_projs = np.einsum("pad,pkd->pak", normals, other_obj_points)
+        gap = (other_projs.min(-1) > obj_projs.max(-1)) | (
+            obj_projs.min(-1) > other_projs.max(-1)
+        )
+
+    return ~np.any(gap, axis=-1)
+
+
+def objs_intersect_radius_batch(obj, obj_pos, other_obj, other_obj_pos):
+    """
+    Batched version of the horizontal radius check in objs_intersect, for N candidate positions of @obj
+
+    Args:
+        obj_pos (np.array): (N, 3) array of candidate positions of @obj
+
+        other_obj_pos (3-array): position of @other_obj
+
+    Returns:
+        np.array: (N,) boolean array, True if the candidate intersects @other_obj
+    """
+    obj_pos = np.asarray(obj_pos)
+    other_obj_pos = np.asarray(other_obj_pos)
+    xy_collision = (
+        np.linalg.norm(obj_pos[:, :2] - other_obj_pos[:2], axis=1)
+        <= other_obj.horizontal_radius + obj.horizontal_radius
+    )
+    dz = obj_pos[:, 2] - other_obj_pos[2]
+    z_collision = np.where(
+        dz > 0,
+        dz <= other_obj.top_offset[-1] - obj.bottom_offset[-1],
+        -dz <= obj.top_offset[-1] - other_obj.bottom_offset[-1],
+    )
+    return xy_collision & z_collision
+
+
 def normalize_joint_value(raw, joint_min, joint_max):
     """
     normalize raw value to be between 0 and 1
@@ -602,11 +838,21 @@ def check_obj_in_receptacle(env, obj_name, receptacle_name, th=None):
 
 
 def check_obj_upright(env, obj_name, th=15):
-    obj_rot = env.sim.data.xquat[env.obj_body_id[obj_name]]
-    r = R.from_quat([obj_rot[1], obj_rot[2], obj_rot[3], obj_rot[0]])
-    obj_rot_euler = r.as_euler("xyz", degrees=True)
-    obj_upright = abs(obj_rot_euler[1]) < th and abs(obj_rot_euler[0]) < th
-    return obj_upright
+    return bool(check_objs_upright(env, [obj_name], th=th)[0])
+
+
+def check_objs_upright(env, obj_names, th=15):
+    """
+    Batched version of check_obj_upright. An object is upright if its roll and pitch (xyz euler angles)
+    are both within @th degrees
+
+    Returns:
+        np.array: (N,) boolean array, True if the object is upright
+    """
+    _, mats = get_obj_poses(env, obj_names)
+    roll = np.degrees(np.arctan2(mats[:, 2, 1], mats[:, 2, 2]))
+    pitch = np.degrees(np.arcsin(np.clip(-mats[:, 2, 0], -1.0, 1.0)))
+    return (np.abs(pitch) < th) & (np.abs(roll) < th)
 
 
 def check_fxtr_upright(env, fixture_name, th=15):
@@ -635,11 +881,8 @@ def check_obj_any_counter_contact(env, obj_name):
     """
     check if the object is in contact with any counter fixture in the environment.
     """
-    for fixture in env.fixtures.values():
-        if isinstance(fixture, Counter):
-            if check_obj_fixture_contact(env, obj_name, fixture):
-                return True
-    return False
+    counters = env.fixture_index.get_fixtures_of_class(Counter)
+    return env.check_contact(env.objects[obj_name], counters)
 
 
 def gripper_obj_far(env, obj_name="obj", th=0.25):
@@ -652,6 +895,29 @@ def gripper_obj_far(env, obj_name="obj", th=0.25):
     return gripper_obj_far
 
 
+def gripper_objs_dist(env, obj_names):
+    """
+    Get the distances between the gripper and a set of objects
+
+    Returns:
+        np.array: (N,) array of distances
+    """
+    body_ids = [env.obj_body_id[name] for name in obj_names]
+    obj_pos = env.sim.data.body_xpos[body_ids]
+    gripper_site_pos = env.sim.data.site_xpos[env.robots[0].eef_site_id["right"]]
+    return np.linalg.norm(obj_pos - gripper_site_pos, axis=1)
+
+
+def gripper_objs_far(env, obj_names, th=0.25):
+    """
+    Batched version of gripper_obj_far
+
+    Returns:
+        np.array: (N,) boolean array, True if the gripper is farther than @th from the object
+    """
+    return gripper_objs_dist(env, obj_names) > th
+
+
 def gripper_fxtr_far(env, fixture_name, th=0.25):
     """
     check if gripper is far from fixture based on distance defined by threshold
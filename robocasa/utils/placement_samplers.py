@@ -12,11 +12,41 @@ from robosuite.utils.transform_utils import (
     rotate_2d_point,
 )
 
+import robocasa.macros as macros
+import robocasa.utils.object_utils as OU
 from robocasa.models.objects.objects import MJCFObject
 from robocasa.utils.object_utils import obj_in_region, objs_intersect
 from robocasa.utils.errors import PlacementError
 
 
+def is_auxiliary_pair(a, b):
+    """
+    Return True if exactly one of (a,b) is the auxiliary partner of the other
+    """
+    if b.startswith(a + "_auxiliary_"):
+        return True
+    if a.startswith(b + "_auxiliary_"):
+        return True
+    return False
+
+
+def _quat_multiply_batch(quaternion1, quaternion0):
+    """
+    Batched version of quat_multiply. Inputs are (..., 4) arrays in (x,y,z,w) form
+    """
+    x0, y0, z0, w0 = np.moveaxis(np.asarray(quaternion0), -1, 0)
+    x1, y1, z1, w1 = np.moveaxis(np.asarray(quaternion1), -1, 0)
+    return np.stack(
+        (
+            x1 * w0 + y1 * z0 - z1 * y0 + w1 * x0,
+            -x1 * z0 + y1 * w0 + z1 * x0 + w1 * y0,
+            x1 * y0 - y1 * x0 + z1 * w0 + w1 * z0,
+            -x1 * x0 - y1 * y0 - z1 * z0 + w1 * w0,
+        ),
+        axis=-1,
+    ).astype(np.float32)
+
+
 class ObjectPositionSampler:
     """
     Base class of object placement sampler.
@@ -179,6 +209,9 @@ class UniformRandomSampler(ObjectPositionSampler):
 
         z_offset (float): Add a small z-offset to placements. This is useful for fixed objects
             that do not move (i.e. no free joint) to place them above the table.
+
+        batch_size (None or int): number of candidate poses to draw and check at once. If None, uses
+            macros.PLACEMENT_SAMPLER_BATCH_SIZE. A value of 1 samples candidates one at a time
     """
 
     def __init__(
@@ -198,12 +231,14 @@ class UniformRandomSampler(ObjectPositionSampler):
         z_offset=0.0,
         rng=None,
         side="all",
+        batch_size=None,
     ):
         self.x_range = x_range
         self.y_range = y_range
         self.rotation = rotation
         self.rotation_axis = rotation_axis
         self.ensure_valid_auxiliary_placement = ensure_valid_auxiliary_placement
+        self.batch_size = batch_size
 
         if side not in self.valid_sides:
             raise ValueError(
@@ -222,14 +257,20 @@ class UniformRandomSampler(ObjectPositionSampler):
             rng=rng,
         )
 
-    def _sample_x(self, obj_size=None):
+    def _get_sampling_range(self, axis, obj_size=None):
         """
-        Samples the x location for a given object
+        Gets the (min, max) range to sample the x or y location for a given object from
+
+        Args:
+            axis (str): "x" or "y"
 
         Returns:
-            float: sampled x position
+            2-tuple: (min, max) sampling range
+
+        Raises:
+            PlacementError: [Invalid range]
         """
-        minimum, maximum = self.x_range
+        minimum, maximum = self.x_range if axis == "x" else self.y_range
         if obj_size is not None:
             buffer = min(obj_size[0], obj_size[1]) / 2
             if self.ensure_object_boundary_in_range:
@@ -238,9 +279,19 @@ class UniformRandomSampler(ObjectPositionSampler):
 
         if minimum > maximum:
             raise PlacementError(
-                f"Invalid x range for placement initializer: ({minimum}, {maximum})"
+                f"Invalid {axis} range for placement initializer: ({minimum}, {maximum})"
             )
 
+        return minimum, maximum
+
+    def _sample_x(self, obj_size=None):
+        """
+        Samples the x location for a given object
+
+        Returns:
+            float: sampled x position
+        """
+        minimum, maximum = self._get_sampling_range("x", obj_size)
         return self.rng.uniform(high=maximum, low=minimum)
 
     def _sample_y(self, obj_size=None):
@@ -250,49 +301,29 @@ class UniformRandomSampler(ObjectPositionSampler):
         Returns:
             float: sampled y position
         """
-        minimum, maximum = self.y_range
-        if obj_size is not None:
-            buffer = min(obj_size[0], obj_size[1]) / 2
-            if self.ensure_object_boundary_in_range:
-                minimum += buffer
-                maximum -= buffer
-
-        if minimum > maximum:
-            raise PlacementError(
-                f"Invalid y range for placement initializer: ({minimum}, {maximum})"
-            )
-
+        minimum, maximum = self._get_sampling_range("y", obj_size)
         return self.rng.uniform(high=maximum, low=minimum)
 
-    def _sample_quat(self):
+    def _sample_rot_angle(self):
         """
-        Samples the orientation for a given object
+        Samples the rotation angle (about the rotation axis) for a given object
 
         Returns:
-            np.array: sampled object quaternion in (w,x,y,z) form
-
-        Raises:
-            ValueError: [Invalid rotation axis]
+            float: sampled angle
         """
         if self.rotation is None:
-            rot_angle = self.rng.uniform(high=2 * np.pi, low=0)
+            return self.rng.uniform(high=2 * np.pi, low=0)
         elif isinstance(self.rotation, collections.abc.Iterable):
             if isinstance(self.rotation[0], collections.abc.Iterable):
                 rotation = self.rng.choice(self.rotation)
             else:
                 rotation = self.rotation
-            rot_angle = self.rng.uniform(high=max(rotation), low=min(rotation))
-        else:
-            rot_angle = self.rotation
-
-        # Return angle based on axis requested
-        if self.rotation_axis == "x":
-            return np.array([np.cos(rot_angle / 2), np.sin(rot_angle / 2), 0, 0])
-        elif self.rotation_axis == "y":
-            return np.array([np.cos(rot_angle / 2), 0, np.sin(rot_angle / 2), 0])
-        elif self.rotation_axis == "z":
-            return np.array([np.cos(rot_angle / 2), 0, 0, np.sin(rot_angle / 2)])
+            return self.rng.uniform(high=max(rotation), low=min(rotation))
         else:
+            return self.rotation
+
+    def _check_rotation_axis(self):
+        if self.rotation_axis not in ("x", "y", "z"):
             # Invalid axis specified, raise error
             raise ValueError(
                 "Invalid rotation axis specified. Must be 'x', 'y', or 'z'. Got: {}".format(
@@ -300,6 +331,224 @@ class UniformRandomSampler(ObjectPositionSampler):
                 )
             )
 
+    def _sample_quat(self):
+        """
+        Samples the orientation for a given object
+
+        Returns:
+            np.array: sampled object quaternion in (w,x,y,z) form
+
+        Raises:
+            ValueError: [Invalid rotation axis]
+        """
+        self._check_rotation_axis()
+        rot_angle = self._sample_rot_angle()
+        quat = np.zeros(4)
+        quat[0] = np.cos(rot_angle / 2)
+        quat[{"x": 1, "y": 2, "z": 3}[self.rotation_axis]] = np.sin(rot_angle / 2)
+        return quat
+
+    def _can_draw_in_blocks(self):
+        """
+        Whether candidate poses can be drawn from the rng as a single block, so that the rng can be rewound to
+        the chosen candidate afterwards. Otherwise candidates are drawn one at a time
+        """
+        if not isinstance(self.rng, np.random.Generator):
+            return False
+        if isinstance(self.rotation, collections.abc.Iterable) and isinstance(
+            self.rotation[0], collections.abc.Iterable
+        ):
+            # rotation ranges are chosen with rng.choice on every try
+            return False
+        return True
+
+    def _sample_placement(
+        self,
+        obj,
+        placed_objects,
+        base_offset,
+        ref_quat,
+        region_points,
+        obj_size,
+        on_top,
+    ):
+        """
+        Rejection sampling of a valid pose for @obj. Candidate poses are drawn in batches (see batch_size), and
+        the region and overlap checks run as array operations over all candidates and placed objects.
+
+        Candidates are drawn from the same random stream, and checked in the same order, as if they were drawn one
+        at a time. Once a candidate is accepted the rng is rewound so that only the draws up to that candidate are
+        consumed. For a fixed seed, the placement and the final rng state do not depend on the batch size.
+
+        Returns:
+            None or 2-tuple: (pos, quat) of the first valid candidate (quat in (w,x,y,z) form), or None if no
+                valid candidate was found
+        """
+        from robocasa.models.fixtures import Fixture
+
+        self._check_rotation_axis()
+        block_draws = self._can_draw_in_blocks()
+        batch_size = self.batch_size
+        if batch_size is None:
+            batch_size = macros.PLACEMENT_SAMPLER_BATCH_SIZE
+        if not block_draws or batch_size is None or batch_size < 1:
+            batch_size = 1
+        use_bbox = isinstance(obj, MJCFObject) or isinstance(obj, Fixture)
+
+        if block_draws:
+            # sampling ranges, in the order in which candidates draw from the rng
+            ranges = [
+                self._get_sampling_range("x", obj_size),
+                self._get_sampling_range("y", obj_size),
+            ]
+            if self.rotation is None:
+                ranges.append((0, 2 * np.pi))
+            elif isinstance(self.rotation, collections.abc.Iterable):
+                ranges.append((min(self.rotation), max(self.rotation)))
+            low = np.array([r[0] for r in ranges], dtype=np.float64)
+            high = np.array([r[1] for r in ranges], dtype=np.float64)
+            num_draws = len(ranges)
+
+        object_z = self.z_offset + base_offset[2]
+        if on_top:
+            object_z -= obj.bottom_offset[-1]
+        ref_quat_xyzw = convert_quat(ref_quat, to="xyzw")
+        quat_axis = {"x": 1, "y": 2, "z": 3}[self.rotation_axis]
+
+        if use_bbox:
+            local_points = OU.get_local_bbox_points(obj)
+        else:
+            radius = obj.horizontal_radius
+            local_points = np.array(
+                [
+                    [radius, 0, 0],
+                    [-radius, 0, 0],
+                    [0, radius, 0],
+                    [0, -radius, 0],
+                ]
+            )
+
+        # gather the placed objects that candidates must not overlap with
+        other_bbox_points = []
+        other_radius_objs = []
+        if self.ensure_valid_placement:
+            for placed_obj_name, (
+                other_pos,
+                other_quat,
+                other_obj,
+            ) in placed_objects.items():
+                if placed_obj_name == self.reference_object:
+                    continue
+                if (
+                    is_auxiliary_pair(obj.name, other_obj.name)
+                    and not self.ensure_valid_auxiliary_placement
+                ):
+                    continue
+                if use_bbox and (
+                    isinstance(other_obj, MJCFObject) or isinstance(other_obj, Fixture)
+                ):
+                    other_bbox_points.append(
+                        other_obj.get_bbox_points(
+                            trans=other_pos, rot=convert_quat(other_quat, to="xyzw")
+                        )
+                    )
+                else:
+                    other_radius_objs.append((other_pos, other_obj))
+        other_bbox_points = np.array(other_bbox_points)
+
+        cos_rot = np.cos(self.reference_rot)
+        sin_rot = np.sin(self.reference_rot)
+
+        num_tries = 0
+        while num_tries < 5000:  # 5000 retries
+            n = min(batch_size, 5000 - num_tries)
+            num_tries += n
+
+            if block_draws:
+                rng_state = self.rng.bit_generator.state
+                samples = low + (high - low) * self.rng.random((n, num_draws))
+                relative_x, relative_y = samples[:, 0], samples[:, 1]
+                if num_draws == 3:
+                    rot_angle = samples[:, 2]
+                else:
+                    rot_angle = np.full(n, self.rotation, dtype=np.float64)
+            else:
+                relative_x = np.array([self._sample_x(obj_size)])
+                relative_y = np.array([self._sample_y(obj_size)])
+                rot_angle = np.array([self._sample_rot_angle()], dtype=np.float64)
+
+            # apply rotation to object coordinates
+            pos = np.empty((n, 3))
+            pos[:, 0] = relative_x * cos_rot - relative_y * sin_rot + base_offset[0]
+            pos[:, 1] = relative_x * sin_rot + relative_y * cos_rot + base_offset[1]
+            pos[:, 2] = object_z
+
+            # random rotation
+            quat = np.zeros((n, 4))
+            quat[:, 0] = np.cos(rot_angle / 2)
+            quat[:, quat_axis] = np.sin(rot_angle / 2)
+            if hasattr(obj, "init_quat"):
+                quat = _quat_multiply_batch(quat, obj.init_quat)
+            quat = _quat_multiply_batch(ref_quat_xyzw, quat[:, [1, 2, 3, 0]])
+            quat_xyzw = quat
+            quat = quat[:, [3, 0, 1, 2]]
+
+            if use_bbox:
+                points = OU.transform_points_batch(local_points, pos, quat_xyzw)
+            else:
+                points = pos[:, None, :] + local_points[None]
+
+            # ensure object placed fully in region
+            if self.ensure_object_boundary_in_range:
+                valid = OU.points_in_region_batch(
+                    points,
+                    p0=region_points[0],
+                    px=region_points[1],
+                    py=region_points[2],
+                )
+            else:
+                valid = np.ones(n, dtype=bool)
+            in_region_inds = np.flatnonzero(valid)
+            if len(in_region_inds) == 0:
+                continue
+
+            # objects cannot overlap
+            collision = np.zeros(len(in_region_inds), dtype=bool)
+            if len(other_bbox_points) > 0:
+                collision |= np.any(
+                    OU.objs_intersect_bbox_batch(
+                        points[in_region_inds], other_bbox_points
+                    ),
+                    axis=1,
+                )
+            for other_pos, other_obj in other_radius_objs:
+                collision |= OU.objs_intersect_radius_batch(
+                    obj=obj,
+                    obj_pos=pos[in_region_inds],
+                    other_obj=other_obj,
+                    other_obj_pos=other_pos,
+                )
+            valid[in_region_inds] = ~collision
+
+            if "_auxiliary_" in obj.name:
+                # auxiliary objects give up after the first in-range candidate that overlaps
+                ind = in_region_inds[0]
+            elif np.any(valid):
+                ind = np.flatnonzero(valid)[0]
+            else:
+                continue
+
+            if block_draws:
+                # rewind the rng so that only the draws up to the chosen candidate are consumed
+                self.rng.bit_generator.state = rng_state
+                self.rng.random((ind + 1) * num_draws)
+
+            if not valid[ind]:
+                return None
+            return tuple(pos[ind]), quat[ind].copy()
+
+        return None
+
     def sample(
         self, placed_objects=None, reference=None, on_top=True, use_reference_quat=False
     ):
@@ -399,92 +648,19 @@ class UniformRandomSampler(ObjectPositionSampler):
             else:
                 obj_size = None
 
-            def is_auxiliary_pair(a, b):
-                """
-                Return True if exactly one of (a,b) is the auxiliary partner of the other
-                """
-                if b.startswith(a + "_auxiliary_"):
-                    return True
-                if a.startswith(b + "_auxiliary_"):
-                    return True
-                return False
-
-            for i in range(5000):  # 5000 retries
-                # sample object coordinates
-                relative_x = self._sample_x(obj_size)
-                relative_y = self._sample_y(obj_size)
-
-                # apply rotation
-                object_x, object_y = rotate_2d_point(
-                    [relative_x, relative_y], rot=self.reference_rot
-                )
-
-                object_x = object_x + base_offset[0]
-                object_y = object_y + base_offset[1]
-                object_z = self.z_offset + base_offset[2]
-                if on_top:
-                    object_z -= obj.bottom_offset[-1]
-
-                # random rotation
-                quat = self._sample_quat()
-                # multiply this quat by the object's initial rotation if it has the attribute specified
-                if hasattr(obj, "init_quat"):
-                    quat = quat_multiply(quat, obj.init_quat)
-                quat = convert_quat(
-                    quat_multiply(
-                        convert_quat(ref_quat, to="xyzw"),
-                        convert_quat(quat, to="xyzw"),
-                    ),
-                    to="wxyz",
-                )
-
-                location_valid = True
-
-                # ensure object placed fully in region
-                if self.ensure_object_boundary_in_range and not obj_in_region(
-                    obj,
-                    obj_pos=[object_x, object_y, object_z],
-                    obj_quat=convert_quat(quat, to="xyzw"),
-                    p0=region_points[0],
-                    px=region_points[1],
-                    py=region_points[2],
-                ):
-                    location_valid = False
-                    continue
-
-                # objects cannot overlap
-                if self.ensure_valid_placement:
-                    for placed_obj_name, (
-                        (x, y, z),
-                        other_quat,
-                        other_obj,
-                    ) in placed_objects.items():
-                        if placed_obj_name == self.reference_object:
-                            continue
-                        if (
-                            not is_auxiliary_pair(obj.name, other_obj.name)
-                            or self.ensure_valid_auxiliary_placement
-                        ):
-                            if objs_intersect(
-                                obj=obj,
-                                obj_pos=[object_x, object_y, object_z],
-                                obj_quat=convert_quat(quat, to="xyzw"),
-                                other_obj=other_obj,
-                                other_obj_pos=[x, y, z],
-                                other_obj_quat=convert_quat(other_quat, to="xyzw"),
-                            ):
-                                location_valid = False
-                                break
-
-                if "_auxiliary_" in obj.name and not location_valid:
-                    break
-
-                if location_valid:
-                    # location is valid, put the object down
-                    pos = (object_x, object_y, object_z)
-                    placed_objects[obj.name] = (pos, quat, obj)
-                    success = True
-                    break
+            placement = self._sample_placement(
+                obj=obj,
+                placed_objects=placed_objects,
+                base_offset=base_offset,
+                ref_quat=ref_quat,
+                region_points=region_points,
+                obj_size=obj_size,
+                on_top=on_top,
+            )
+            if placement is not None:
+                pos, quat = placement
+                placed_objects[obj.name] = (pos, quat, obj)
+                success = True
 
             if not success:
                 raise PlacementError(f"Cannot place all objects, failed for {obj.name}")
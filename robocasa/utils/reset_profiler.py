@@ -0,0 +1,104 @@
+"""
+Wall time and call counts of the phases of an environment reset.
+
+Kitchen records each phase of a reset (building the arena, placing fixtures and objects, compiling the model,
+spawning the robot, settling objects, ...) through a ResetProfiler, and finalizes one profile per reset. The last
+profile is available through Kitchen.get_reset_profile(). If macros.RESET_PROFILE_PATH is set, every profile is
+also appended to that file as one json line, so that reset latency can be attributed per task, layout and style
+across many resets.
+"""
+
+import json
+import os
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+
+class ResetProfiler:
+    """
+    Accumulates the time spent in named phases until the profile is finalized
+    """
+
+    def __init__(self):
+        self._phases = OrderedDict()
+        # nesting depth of each phase that is currently running
+        self._depths = dict()
+        self.last_profile = None
+
+    def record(self, name, duration, num_calls=1):
+        """
+        Adds calls to a phase
+
+        Args:
+            name (str): name of the phase
+
+            duration (float): time spent, in seconds
+
+            num_calls (int): number of calls (or attempts) made
+        """
+        phase = self._phases.get(name)
+        if phase is None:
+            phase = dict(time=0.0, calls=0)
+            self._phases[name] = phase
+        phase["time"] += duration
+        phase["calls"] += num_calls
+
+    def get_time(self, name):
+        """
+        Returns:
+            float: time spent so far in phase @name, within the current profile
+        """
+        phase = self._phases.get(name)
+        return 0.0 if phase is None else phase["time"]
+
+    def has_phase(self, name):
+        """
+        Returns:
+            bool: True if phase @name was recorded within the current profile
+        """
+        return name in self._phases
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Times the enclosed code as a call to phase @name. Nested calls to the same phase (eg. recursive calls)
+        are counted, but their time is only accounted for once, by the outermost call
+        """
+        depth = self._depths.get(name, 0)
+        self._depths[name] = depth + 1
+        t_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._depths[name] = depth
+            duration = time.perf_counter() - t_start
+            self.record(name, duration if depth == 0 else 0.0)
+
+    def finalize(self, total_time, path=None, **info):
+        """
+        Ends the current profile, containing all phases recorded since the previous one, and starts a new one
+
+        Args:
+            total_time (float): wall time of the reset, in seconds
+
+            path (str): if set, the profile is appended as a json line to this file
+
+            info (dict): additional entries of the profile (eg. task, layout and style)
+
+        Returns:
+            dict: the profile
+        """
+        profile = dict(info)
+        profile["total_time"] = total_time
+        profile["phases"] = dict(self._phases)
+        self._phases = OrderedDict()
+        self.last_profile = profile
+
+        if path is not None:
+            dirname = os.path.dirname(path)
+            if dirname:
+                os.makedirs(dirname, exist_ok=True)
+            with open(path, "a") as f:
+                f.write(json.dumps(profile, default=str) + "\n")
+        return profile
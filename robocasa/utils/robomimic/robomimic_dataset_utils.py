@@ -4,6 +4,7 @@ import json
 import torch
 import numpy as np
 
+import robocasa.utils.model_store as ModelStore
 import robocasa.utils.robomimic.robomimic_torch_utils as TorchUtils
 
 
@@ -171,6 +172,14 @@ def filter_dataset_size(
 def move_demo_to_new_key(f, old_demo_key, new_demo_key, delete_old_demo=True):
     print(f"Moving {old_demo_key} -> {new_demo_key}")
 
+    link = f["data"].get(old_demo_key, getlink=True)
+    if isinstance(link, h5py.ExternalLink):
+        # demo lives in a shard file: point the new key at it, without copying any data
+        f["data"][new_demo_key] = h5py.ExternalLink(link.filename, link.path)
+        if delete_old_demo is True:
+            del f["data"][old_demo_key]
+        return
+
     src_ep = f["data"][old_demo_key]
 
     if new_demo_key not in f["data"]:
@@ -301,7 +310,7 @@ def convert_to_robomimic_format(
     total_samples = 0
     for ep in f["data"]:
         # ensure model-xml is in per-episode metadata
-        assert "model_file" in f["data/{}".format(ep)].attrs
+        assert ModelStore.has_model_xml(f["data/{}".format(ep)])
 
         # add "num_samples" into per-episode metadata
         if "num_samples" in f["data/{}".format(ep)].attrs:
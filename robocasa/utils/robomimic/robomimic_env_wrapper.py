@@ -338,7 +338,7 @@ class EnvRobocasa:
         { str: bool } with at least a "task" key for the overall task success,
         and additional optional keys corresponding to other task criteria.
         """
-        succ = self.env._check_success()
+        succ = self.env.check_success()
         if isinstance(succ, dict):
             assert "task" in succ
             return succ
@@ -0,0 +1,290 @@
+"""
+Cache for the fixture placements of kitchen scenes.
+
+Placing fixtures requires running the placement samplers for every fixture in the layout (with retries),
+which is a large part of the cost of Kitchen._load_model. The result depends on the layout, style and fixture
+configuration, and on the state of the env rng, which captures the seed and the episode index. Entries are keyed
+on all of them, and also store the rng state after placement. On a cache hit, the cached placements are applied
+directly and the rng is restored to that state, so episodes are the same as without the cache. This speeds up
+replaying the same seeds, eg. in repeated benchmark runs or when several processes regenerate the same episodes.
+
+A hit only skips sampling the fixture placements: the arena and fixtures are still constructed, objects are still
+placed, and the MuJoCo model is still compiled on every reset.
+
+The cache is opt-in and controlled through macros.SCENE_CACHE_MODE:
+    None: disabled (default)
+    "memory": placements are cached in-process
+    "disk": placements are cached in-process and persisted as pickle files under macros.SCENE_CACHE_DIR
+
+Both hold at most macros.SCENE_CACHE_MAX_ENTRIES entries, evicting the least recently used ones (on disk, by file
+modification time, which is updated on every hit). Entries are also evicted when a later placement stage (objects)
+fails on the scene, see evict_fixture_placements.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+from collections import OrderedDict
+
+import numpy as np
+
+import robocasa.macros as macros
+from robocasa.utils.cache_utils import get_cache_path
+
+# scene cache key -> entry, in least recently used order
+_SCENE_CACHE = OrderedDict()
+_SCENE_CACHE_STATS = dict(
+    hits=0, disk_hits=0, misses=0, stores=0, evictions=0, lru_evictions=0
+)
+
+
+def scene_cache_enabled():
+    """
+    Returns:
+        bool: True if the scene cache is enabled through macros.SCENE_CACHE_MODE
+    """
+    mode = macros.SCENE_CACHE_MODE
+    if mode is None:
+        return False
+    if mode not in ("memory", "disk"):
+        raise ValueError(
+            "Invalid scene cache mode: {}. Must be None, 'memory' or 'disk'".format(
+                mode
+            )
+        )
+    return True
+
+
+def get_scene_cache_dir():
+    """
+    Returns:
+        str: directory where on-disk scene cache entries are stored
+    """
+    return macros.SCENE_CACHE_DIR or get_cache_path("scene_cache")
+
+
+def _get_fixture_signature(fxtr):
+    """
+    Get a json-serializable signature of a fixture, capturing everything its placement depends on
+    """
+    return dict(
+        cls=fxtr.__class__.__name__,
+        file=getattr(fxtr, "file", None),
+        pos=np.round(np.array(fxtr.pos, dtype=float), 6).tolist(),
+        size=np.round(np.array(fxtr.size, dtype=float), 6).tolist()
+        if getattr(fxtr, "size", None) is not None
+        else None,
+        placement=getattr(fxtr, "_placement", None),
+    )
+
+
+def get_scene_cache_key(env):
+    """
+    Computes the cache key of the current scene of a kitchen environment. The key is built from
+    the layout, style, enabled fixtures, clutter mode and fixture config updates, a signature of
+    the fixtures sampled for the scene (which captures the seed-dependent choice of fixture models), and the
+    seed and current state of the env rng (which captures the episode index and earlier placement attempts)
+
+    Args:
+        env (Kitchen): environment whose model has been set up through _setup_model
+
+    Returns:
+        str: hex digest identifying the scene
+    """
+    scene = dict(
+        layout_id=env.layout_id,
+        style_id=env.style_id,
+        enable_fixtures=env.enable_fixtures,
+        clutter_mode=env.clutter_mode,
+        update_fxtr_cfg_dict=env.update_fxtr_cfg_dict,
+        seed=env.seed,
+        rng_state=env.rng.bit_generator.state,
+        fixtures={
+            name: _get_fixture_signature(fxtr)
+            for (name, fxtr) in sorted(env.fixtures.items())
+        },
+    )
+    scene_str = json.dumps(scene, sort_keys=True, default=str)
+    return hashlib.sha1(scene_str.encode("utf-8")).hexdigest()
+
+
+def _get_cache_path(key):
+    return os.path.join(get_scene_cache_dir(), "{}.pkl".format(key))
+
+
+def _add_to_memory(key, entry):
+    """
+    Adds an entry to the in-process cache as the most recently used one, evicting the least recently used
+    entries beyond macros.SCENE_CACHE_MAX_ENTRIES
+    """
+    _SCENE_CACHE[key] = entry
+    _SCENE_CACHE.move_to_end(key)
+    while len(_SCENE_CACHE) > max(macros.SCENE_CACHE_MAX_ENTRIES, 0):
+        _SCENE_CACHE.popitem(last=False)
+        _SCENE_CACHE_STATS["lru_evictions"] += 1
+
+
+def _prune_disk_cache(keep_path):
+    """
+    Deletes the least recently used on-disk entries beyond macros.SCENE_CACHE_MAX_ENTRIES, other than the
+    entry at @keep_path that was just written
+    """
+    cache_dir = get_scene_cache_dir()
+    entries = []
+    for fname in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, fname)
+        if not fname.endswith(".pkl") or path == keep_path:
+            continue
+        try:
+            entries.append((os.stat(path).st_mtime_ns, path))
+        except OSError:
+            # removed by another process
+            continue
+    num_evicted = len(entries) + 1 - max(macros.SCENE_CACHE_MAX_ENTRIES, 1)
+    for (_, path) in sorted(entries)[: max(num_evicted, 0)]:
+        try:
+            os.remove(path)
+            _SCENE_CACHE_STATS["lru_evictions"] += 1
+        except OSError:
+            pass
+
+
+def load_fixture_placements(key, fixtures, rng=None):
+    """
+    Looks up cached fixture placements for a scene
+
+    Args:
+        key (str): scene cache key from get_scene_cache_key
+
+        fixtures (dict): fixture name to Fixture model, for the fixtures of the current scene
+
+        rng (np.random.Generator or None): if specified and the lookup hits, @rng is set to the state it had
+            after the cached placements were sampled
+
+    Returns:
+        dict or None: fixture name to (pos, quat, fixture) placements as returned by the placement samplers,
+            or None if there is no valid cache entry for the scene
+    """
+    entry = _SCENE_CACHE.get(key)
+    from_disk = False
+    if entry is None and macros.SCENE_CACHE_MODE == "disk":
+        path = _get_cache_path(key)
+        if os.path.exists(path):
+            try:
+                with open(path, "rb") as f:
+                    entry = pickle.load(f)
+                from_disk = True
+            except (OSError, EOFError, pickle.UnpicklingError):
+                entry = None
+
+    if (
+        not isinstance(entry, dict)
+        or "placements" not in entry
+        or not set(entry["placements"]).issubset(fixtures)
+    ):
+        _SCENE_CACHE_STATS["misses"] += 1
+        return None
+
+    _add_to_memory(key, entry)
+    _SCENE_CACHE_STATS["hits"] += 1
+    if from_disk:
+        _SCENE_CACHE_STATS["disk_hits"] += 1
+    if macros.SCENE_CACHE_MODE == "disk":
+        # mark the entry as recently used on disk, including on in-process hits
+        try:
+            os.utime(_get_cache_path(key))
+        except OSError:
+            pass
+
+    if rng is not None and entry["rng_state"] is not None:
+        rng.bit_generator.state = entry["rng_state"]
+
+    return {
+        name: (tuple(pos), np.array(quat), fixtures[name])
+        for (name, (pos, quat)) in entry["placements"].items()
+    }
+
+
+def store_fixture_placements(key, placements, rng=None):
+    """
+    Stores fixture placements for a scene
+
+    Args:
+        key (str): scene cache key from get_scene_cache_key
+
+        placements (dict): fixture name to (pos, quat, fixture) placements
+
+        rng (np.random.Generator or None): rng used to sample the placements. Its current state is stored
+            and restored on cache hits
+    """
+    entry = dict(
+        placements={
+            name: (tuple(np.array(pos, dtype=float)), np.array(quat, dtype=float))
+            for (name, (pos, quat, _)) in placements.items()
+        },
+        rng_state=rng.bit_generator.state if rng is not None else None,
+    )
+    _add_to_memory(key, entry)
+    _SCENE_CACHE_STATS["stores"] += 1
+
+    if macros.SCENE_CACHE_MODE == "disk":
+        path = _get_cache_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # write to a temporary file first so that concurrent readers never see partial entries
+        tmp_path = "{}.{}.tmp".format(path, os.getpid())
+        with open(tmp_path, "wb") as f:
+            pickle.dump(entry, f)
+        os.replace(tmp_path, path)
+        _prune_disk_cache(path)
+
+
+def evict_fixture_placements(key):
+    """
+    Removes the entry of a scene from the cache (and from disk). Used when a later placement stage fails on a
+    scene built from cached placements, so that the retry does not reuse them
+
+    Args:
+        key (str): scene cache key from get_scene_cache_key
+    """
+    evicted = _SCENE_CACHE.pop(key, None) is not None
+    if macros.SCENE_CACHE_MODE == "disk":
+        try:
+            os.remove(_get_cache_path(key))
+            evicted = True
+        except OSError:
+            pass
+    if evicted:
+        _SCENE_CACHE_STATS["evictions"] += 1
+
+
+def get_scene_cache_stats():
+    """
+    Returns:
+        dict: number of cache hits (of which disk_hits were loaded from disk), misses, stores, evictions of
+            failed scenes and lru_evictions beyond macros.SCENE_CACHE_MAX_ENTRIES in the current process, along
+            with the hit rate
+    """
+    stats = dict(_SCENE_CACHE_STATS)
+    num_lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = stats["hits"] / num_lookups if num_lookups > 0 else 0.0
+    return stats
+
+
+def clear_scene_cache(disk=False):
+    """
+    Clears the in-process scene cache and resets its statistics
+
+    Args:
+        disk (bool): if True, also deletes all on-disk cache entries
+    """
+    _SCENE_CACHE.clear()
+    for k in _SCENE_CACHE_STATS:
+        _SCENE_CACHE_STATS[k] = 0
+
+    if disk:
+        cache_dir = get_scene_cache_dir()
+        if os.path.isdir(cache_dir):
+            for fname in os.listdir(cache_dir):
+                if fname.endswith(".pkl"):
+                    os.remove(os.path.join(cache_dir, fname))
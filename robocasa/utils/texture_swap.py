@@ -1,12 +1,12 @@
 import inspect
 import os
 import random
+from collections import defaultdict
 from copy import deepcopy
 from pathlib import Path
 
 import numpy as np
 from lxml import etree as ET
-from robosuite.utils.mjcf_utils import find_elements
 
 import robocasa
 
@@ -454,6 +454,187 @@ def get_random_textures(rng, frac=1.0):
     return textures
 
 
+class TextureIndex:
+    """
+    Index of the materials and textures in the asset section of a parsed model, used to apply several
+    texture replacements to the same tree without repeatedly scanning it. Works with both lxml and
+    xml.etree element trees.
+
+    Args:
+        root (Element): root element of the model
+    """
+
+    def __init__(self, root):
+        self.asset = root.find("asset")
+        self.materials = self.asset.findall("material")
+        self.textures = defaultdict(list)
+        for tex in self.asset.findall("texture"):
+            self.textures[tex.get("name")].append(tex)
+
+    def get_material_texture(self, match_fn):
+        """
+        Get the texture referenced by the first material whose name satisfies @match_fn
+        """
+        for mat in self.materials:
+            if match_fn(mat.get("name")):
+                return mat.get("texture")
+        return None
+
+    def set_material_texture(self, match_fn, tex_name, **attribs):
+        """
+        Set the texture (and other attributes) of all materials whose name satisfies @match_fn
+        """
+        for mat in self.materials:
+            if match_fn(mat.get("name")):
+                mat.set("texture", tex_name)
+                for (k, v) in attribs.items():
+                    mat.set(k, v)
+
+    def replace_texture(self, old_name, new_name, **attribs):
+        """
+        Rename all textures named @old_name to @new_name and update their attributes
+        """
+        texs = self.textures.pop(old_name, [])
+        for tex in texs:
+            tex.set("name", new_name)
+            for (k, v) in attribs.items():
+                tex.set(k, v)
+        self.textures[new_name] += texs
+
+    def set_or_add_texture(self, name, file, tex_type):
+        """
+        Set the file of the texture named @name, adding the texture if it does not exist yet
+        """
+        if len(self.textures[name]) > 0:
+            self.textures[name][0].set("file", file)
+        else:
+            tex = self.asset.makeelement(
+                "texture", dict(type=tex_type, name=name, file=file)
+            )
+            self.asset.append(tex)
+            self.textures[name].append(tex)
+
+
+def _is_counter_top_mat(name):
+    return "counter_top" in name
+
+
+def _is_floor_mat(name):
+    return "floor" in name and "backing" not in name
+
+
+def _is_wall_mat(name):
+    return "wall" in name and "floor" not in name and "backing" not in name
+
+
+def _replace_counter_top_texture_in_index(tex_index, new_counter_top_texture_file):
+    # step 1: find the name of texture that will be replaced
+    counter_tex_name = tex_index.get_material_texture(_is_counter_top_mat)
+    assert counter_tex_name is not None
+
+    # step 2: find and replace texture element
+    CTOP_TEX_NAME = "counter_top_replacement_texture"
+    tex_index.replace_texture(
+        counter_tex_name, CTOP_TEX_NAME, file=str(new_counter_top_texture_file)
+    )
+
+    # step 3: reference new textures in materials
+    tex_index.set_material_texture(_is_counter_top_mat, CTOP_TEX_NAME)
+
+
+def _replace_cab_textures_in_index(tex_index, new_cab_texture_file):
+    CAB_TEX_NAME_2D = "cab_replacement_texture_2d"
+    tex_index.set_or_add_texture(CAB_TEX_NAME_2D, str(new_cab_texture_file), "2d")
+
+    CAB_TEX_NAME_CUBE = "cab_replacement_texture_cube"
+    tex_index.set_or_add_texture(CAB_TEX_NAME_CUBE, str(new_cab_texture_file), "cube")
+
+    for mat in tex_index.materials:
+        name = mat.get("name")
+        if "counter_base" in name:
+            mat.set("texture", CAB_TEX_NAME_CUBE)
+        elif "housing" in name:
+            mat.set("texture", CAB_TEX_NAME_CUBE)
+        elif (
+            "stack" in name
+            or "cab" in name
+            or "shelves" in name
+            or "bottom" in name
+            or ("top" in name and "counter" not in name and "stove" not in name)
+        ):
+            if "handle" in name or "transparent" in name:
+                continue
+            elif "door" in name:
+                mat.set("texture", CAB_TEX_NAME_2D)
+            elif "shelves" in name:
+                mat.set("texture", CAB_TEX_NAME_2D)
+            else:
+                mat.set("texture", CAB_TEX_NAME_CUBE)
+
+
+def _replace_floor_texture_in_index(tex_index, new_floor_texture_file):
+    # step 1: find the name of texture that will be replaced
+    floor_tex_name = tex_index.get_material_texture(_is_floor_mat)
+    assert floor_tex_name is not None
+
+    # step 2: find and replace texture element
+    FLOOR_TEX_NAME = "floor_replacement_texture"
+    tex_index.replace_texture(
+        floor_tex_name, FLOOR_TEX_NAME, file=str(new_floor_texture_file), type="2d"
+    )
+
+    # step 3: reference new textures in materials
+    tex_index.set_material_texture(_is_floor_mat, FLOOR_TEX_NAME, texrepeat="2 2")
+
+
+def _replace_wall_texture_in_index(tex_index, new_wall_texture_file):
+    # step 1: find the name of texture that will be replaced
+    wall_tex_name = tex_index.get_material_texture(_is_wall_mat)
+    assert wall_tex_name is not None
+
+    # step 2: add new texture element
+    WALL_TEX_NAME = "wall_replacement_texture"
+    tex_index.replace_texture(
+        wall_tex_name, WALL_TEX_NAME, file=str(new_wall_texture_file), type="2d"
+    )
+
+    # step 3: reference new textures in materials
+    tex_index.set_material_texture(_is_wall_mat, WALL_TEX_NAME, texrepeat="3 3")
+
+
+def replace_textures_in_tree(
+    root, cab_tex=None, counter_tex=None, wall_tex=None, floor_tex=None
+):
+    """
+    Applies the cabinet, counter top, wall and floor texture replacements (in this order) in-place to a parsed model.
+    The materials and textures of the model are indexed once and shared by all replacements.
+
+    Args:
+        root (Element): root element of the model (lxml or xml.etree)
+
+        cab_tex (str): new texture file for counter base and cabinets. Skipped if None
+
+        counter_tex (str): new texture file for counter top. Skipped if None
+
+        wall_tex (str): new texture file for walls. Skipped if None
+
+        floor_tex (str): new texture file for floor. Skipped if None
+    """
+    tex_index = TextureIndex(root)
+    if cab_tex is not None:
+        _replace_cab_textures_in_index(tex_index, os.path.join(TEXTURES_DIR, cab_tex))
+    if counter_tex is not None:
+        _replace_counter_top_texture_in_index(
+            tex_index, os.path.join(TEXTURES_DIR, counter_tex)
+        )
+    if wall_tex is not None:
+        _replace_wall_texture_in_index(tex_index, os.path.join(TEXTURES_DIR, wall_tex))
+    if floor_tex is not None:
+        _replace_floor_texture_in_index(
+            tex_index, os.path.join(TEXTURES_DIR, floor_tex)
+        )
+
+
 def replace_counter_top_texture(
     rng, initial_state: str, new_counter_top_texture_file: str = None
 ):
@@ -470,38 +651,11 @@ def replace_counter_top_texture(
     """
 
     root = ET.fromstring(initial_state)
-    asset = root.find("asset")
 
     if new_counter_top_texture_file is None:
         new_counter_top_texture_file = get_random_textures(rng)["counter_tex"]
-    else:
-        new_counter_top_texture_file = os.path.join(
-            TEXTURES_DIR, new_counter_top_texture_file
-        )
-
-    # step 1: find the name of texture that will be replaced
-    counter_tex_name = None
-    for mat in asset.findall("material"):
-        name = mat.get("name")
-        if "counter_top" in name:
-            counter_tex_name = mat.get("texture")
-            break
-    assert counter_tex_name is not None
-
-    # step 2: find and replace texture element
-    CTOP_TEX_NAME = "counter_top_replacement_texture"
-    for tex in asset.findall("texture"):
-        name = tex.get("name")
-        if name == counter_tex_name:
-            tex.set("name", CTOP_TEX_NAME)
-            tex.set("file", str(new_counter_top_texture_file))
-
-    # step 3: reference new textures in materials
-    for mat in asset.findall("material"):
-        name = mat.get("name")
-        if "counter_top" in name:
-            mat.set("texture", CTOP_TEX_NAME)
 
+    replace_textures_in_tree(root, counter_tex=new_counter_top_texture_file)
     return ET.tostring(root).decode("utf-8")
 
 
@@ -519,62 +673,11 @@ def replace_cab_textures(rng, initial_state: str, new_cab_texture_file: str = No
     """
 
     root = ET.fromstring(initial_state)
-    asset = root.find("asset")
 
     if new_cab_texture_file is None:
         new_cab_texture_file = get_random_textures(rng)["cab_tex"]
-    else:
-        new_cab_texture_file = os.path.join(TEXTURES_DIR, new_cab_texture_file)
-
-    CAB_TEX_NAME_2D = "cab_replacement_texture_2d"
-    tex_2d = find_elements(
-        asset, tags="texture", attribs={"name": CAB_TEX_NAME_2D}, return_first=True
-    )
-    if tex_2d is not None:
-        tex_2d.set("file", str(new_cab_texture_file))
-    else:
-        tex_2d = ET.Element(
-            "texture", type="2d", name=CAB_TEX_NAME_2D, file=str(new_cab_texture_file)
-        )
-        asset.append(tex_2d)
-
-    CAB_TEX_NAME_CUBE = "cab_replacement_texture_cube"
-    tex_cube = find_elements(
-        asset, tags="texture", attribs={"name": CAB_TEX_NAME_CUBE}, return_first=True
-    )
-    if tex_cube is not None:
-        tex_cube.set("file", str(new_cab_texture_file))
-    else:
-        tex_cube = ET.Element(
-            "texture",
-            type="cube",
-            name=CAB_TEX_NAME_CUBE,
-            file=str(new_cab_texture_file),
-        )
-        asset.append(tex_cube)
-
-    for mat in asset.findall("material"):
-        name = mat.get("name")
-        if "counter_base" in name:
-            mat.set("texture", CAB_TEX_NAME_CUBE)
-        elif "housing" in name:
-            mat.set("texture", CAB_TEX_NAME_CUBE)
-        elif (
-            "stack" in name
-            or "cab" in name
-            or "shelves" in name
-            or "bottom" in name
-            or ("top" in name and "counter" not in name and "stove" not in name)
-        ):
-            if "handle" in name or "transparent" in name:
-                continue
-            elif "door" in name:
-                mat.set("texture", CAB_TEX_NAME_2D)
-            elif "shelves" in name:
-                mat.set("texture", CAB_TEX_NAME_2D)
-            else:
-                mat.set("texture", CAB_TEX_NAME_CUBE)
 
+    replace_textures_in_tree(root, cab_tex=new_cab_texture_file)
     return ET.tostring(root).decode("utf-8")
 
 
@@ -592,38 +695,11 @@ def replace_floor_texture(rng, initial_state: str, new_floor_texture_file: str =
     """
 
     root = ET.fromstring(initial_state)
-    asset = root.find("asset")
 
     if new_floor_texture_file is None:
         new_floor_texture_file = get_random_textures(rng)["floor_tex"]
-    else:
-        new_floor_texture_file = os.path.join(TEXTURES_DIR, new_floor_texture_file)
-
-    # step 1: find the name of texture that will be replaced
-    floor_tex_name = None
-    for mat in asset.findall("material"):
-        name = mat.get("name")
-        if "floor" in name and "backing" not in name:
-            floor_tex_name = mat.get("texture")
-            break
-    assert floor_tex_name is not None
-
-    # step 2: find and replace texture element
-    FLOOR_TEX_NAME = "floor_replacement_texture"
-    for tex in asset.findall("texture"):
-        name = tex.get("name")
-        if name == floor_tex_name:
-            tex.set("name", FLOOR_TEX_NAME)
-            tex.set("file", str(new_floor_texture_file))
-            tex.set("type", "2d")
-
-    # step 3: reference new textures in materials
-    for mat in asset.findall("material"):
-        name = mat.get("name")
-        if "floor" in name and "backing" not in name:
-            mat.set("texture", FLOOR_TEX_NAME)
-            mat.set("texrepeat", "2 2")
 
+    replace_textures_in_tree(root, floor_tex=new_floor_texture_file)
     return ET.tostring(root).decode("utf-8")
 
 
@@ -641,36 +717,9 @@ def replace_wall_texture(rng, initial_state: str, new_wall_texture_file: str = N
     """
 
     root = ET.fromstring(initial_state)
-    asset = root.find("asset")
 
     if new_wall_texture_file is None:
         new_wall_texture_file = get_random_textures(rng)["wall_tex"]
-    else:
-        new_wall_texture_file = os.path.join(TEXTURES_DIR, new_wall_texture_file)
-
-    # step 1: find the name of texture that will be replaced
-    wall_tex_name = None
-    for mat in asset.findall("material"):
-        name = mat.get("name")
-        if "wall" in name and "floor" not in name and "backing" not in name:
-            wall_tex_name = mat.get("texture")
-            break
-    assert wall_tex_name is not None
-
-    # step 2: add new texture element
-    WALL_TEX_NAME = "wall_replacement_texture"
-    for tex in asset.findall("texture"):
-        name = tex.get("name")
-        if name == wall_tex_name:
-            tex.set("name", WALL_TEX_NAME)
-            tex.set("file", str(new_wall_texture_file))
-            tex.set("type", "2d")
-
-    # step 3: reference new textures in materials
-    for mat in asset.findall("material"):
-        name = mat.get("name")
-        if "wall" in name and "floor" not in name and "backing" not in name:
-            mat.set("texture", WALL_TEX_NAME)
-            mat.set("texrepeat", "3 3")
 
+    replace_textures_in_tree(root, wall_tex=new_wall_texture_file)
     return ET.tostring(root).decode("utf-8")
@@ -3,11 +3,11 @@ from __future__ import annotations
 from typing import Dict, Optional
 
 import numpy as np
-import yaml
 from robosuite.wrappers import Wrapper
 from pynput.keyboard import Key, Listener
 
 import robocasa.models.scenes.scene_registry as SceneRegistry
+from robocasa.models.scenes.config_cache import load_yaml_config
 
 
 def _unwrap_env(env):
@@ -191,8 +191,7 @@ class EnclosingWallRenderWrapper(Wrapper):
     @staticmethod
     def _get_enclosing_wall_names_from_layout(layout_id: int) -> list[str]:
         layout_path = SceneRegistry.get_layout_path(layout_id)
-        with open(layout_path, "r") as f:
-            layout_data = yaml.safe_load(f) or {}
+        layout_data = load_yaml_config(layout_path) or {}
         walls = (layout_data.get("room") or {}).get("walls") or []
         return [w.get("name") for w in walls if w.get("enclosing_wall", False) is True]
 
@@ -373,7 +373,7 @@ class RoboCasaGymEnv(gym.Env):
 
         raw_obs, reward, done, info = self.env.step(env_action)
         # sparse reward
-        is_success = self.env._check_success()
+        is_success = self.env.check_success()
         reward = 1.0 if is_success else 0.0
 
         obs = self.get_observation(raw_obs)
@@ -414,10 +414,12 @@ def create_robocasa_gym_env_class(env):
 
     current_module = sys.modules["robocasa.wrappers.gym_wrapper"]
     setattr(current_module, class_name, env_class_type)
-    register(
-        id=id_name,  # Unique ID for the environment
-        entry_point=f"robocasa.wrappers.gym_wrapper:{class_name}",  # Path to your environment class
-    )
+    # environments are usually registered lazily on import robocasa already
+    if id_name not in gym.envs.registry:
+        register(
+            id=id_name,  # Unique ID for the environment
+            entry_point=f"robocasa.wrappers.gym_wrapper:{class_name}",  # Path to your environment class
+        )
 
 
 for ENV in REGISTERED_ENVS:
@@ -0,0 +1,161 @@
+import os
+import tempfile
+import unittest
+
+import mujoco
+import numpy as np
+from PIL import Image
+from robosuite.models.world import MujocoWorldBase
+
+import robocasa.macros as macros
+import robocasa.utils.asset_cache as AssetCache
+from robocasa.models.fixtures.fixture import Fixture
+
+# fixtures with meshes and textures, some of them with the same file names
+FIXTURE_XMLS = [
+    "fixtures/accessories/outlets/simple_white",
+    "fixtures/accessories/light_switches/white_wide_switch",
+]
+
+MESH_OBJ = """v 0 0 0
+v {size} 0 0
+v 0 {size} 0
+v 0 0 {size}
+f 1 3 2
+f 1 2 4
+f 1 4 3
+f 2 3 4
+"""
+
+ASSET_XML = """
+<mujoco model="assets">
+  <asset>
+    <mesh name="tetra" file="{dir}/tetra.obj"/>
+    <mesh name="tetra_scaled" file="{dir}/tetra.obj" scale="2 1 1"/>
+    <texture name="cube" type="cube" fileright="{dir}/right.png" fileleft="{dir}/left.png"
+      fileup="{dir}/up.png" filedown="{dir}/down.png" filefront="{dir}/front.png" fileback="{dir}/back.png"/>
+    <texture name="skin" type="2d" file="{dir}/sub/image0.png"/>
+    <hfield name="terrain" file="{dir}/terrain.png" size="1 1 0.2 0.1"/>
+    <material name="cube_mat" texture="cube"/>
+  </asset>
+  <worldbody>
+    <geom type="mesh" mesh="tetra" material="cube_mat"/>
+    <geom type="mesh" mesh="tetra_scaled" pos="1 0 0"/>
+    <geom type="hfield" hfield="terrain" pos="0 2 0"/>
+  </worldbody>
+</mujoco>
+"""
+
+
+def model_to_bytes(model):
+    buffer = np.zeros(mujoco.mj_sizeModel(model), dtype=np.uint8)
+    mujoco.mj_saveModel(model, None, buffer)
+    return buffer.tobytes()
+
+
+class TestAssetCache(unittest.TestCase):
+    def setUp(self):
+        self.max_bytes = macros.ASSET_CACHE_MAX_BYTES
+        macros.ASSET_CACHE_MAX_BYTES = 64 * 1024**2
+        AssetCache.clear_asset_cache()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.write_assets(mesh_size=1.0)
+
+    def tearDown(self):
+        macros.ASSET_CACHE_MAX_BYTES = self.max_bytes
+        AssetCache.clear_asset_cache()
+        self.tmp_dir.cleanup()
+
+    def write_assets(self, mesh_size):
+        asset_dir = self.tmp_dir.name
+        os.makedirs(os.path.join(asset_dir, "sub"), exist_ok=True)
+        with open(os.path.join(asset_dir, "tetra.obj"), "w") as f:
+            f.write(MESH_OBJ.format(size=mesh_size))
+        rng = np.random.default_rng(int(mesh_size * 10))
+        for fname in ["right", "left", "up", "down", "front", "back", "sub/image0"]:
+            image = rng.integers(0, 256, (8, 8, 3), dtype=np.uint8)
+            Image.fromarray(image).save(os.path.join(asset_dir, fname + ".png"))
+        terrain = rng.integers(0, 256, (16, 16), dtype=np.uint8)
+        Image.fromarray(terrain).save(os.path.join(asset_dir, "terrain.png"))
+
+    def get_xml(self):
+        world = MujocoWorldBase()
+        for (i, xml) in enumerate(FIXTURE_XMLS):
+            fixture = Fixture(xml=xml, name="fixture_{}".format(i))
+            world.worldbody.append(fixture.get_obj())
+            world.merge_assets(fixture)
+        xml_str = world.get_xml()
+        # add the test assets to the merged fixtures
+        asset_xml = ASSET_XML.format(dir=self.tmp_dir.name)
+        asset_start = asset_xml.index("<asset>") + len("<asset>")
+        asset_end = asset_xml.index("</asset>")
+        world_start = asset_xml.index("<worldbody>") + len("<worldbody>")
+        world_end = asset_xml.index("</worldbody>")
+        xml_str = xml_str.replace(
+            "<asset>", "<asset>" + asset_xml[asset_start:asset_end], 1
+        )
+        xml_str = xml_str.replace(
+            "<worldbody>", "<worldbody>" + asset_xml[world_start:world_end], 1
+        )
+        return xml_str
+
+    def assert_compiles_same(self, xml_str):
+        np.testing.assert_equal(
+            np.frombuffer(model_to_bytes(AssetCache.compile_model(xml_str)), np.uint8),
+            np.frombuffer(
+                model_to_bytes(mujoco.MjModel.from_xml_string(xml_str)), np.uint8
+            ),
+        )
+
+    def test_compile_matches_mujoco(self):
+        """
+        Models compiled through the cache should match models compiled by MuJoCo from the files on disk, on
+        cache misses and hits, with the cache disabled, and after asset files change
+        """
+        xml_str = self.get_xml()
+        paths = AssetCache.get_asset_paths(xml_str)
+        # files that share their name with another file are read from disk
+        fnames = [os.path.basename(path) for path in paths]
+        self.assertEqual(len(fnames), len(set(fnames)))
+        self.assertNotIn("image0.png", fnames)
+        self.assertIn("tetra.obj", fnames)
+        self.assertIn("right.png", fnames)
+
+        self.assert_compiles_same(xml_str)
+        stats = AssetCache.get_asset_cache_stats()
+        self.assertEqual(stats["misses"], len(paths))
+        self.assertEqual(stats["num_assets"], len(paths))
+
+        self.assert_compiles_same(xml_str)
+        self.assertEqual(AssetCache.get_asset_cache_stats()["hits"], len(paths))
+
+        # only the changed files are read again
+        self.write_assets(mesh_size=1.5)
+        self.assert_compiles_same(xml_str)
+        num_changed = len([p for p in paths if p.startswith(self.tmp_dir.name)])
+        self.assertEqual(
+            AssetCache.get_asset_cache_stats()["misses"], len(paths) + num_changed
+        )
+
+        macros.ASSET_CACHE_MAX_BYTES = 0
+        self.assert_compiles_same(xml_str)
+
+    def test_eviction(self):
+        """
+        The cache should hold at most macros.ASSET_CACHE_MAX_BYTES, and models should still match when
+        assets are evicted
+        """
+        xml_str = self.get_xml()
+        self.assert_compiles_same(xml_str)
+        num_bytes = AssetCache.get_asset_cache_stats()["num_bytes"]
+
+        macros.ASSET_CACHE_MAX_BYTES = num_bytes // 2
+        for _ in range(2):
+            self.assert_compiles_same(xml_str)
+            stats = AssetCache.get_asset_cache_stats()
+            self.assertLessEqual(stats["num_bytes"], num_bytes // 2)
+            self.assertGreater(stats["evictions"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
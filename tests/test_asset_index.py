@@ -0,0 +1,160 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import robocasa.models.objects.asset_index as AssetIndex
+from robocasa.models.objects.asset_index import ObjectAssetIndex, read_bbox_half_size
+
+MODEL_XML = """
+<mujoco model="{name}">
+  <worldbody>
+    <body>
+      <body name="object">
+        <geom name="reg_bbox" type="box" pos="0 0 0" size="{size}"/>
+      </body>
+    </body>
+  </worldbody>
+</mujoco>
+"""
+
+
+def write_model(model_dir, size, fname="model.xml"):
+    os.makedirs(model_dir, exist_ok=True)
+    with open(os.path.join(model_dir, fname), "w") as f:
+        f.write(MODEL_XML.format(name=os.path.basename(model_dir), size=size))
+
+
+def scan_folder(root, folder):
+    """
+    Reference listing of the models of a category folder, read directly from disk
+    """
+    cat_path = os.path.join(root, folder)
+    mjcf_paths = []
+    for model_name in sorted(os.listdir(cat_path)):
+        mjcf_path = os.path.join(cat_path, model_name, "model.xml")
+        if os.path.exists(mjcf_path):
+            mjcf_paths.append(mjcf_path)
+    return mjcf_paths
+
+
+class TestAssetIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.tmp_dir.name, "objects")
+        self.index_path = os.path.join(self.tmp_dir.name, "cache", "asset_index.json")
+        for (i, name) in enumerate(["apple_0", "apple_1", "apple_2"]):
+            write_model(
+                os.path.join(self.root, "objaverse", "apple", name),
+                "0.0{} 0.04 0.05".format(i + 1),
+            )
+        write_model(
+            os.path.join(self.root, "objaverse", "apple", "apple_1"),
+            "0.04 0.05 0.01",
+            fname="model_upright.xml",
+        )
+
+        # count the models whose xml files are checked for changes
+        self.checked_dirs = []
+        self.get_model_signature = AssetIndex.get_model_signature
+
+        def get_model_signature(model_dir):
+            self.checked_dirs.append(model_dir)
+            return self.get_model_signature(model_dir)
+
+        AssetIndex.get_model_signature = get_model_signature
+
+    def tearDown(self):
+        AssetIndex.get_model_signature = self.get_model_signature
+        self.tmp_dir.cleanup()
+
+    def assert_matches_scan(self, index, folder):
+        mjcf_paths = index.get_mjcf_paths(folder)
+        self.assertEqual(mjcf_paths, scan_folder(self.root, folder))
+        upright_paths = [
+            os.path.join(os.path.dirname(p), "model_upright.xml") for p in mjcf_paths
+        ]
+        for paths in [mjcf_paths, upright_paths]:
+            expected = np.array(
+                [read_bbox_half_size(p) or [np.nan] * 3 for p in paths], dtype=float
+            )
+            np.testing.assert_array_equal(index.get_half_sizes(paths), expected)
+
+    def test_index_matches_scan(self):
+        """
+        Models and bounding box sizes from the index should match those read from disk, including after the
+        index is saved and loaded again, and after models change
+        """
+        index = ObjectAssetIndex(root=self.root, index_path=self.index_path)
+        self.assert_matches_scan(index, "objaverse/apple")
+        index.save()
+        self.assertTrue(os.path.exists(self.index_path))
+
+        # a model xml changes, without changing the folder
+        write_model(
+            os.path.join(self.root, "objaverse", "apple", "apple_0"),
+            "0.2 0.3 0.4",
+        )
+        index = ObjectAssetIndex(root=self.root, index_path=self.index_path)
+        self.assertGreater(len(index._folders), 0)
+        self.assert_matches_scan(index, "objaverse/apple")
+        index.save()
+
+        # a model is added
+        write_model(
+            os.path.join(self.root, "objaverse", "apple", "apple_3"),
+            "0.01 0.01 0.01",
+        )
+        index = ObjectAssetIndex(root=self.root, index_path=self.index_path)
+        self.assert_matches_scan(index, "objaverse/apple")
+        index.save()
+
+    def test_models_checked_on_size_lookup(self):
+        """
+        Listing models should only check the folder. Models should be checked for changes when their size is
+        first looked up, and on rebuild
+        """
+        index = ObjectAssetIndex(root=self.root, index_path=self.index_path)
+        index.get_mjcf_paths("objaverse/apple")
+        index.save()
+
+        model_dir = os.path.join(self.root, "objaverse", "apple", "apple_1")
+        write_model(model_dir, "0.2 0.3 0.4")
+        index = ObjectAssetIndex(root=self.root, index_path=self.index_path)
+        del self.checked_dirs[:]
+        for _ in range(2):
+            mjcf_paths = index.get_mjcf_paths("objaverse/apple")
+        self.assertEqual(self.checked_dirs, [])
+
+        upright_path = os.path.join(model_dir, "model_upright.xml")
+        for _ in range(2):
+            half_sizes = index.get_half_sizes([mjcf_paths[1], upright_path])
+            np.testing.assert_array_equal(
+                half_sizes, [[0.2, 0.3, 0.4], [0.04, 0.05, 0.01]]
+            )
+        # checked once, and its signature read again as the model changed
+        self.assertEqual(self.checked_dirs, [model_dir, model_dir])
+
+        # models changed after their sizes were looked up are read again on rebuild
+        write_model(model_dir, "0.5 0.5 0.5")
+        index.rebuild()
+        self.assertEqual(len(self.checked_dirs), 2 + len(mjcf_paths) + 1)
+        np.testing.assert_array_equal(
+            index.get_half_sizes([mjcf_paths[1]]), [[0.5, 0.5, 0.5]]
+        )
+        self.assert_matches_scan(index, "objaverse/apple")
+
+    def test_no_writes_to_asset_zoo(self):
+        """
+        Building and saving the index should not write into the asset zoo
+        """
+        index = ObjectAssetIndex(root=self.root, index_path=self.index_path)
+        index.get_mjcf_paths("objaverse/apple")
+        index.save()
+        self.assertEqual(os.listdir(self.root), ["objaverse"])
+        self.assertEqual(os.listdir(os.path.join(self.root, "objaverse")), ["apple"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import tempfile
+import unittest
+
+import yaml
+
+import robocasa
+import robocasa.macros as macros
+import robocasa.models.scenes.config_cache as ConfigCache
+
+
+def find_yaml_configs():
+    """
+    Paths of all yaml configs included in the config bundle
+    """
+    paths = []
+    for folder in ConfigCache.CONFIG_BUNDLE_FOLDERS:
+        folder_path = os.path.join(robocasa.models.assets_root, folder)
+        for (dirpath, dirnames, filenames) in os.walk(folder_path):
+            paths += [
+                os.path.join(dirpath, fname)
+                for fname in filenames
+                if fname.endswith(".yaml")
+            ]
+    return sorted(paths)
+
+
+def parse_yaml(path):
+    with open(path, "r") as f:
+        return yaml.safe_load(f)
+
+
+class TestConfigCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = macros.CACHE_DIR
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        macros.CACHE_DIR = self.tmp_dir.name
+        ConfigCache.clear_config_cache()
+
+    def tearDown(self):
+        ConfigCache.clear_config_cache()
+        macros.CACHE_DIR = self.cache_dir
+        self.tmp_dir.cleanup()
+
+    def test_configs_match_yaml(self):
+        """
+        Configs loaded through the cache, with and without the config bundle, should match the parsed yaml
+        files, and callers modifying a loaded config should not affect later loads
+        """
+        paths = find_yaml_configs()
+        self.assertGreater(len(paths), 0)
+        expected = {path: parse_yaml(path) for path in paths}
+        self.assertFalse(os.path.exists(ConfigCache.get_config_bundle_path()))
+        for path in paths:
+            self.assertEqual(ConfigCache.load_yaml_config(path), expected[path])
+
+        num_configs = ConfigCache.build_config_bundle()
+        self.assertEqual(num_configs, len(paths))
+        # the bundle is written to the cache directory, not to the assets
+        self.assertEqual(
+            os.path.dirname(ConfigCache.get_config_bundle_path()), self.tmp_dir.name
+        )
+        self.assertTrue(os.path.exists(ConfigCache.get_config_bundle_path()))
+
+        ConfigCache.clear_config_cache()
+        for path in paths:
+            config = ConfigCache.load_yaml_config(path)
+            self.assertEqual(config, expected[path])
+            if isinstance(config, dict):
+                config["modified"] = True
+                self.assertEqual(ConfigCache.load_yaml_config(path), expected[path])
+
+    def test_changed_config(self):
+        """
+        A config whose yaml file changed after it was cached should be parsed again
+        """
+        path = os.path.join(self.tmp_dir.name, "layout.yaml")
+        with open(path, "w") as f:
+            f.write("room:\n  walls: [1, 2]\n")
+        self.assertEqual(ConfigCache.load_yaml_config(path), parse_yaml(path))
+
+        with open(path, "w") as f:
+            f.write("room:\n  walls: [1, 2, 3]\n  floor: tiles\n")
+        self.assertEqual(ConfigCache.load_yaml_config(path), parse_yaml(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import itertools
+import unittest
+
+from robosuite.models.base import MujocoModel
+from robosuite.utils.binding_utils import MjSim
+from robosuite.utils.sim_utils import check_contact
+
+from robocasa.utils.contact_index import ContactIndex
+
+# objects dropped in a pile on a table, so that the set of contacts changes over the rollout
+SCENE_XML = """
+<mujoco model="contacts">
+  <worldbody>
+    <geom name="floor" type="plane" size="2 2 0.1"/>
+    <geom name="table" type="box" pos="0 0 0.2" size="0.4 0.4 0.2"/>
+    <body name="box" pos="0.05 0 0.6">
+      <freejoint/>
+      <geom name="box_g0" type="box" size="0.05 0.05 0.05"/>
+      <geom name="box_g1" type="sphere" pos="0.06 0 0" size="0.03"/>
+    </body>
+    <body name="can" pos="0 0.02 0.9">
+      <freejoint/>
+      <geom name="can_g0" type="cylinder" size="0.04 0.06"/>
+    </body>
+    <body name="ball" pos="0.35 0.3 1.2">
+      <freejoint/>
+      <geom name="ball_g0" type="sphere" size="0.05"/>
+    </body>
+    <body name="ghost" pos="-0.2 0 0.5">
+      <freejoint/>
+      <geom name="ghost_g0" type="sphere" size="0.05" contype="2" conaffinity="2"/>
+    </body>
+  </worldbody>
+</mujoco>
+"""
+
+
+class GeomGroup(MujocoModel):
+    """
+    Minimal model whose contact geoms are a fixed list of geom names
+    """
+
+    def __init__(self, name, contact_geoms):
+        self._name = name
+        self._contact_geoms = contact_geoms
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def contact_geoms(self):
+        return self._contact_geoms
+
+
+BOX = GeomGroup("box", ["box_g0", "box_g1"])
+CAN = GeomGroup("can", ["can_g0"])
+
+# geom groups in all forms accepted by check_contact, including geoms that are not in the model
+GROUPS = [
+    "floor",
+    "table",
+    "box_g1",
+    "ghost_g0",
+    "missing_geom",
+    ["box_g0", "box_g1"],
+    ["can_g0", "ball_g0", "missing_geom"],
+    ("table", "floor"),
+    BOX,
+    CAN,
+]
+
+
+class TestContactIndex(unittest.TestCase):
+    def test_check_contact_matches_robosuite(self):
+        """
+        Contact queries through the index should match robosuite's check_contact at every step, for every pair
+        of geom groups, and repeated queries within a step should read the cached results
+        """
+        sim = MjSim.from_xml_string(SCENE_XML)
+        sim.forward()
+        index = ContactIndex(sim)
+        num_contacts = set()
+        num_true = 0
+        for _ in range(400):
+            sim.step()
+            num_contacts.add(sim.data.ncon)
+            for _ in range(2):
+                for geoms_1 in GROUPS:
+                    for geoms_2 in GROUPS + [None]:
+                        expected = check_contact(sim, geoms_1, geoms_2)
+                        self.assertEqual(
+                            index.check_contact(geoms_1, geoms_2), expected
+                        )
+                        num_true += expected
+        # the rollout covers several different contact sets
+        self.assertGreater(len(num_contacts), 2)
+        self.assertGreater(num_true, 0)
+
+    def test_external_contact(self):
+        """
+        External contact checks should match a scan over the active contacts, for groups given by geom id
+        """
+        sim = MjSim.from_xml_string(SCENE_XML)
+        sim.forward()
+        index = ContactIndex(sim)
+        names = ["box_g0", "box_g1", "can_g0", "ball_g0", "table"]
+        groups = []
+        for size in [1, 2, 3]:
+            groups += list(itertools.combinations(names, size))
+        for _ in range(400):
+            sim.step()
+            for group in groups:
+                geom_ids = [sim.model.geom_name2id(name) for name in group]
+                mask = index.get_id_mask("_".join(group), geom_ids)
+                expected = any(
+                    (contact.geom1 in geom_ids) != (contact.geom2 in geom_ids)
+                    for contact in sim.data.contact[: sim.data.ncon]
+                )
+                self.assertEqual(index.check_external_contact(mask), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
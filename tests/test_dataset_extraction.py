@@ -0,0 +1,223 @@
+import os
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+import h5py
+import numpy as np
+
+import robocasa.utils.robomimic.robomimic_dataset_utils as DatasetUtils
+from robocasa.scripts.dataset_scripts.dataset_states_to_obs import (
+    extract_trajectory,
+    extract_trajectory_streaming,
+    write_sharded_output,
+)
+
+
+class StateReplayEnv:
+    """
+    Stand-in for the env wrapper used during extraction. Observations, rewards and successes are deterministic
+    functions of the simulation state that was last loaded
+    """
+
+    def __init__(self):
+        self.env = SimpleNamespace(get_ep_meta=lambda: dict(lang="test"))
+        self.state = None
+
+    def reset(self):
+        self.state = None
+
+    def reset_to(self, state):
+        self.state = np.array(state["states"])
+        return dict(
+            robot0_eef_pos=self.state[:3].copy(),
+            robot0_agentview_image=(np.outer(self.state, self.state) * 100).astype(
+                np.uint8
+            )[..., None],
+        )
+
+    def get_reward(self):
+        return float(self.state[0] > 0.5)
+
+    def is_success(self):
+        return dict(task=bool(self.state[1] > 0.5))
+
+
+def make_demo(seed, traj_len, state_dim=6):
+    rng = np.random.default_rng(seed)
+    states = rng.random((traj_len, state_dim))
+    actions = rng.random((traj_len, 4))
+    initial_state = dict(states=states[0] if traj_len > 0 else rng.random(state_dim))
+    return initial_state, states, actions
+
+
+def write_temp_file(path, demos):
+    """
+    Writes a per-process output file, as written by the extraction workers
+    """
+    with h5py.File(path, "w") as f:
+        data_grp = f.create_group("data")
+        data_grp.attrs["env_args"] = '{"env_name": "test"}'
+        for demo in demos:
+            rng = np.random.default_rng(int(demo.split("_")[-1]))
+            traj_len = 5 + int(demo.split("_")[-1])
+            ep_data_grp = data_grp.create_group(demo)
+            ep_data_grp.create_dataset("actions", data=rng.random((traj_len, 12)))
+            ep_data_grp.create_dataset(
+                "obs/robot0_eef_pos",
+                data=rng.random((traj_len, 3)),
+                compression="gzip",
+            )
+            ep_data_grp.attrs["num_samples"] = traj_len
+            ep_data_grp.attrs["ep_meta"] = '{"lang": "test"}'
+
+
+def read_group(grp):
+    """
+    Reads all datasets and attributes under an hdf5 group, following links
+    """
+    contents = {"@" + k: str(v) for (k, v) in grp.attrs.items()}
+    for (k, v) in grp.items():
+        if isinstance(v, h5py.Group):
+            contents[k] = read_group(v)
+        else:
+            contents[k] = v[()]
+    return contents
+
+
+class TestDatasetExtraction(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_streaming_matches_in_memory(self):
+        """
+        Observations, rewards and dones written by the streaming extraction should match those of the
+        in-memory extraction, for any chunk size, including for empty demos
+        """
+        env = StateReplayEnv()
+        path = os.path.join(self.tmp_dir.name, "out.hdf5")
+        with h5py.File(path, "w") as f:
+            for traj_len in [0, 1, 7, 64]:
+                for chunk_size in [1, 3, 64]:
+                    for done_mode in [0, 1, 2]:
+                        initial_state, states, actions = make_demo(traj_len, traj_len)
+                        traj = extract_trajectory(
+                            env=env,
+                            initial_state=dict(initial_state),
+                            states=states,
+                            actions=actions,
+                            done_mode=done_mode,
+                        )
+                        grp = f.create_group(
+                            "demo_{}_{}_{}".format(traj_len, chunk_size, done_mode)
+                        )
+                        traj_stream = extract_trajectory_streaming(
+                            env=env,
+                            initial_state=dict(initial_state),
+                            states=states,
+                            actions=actions,
+                            done_mode=done_mode,
+                            ep_data_grp=grp,
+                            chunk_size=chunk_size,
+                            include_next_obs=True,
+                        )
+
+                        for k in ["rewards", "dones", "actions", "states"]:
+                            np.testing.assert_array_equal(
+                                traj_stream[k].reshape(-1),
+                                np.asarray(traj[k]).reshape(-1),
+                            )
+                        self.assertEqual(
+                            traj_stream["initial_state_dict"]["ep_meta"],
+                            traj["initial_state_dict"]["ep_meta"],
+                        )
+                        if traj_len == 0:
+                            self.assertNotIn("obs", grp)
+                            self.assertNotIn("next_obs", grp)
+                            continue
+                        self.assertEqual(set(grp["obs"]), set(traj["obs"]))
+                        for k in traj["obs"]:
+                            obs = grp["obs/{}".format(k)][()]
+                            np.testing.assert_array_equal(obs, traj["obs"][k])
+                            # next obs at t is the obs at t + 1, and the last one repeats the last obs
+                            np.testing.assert_array_equal(
+                                grp["next_obs/{}".format(k)][()],
+                                np.concatenate([obs[1:], obs[-1:]]),
+                            )
+
+    def assert_same_contents(self, contents_1, contents_2):
+        self.assertEqual(set(contents_1), set(contents_2))
+        for k in contents_1:
+            if isinstance(contents_1[k], dict):
+                self.assert_same_contents(contents_1[k], contents_2[k])
+            else:
+                np.testing.assert_array_equal(contents_1[k], contents_2[k])
+
+    def test_sharded_matches_merged(self):
+        """
+        A sharded output (index of links into the per-process files) should read the same as the merged
+        output, after the post-processing steps of dataset_states_to_obs_mp, and after being moved
+        """
+        tmp = self.tmp_dir.name
+        source_path = os.path.join(tmp, "demo.hdf5")
+        with h5py.File(source_path, "w") as f:
+            f.create_dataset("mask/train", data=np.array([b"demo_0", b"demo_2"]))
+        demos = ["demo_0", "demo_1", "demo_2", "demo_3", "demo_5"]
+        demo_locations = dict()
+        demos_per_proc = [["demo_0", "demo_2"], ["demo_1", "demo_5"]]
+        for (i, proc_demos) in enumerate(demos_per_proc):
+            for name in ["temp_{}.hdf5", "merge_temp_{}.hdf5"]:
+                write_temp_file(os.path.join(tmp, name.format(i)), proc_demos)
+            for demo in proc_demos:
+                demo_locations[demo] = os.path.join(tmp, "temp_{}.hdf5".format(i))
+
+        # reference: demos copied into a single file, as in dataset_states_to_obs_mp
+        merged_path = os.path.join(tmp, "merged.hdf5")
+        with h5py.File(merged_path, "w") as f_out:
+            data_grp = f_out.create_group("data")
+            total_samples = 0
+            for demo in demos:
+                if demo not in demo_locations:
+                    continue
+                temp_file = demo_locations[demo].replace("temp_", "merge_temp_")
+                with h5py.File(temp_file, "r") as f_temp:
+                    f_temp.copy("data/{}".format(demo), data_grp)
+                    total_samples += data_grp[demo].attrs["num_samples"]
+                    if "env_args" not in data_grp.attrs:
+                        data_grp.attrs["env_args"] = f_temp["data"].attrs["env_args"]
+            with h5py.File(source_path, "r") as f:
+                f.copy("mask", f_out)
+            data_grp.attrs["total"] = total_samples
+
+        sharded_path = os.path.join(tmp, "sharded.hdf5")
+        write_sharded_output(
+            output_path=sharded_path,
+            demos=demos,
+            demo_locations=demo_locations,
+            source_dataset=source_path,
+        )
+
+        for path in [merged_path, sharded_path]:
+            DatasetUtils.extract_action_dict(dataset=path)
+            DatasetUtils.make_demo_ids_contiguous(dataset=path)
+
+        with h5py.File(merged_path, "r") as f:
+            merged = read_group(f)
+        self.assertIn("demo_3", merged["data"])
+
+        # the index and its shards can be moved together
+        moved_dir = os.path.join(tmp, "moved")
+        os.makedirs(moved_dir)
+        for fname in os.listdir(tmp):
+            if fname.startswith("sharded"):
+                shutil.move(os.path.join(tmp, fname), moved_dir)
+        with h5py.File(os.path.join(moved_dir, "sharded.hdf5"), "r") as f:
+            self.assert_same_contents(read_group(f), merged)
+
+
+if __name__ == "__main__":
+    unittest.main()
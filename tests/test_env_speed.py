@@ -1,7 +1,7 @@
-from robocasa.scripts.bench_speed import run_bench, get_args
+from robocasa.scripts.bench_speed import bench_env, summarize
 
 import argparse
-import numpy as np
+import json
 from termcolor import colored
 
 TASKS_COMPOSITE30 = [
@@ -51,6 +51,9 @@ if __name__ == "__main__":
         type=int,
         nargs="+",
     )
+    parser.add_argument("--num_resets", type=int, default=5)
+    parser.add_argument("--num_steps", type=int, default=100)
+    parser.add_argument("--out", type=str, default=None)
     args = parser.parse_args()
 
     all_infos = {}
@@ -67,31 +70,38 @@ if __name__ == "__main__":
         all_infos[task] = {}
         for layout in layout_list:
             print(colored(f"Task: {task}; Layout: {layout}", "yellow"))
-            info = run_bench(
+            samples = bench_env(
                 env_name=task,
-                robots="PandaOmron",
-                onscreen=True,
-                camera="robot0_frontview",
-                seed=0,
-                n_trials=30,
+                robot="PandaOmron",
                 layout=layout,
                 style=-1,
+                render=False,
+                num_resets=args.num_resets,
+                num_steps=args.num_steps,
+                seed=0,
             )
-            all_infos[task][layout] = info
+            all_infos[task][layout] = {k: summarize(v) for (k, v) in samples.items()}
             print()
 
     print()
     print(colored("***** Summary of stats *****", "yellow"))
     for task in all_infos.keys():
         for layout in all_infos[task].keys():
-            reset_time_list = all_infos[task][layout]["reset_time_list"]
-            steps_per_sec_list = all_infos[task][layout]["steps_per_sec_list"]
-
+            info = all_infos[task][layout]
             print(colored(f"Task: {task}; Layout: {layout}", "yellow"))
             print(
                 colored(
-                    "reset time: {:.2f}s".format(np.mean(reset_time_list)), "yellow"
+                    "reset time: p50 {:.2f}s, p95 {:.2f}s".format(
+                        info["reset_time"]["p50"], info["reset_time"]["p95"]
+                    ),
+                    "yellow",
                 )
             )
-            print(colored("fps: {:.2f}".format(np.mean(steps_per_sec_list)), "yellow"))
+            print(
+                colored("fps: {:.2f}".format(1.0 / info["step_time"]["mean"]), "yellow")
+            )
             print()
+
+    if args.out is not None:
+        with open(args.out, "w") as f:
+            json.dump(all_infos, f, indent=2)
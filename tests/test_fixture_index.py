@@ -0,0 +1,143 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+import robocasa.models.fixtures as F
+import robocasa.utils.object_utils as OU
+from robocasa.models.fixtures import FixtureType
+from robocasa.models.fixtures.fixture_utils import fixture_is_type, is_fxtr_valid
+from robocasa.utils.fixture_index import FixtureIndex
+
+FIXTURE_XML = """
+<mujoco model="block">
+  <worldbody>
+    <body>
+      <body name="object">
+        <geom name="g0" type="box" pos="0 0 0.2" size="{size} 0.2" group="0"/>
+        <geom name="reg_main" type="box" pos="0 0 0.2" size="{size} 0.2" rgba="0 1 0 0" group="1" contype="0" conaffinity="0"/>
+      </body>
+    </body>
+  </worldbody>
+</mujoco>
+"""
+
+# (class, name, footprint half size, pos, z rotation), with overlapping and rotated fixtures
+SCENE = [
+    (F.Sink, "sink_main", "0.4 0.3", [0.0, 0.0, 0.6], 0.0),
+    (F.Stove, "stove_main", "0.35 0.3", [0.9, 0.1, 0.6], 0.0),
+    (F.Fridge, "fridge", "0.45 0.4", [-1.2, 0.3, 0.0], 0.3),
+    (F.Microwave, "microwave", "0.25 0.2", [0.2, 0.1, 1.2], 0.0),
+    (F.Toaster, "toaster_left", "0.1 0.1", [1.7, -0.8, 0.9], -0.8),
+    (F.Dishwasher, "dishwasher", "0.3 0.3", [2.2, 1.4, 0.0], np.pi / 2),
+    (F.Oven, "oven", "0.4 0.35", [-0.4, -1.5, 0.0], np.pi),
+    (F.Accessory, "toaster_right_accessory", "0.05 0.05", [1.9, -0.7, 0.9], 0.0),
+]
+
+
+class TestFixtureIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        fixtures = dict()
+        for (i, (fxtr_cls, name, size, pos, z_rot)) in enumerate(SCENE):
+            path = os.path.join(cls.tmp_dir.name, "fixture_{}.xml".format(i))
+            with open(path, "w") as f:
+                f.write(FIXTURE_XML.format(size=size))
+            fxtr = fxtr_cls(xml=path, name=name, pos=pos)
+            fxtr.set_euler([0, 0, z_rot])
+            fixtures[name] = fxtr
+        cls.env = SimpleNamespace(fixtures=fixtures)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp_dir.cleanup()
+
+    def test_queries_match_scan(self):
+        """
+        Type, name, class and counter size queries should match a scan over all fixtures
+        """
+        fixtures = self.env.fixtures
+        index = FixtureIndex(self.env)
+        for _ in range(2):
+            # the second pass reads the memoized results
+            for fixture_type in [
+                FixtureType.SINK,
+                FixtureType.STOVE,
+                FixtureType.OVEN,
+                FixtureType.FRIDGE,
+                FixtureType.DISHWASHER,
+                FixtureType.MICROWAVE,
+                FixtureType.TOASTER,
+                FixtureType.COUNTER,
+                FixtureType.CABINET,
+                FixtureType.DRAWER,
+            ]:
+                self.assertEqual(
+                    index.get_names_of_type(fixture_type),
+                    [
+                        name
+                        for (name, fxtr) in fixtures.items()
+                        if fixture_is_type(fxtr, fixture_type)
+                    ],
+                )
+            for substr in ["toaster", "main", "_", "cabinet"]:
+                self.assertEqual(
+                    index.get_names_containing(substr),
+                    [name for name in fixtures if substr in name],
+                )
+            for classes in [F.Fixture, F.Sink, (F.Toaster, F.Oven), F.Counter]:
+                self.assertEqual(
+                    index.get_fixtures_of_class(classes),
+                    [fxtr for fxtr in fixtures.values() if isinstance(fxtr, classes)],
+                )
+            for name in ["sink_main", "stove_main", "microwave", "dishwasher"]:
+                for size in [(0.2, 0.2), (0.7, 0.5), (0.9, 0.5)]:
+                    self.assertEqual(
+                        index.is_valid_counter(name, size),
+                        is_fxtr_valid(self.env, fixtures[name], size),
+                    )
+
+    def test_spatial_queries_match_scan(self):
+        """
+        Point containment and fixture distance queries should match OU.point_in_fixture and
+        OU.fixture_pairwise_dist, including for points on cell boundaries and fixtures spanning several cells
+        """
+        fixtures = self.env.fixtures
+        rng = np.random.default_rng(0)
+        for grid_size in [0.1, 0.5, 3.0]:
+            index = FixtureIndex(self.env, grid_size=grid_size)
+            points = np.concatenate(
+                [
+                    rng.uniform(-2.5, 2.5, (500, 3)),
+                    [fxtr.pos for fxtr in fixtures.values()],
+                    [[0.5, 0.0, 0.0], [1.0, -1.0, 0.0], [0.0, 0.0, 5.0]],
+                ]
+            )
+            num_contained = 0
+            for point in points:
+                names = index.get_names_at_point(point)
+                self.assertEqual(
+                    names,
+                    [
+                        name
+                        for (name, fxtr) in fixtures.items()
+                        if OU.point_in_fixture(point, fxtr, only_2d=True)
+                    ],
+                )
+                num_contained += len(names) > 0
+            self.assertGreater(num_contained, 0)
+
+            for ref_fixture in fixtures.values():
+                cand_fixtures = [f for f in fixtures.values() if f is not ref_fixture]
+                np.testing.assert_allclose(
+                    index.get_pairwise_dists(ref_fixture, cand_fixtures),
+                    [OU.fixture_pairwise_dist(ref_fixture, f) for f in cand_fixtures],
+                    atol=1e-9,
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
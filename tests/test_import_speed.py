@@ -0,0 +1,88 @@
+import argparse
+import subprocess
+import sys
+
+import numpy as np
+
+IMPORT_SCRIPT = """
+import sys
+import time
+t_start = time.perf_counter()
+import robocasa
+{extra}
+print(time.perf_counter() - t_start)
+"""
+
+
+def measure_cold_import_time(eager=False):
+    """
+    Measures the time to import robocasa in a fresh interpreter
+
+    Args:
+        eager (bool): if True, also imports all kitchen task modules (matching the former eager registration)
+
+    Returns:
+        float: import time in seconds
+    """
+    extra = "robocasa.import_all_kitchen_envs()" if eager else ""
+    out = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT.format(extra=extra)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def get_import_time_stats(num_trials=5, eager=False):
+    import_times = [measure_cold_import_time(eager=eager) for _ in range(num_trials)]
+
+    stats = dict(
+        mean=np.mean(import_times),
+        min=np.min(import_times),
+        percentile50=np.percentile(import_times, 50),
+        max=np.max(import_times),
+    )
+
+    print("Eager task imports:", eager)
+    print("Mean import time: {:.4f} s".format(stats["mean"]))
+    print("Median import time: {:.4f} s".format(stats["percentile50"]))
+    print()
+
+    return stats
+
+
+def test_lazy_task_registration():
+    """
+    Tests that importing robocasa does not import task modules, and that tasks resolve on demand
+    """
+    script = """
+import sys
+import robosuite
+import robocasa
+from robosuite.environments.base import REGISTERED_ENVS
+from robocasa.environments.registry import LazyKitchenEnv
+
+task_modules = [m for m in sys.modules if m.startswith("robocasa.environments.kitchen.composite.")]
+assert len(task_modules) == 0, task_modules
+assert "PickPlaceCounterToCabinet" in robocasa.ALL_KITCHEN_ENVIRONMENTS
+assert isinstance(REGISTERED_ENVS["PickPlaceCounterToCabinet"], LazyKitchenEnv)
+
+env_cls = robocasa.PickPlaceCounterToCabinet
+assert REGISTERED_ENVS["PickPlaceCounterToCabinet"] is env_cls
+"""
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_trials", type=int, default=5)
+    args = parser.parse_args()
+
+    lazy_stats = get_import_time_stats(num_trials=args.num_trials, eager=False)
+    eager_stats = get_import_time_stats(num_trials=args.num_trials, eager=True)
+    print(
+        "Speedup from lazy task registration: {:.2f}x".format(
+            eager_stats["percentile50"] / lazy_stats["percentile50"]
+        )
+    )
@@ -0,0 +1,173 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+import h5py
+import numpy as np
+import torch
+from lerobot.datasets.lerobot_dataset import LeRobotDataset
+
+import robocasa.scripts.dataset_scripts.convert_hdf5_lerobot as ConvertLerobot
+import robocasa.utils.model_store as ModelStore
+
+MODEL_XML = """<mujoco model="base">
+  <worldbody>
+    <body name="layout_{layout}">
+      <geom name="counter" type="box" size="0.5 0.3 0.45"/>
+    </body>
+  </worldbody>
+</mujoco>
+"""
+
+# low-dim observations read by the converter, and their sizes
+OBS_SIZES = {
+    "robot0_base_pos": 3,
+    "robot0_base_quat": 4,
+    "robot0_base_to_eef_pos": 3,
+    "robot0_base_to_eef_quat": 4,
+    "robot0_gripper_qpos": 2,
+}
+STATE_DIM = sum(OBS_SIZES.values())
+IMAGE_SIZE = 32
+
+
+class StateReplayEnv:
+    """
+    Stand-in for the env wrapper used during conversion. Observations, rewards and successes are deterministic
+    functions of the simulation state that was last loaded
+    """
+
+    def __init__(self):
+        self.env = SimpleNamespace(get_ep_meta=lambda: dict(lang="test"))
+        self.state = None
+
+    def reset(self):
+        self.state = None
+
+    def reset_to(self, state):
+        self.state = np.array(state["states"])
+        obs = dict()
+        start = 0
+        for (k, size) in OBS_SIZES.items():
+            obs[k] = self.state[start : start + size].copy()
+            start += size
+        grid = np.linspace(0, 1, IMAGE_SIZE)
+        for (i, cam) in enumerate(ConvertLerobot.CAMERA_NAMES):
+            image = np.stack(
+                [
+                    np.outer(grid, grid) * self.state[i],
+                    np.outer(grid, 1 - grid) * self.state[i + 1],
+                    np.full((IMAGE_SIZE, IMAGE_SIZE), self.state[i + 2]),
+                ],
+                axis=-1,
+            )
+            obs["{}_image".format(cam)] = (image * 255).astype(np.uint8)
+        return obs
+
+    def get_reward(self):
+        return float(self.state[0] > 0.5)
+
+    def is_success(self):
+        return dict(task=bool(self.state[1] > 0.5))
+
+
+def create_env_from_hdf5(hdf5_path, args):
+    return StateReplayEnv()
+
+
+def write_raw_dataset(path, demo_lengths):
+    rng = np.random.default_rng(0)
+    langs = ["open the drawer", "close the drawer"]
+    with h5py.File(path, "w") as f:
+        data_grp = f.create_group("data")
+        data_grp.attrs["env_args"] = json.dumps(
+            dict(env_name="OpenDrawer", type=1, env_kwargs=dict())
+        )
+        data_grp.attrs["total"] = sum(demo_lengths)
+        for (i, demo_length) in enumerate(demo_lengths):
+            ep_data_grp = data_grp.create_group("demo_{}".format(i))
+            ep_data_grp.create_dataset(
+                "states", data=rng.random((demo_length, STATE_DIM))
+            )
+            ep_data_grp.create_dataset("actions", data=rng.random((demo_length, 12)))
+            ep_data_grp.attrs["ep_meta"] = json.dumps(dict(lang=langs[i % 3 == 2]))
+            ModelStore.write_model_xml(ep_data_grp, MODEL_XML.format(layout=i % 2))
+
+
+class TestLerobotConversion(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.create_env_from_hdf5 = ConvertLerobot.create_env_from_hdf5
+        ConvertLerobot.create_env_from_hdf5 = create_env_from_hdf5
+
+    def tearDown(self):
+        ConvertLerobot.create_env_from_hdf5 = self.create_env_from_hdf5
+        self.tmp_dir.cleanup()
+
+    def test_parallel_matches_single_process(self):
+        """
+        The dataset written with several workers should load with LeRobotDataset and match the dataset written
+        by the single-process converter: metadata, low-dim columns and decoded video frames
+        """
+        raw_dataset_path = os.path.join(self.tmp_dir.name, "demo.hdf5")
+        write_raw_dataset(raw_dataset_path, demo_lengths=[5, 8, 3, 6, 4])
+        lerobot_path = os.path.join(self.tmp_dir.name, "lerobot")
+        args = SimpleNamespace(
+            raw_dataset_path=raw_dataset_path,
+            camera_names=ConvertLerobot.CAMERA_NAMES,
+            camera_height=IMAGE_SIZE,
+            camera_width=IMAGE_SIZE,
+            num_workers=1,
+        )
+
+        ConvertLerobot.main(args)
+        single_path = os.path.join(self.tmp_dir.name, "lerobot_single")
+        shutil.move(lerobot_path, single_path)
+        args.num_workers = 2
+        ConvertLerobot.main_parallel(args)
+
+        dataset = LeRobotDataset(
+            "robocasa/parallel", root=lerobot_path, video_backend="pyav"
+        )
+        dataset_single = LeRobotDataset(
+            "robocasa/single", root=single_path, video_backend="pyav"
+        )
+
+        self.assertEqual(dataset.meta.info, dataset_single.meta.info)
+        self.assertEqual(dataset.meta.tasks, dataset_single.meta.tasks)
+        self.assertEqual(dataset.meta.episodes, dataset_single.meta.episodes)
+        for (ep_idx, ep_stats) in dataset_single.meta.episodes_stats.items():
+            for (key, stats) in ep_stats.items():
+                if key in dataset.meta.video_keys:
+                    # image statistics are computed on all frames instead of a subsample
+                    continue
+                for (stat, value) in stats.items():
+                    np.testing.assert_allclose(
+                        dataset.meta.episodes_stats[ep_idx][key][stat], value, atol=1e-6
+                    )
+        for fname in ["modality.json", "embodiment.json", "stats.json"]:
+            with open(os.path.join(lerobot_path, "meta", fname), "r") as f_1, open(
+                os.path.join(single_path, "meta", fname), "r"
+            ) as f_2:
+                self.assertEqual(json.load(f_1), json.load(f_2))
+        self.assertEqual(
+            sorted(os.listdir(os.path.join(lerobot_path, "extras"))),
+            sorted(os.listdir(os.path.join(single_path, "extras"))),
+        )
+
+        self.assertEqual(len(dataset), len(dataset_single))
+        for i in range(len(dataset)):
+            item, item_single = dataset[i], dataset_single[i]
+            self.assertEqual(item.keys(), item_single.keys())
+            for key in item:
+                if isinstance(item[key], torch.Tensor):
+                    torch.testing.assert_close(item[key], item_single[key])
+                else:
+                    self.assertEqual(item[key], item_single[key])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import os
+import tempfile
+import unittest
+
+import h5py
+
+import robocasa.macros as macros
+import robocasa.utils.model_store as ModelStore
+
+MODEL_XML = """<mujoco model="base">
+  <worldbody>
+    <body name="layout_{layout}_style_{style}">
+      <geom name="counter" type="box" size="0.5 0.3 0.45" pos="0 0 0.45"/>
+    </body>
+  </worldbody>
+</mujoco>
+"""
+
+
+class TestModelStore(unittest.TestCase):
+    def setUp(self):
+        self.model_store = macros.HDF5_MODEL_STORE
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        ModelStore._MODEL_XML_CACHE.clear()
+
+    def tearDown(self):
+        macros.HDF5_MODEL_STORE = self.model_store
+        ModelStore._MODEL_XML_CACHE.clear()
+        self.tmp_dir.cleanup()
+
+    def write_demos(self, path, xmls):
+        with h5py.File(path, "w") as f:
+            for (i, xml_str) in enumerate(xmls):
+                ModelStore.write_model_xml(
+                    f.create_group("data/demo_{}".format(i)), xml_str
+                )
+
+    def test_roundtrip(self):
+        """
+        Model xmls read back from a file should match the written xmls, for both storage formats, and
+        identical xmls should only be stored once
+        """
+        xmls = [
+            MODEL_XML.format(layout=layout, style=style)
+            for (layout, style) in [(1, 1), (1, 2), (1, 1), (3, 5), (1, 2)]
+        ]
+        for use_store in [True, False]:
+            macros.HDF5_MODEL_STORE = use_store
+            path = os.path.join(self.tmp_dir.name, "demo_{}.hdf5".format(use_store))
+            self.write_demos(path, xmls)
+
+            ModelStore._MODEL_XML_CACHE.clear()
+            with h5py.File(path, "r") as f:
+                for (i, xml_str) in enumerate(xmls):
+                    ep_grp = f["data/demo_{}".format(i)]
+                    self.assertTrue(ModelStore.has_model_xml(ep_grp))
+                    self.assertEqual(ModelStore.read_model_xml(ep_grp), xml_str)
+                    # second read, from the decompressed xml cache
+                    self.assertEqual(ModelStore.read_model_xml(ep_grp), xml_str)
+                if use_store:
+                    self.assertEqual(len(f[ModelStore.MODEL_STORE_GROUP]), 3)
+                    self.assertNotIn(ModelStore.MODEL_FILE_ATTR, f["data/demo_0"].attrs)
+                else:
+                    self.assertNotIn(ModelStore.MODEL_STORE_GROUP, f)
+                    self.assertEqual(
+                        f["data/demo_0"].attrs[ModelStore.MODEL_FILE_ATTR], xmls[0]
+                    )
+
+    def test_copy(self):
+        """
+        Model xmls copied to another file, as in the multi-process merge, should read back the same, whichever
+        format the source and destination use
+        """
+        xmls = [MODEL_XML.format(layout=i % 2, style=0) for i in range(4)]
+        for (src_store, dst_store) in [
+            (True, True),
+            (True, False),
+            (False, True),
+            (False, False),
+        ]:
+            macros.HDF5_MODEL_STORE = src_store
+            src_path = os.path.join(self.tmp_dir.name, "src.hdf5")
+            self.write_demos(src_path, xmls)
+
+            macros.HDF5_MODEL_STORE = dst_store
+            dst_path = os.path.join(self.tmp_dir.name, "dst.hdf5")
+            with h5py.File(src_path, "r") as f_src, h5py.File(dst_path, "w") as f_dst:
+                for i in range(len(xmls)):
+                    ModelStore.copy_model_xml(
+                        f_src["data/demo_{}".format(i)],
+                        f_dst.create_group("data/demo_{}".format(i)),
+                    )
+
+            ModelStore._MODEL_XML_CACHE.clear()
+            with h5py.File(dst_path, "r") as f:
+                for (i, xml_str) in enumerate(xmls):
+                    self.assertEqual(
+                        ModelStore.read_model_xml(f["data/demo_{}".format(i)]), xml_str
+                    )
+                if dst_store:
+                    self.assertEqual(len(f[ModelStore.MODEL_STORE_GROUP]), 2)
+                else:
+                    self.assertNotIn(ModelStore.MODEL_STORE_GROUP, f)
+
+
+if __name__ == "__main__":
+    unittest.main()
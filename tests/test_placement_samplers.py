@@ -0,0 +1,232 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+from robosuite.models.objects import BoxObject
+from robosuite.utils.transform_utils import convert_quat, quat_multiply, rotate_2d_point
+
+from robocasa.models.objects.objects import MJCFObject
+from robocasa.utils.object_utils import obj_in_region, objs_intersect
+from robocasa.utils.placement_samplers import UniformRandomSampler, is_auxiliary_pair
+
+
+# a box-shaped object, in the format of the object models under the assets folder
+OBJECT_XML = """
+<mujoco model="block">
+  <asset/>
+  <worldbody>
+    <body>
+      <body name="object">
+        <geom name="g0" type="box" pos="0 0 0" size="0.05 0.02 0.03" group="0"/>
+        <geom name="reg_bbox" type="box" pos="0 0 0" size="0.05 0.02 0.03" rgba="0 1 0 1" group="1" contype="0" conaffinity="0"/>
+      </body>
+      <site rgba="0 0 0 0" size="0.005" pos="0 0 -0.03" name="bottom_site"/>
+      <site rgba="0 0 0 0" size="0.005" pos="0 0 0.03" name="top_site"/>
+      <site rgba="0 0 0 0" size="0.005" pos="0.05 0.02 0" name="horizontal_radius_site"/>
+    </body>
+  </worldbody>
+</mujoco>
+"""
+
+
+def make_objects(mjcf_path):
+    """
+    Objects that exercise both overlap checks: bounding boxes (MJCFObject) and radii (BoxObject)
+    """
+    objects = [
+        MJCFObject(name="block{}".format(i), mjcf_path=mjcf_path) for i in range(4)
+    ]
+    objects += [
+        BoxObject(name="box{}".format(i), size=[0.04, 0.03, 0.02]) for i in range(4)
+    ]
+    return objects
+
+
+class PerCandidateSampler(UniformRandomSampler):
+    """
+    Reference sampler that draws and checks one candidate at a time with obj_in_region and objs_intersect,
+    as UniformRandomSampler did before candidates were checked in batches
+    """
+
+    def _sample_placement(
+        self,
+        obj,
+        placed_objects,
+        base_offset,
+        ref_quat,
+        region_points,
+        obj_size,
+        on_top,
+    ):
+        for _ in range(5000):
+            relative_x = self._sample_x(obj_size)
+            relative_y = self._sample_y(obj_size)
+            object_x, object_y = rotate_2d_point(
+                [relative_x, relative_y], rot=self.reference_rot
+            )
+            object_x = object_x + base_offset[0]
+            object_y = object_y + base_offset[1]
+            object_z = self.z_offset + base_offset[2]
+            if on_top:
+                object_z -= obj.bottom_offset[-1]
+
+            quat = self._sample_quat()
+            if hasattr(obj, "init_quat"):
+                quat = quat_multiply(quat, obj.init_quat)
+            quat = convert_quat(
+                quat_multiply(
+                    convert_quat(ref_quat, to="xyzw"), convert_quat(quat, to="xyzw")
+                ),
+                to="wxyz",
+            )
+            obj_pos = [object_x, object_y, object_z]
+
+            if self.ensure_object_boundary_in_range and not obj_in_region(
+                obj,
+                obj_pos=obj_pos,
+                obj_quat=convert_quat(quat, to="xyzw"),
+                p0=region_points[0],
+                px=region_points[1],
+                py=region_points[2],
+            ):
+                continue
+
+            location_valid = True
+            if self.ensure_valid_placement:
+                for (
+                    name,
+                    (other_pos, other_quat, other_obj),
+                ) in placed_objects.items():
+                    if name == self.reference_object:
+                        continue
+                    if (
+                        is_auxiliary_pair(obj.name, other_obj.name)
+                        and not self.ensure_valid_auxiliary_placement
+                    ):
+                        continue
+                    if objs_intersect(
+                        obj=obj,
+                        obj_pos=obj_pos,
+                        obj_quat=convert_quat(quat, to="xyzw"),
+                        other_obj=other_obj,
+                        other_obj_pos=other_pos,
+                        other_obj_quat=convert_quat(other_quat, to="xyzw"),
+                    ):
+                        location_valid = False
+                        break
+
+            if location_valid:
+                return tuple(obj_pos), quat
+            if "_auxiliary_" in obj.name:
+                return None
+        return None
+
+
+def sample_placements(
+    mjcf_path, seed, batch_size, rotation=None, sampler_cls=UniformRandomSampler
+):
+    rng = np.random.default_rng(seed)
+    sampler = sampler_cls(
+        name="test",
+        mujoco_objects=make_objects(mjcf_path),
+        # a small region, so that many candidates are rejected
+        x_range=(-0.3, 0.3),
+        y_range=(-0.25, 0.25),
+        rotation=rotation,
+        reference_pos=(0.5, -0.3, 0.8),
+        reference_rot=0.3,
+        rng=rng,
+        batch_size=batch_size,
+    )
+    placements = sampler.sample()
+    return placements, rng.bit_generator.state
+
+
+class TestPlacementSamplers(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.mjcf_path = os.path.join(cls.tmp_dir.name, "model.xml")
+        with open(cls.mjcf_path, "w") as f:
+            f.write(OBJECT_XML)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp_dir.cleanup()
+
+    def assert_same_placements(self, res1, res2):
+        (placements1, rng_state1), (placements2, rng_state2) = res1, res2
+        self.assertEqual(list(placements1), list(placements2))
+        for name in placements1:
+            np.testing.assert_allclose(
+                placements1[name][0], placements2[name][0], rtol=0, atol=1e-12
+            )
+            np.testing.assert_allclose(
+                placements1[name][1], placements2[name][1], rtol=0, atol=1e-12
+            )
+        self.assertEqual(rng_state1, rng_state2)
+
+    def test_batch_size_equivalence(self):
+        """
+        Placements and the final rng state should not depend on the number of candidates checked at once
+        """
+        for rotation in [None, (-np.pi / 4, np.pi / 4), 0.5]:
+            for seed in range(5):
+                res = sample_placements(
+                    self.mjcf_path, seed, batch_size=1, rotation=rotation
+                )
+                for batch_size in [7, 64]:
+                    self.assert_same_placements(
+                        res,
+                        sample_placements(
+                            self.mjcf_path,
+                            seed,
+                            batch_size=batch_size,
+                            rotation=rotation,
+                        ),
+                    )
+
+    def test_per_candidate_equivalence(self):
+        """
+        Placements and the final rng state should match checking one candidate at a time with obj_in_region and
+        objs_intersect
+        """
+        for rotation in [None, (-np.pi / 4, np.pi / 4), 0.5]:
+            for seed in range(20):
+                self.assert_same_placements(
+                    sample_placements(
+                        self.mjcf_path, seed, batch_size=64, rotation=rotation
+                    ),
+                    sample_placements(
+                        self.mjcf_path,
+                        seed,
+                        batch_size=1,
+                        rotation=rotation,
+                        sampler_cls=PerCandidateSampler,
+                    ),
+                )
+
+    def test_block_draws_equivalence(self):
+        """
+        Drawing candidates as a block (and rewinding the rng) should match drawing them one at a time
+        """
+        for rotation in [None, (-np.pi / 4, np.pi / 4)]:
+            for seed in range(5):
+                res = sample_placements(
+                    self.mjcf_path, seed, batch_size=64, rotation=rotation
+                )
+                with mock.patch.object(
+                    UniformRandomSampler, "_can_draw_in_blocks", return_value=False
+                ):
+                    self.assert_same_placements(
+                        res,
+                        sample_placements(
+                            self.mjcf_path, seed, batch_size=64, rotation=rotation
+                        ),
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,352 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+import robosuite.utils.transform_utils as T
+from robosuite.utils.mjcf_utils import string_to_array as s2a
+
+import robocasa.utils.object_utils as OU
+from robocasa.models.fixtures.fixture import Fixture
+from robocasa.models.objects.objects import MJCFObject
+import robocasa.models.scenes.scene_builder as SceneBuilder
+
+FIXTURE_XML = """
+<mujoco model="block">
+  <worldbody>
+    <body>
+      <body name="object">
+        <geom name="g0" type="box" pos="0 0 0.2" size="0.3 0.25 0.2" group="0"/>
+        <geom name="reg_main" type="box" pos="0 0 0.2" size="0.3 0.25 0.2" rgba="0 1 0 0" group="1" contype="0" conaffinity="0"/>
+        <geom name="reg_int" type="box" pos="0.02 -0.01 0.18" size="0.25 0.2 0.15" rgba="0 1 0 0" group="1" contype="0" conaffinity="0"/>
+        <geom name="reg_int_top" type="box" pos="0.02 -0.01 0.5" size="0.25 0.2 0.1" rgba="0 1 0 0" group="1" contype="0" conaffinity="0"/>
+      </body>
+    </body>
+  </worldbody>
+</mujoco>
+"""
+
+OBJECT_XML = """
+<mujoco model="can">
+  <asset/>
+  <worldbody>
+    <body>
+      <body name="object">
+        <geom name="g0" type="{type}" pos="0.01 0 0.05" size="{size}" group="0"/>
+        <geom name="reg_bbox" type="{type}" pos="0.01 0 0.05" size="{size}" rgba="0 1 0 1" group="1" contype="0" conaffinity="0"/>
+      </body>
+      <site rgba="0 0 0 0" size="0.005" pos="0 0 0" name="bottom_site"/>
+      <site rgba="0 0 0 0" size="0.005" pos="0 0 0.1" name="top_site"/>
+      <site rgba="0 0 0 0" size="0.005" pos="0.03 0.03 0.05" name="horizontal_radius_site"/>
+    </body>
+  </worldbody>
+</mujoco>
+"""
+
+
+class ShelfFixture(Fixture):
+    """
+    Fixture with two interior regions
+    """
+
+    def get_reset_region_names(self):
+        return ("int", "int_top")
+
+
+def objs_inside_of_scan(env, obj_names, fixture, region_names):
+    """
+    Reference containment check, testing the 8 bounding box points of each object against each region
+    """
+    inside = []
+    for name in obj_names:
+        obj = env.objects[name]
+        body_id = env.obj_body_id[name]
+        obj_pos = env.sim.data.body_xpos[body_id]
+        obj_quat = T.mat2quat(env.sim.data.body_xmat[body_id].reshape(3, 3))
+        obj_points = obj.get_bbox_points(trans=obj_pos, rot=obj_quat)
+        obj_inside = False
+        for (reg_name, (p0, px, py, pz)) in fixture.get_int_sites(
+            relative=False
+        ).items():
+            if reg_name not in region_names:
+                continue
+            reg_inside = True
+            for (axis, p1) in [(px - p0, px), (py - p0, py), (pz - p0, pz)]:
+                projs = obj_points @ axis
+                if not np.all(
+                    (axis @ p0 - 0.05 <= projs) & (projs <= axis @ p1 + 0.05)
+                ):
+                    reg_inside = False
+            obj_inside = obj_inside or reg_inside
+        inside.append(obj_inside)
+    return inside
+
+
+def get_region_points(fixture, reg_name):
+    """
+    Reference computation of the 8 world frame corners of a region, from its boundary points p0, px, py, pz
+    """
+    reg = fixture._regions[reg_name]
+    p0, px, py, pz = reg["p0"], reg["px"], reg["py"], reg["pz"]
+    sites = [
+        p0,
+        px,
+        py,
+        pz,
+        np.array([p0[0], py[1], pz[2]]),
+        np.array([px[0], py[1], pz[2]]),
+        np.array([px[0], py[1], p0[2]]),
+        np.array([px[0], p0[1], pz[2]]),
+    ]
+    return np.array([OU.get_pos_after_rel_offset(fixture, site) for site in sites])
+
+
+class TestRegionGeometry(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.fixture_path = os.path.join(cls.tmp_dir.name, "fixture.xml")
+        with open(cls.fixture_path, "w") as f:
+            f.write(FIXTURE_XML)
+        cls.object_paths = dict()
+        for (geom_type, size) in [
+            ("box", "0.03 0.02 0.05"),
+            ("cylinder", "0.03 0.05"),
+        ]:
+            path = os.path.join(cls.tmp_dir.name, "{}.xml".format(geom_type))
+            with open(path, "w") as f:
+                f.write(OBJECT_XML.format(type=geom_type, size=size))
+            cls.object_paths[geom_type] = path
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp_dir.cleanup()
+
+    def assert_fixture_geometry(self, fixture):
+        np.testing.assert_allclose(
+            fixture.get_ext_sites(all_points=True, relative=False),
+            get_region_points(fixture, "main"),
+            atol=1e-9,
+        )
+        int_sites = fixture.get_int_sites(all_points=True, relative=False)
+        np.testing.assert_allclose(
+            int_sites["int"], get_region_points(fixture, "int"), atol=1e-9
+        )
+
+    def test_fixture_geometry_cache(self):
+        """
+        Cached world frame region corners should match the corners computed from scratch, after every pose or
+        scale change
+        """
+        fixture = Fixture(xml=self.fixture_path, name="block", pos=[1.0, 2.0, 0.5])
+        self.assert_fixture_geometry(fixture)
+
+        fixture.set_pos([-0.5, 0.3, 0.0])
+        self.assert_fixture_geometry(fixture)
+
+        fixture.set_euler([0, 0, 0.7])
+        self.assert_fixture_geometry(fixture)
+
+        fixture.set_scale([1.2, 0.8, 1.1])
+        self.assert_fixture_geometry(fixture)
+
+    def assert_halfspaces(self, fixture, rng):
+        """
+        Points inside the interior region according to the halfspaces should match a check in the fixture
+        frame against the region boundary points
+        """
+        halfspaces = fixture.get_int_region_halfspaces()
+        self.assertEqual(halfspaces["names"], ["int"])
+        reg = fixture._regions["int"]
+        lo = np.array([reg["p0"][0], reg["p0"][1], reg["p0"][2]])
+        hi = np.array([reg["px"][0], reg["py"][1], reg["pz"][2]])
+        mat = T.euler2mat(np.array([0, 0, fixture.rot]))
+        center = get_region_points(fixture, "int").mean(axis=0)
+        points = center + rng.uniform(-0.4, 0.4, (500, 3))
+
+        projs = points @ halfspaces["axes"][0].T
+        inside = np.all(
+            (halfspaces["lo"][0] <= projs) & (projs <= halfspaces["hi"][0]), axis=1
+        )
+        local_points = (points - fixture.pos) @ mat
+        expected = np.all((lo <= local_points) & (local_points <= hi), axis=1)
+        np.testing.assert_array_equal(inside, expected)
+        self.assertTrue(np.any(inside))
+        self.assertFalse(np.all(inside))
+
+    def test_fixture_halfspaces(self):
+        """
+        Cached interior region halfspaces should give the same containment as the region boundary points,
+        after every pose or scale change
+        """
+        rng = np.random.default_rng(0)
+        fixture = Fixture(xml=self.fixture_path, name="block", pos=[1.0, 2.0, 0.5])
+        self.assert_halfspaces(fixture, rng)
+        # second call, from the cache
+        self.assertIs(
+            fixture.get_int_region_halfspaces(), fixture.get_int_region_halfspaces()
+        )
+
+        fixture.set_pos([-0.5, 0.3, 0.0])
+        self.assert_halfspaces(fixture, rng)
+
+        fixture.set_euler([0, 0, 0.7])
+        self.assert_halfspaces(fixture, rng)
+
+        fixture.set_scale([1.2, 0.8, 1.1])
+        self.assert_halfspaces(fixture, rng)
+
+    def test_scene_builder_pose_edits(self):
+        """
+        Region geometry of fixtures rotated and displaced with their group by create_fixtures should match the
+        geometry computed from scratch, including when it was cached before the group rotation
+        """
+        layout_config = {
+            "main_group": {
+                "group_origin": [0, 0],
+                "group_pos": [1.0, 2.0],
+                "group_z_rot": 0.7,
+                "accessories": [
+                    dict(
+                        name="block",
+                        type="hood",
+                        xml=self.fixture_path,
+                        pos=[0.5, 0, 1.0],
+                        z_rot=0.2,
+                    ),
+                    dict(
+                        name="block_right",
+                        type="hood",
+                        xml=self.fixture_path,
+                        align_to="block",
+                        side="right",
+                        z_rot=-0.4,
+                    ),
+                ],
+            }
+        }
+        get_relative_position = SceneBuilder.get_relative_position
+
+        def get_relative_position_cached(fixture, config, prev_fxtr, prev_fxtr_config):
+            # cache the geometry of the fixture aligned to, which is then rotated with its group
+            prev_fxtr.get_ext_sites(all_points=True, relative=False)
+            prev_fxtr.get_int_region_halfspaces()
+            return get_relative_position(fixture, config, prev_fxtr, prev_fxtr_config)
+
+        SceneBuilder.get_relative_position = get_relative_position_cached
+        try:
+            fixtures = SceneBuilder.create_fixtures(
+                layout_config, {}, rng=np.random.default_rng(0)
+            )
+        finally:
+            SceneBuilder.get_relative_position = get_relative_position
+
+        rng = np.random.default_rng(0)
+        self.assertEqual(len(fixtures), 2)
+        for fixture in fixtures.values():
+            self.assertNotEqual(s2a(fixture._obj.get("euler"))[2], 0)
+            self.assert_fixture_geometry(fixture)
+            self.assert_halfspaces(fixture, rng)
+
+    def test_objs_inside_of_regions(self):
+        """
+        Containment checks restricted to some regions of a fixture should match a scan over those regions,
+        whether the halfspaces of the fixture were cached by a restricted or an unrestricted check
+        """
+        fixture = ShelfFixture(xml=self.fixture_path, name="shelf", pos=[0.5, 0.2, 0.0])
+        fixture.set_euler([0, 0, 0.4])
+        rng = np.random.default_rng(0)
+        num_objs = 200
+        objects = {
+            "obj_{}".format(i): MJCFObject(
+                name="obj_{}".format(i), mjcf_path=self.object_paths["box"]
+            )
+            for i in range(num_objs)
+        }
+        center = fixture.get_int_sites(all_points=True, relative=False)["int"].mean(
+            axis=0
+        )
+        offsets = rng.uniform([-0.3, -0.3, -0.2], [0.3, 0.3, 0.5], (num_objs, 3))
+        mats = np.array(
+            [T.euler2mat(np.array([0, 0, yaw])) for yaw in rng.uniform(-3, 3, num_objs)]
+        )
+        env = SimpleNamespace(
+            objects=objects,
+            obj_body_id={name: i for (i, name) in enumerate(objects)},
+            sim=SimpleNamespace(
+                data=SimpleNamespace(
+                    body_xpos=center + offsets, body_xmat=mats.reshape(-1, 9)
+                )
+            ),
+            get_fixture=lambda fixture_id: fixture,
+        )
+        obj_names = list(objects)
+
+        for region_names in [
+            ["int_top"],
+            None,
+            ["int"],
+            ["int", "int_top"],
+            ["int_top"],
+            [],
+        ]:
+            inside = OU.objs_inside_of(
+                env, obj_names, fixture, region_names=region_names
+            )
+            expected = objs_inside_of_scan(
+                env,
+                obj_names,
+                fixture,
+                ["int", "int_top"] if region_names is None else region_names,
+            )
+            np.testing.assert_array_equal(inside, expected)
+            if region_names:
+                self.assertTrue(np.any(inside))
+            self.assertEqual(
+                OU.obj_inside_of(env, "obj_0", fixture, region_names=region_names),
+                expected[0],
+            )
+
+    def test_object_geometry_cache(self):
+        """
+        Cached bounding box geometry of objects should match the geometry read from the region geom, for box
+        and cylinder regions
+        """
+        for (geom_type, path) in self.object_paths.items():
+            obj = MJCFObject(name="obj", mjcf_path=path, scale=1.5)
+            reg = obj._regions["bbox"]
+            center = s2a(reg["elem"].get("pos"))
+            half_size = (
+                np.array(
+                    [
+                        reg["px"][0] - reg["p0"][0],
+                        reg["py"][1] - reg["p0"][1],
+                        reg["pz"][2] - reg["p0"][2],
+                    ]
+                )
+                / 2
+            )
+
+            points = np.array(obj.get_bbox_points())
+            np.testing.assert_allclose(points[0], reg["p0"], atol=1e-9)
+            np.testing.assert_allclose(points[1], reg["px"], atol=1e-9)
+            np.testing.assert_allclose(points[2], reg["py"], atol=1e-9)
+            np.testing.assert_allclose(points[3], reg["pz"], atol=1e-9)
+            np.testing.assert_allclose(
+                obj.horizontal_radius, np.linalg.norm(half_size[:2]), atol=1e-9
+            )
+            np.testing.assert_allclose(
+                obj.bottom_offset,
+                [center[0], center[1], center[2] - half_size[2]],
+                atol=1e-9,
+            )
+            np.testing.assert_allclose(
+                obj.top_offset,
+                [center[0], center[1], center[2] + half_size[2]],
+                atol=1e-9,
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
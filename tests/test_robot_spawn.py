@@ -0,0 +1,162 @@
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+from robosuite.utils.binding_utils import MjSim
+
+import robocasa.macros as macros
+import robocasa.utils.env_utils as EnvUtils
+from robocasa.utils.contact_index import ContactIndex
+
+# mobile base on slide joints (placed at -10, -10 by set_robot_to_position when the joints are at 0), and
+# obstacles around the anchor position at the origin
+SCENE_XML = """
+<mujoco model="spawn">
+  <worldbody>
+    <body name="mobilebase0_base" pos="10 10 0">
+      <joint name="mobilebase0_joint_mobile_forward" type="slide" axis="1 0 0"/>
+      <joint name="mobilebase0_joint_mobile_side" type="slide" axis="0 1 0"/>
+      <joint name="mobilebase0_joint_mobile_yaw" type="hinge" axis="0 0 1"/>
+      <geom name="robot_base" type="box" pos="0 0 0.3" size="0.3 0.25 0.2"/>
+      <geom name="robot_arm" type="capsule" fromto="0.1 0 0.5 0.5 0.1 0.9" size="0.05"/>
+    </body>
+    <geom name="counter_0" type="box" pos="0.8 0 0.5" size="0.3 1.5 0.5"/>
+    <geom name="counter_1" type="box" pos="0 -0.9 0.5" size="1.2 0.3 0.5" euler="0 0 0.3"/>
+    <geom name="stool" type="cylinder" pos="-0.4 0.4 0.3" size="0.15 0.3"/>
+    <geom name="shelf" type="box" pos="-0.1 0.6 1.2" size="0.3 0.1 0.05" contype="2" conaffinity="2"/>
+  </worldbody>
+</mujoco>
+"""
+
+
+def make_env(seed):
+    """
+    Minimal stand-in for the attributes of a Kitchen env used to spawn the robot
+    """
+    sim = MjSim.from_xml_string(SCENE_XML)
+    sim.forward()
+    return SimpleNamespace(
+        sim=sim,
+        rng=np.random.default_rng(seed),
+        robots=[None],
+        robot_geom_ids={
+            sim.model.geom_name2id("robot_base"),
+            sim.model.geom_name2id("robot_arm"),
+        },
+        init_robot_base_ori_anchor=np.zeros(3),
+        contact_index=ContactIndex(sim),
+        robot_spawn_stats=None,
+    )
+
+
+def set_robot_base_sequential(
+    env, anchor_pos, anchor_ori, rot_dev, pos_dev_x, pos_dev_y
+):
+    """
+    Reference robot spawn search, sampling and checking one candidate at a time in the simulator
+    """
+    with EnvUtils.no_collision(env.sim):
+        env.sim.data.qpos[
+            env.sim.model.get_joint_qpos_addr("mobilebase0_joint_mobile_yaw")
+        ] = env.rng.uniform(-rot_dev, rot_dev)
+        env.sim.forward()
+    initial_state_copy = env.sim.get_state()
+
+    num_sim_checks = 0
+    cur_dev_pos_x = pos_dev_x
+    cur_dev_pos_y = pos_dev_y
+    while True:
+        for _ in range(50):
+            robot_pos = EnvUtils.generate_random_robot_pos(
+                env=env,
+                anchor_pos=anchor_pos,
+                anchor_ori=anchor_ori,
+                pos_dev_x=cur_dev_pos_x,
+                pos_dev_y=cur_dev_pos_y,
+            )
+            EnvUtils.set_robot_to_position(env, robot_pos)
+            env.sim.forward()
+            num_sim_checks += 1
+            if not EnvUtils.detect_robot_collision(env):
+                return robot_pos, num_sim_checks
+            env.sim.set_state(initial_state_copy)
+        cur_dev_pos_x += 0.10
+        cur_dev_pos_y += 0.05
+
+
+class TestRobotSpawn(unittest.TestCase):
+    def setUp(self):
+        self.use_map = macros.ROBOT_SPAWN_USE_FREE_SPACE_MAP
+        self.spawn_args = dict(
+            anchor_pos=np.zeros(3),
+            anchor_ori=np.zeros(3),
+            rot_dev=0.0,
+            pos_dev_x=0.4,
+            pos_dev_y=0.4,
+        )
+
+    def tearDown(self):
+        macros.ROBOT_SPAWN_USE_FREE_SPACE_MAP = self.use_map
+
+    def test_spawn_map_is_conservative(self):
+        """
+        Candidates that the spawn map reports free should not be in collision in the simulator
+        """
+        env = make_env(0)
+        initial_state = env.sim.get_state()
+        spawn_map = EnvUtils.compute_robot_spawn_map(env, np.zeros(3))
+        env.sim.set_state(initial_state)
+        candidates = EnvUtils.generate_random_robot_pos_batch(
+            env=env,
+            anchor_pos=np.zeros(3),
+            anchor_ori=np.zeros(3),
+            pos_dev_x=1.0,
+            pos_dev_y=1.0,
+            num_samples=300,
+        )
+        may_collide = EnvUtils.robot_spawn_map_collisions(spawn_map, candidates)
+        num_collisions = 0
+        for robot_pos, candidate_may_collide in zip(candidates, may_collide):
+            EnvUtils.set_robot_to_position(env, robot_pos)
+            env.sim.forward()
+            in_collision = EnvUtils.detect_robot_collision(env)
+            num_collisions += in_collision
+            if in_collision:
+                self.assertTrue(candidate_may_collide)
+            env.sim.set_state(initial_state)
+        # the scene should exercise both outcomes
+        self.assertGreater(num_collisions, 0)
+        self.assertLess(num_collisions, len(candidates))
+
+    def test_spawn_matches_sequential(self):
+        """
+        Without the spawn map, the chosen position and rng state should match the sequential search. With the
+        map, the chosen position should be free and found with no more simulator checks
+        """
+        for seed in range(10):
+            env = make_env(seed)
+            robot_pos, num_sim_checks = set_robot_base_sequential(
+                env, **self.spawn_args
+            )
+            rng_state = env.rng.bit_generator.state
+
+            macros.ROBOT_SPAWN_USE_FREE_SPACE_MAP = False
+            env = make_env(seed)
+            np.testing.assert_array_equal(
+                EnvUtils.set_robot_base(env, **self.spawn_args), robot_pos
+            )
+            self.assertEqual(env.rng.bit_generator.state, rng_state)
+            self.assertEqual(env.robot_spawn_stats["num_sim_checks"], num_sim_checks)
+
+            macros.ROBOT_SPAWN_USE_FREE_SPACE_MAP = True
+            env = make_env(seed)
+            EnvUtils.set_robot_base(env, **self.spawn_args)
+            env.sim.forward()
+            self.assertFalse(EnvUtils.detect_robot_collision(env))
+            self.assertLessEqual(
+                env.robot_spawn_stats["num_sim_checks"], num_sim_checks
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,181 @@
+import os
+import tempfile
+import time
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+import robocasa.macros as macros
+import robocasa.utils.scene_cache as SceneCache
+from robocasa.utils.env_utils import create_env
+
+
+def make_scene(seed):
+    """
+    Minimal stand-in for the attributes of a Kitchen env that the scene cache key is built from
+    """
+    return SimpleNamespace(
+        layout_id=1,
+        style_id=2,
+        enable_fixtures=None,
+        clutter_mode=0,
+        update_fxtr_cfg_dict=None,
+        seed=seed,
+        rng=np.random.default_rng(seed),
+        fixtures=dict(),
+    )
+
+
+def sample_placements(rng, names):
+    return {
+        name: (tuple(rng.uniform(-1, 1, 3)), rng.uniform(-1, 1, 4), None)
+        for name in names
+    }
+
+
+class TestSceneCache(unittest.TestCase):
+    def setUp(self):
+        self.mode, self.cache_dir = macros.SCENE_CACHE_MODE, macros.SCENE_CACHE_DIR
+        self.max_entries = macros.SCENE_CACHE_MAX_ENTRIES
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        macros.SCENE_CACHE_DIR = self.tmp_dir.name
+        SceneCache.clear_scene_cache()
+
+    def tearDown(self):
+        SceneCache.clear_scene_cache()
+        macros.SCENE_CACHE_MODE, macros.SCENE_CACHE_DIR = self.mode, self.cache_dir
+        macros.SCENE_CACHE_MAX_ENTRIES = self.max_entries
+        self.tmp_dir.cleanup()
+
+    def test_key(self):
+        """
+        Scenes sampled with different seeds, or at different episodes of the same seed, should not share entries
+        """
+        key_1 = SceneCache.get_scene_cache_key(make_scene(0))
+        self.assertEqual(key_1, SceneCache.get_scene_cache_key(make_scene(0)))
+        self.assertNotEqual(key_1, SceneCache.get_scene_cache_key(make_scene(1)))
+
+        scene = make_scene(0)
+        scene.rng.random()
+        self.assertNotEqual(key_1, SceneCache.get_scene_cache_key(scene))
+
+    def test_cached_episodes(self):
+        """
+        Placements and the rng state after a cache hit should be the same as after sampling without the cache
+        """
+        names = ["counter", "sink", "stove"]
+        fixtures = {name: None for name in names}
+        for mode in ["memory", "disk"]:
+            macros.SCENE_CACHE_MODE = mode
+            SceneCache.clear_scene_cache()
+
+            scene = make_scene(0)
+            key = SceneCache.get_scene_cache_key(scene)
+            self.assertIsNone(
+                SceneCache.load_fixture_placements(key, fixtures, rng=scene.rng)
+            )
+            placements = sample_placements(scene.rng, names)
+            SceneCache.store_fixture_placements(key, placements, rng=scene.rng)
+            if mode == "disk":
+                # only keep the entry on disk
+                SceneCache._SCENE_CACHE.clear()
+
+            scene_2 = make_scene(0)
+            cached = SceneCache.load_fixture_placements(
+                SceneCache.get_scene_cache_key(scene_2), fixtures, rng=scene_2.rng
+            )
+            self.assertEqual(list(cached), names)
+            for name in names:
+                np.testing.assert_array_equal(cached[name][0], placements[name][0])
+                np.testing.assert_array_equal(cached[name][1], placements[name][1])
+            self.assertEqual(
+                scene_2.rng.bit_generator.state, scene.rng.bit_generator.state
+            )
+
+            SceneCache.evict_fixture_placements(key)
+            self.assertIsNone(
+                SceneCache.load_fixture_placements(key, fixtures, rng=scene_2.rng)
+            )
+            self.assertFalse(os.path.exists(SceneCache._get_cache_path(key)))
+            self.assertEqual(SceneCache.get_scene_cache_stats()["evictions"], 1)
+
+    def test_max_entries(self):
+        """
+        The cache should hold at most macros.SCENE_CACHE_MAX_ENTRIES entries in memory and on disk, evicting
+        the least recently used ones
+        """
+        names = ["counter", "sink"]
+        fixtures = {name: None for name in names}
+        macros.SCENE_CACHE_MAX_ENTRIES = 2
+        for mode in ["memory", "disk"]:
+            macros.SCENE_CACHE_MODE = mode
+            SceneCache.clear_scene_cache(disk=True)
+            keys = []
+            for seed in range(4):
+                scene = make_scene(seed)
+                keys.append(SceneCache.get_scene_cache_key(scene))
+                SceneCache.store_fixture_placements(
+                    keys[-1], sample_placements(scene.rng, names), rng=scene.rng
+                )
+                # on disk, entries are ordered by modification time, which may have a coarse resolution
+                time.sleep(0.02)
+                if seed == 2:
+                    # the entry of seed 1 is used again, so that seed 2 is the least recently used
+                    self.assertIsNotNone(
+                        SceneCache.load_fixture_placements(keys[1], fixtures)
+                    )
+                    time.sleep(0.02)
+            self.assertEqual(list(SceneCache._SCENE_CACHE), [keys[1], keys[3]])
+            if mode == "disk":
+                self.assertEqual(len(os.listdir(SceneCache.get_scene_cache_dir())), 2)
+                self.assertTrue(os.path.exists(SceneCache._get_cache_path(keys[3])))
+            for (seed, key) in enumerate(keys):
+                cached = SceneCache.load_fixture_placements(key, fixtures)
+                self.assertEqual(cached is not None, seed in [1, 3])
+            self.assertGreater(SceneCache.get_scene_cache_stats()["lru_evictions"], 0)
+
+    def test_env_cached_episodes(self):
+        """
+        Episodes of a kitchen env should be the same with and without the scene cache
+        """
+
+        def get_episodes(mode, num_episodes=2):
+            macros.SCENE_CACHE_MODE = mode
+            env = create_env(
+                env_name="PickPlaceCounterToCabinet",
+                seed=3,
+                camera_names=[],
+                layout_ids=1,
+                style_ids=1,
+            )
+            episodes = []
+            for _ in range(num_episodes):
+                env.reset()
+                episodes.append(
+                    (
+                        {k: v[:2] for (k, v) in env.fxtr_placements.items()},
+                        {k: v[:2] for (k, v) in env.object_placements.items()},
+                    )
+                )
+            env.close()
+            return episodes
+
+        episodes = get_episodes(None)
+        # the first run stores the scenes, the second run hits the cache
+        for episodes_cached in [get_episodes("memory"), get_episodes("memory")]:
+            for (ep, ep_cached) in zip(episodes, episodes_cached):
+                for (placements, placements_cached) in zip(ep, ep_cached):
+                    self.assertEqual(placements.keys(), placements_cached.keys())
+                    for name in placements:
+                        np.testing.assert_allclose(
+                            placements[name][0], placements_cached[name][0], atol=1e-9
+                        )
+                        np.testing.assert_allclose(
+                            placements[name][1], placements_cached[name][1], atol=1e-9
+                        )
+        self.assertGreater(SceneCache.get_scene_cache_stats()["hits"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,273 @@
+import ast
+import inspect
+import os
+import tempfile
+import textwrap
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+from robocasa.environments import ALL_KITCHEN_ENVIRONMENTS
+from robocasa.environments.kitchen.kitchen import Kitchen
+from robocasa.environments.registry import get_kitchen_env_class
+from robocasa.models.fixtures.fixture import Fixture
+from robocasa.utils.env_utils import create_env
+
+# methods of builtin containers that modify them in place
+MUTATING_METHODS = {
+    "append",
+    "add",
+    "clear",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "setdefault",
+    "update",
+}
+
+
+def get_self_attr(node):
+    """
+    Name of the attribute of self that @node (eg. self.timer, self.positions[0]) refers to, if any
+    """
+    while isinstance(node, (ast.Attribute, ast.Subscript)):
+        if (
+            isinstance(node, ast.Attribute)
+            and isinstance(node.value, ast.Name)
+            and node.value.id == "self"
+        ):
+            return node.attr
+        node = node.value
+    return None
+
+
+def get_state_updates(cls, method_name="_check_success", visited=None):
+    """
+    Attributes of the task that @method_name of @cls assigns or modifies, including through other methods
+    defined by the task
+    """
+    visited = set() if visited is None else visited
+    visited.add(method_name)
+    func = getattr(cls, method_name)
+    tree = ast.parse(textwrap.dedent(inspect.getsource(func)))
+    updates = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, (ast.AugAssign, ast.AnnAssign)):
+            targets = [node.target]
+        else:
+            targets = []
+        for target in targets:
+            for elt in ast.walk(target):
+                attr = get_self_attr(elt)
+                if attr is not None:
+                    updates.add(attr)
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute):
+            attr = get_self_attr(node.func.value)
+            if attr is not None and node.func.attr in MUTATING_METHODS:
+                updates.add(attr)
+            if (
+                isinstance(node.func.value, ast.Name)
+                and node.func.value.id == "self"
+                and node.func.attr not in visited
+                and inspect.isfunction(getattr(cls, node.func.attr, None))
+                and not hasattr(Kitchen, node.func.attr)
+            ):
+                updates |= get_state_updates(cls, node.func.attr, visited)
+    return updates
+
+
+FIXTURE_XML = """
+<mujoco model="drawer">
+  <worldbody>
+    <body>
+      <body name="object">
+        <geom name="g0" type="box" pos="0 0 0.2" size="0.3 0.25 0.2" group="0"/>
+        <geom name="reg_main" type="box" pos="0 0 0.2" size="0.3 0.25 0.2" rgba="0 1 0 0" group="1" contype="0" conaffinity="0"/>
+        <geom name="reg_int" type="box" pos="0 0 0.2" size="0.25 0.2 0.15" rgba="0 1 0 0" group="1" contype="0" conaffinity="0"/>
+      </body>
+    </body>
+  </worldbody>
+</mujoco>
+"""
+
+
+class DrawerFixture(Fixture):
+    """
+    Fixture whose state update moves its interior region and switches it on, as eg. the fridge and
+    the microwave do
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._turned_on = False
+        self.opening = 0.0
+
+    def update_state(self, env):
+        self.update_regions(
+            {"int": {"pos": [self.opening, 0, 0.2], "halfsize": [0.25, 0.2, 0.15]}},
+            update_elem=False,
+        )
+        self._turned_on = env.turned_on
+
+
+class SuccessTimerEnv:
+    """
+    Stand-in for a Kitchen task whose success check counts the steps in contact, as eg. WipeTable does,
+    or reads the state of a fixture that is updated after the reward. Uses the success check methods of
+    Kitchen
+    """
+
+    check_success = Kitchen.check_success
+    _get_success_cache_key = Kitchen._get_success_cache_key
+    reward = Kitchen.reward
+
+    def __init__(self, stateful):
+        self.STATEFUL_SUCCESS_CHECK = stateful
+        self.sim = SimpleNamespace(
+            data=SimpleNamespace(time=0.0, qpos=np.zeros(2), qvel=np.zeros(2))
+        )
+        self.contact_timer = 0
+        self.num_checks = 0
+        self.fixture_on = False
+
+    def step(self, qpos):
+        self.sim.data.time += 0.05
+        self.sim.data.qpos = np.array(qpos)
+        reward = self.reward()
+        # as Kitchen._post_action, fixture states are updated after the reward
+        if self.fixture_on != (qpos[1] > 0.5):
+            self.fixture_on = qpos[1] > 0.5
+            self._fixture_state_version = getattr(self, "_fixture_state_version", 0) + 1
+        return reward
+
+    def _check_success(self):
+        self.num_checks += 1
+        if not self.STATEFUL_SUCCESS_CHECK:
+            return bool(self.sim.data.qpos[0] > 0.5 and self.fixture_on)
+        if self.sim.data.qpos[0] > 0.5:
+            self.contact_timer += 1
+        return self.contact_timer >= 3
+
+
+def run_episode(env, trajectory):
+    """
+    Steps through @trajectory, querying success after every step as the gym and robomimic wrappers do
+
+    Returns:
+        list: reward and success results of every step
+    """
+    results = []
+    for qpos in trajectory:
+        reward = env.step(qpos)
+        results.append((reward, env.check_success(), env.check_success()))
+    return results
+
+
+class TestSuccessChecks(unittest.TestCase):
+    def test_stateful_tasks_are_declared(self):
+        """
+        Tasks whose success check updates task state should set STATEFUL_SUCCESS_CHECK, so that it is not
+        memoized
+        """
+        num_stateful = 0
+        for env_name in sorted(ALL_KITCHEN_ENVIRONMENTS):
+            cls = get_kitchen_env_class(env_name)
+            updates = get_state_updates(cls)
+            self.assertEqual(
+                cls.STATEFUL_SUCCESS_CHECK,
+                len(updates) > 0,
+                "{} updates {} in _check_success".format(env_name, sorted(updates)),
+            )
+            num_stateful += cls.STATEFUL_SUCCESS_CHECK
+        self.assertGreater(num_stateful, 0)
+
+    def test_success_timing_matches_baseline(self):
+        """
+        Rewards and success queries should match calling _check_success directly (as before success checks
+        were memoized) at every step, for stateful and stateless success checks
+        """
+        trajectory = [[0, 0], [1, 0], [1, 0], [1, 1], [1, 1], [0, 1], [1, 0], [0, 0]]
+        for stateful in [True, False]:
+            env = SuccessTimerEnv(stateful=stateful)
+            baseline_env = SuccessTimerEnv(stateful=stateful)
+            baseline_env.check_success = baseline_env._check_success
+            self.assertEqual(
+                run_episode(env, trajectory),
+                run_episode(baseline_env, trajectory),
+            )
+            self.assertEqual(env.contact_timer, baseline_env.contact_timer)
+            self.assertEqual(baseline_env.num_checks, 3 * len(trajectory))
+            if not stateful:
+                # memoized checks are evaluated again after the step only if the fixture state changed
+                num_fixture_updates = env._fixture_state_version
+                self.assertEqual(num_fixture_updates, 2)
+                self.assertEqual(env.num_checks, len(trajectory) + num_fixture_updates)
+
+    def test_fixture_state_fingerprint(self):
+        """
+        Fixture fingerprints should only change when update_state changes the fixture attributes or
+        moves its regions
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "fixture.xml")
+            with open(path, "w") as f:
+                f.write(FIXTURE_XML)
+            fixture = DrawerFixture(xml=path, name="drawer", pos=[0, 0, 0])
+        self.assertTrue(fixture.has_dynamic_state)
+        env = SimpleNamespace(turned_on=False)
+        fixture.update_state(env)
+        fingerprint = fixture.get_state_fingerprint()
+
+        # updating to the same state, and filling caches, keeps the fingerprint
+        fixture.get_int_sites(relative=False)
+        fixture.update_state(env)
+        self.assertEqual(fixture.get_state_fingerprint(), fingerprint)
+
+        env.turned_on = True
+        fixture.update_state(env)
+        self.assertNotEqual(fixture.get_state_fingerprint(), fingerprint)
+
+        env.turned_on = False
+        fixture.update_state(env)
+        self.assertEqual(fixture.get_state_fingerprint(), fingerprint)
+        fixture.opening = 0.1
+        fixture.update_state(env)
+        self.assertNotEqual(fixture.get_state_fingerprint(), fingerprint)
+
+    def test_env_success_timing_matches_baseline(self):
+        """
+        Replays random actions in stateful tasks and checks that rewards, success queries and task timers
+        match an env calling _check_success directly
+        """
+        for env_name in ["WipeTable", "SanitizeSink", "JuiceFruitReamer", "PreheatPot"]:
+            envs = []
+            for baseline in [False, True]:
+                env = create_env(env_name=env_name, seed=3, camera_names=[])
+                if baseline:
+                    env.check_success = env._check_success
+                env.reset()
+                envs.append(env)
+
+            rng = np.random.default_rng(0)
+            low, high = envs[0].action_spec
+            for _ in range(100):
+                action = rng.uniform(low, high)
+                results = []
+                for env in envs:
+                    _, reward, _, _ = env.step(action)
+                    results.append((reward, env.check_success(), env.check_success()))
+                self.assertEqual(results[0], results[1])
+            for attr in get_state_updates(type(envs[0])):
+                np.testing.assert_equal(
+                    getattr(envs[0], attr), getattr(envs[1], attr), err_msg=attr
+                )
+            for env in envs:
+                env.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
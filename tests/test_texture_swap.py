@@ -0,0 +1,80 @@
+import unittest
+
+import numpy as np
+from lxml import etree as ET
+
+from robocasa.utils.texture_swap import (
+    get_random_textures,
+    replace_cab_textures,
+    replace_counter_top_texture,
+    replace_floor_texture,
+    replace_textures_in_tree,
+    replace_wall_texture,
+)
+
+# asset section with the material names matched by the texture swaps, including textures shared between materials
+# of different swaps, duplicated texture names and a pre-existing replacement texture
+MODEL_XML = """
+<mujoco model="kitchen">
+  <asset>
+    <texture name="tex_counter" type="2d" file="/assets/counter.png"/>
+    <texture name="tex_wood" type="cube" file="/assets/wood.png"/>
+    <texture name="tex_wood" type="2d" file="/assets/wood_2d.png"/>
+    <texture name="tex_plaster" type="2d" file="/assets/plaster.png"/>
+    <texture name="tex_tiles" type="cube" file="/assets/tiles.png"/>
+    <texture name="cab_replacement_texture_2d" type="2d" file="/assets/old_cab.png"/>
+    <material name="counter_1_counter_top" texture="tex_counter"/>
+    <material name="counter_2_counter_top" texture="tex_counter"/>
+    <material name="counter_1_counter_base" texture="tex_wood"/>
+    <material name="cab_1_door" texture="tex_wood"/>
+    <material name="cab_1_handle" texture="tex_wood"/>
+    <material name="shelves_1" texture="tex_wood"/>
+    <material name="stack_1_top" texture="tex_wood"/>
+    <material name="stove_top" texture="tex_wood"/>
+    <material name="fridge_housing" texture="tex_wood"/>
+    <material name="wall_left" texture="tex_plaster"/>
+    <material name="wall_backing" texture="tex_plaster"/>
+    <material name="floor_wall_trim" texture="tex_plaster"/>
+    <material name="floor_room" texture="tex_tiles"/>
+    <material name="floor_backing" texture="tex_tiles"/>
+  </asset>
+  <worldbody/>
+</mujoco>
+"""
+
+
+def c14n(xml):
+    return ET.tostring(ET.fromstring(xml), method="c14n")
+
+
+class TestTextureSwap(unittest.TestCase):
+    def test_tree_swap_matches_string_swaps(self):
+        """
+        Applying all swaps to one parsed tree should give the same model as the sequence of string-based swaps
+        (cabinet, counter top, wall, floor) applied to the serialized model
+        """
+        for seed in range(3):
+            textures = get_random_textures(np.random.default_rng(seed))
+
+            rng = np.random.default_rng(0)
+            result = MODEL_XML
+            result = replace_cab_textures(
+                rng, result, new_cab_texture_file=textures["cab_tex"]
+            )
+            result = replace_counter_top_texture(
+                rng, result, new_counter_top_texture_file=textures["counter_tex"]
+            )
+            result = replace_wall_texture(
+                rng, result, new_wall_texture_file=textures["wall_tex"]
+            )
+            result = replace_floor_texture(
+                rng, result, new_floor_texture_file=textures["floor_tex"]
+            )
+
+            root = ET.fromstring(MODEL_XML)
+            replace_textures_in_tree(root, **textures)
+            self.assertEqual(c14n(ET.tostring(root)), c14n(result))
+
+
+if __name__ == "__main__":
+    unittest.main()